@@ -1,14 +1,31 @@
 import corepy
 import numpy as np
-import time
+import sys
+import timeit
+
+def time_call(fn, repeat=5):
+    """Return the best per-call time (seconds) of fn over `repeat` batched runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+# Row formatter bound once instead of re-parsing an f-string per row
+ROW_FMT = "{:<15} | {:<12.2f} | {:<12.2f} | {:<10.2f} | {}\n".format
 
 def benchmark_compare():
     """compare CorePy vs NumPy performance"""
+    row_fmt = ROW_FMT
+    write = sys.stdout.write
     sizes = [(64, 64), (256, 256), (512, 512), (1024, 1024), (2048, 2048), (4096, 4096)]
     
     print(f"{'Size':<15} | {'NumPy (ms)':<12} | {'CorePy (ms)':<12} | {'Speedup':<10} | {'Backend/Policy'}")
     print("-" * 80)
     
+    # Draw all random data once (seeded, so runs are comparable) and slice
+    # per-size views out of it, keeping RNG cost out of the timed section.
+    max_elems = max(m * n for m, n in sizes)
+    pool = np.random.default_rng(0).standard_normal(2 * max_elems, dtype=np.float32)
+
     policies = [
         ("Default", corepy.BackendPolicy.DEFAULT),
         ("BLAS", corepy.BackendPolicy.BLAS)
@@ -19,44 +36,30 @@ def benchmark_compare():
         corepy.set_backend_policy(policy)
         
         for m, n in sizes:
-            # Data generation
-            np_a = np.random.randn(m, n).astype(np.float32)
-            np_b = np.random.randn(n, m).astype(np.float32)
+            # Data generation: contiguous views into the shared pool
+            np_a = pool[:m * n].reshape(m, n)
+            np_b = pool[m * n:2 * m * n].reshape(n, m)
             
             cp_a = corepy.Tensor(np_a)
             cp_b = corepy.Tensor(np_b)
+            # Preallocated result: the timed call writes in place instead of
+            # allocating a new buffer and Tensor per iteration
+            cp_c = corepy.Tensor(np.empty((m, m), dtype=np.float32))
             
             # --- NumPy Benchmark ---
-            # Warmup
-            _ = np_a @ np_b
-            
-            times_np = []
-            for _ in range(5):
-                start = time.perf_counter()
-                _ = np_a @ np_b
-                times_np.append(time.perf_counter() - start)
-            avg_np = np.mean(times_np) * 1000 # ms
+            # autorange() doubles as warmup and picks a batch size large enough
+            # that timer overhead is negligible for the small sizes.
+            avg_np = time_call(lambda: np_a @ np_b) * 1000 # ms
 
             # --- CorePy Benchmark ---
-            # Warmup
-            _ = cp_a.matmul(cp_b)
-            
-            times_cp = []
-            for _ in range(5):
-                start = time.perf_counter()
-                _ = cp_a.matmul(cp_b)
-                times_cp.append(time.perf_counter() - start)
-            avg_cp = np.mean(times_cp) * 1000 # ms
+            avg_cp = time_call(lambda: cp_a.matmul(cp_b, out=cp_c)) * 1000 # ms
             
             speedup = avg_np / avg_cp
             
-            # Get backend used
-            dispatch_info = corepy.explain_last_dispatch()
-            # Extract backend name locally for cleaner table if possible, but full string is good too.
-            # Let's keep it somewhat concise.
-            backend_short = dispatch_info.split('(')[0].strip() # e.g. "matmul → OpenBLAS"
+            # Get backend used (short name straight from Rust, no parsing)
+            backend_short = corepy.last_backend_name() # e.g. "OpenBLAS"
             
-            print(f"{m}x{n:<10} | {avg_np:<12.2f} | {avg_cp:<12.2f} | {speedup:<10.2f} | {backend_short}")
+            write(row_fmt(f"{m}x{n}", avg_np, avg_cp, speedup, backend_short))
 
 if __name__ == "__main__":
     benchmark_compare()
@@ -1,7 +1,12 @@
 # ~/VSCode/corepy/benchmark.py
 import corepy
 import numpy as np
-import time
+import timeit
+
+try:
+    from corepy import _corepy_rust
+except ImportError:
+    _corepy_rust = None
 
 def benchmark_matmul():
     """Benchmark different matrix sizes and backends"""
@@ -19,24 +24,28 @@ def benchmark_matmul():
         
         for m, n in sizes:
             # Create random matrices
-            a = corepy.Tensor(np.random.randn(m, n).astype(np.float32))
-            b = corepy.Tensor(np.random.randn(n, m).astype(np.float32))
-            
-            # Warmup
-            _ = a.matmul(b)
+            np_a = np.random.randn(m, n).astype(np.float32)
+            np_b = np.random.randn(n, m).astype(np.float32)
+            a = corepy.Tensor(np_a)
+            b = corepy.Tensor(np_b)
             
-            # Benchmark
-            times = []
-            for _ in range(5):
-                start = time.perf_counter()
-                c = a.matmul(b)
-                elapsed = time.perf_counter() - start
-                times.append(elapsed)
-            
-            avg_time = np.mean(times)
+            # Benchmark: autorange() warms up and batches enough calls per
+            # measurement; take the min of the repeats to filter out noise.
+            timer = timeit.Timer(lambda: a.matmul(b))
+            number, _ = timer.autorange()
+            avg_time = min(timer.repeat(repeat=5, number=number)) / number
             gflops = (2 * m * n * m) / (avg_time * 1e9)
             
             print(f"  {m}x{n}: {avg_time*1000:.2f}ms ({gflops:.2f} GFLOPs) - {corepy.explain_last_dispatch()}")
+            
+            # Kernel-only: the timing loop runs inside Rust, so neither the
+            # Python loop nor Tensor boxing is part of the measurement.
+            if _corepy_rust is not None:
+                out = np.empty((m, m), dtype=np.float32)
+                min_ns, mean_ns = _corepy_rust.time_matmul_2d_f32(
+                    np_a.ctypes.data, np_b.ctypes.data, out.ctypes.data, m, n, m, 5
+                )
+                print(f"    kernel: min {min_ns/1e6:.2f}ms, mean {mean_ns/1e6:.2f}ms")
 
 if __name__ == "__main__":
     benchmark_matmul()
@@ -1,17 +1,94 @@
 """
 Benchmark to measure profiling overhead.
 Goal: Ensure enabled overhead is <2% and disabled is ~0%.
+
+Timing uses integer nanoseconds (perf_counter_ns). On Linux, hardware
+counters (cycles, instructions, branch misses) are also read via
+perf_event_open when the kernel permits it, so overhead can be checked at
+the instruction-count level rather than against wall-clock jitter.
 """
+import ctypes
+import fcntl
+import os
+import platform
+import struct
+import sys
 import time
 
 import corepy as cp
 
+# perf_event_open(2) constants
+_PERF_TYPE_HARDWARE = 0
+_PERF_EVENTS = {"cycles": 0, "instructions": 1, "branch_misses": 5}
+_PERF_FLAGS = (1 << 0) | (1 << 5) | (1 << 6)  # disabled, exclude_kernel, exclude_hv
+_PERF_EVENT_IOC_ENABLE = 0x2400
+_PERF_EVENT_IOC_DISABLE = 0x2401
+_PERF_EVENT_IOC_RESET = 0x2403
+_PERF_SYSCALL = {"x86_64": 298, "aarch64": 241}
+
+
+class PerfCounters:
+    """
+    Minimal perf_event_open reader for the current thread.
+
+    Counters that cannot be opened (non-Linux, containers, restrictive
+    perf_event_paranoid) are skipped; `values` then holds only what was read.
+    """
+    def __init__(self):
+        self.fds = {}
+        self.values = {}
+        nr = _PERF_SYSCALL.get(platform.machine())
+        if nr is None or not sys.platform.startswith("linux"):
+            return
+        libc = ctypes.CDLL(None, use_errno=True)
+        for name, config in _PERF_EVENTS.items():
+            # struct perf_event_attr (PERF_ATTR_SIZE_VER0 = 64 bytes)
+            attr = struct.pack("IIQQQQQIIQ", _PERF_TYPE_HARDWARE, 64, config, 0, 0, 0, _PERF_FLAGS, 0, 0, 0)
+            buf = ctypes.create_string_buffer(attr, 64)
+            fd = libc.syscall(nr, buf, 0, -1, -1, 0)  # this thread, any CPU
+            if fd >= 0:
+                self.fds[name] = fd
+
+    def __enter__(self):
+        for fd in self.fds.values():
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_RESET, 0)
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_ENABLE, 0)
+        return self
+
+    def __exit__(self, *exc):
+        for name, fd in self.fds.items():
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_DISABLE, 0)
+            self.values[name] = struct.unpack("Q", os.read(fd, 8))[0]
+        return False
+
+    def close(self):
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds.clear()
+
+
+def _run(data, iterations, counters):
+    """Time `iterations` calls of data.mean(); returns elapsed ns and counter values."""
+    with counters:
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            _ = data.mean()
+        elapsed_ns = time.perf_counter_ns() - start
+    return elapsed_ns, dict(counters.values)
+
+
+def _format_counters(values, iterations):
+    return ", ".join(f"{v / iterations:.0f} {k}/op" for k, v in values.items())
+
 
 def measure_overhead():
     iterations = 100_000
     data = cp.Tensor([1.0, 2.0, 3.0, 4.0, 5.0])
+    counters = PerfCounters()
     
     print(f"Running {iterations} iterations...")
+    if not counters.fds:
+        print("(hardware counters unavailable; reporting wall-clock only)")
     
     # Baseline (No profiling code enabled - simulated by disable)
     # Ideally baseline usually means "compilation without profiling support", 
@@ -19,35 +96,35 @@ def measure_overhead():
     
     # 1. Profiling DISABLED
     cp.disable_profiling()
-    start = time.perf_counter()
-    for _ in range(iterations):
-        _ = data.mean()
-    end = time.perf_counter()
-    duration_disabled = end - start
-    avg_disabled = (duration_disabled / iterations) * 1e6 # micros
+    ns_disabled, pmu_disabled = _run(data, iterations, counters)
+    avg_disabled = ns_disabled / iterations / 1e3 # micros
     
-    print(f"Disabled: {duration_disabled:.4f}s ({avg_disabled:.3f} µs/op)")
+    print(f"Disabled: {ns_disabled / 1e9:.4f}s ({avg_disabled:.3f} µs/op)")
+    if pmu_disabled:
+        print(f"          {_format_counters(pmu_disabled, iterations)}")
     
     # 2. Profiling ENABLED
     cp.enable_profiling()
-    start = time.perf_counter()
-    for _ in range(iterations):
-        _ = data.mean()
-    end = time.perf_counter()
-    duration_enabled = end - start
-    avg_enabled = (duration_enabled / iterations) * 1e6 # micros
+    ns_enabled, pmu_enabled = _run(data, iterations, counters)
+    avg_enabled = ns_enabled / iterations / 1e3 # micros
     
     cp.disable_profiling()
     cp.clear_profile()
+    counters.close()
     
-    print(f"Enabled:  {duration_enabled:.4f}s ({avg_enabled:.3f} µs/op)")
+    print(f"Enabled:  {ns_enabled / 1e9:.4f}s ({avg_enabled:.3f} µs/op)")
+    if pmu_enabled:
+        print(f"          {_format_counters(pmu_enabled, iterations)}")
     
     # 3. Calculate Overhead
     overhead_us = avg_enabled - avg_disabled
-    overhead_pct = ((duration_enabled - duration_disabled) / duration_disabled) * 100.0
+    overhead_pct = ((ns_enabled - ns_disabled) / ns_disabled) * 100.0
     
     print("-" * 40)
     print(f"Overhead: {overhead_us:.3f} µs/op (+{overhead_pct:.1f}%)")
+    if pmu_disabled.get("instructions") and pmu_enabled.get("instructions"):
+        extra = (pmu_enabled["instructions"] - pmu_disabled["instructions"]) / iterations
+        print(f"          {extra:+.0f} instructions/op")
     
     if overhead_pct > 5.0:
         print("⚠️ WARNING: Overhead is > 5%")
@@ -53,10 +53,14 @@ class BenchmarkRunner:
             latencies_ns.append(end - start)
 
         # Analysis
-        latencies_ms = [t / 1e6 for t in latencies_ns]
-        p50 = statistics.median(latencies_ms)
-        p99 = sorted(latencies_ms)[int(len(latencies_ms) * 0.99)]
-        mean = statistics.mean(latencies_ms)
+        # Sort once and read both percentiles off the same list; fmean is the
+        # float-only C fast path (statistics.mean goes through exact fractions).
+        latencies_ms = sorted(t / 1e6 for t in latencies_ns)
+        mid = len(latencies_ms) // 2
+        # Same value as statistics.median, without sorting a second time
+        p50 = latencies_ms[mid] if len(latencies_ms) % 2 else (latencies_ms[mid - 1] + latencies_ms[mid]) / 2
+        p99 = latencies_ms[int(len(latencies_ms) * 0.99)]
+        mean = statistics.fmean(latencies_ms)
         stdev = statistics.stdev(latencies_ms) if len(latencies_ms) > 1 else 0.0
 
         print(f"  P50:  {p50:.4f} ms")
@@ -1,6 +1,8 @@
 """
 Corepy: A unified, high-performance core runtime.
 """
+import contextlib
+
 from corepy import data, runtime, schema
 
 from . import backend
@@ -17,7 +19,8 @@ from .profiler import (
     profile_operation,
     profile_report,
 )
-from .tensor import Tensor
+from .recording import batch, batched, fuse
+from .tensor import Tensor, arange, reduce_stats
 
 try:
     from ._corepy_cpp import add_one
@@ -29,7 +32,11 @@ except ImportError:
 try:
     from . import _corepy_rust
 except ImportError:
-    pass # Managed in usage sites
+    # Managed in usage sites. Without the extension, CPU ops may fall back to
+    # numba kernels: warm them now so JIT costs are not paid on first use.
+    from .ops import _numba_kernels
+    with contextlib.suppress(Exception):
+        _numba_kernels.warmup()
 
 tensor = Tensor
 
@@ -41,20 +48,25 @@ from .backend import (
     BackendPolicy,
     get_backend_policy,
     set_backend_policy,
-    explain_last_dispatch
+    explain_last_dispatch,
+    last_backend_name,
+    simd_level
 )
 
 Float32 = DataType.FLOAT32
 Float64 = DataType.FLOAT64
 Int32 = DataType.INT32
 Int64 = DataType.INT64
+Int8 = DataType.INT8
 Bool = DataType.BOOL
+BFloat16 = DataType.BFLOAT16
 
 __all__ = [
     "data", "schema", "runtime", "add_one", "Tensor", "tensor", "backend", "profiler",
     "enable_profiling", "disable_profiling", "clear_profile", "profile_report",
     "export_profile", "ProfileContext", "profile_operation", "detect_bottlenecks",
     "get_recommendations", "detect_regressions",
-    "Float32", "Float64", "Int32", "Int64", "Bool", "DataType",
-    "BackendPolicy", "get_backend_policy", "set_backend_policy", "explain_last_dispatch"
+    "Float32", "Float64", "Int32", "Int64", "Int8", "Bool", "BFloat16", "DataType",
+    "BackendPolicy", "get_backend_policy", "set_backend_policy", "explain_last_dispatch",
+    "last_backend_name", "simd_level", "batch", "batched", "fuse", "arange", "reduce_stats"
 ]
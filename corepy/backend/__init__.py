@@ -12,20 +12,57 @@ class BackendPolicy(IntEnum):
     BLAS = 2
     CUDA = 3
 
+# Bind the FFI callables once at import time so the wrappers below avoid a
+# per-call import lookup. If the extension is not loaded yet, fall back to
+# resolving it lazily on first use.
+try:
+    from corepy import _corepy_rust as _rust
+
+    _set_backend_policy = _rust.set_backend_policy
+    _get_backend_policy = _rust.get_backend_policy
+    _explain_last_dispatch = _rust.explain_last_dispatch
+    _last_backend_name = _rust.last_backend_name
+    _simd_level = _rust.simd_level
+except ImportError:
+    def _set_backend_policy(policy: int):
+        from corepy import _corepy_rust
+        _corepy_rust.set_backend_policy(policy)
+
+    def _get_backend_policy() -> int:
+        from corepy import _corepy_rust
+        return _corepy_rust.get_backend_policy()
+
+    def _explain_last_dispatch() -> str:
+        from corepy import _corepy_rust
+        return _corepy_rust.explain_last_dispatch()
+
+    def _last_backend_name() -> str:
+        from corepy import _corepy_rust
+        return _corepy_rust.last_backend_name()
+
+    def _simd_level() -> str:
+        from corepy import _corepy_rust
+        return _corepy_rust.simd_level()
+
 def set_backend_policy(policy: BackendPolicy):
     """Set the global CPU backend selection policy."""
-    from corepy import _corepy_rust
-    _corepy_rust.set_backend_policy(int(policy))
+    _set_backend_policy(int(policy))
 
 def get_backend_policy() -> BackendPolicy:
     """Get the current global CPU backend selection policy."""
-    from corepy import _corepy_rust
-    return BackendPolicy(_corepy_rust.get_backend_policy())
+    return BackendPolicy(_get_backend_policy())
 
 def explain_last_dispatch() -> str:
     """Returns a string explaining which backend was used for the last operation."""
-    from corepy import _corepy_rust
-    return _corepy_rust.explain_last_dispatch()
+    return _explain_last_dispatch()
+
+def last_backend_name() -> str:
+    """Returns just the name of the backend used for the last operation (e.g. "OpenBLAS")."""
+    return _last_backend_name()
+
+def simd_level() -> str:
+    """Returns the instruction set the CPU reductions were dispatched to at load ("avx512", "avx2" or "scalar")."""
+    return _simd_level()
 
 __all__ = [
     "BackendType",
@@ -37,6 +74,8 @@ __all__ = [
     "set_backend_policy",
     "get_backend_policy",
     "explain_last_dispatch",
+    "last_backend_name",
+    "simd_level",
     "BackendError",
     "DeviceNotFoundError",
     "OutOfMemoryError",
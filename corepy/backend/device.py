@@ -2,7 +2,7 @@ import os
 import platform
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .types import BackendType
 
@@ -27,6 +27,11 @@ class DeviceInfo:
     def has_gpu(self) -> bool:
         return self.gpu_count > 0
 
+    @property
+    def selection_key(self) -> Tuple[int, Optional[BackendType]]:
+        """Hashable summary of the fields select_backend() depends on (memoization key)."""
+        return (self.gpu_count, self.forced_backend)
+
 class Device(ABC):
     """
     Abstract base class for a hardware device.
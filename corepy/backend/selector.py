@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .device import DeviceInfo
 from .types import BackendType, OperationProperties, OperationType
@@ -14,6 +14,10 @@ THRESHOLD_MATRIX_rows = 512
 THRESHOLD_MATRIX_COLS = 512
 THRESHOLD_BATCH_SIZE = 32
 
+# Memoized select_backend() results; see select_backend_cached()
+_SELECTION_CACHE: Dict[tuple, BackendType] = {}
+_SELECTION_CACHE_MAX = 1024
+
 def _get_forced_backend() -> Optional[BackendType]:
     """Check environment variable for forced backend."""
     env_backend = os.getenv("COREPY_BACKEND", "").lower()
@@ -106,3 +110,34 @@ def select_backend(
 
     # 5. Default
     return BackendType.CPU
+
+def select_backend_cached(
+    op_type: OperationType,
+    element_count: int,
+    shape: Tuple[int, ...],
+    device_info: DeviceInfo,
+    requested_backend: Optional[BackendType] = None,
+    dtype_bytes: int = 4,
+) -> BackendType:
+    """
+    Memoized select_backend() for plain (unbatched, non-streaming) operations.
+
+    Tensor construction asks the same question for the same sizes over and
+    over, so results are cached on everything the decision reads: the
+    operation, size, request, device summary and COREPY_BACKEND. The
+    OperationProperties object is only built on a cache miss.
+    """
+    key = (
+        op_type, element_count, shape, dtype_bytes, requested_backend,
+        device_info.selection_key, os.environ.get("COREPY_BACKEND"),
+    )
+    backend = _SELECTION_CACHE.get(key)
+    if backend is None:
+        op_props = OperationProperties(
+            element_count=element_count, shape=shape, dtype_bytes=dtype_bytes
+        )
+        backend = select_backend(op_type, op_props, device_info, requested_backend)
+        if len(_SELECTION_CACHE) >= _SELECTION_CACHE_MAX:
+            _SELECTION_CACHE.clear()
+        _SELECTION_CACHE[key] = backend
+    return backend
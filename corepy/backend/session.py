@@ -1,4 +1,7 @@
-from typing import Dict
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 from .backend import Backend, CPUBackend, GPUBackend
 from .device import DeviceInfo, detect_devices
@@ -12,6 +15,11 @@ class Session:
     """
     _instance = None
 
+    # Output-buffer pool limits: distinct (dtype, count) keys kept (least
+    # recently used evicted first) and free buffers kept per key
+    MAX_POOLED_SHAPES = 16
+    MAX_BUFFERS_PER_SHAPE = 4
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Session, cls).__new__(cls)
@@ -28,6 +36,9 @@ class Session:
         self._backends[BackendType.CPU] = CPUBackend()
         if self._device_info.gpu_count > 0:
             self._backends[BackendType.GPU] = GPUBackend()
+        
+        # (dtype, count) -> released buffers ready for reuse
+        self._buffer_pool: "OrderedDict[Tuple[Any, int], List[np.ndarray]]" = OrderedDict()
             
         self._initialized = True
 
@@ -41,6 +52,50 @@ class Session:
             raise ValueError(f"Backend {backend_type} not available or not initialized.")
         return self._backends[backend_type]
 
+    def get_output_buffer(self, dtype: Any, count: int) -> np.ndarray:
+        """
+        Return an uninitialized 1-D array of `count` elements for an op result.
+
+        Reuses a buffer handed back via release_output_buffer() with the same
+        dtype and count when one is free, otherwise allocates a new one.
+        `dtype` is a NumPy scalar type such as np.float32.
+        """
+        key = (dtype, count)
+        free = self._buffer_pool.get(key)
+        if free:
+            self._buffer_pool.move_to_end(key)
+            return free.pop()
+        
+        return np.empty(count, dtype=dtype)
+
+    def release_output_buffer(self, arr: np.ndarray) -> bool:
+        """
+        Return a buffer from get_output_buffer() (or a view of one) to the pool.
+
+        The caller must own the buffer (Tensor tracks this, see Tensor.release)
+        and must not touch it afterwards. Returns False, and keeps nothing,
+        for arrays that cannot be an output buffer or are already pooled.
+        """
+        buf = arr if arr.base is None else arr.base
+        if not (isinstance(buf, np.ndarray) and buf.ndim == 1 and buf.flags.writeable):
+            return False
+        
+        key = (buf.dtype.type, buf.size)
+        pool = self._buffer_pool
+        free = pool.get(key)
+        if free is not None and any(pooled is buf for pooled in free):
+            return False # Released twice, e.g. by two tensors sharing it
+        if free is None:
+            free = pool[key] = []
+            if len(pool) > self.MAX_POOLED_SHAPES:
+                pool.popitem(last=False)
+        else:
+            pool.move_to_end(key)
+        
+        if len(free) < self.MAX_BUFFERS_PER_SHAPE:
+            free.append(buf)
+        return True
+
 # Global session instance
 _session = Session()
 
@@ -46,5 +46,7 @@ class DataType(Enum):
     FLOAT64 = "float64"
     INT32 = "int32"
     INT64 = "int64"
+    INT8 = "int8"
     BOOL = "bool"
+    BFLOAT16 = "bfloat16"  # Stored as raw 16-bit patterns; see Tensor.to_bf16()
     # complex types etc.
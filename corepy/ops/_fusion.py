@@ -0,0 +1,136 @@
+"""
+Fused element-wise kernels for ``corepy.fuse()``.
+
+A pending element-wise chain (see tensor._DeferredTensor) is described as an
+expression over numbered input arrays and float32 scalars, for example
+``(((x0[i] * s0) + s1) - x0[i])``. Each distinct expression is compiled once
+with Numba into a single loop that either writes the result or sums it, so
+the chain reads its inputs once and writes no intermediates.
+
+Compiling costs far more than a small chain saves (importing numba alone
+takes about half a second, each expression tens of milliseconds), so the
+generated source is written to a per-user cache directory
+($COREPY_CACHE_DIR, default ~/.cache/corepy) and compiled with Numba's
+on-disk cache: later processes load the machine code instead. Callers
+only fuse chains of at least MIN_FUSED_ELEMENTS elements.
+
+Numba is an optional dependency, imported on the first compile. Without it
+FUSION_AVAILABLE is False and callers run the chain one kernel per op.
+"""
+
+import hashlib
+import importlib.util
+import os
+import stat
+import sys
+import types
+from typing import Callable, Dict, Tuple
+
+FUSION_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Smallest chain (elements processed) worth a compiled kernel: below this
+# the per-op kernels finish before the fused call's dispatch overhead
+MIN_FUSED_ELEMENTS = 1 << 16
+
+_CACHE_DIR = os.path.join(
+    os.environ.get("COREPY_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "corepy"),
+    "fusion",
+)
+
+# (expression, n_inputs, n_scalars, reduce) -> compiled kernel
+_kernels: Dict[Tuple[str, int, int, bool], Callable] = {}
+
+
+def _source(expr: str, n_inputs: int, n_scalars: int, reduce: bool) -> str:
+    params = [f"x{i}" for i in range(n_inputs)] + [f"s{j}" for j in range(n_scalars)]
+    if reduce:
+        body = (
+            "    acc = 0.0\n"
+            "    for i in range(x0.shape[0]):\n"
+            f"        acc += {expr}\n"
+            "    return acc\n"
+        )
+    else:
+        params.append("out")
+        body = (
+            "    for i in range(out.shape[0]):\n"
+            f"        out[i] = {expr}\n"
+        )
+    return f"def kernel({', '.join(params)}):\n{body}"
+
+
+def _private_cache_dir() -> bool:
+    """Create _CACHE_DIR (mode 0o700) and check only this user can write it."""
+    os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+    st = os.stat(_CACHE_DIR)
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _load(source: str) -> Tuple[Callable, bool]:
+    """
+    ``(function, file_backed)`` for ``source``, defining ``kernel``.
+
+    Numba can only cache functions that come from a source file, so the
+    source is stored under _CACHE_DIR, named by its hash, and the kernel is
+    compiled with that file name. The file is only used when the directory
+    is private to this user and its contents are exactly ``source``; the
+    code run is always ``source`` itself, never what was read back.
+    Otherwise (or if the directory is not writable) ``source`` is exec'd
+    without a file and the kernel is not cached.
+    """
+    digest = hashlib.sha1(source.encode()).hexdigest()[:20]
+    path = os.path.join(_CACHE_DIR, f"fused_{digest}.py")
+    try:
+        if not _private_cache_dir():
+            raise PermissionError(_CACHE_DIR)
+        if not os.path.exists(path):
+            # Written once and never modified: Numba checks the file's
+            # timestamp to tell whether its cached code is stale
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(source)
+            os.replace(tmp, path)
+        with open(path) as f:
+            if f.read() != source:
+                raise PermissionError(path)  # Truncated or replaced
+        name = f"corepy_fused_{digest}"
+        module = types.ModuleType(name)
+        module.__file__ = path
+        # Registered so Numba's cache can resolve the kernel's module on load
+        sys.modules[name] = module
+        exec(compile(source, path, "exec"), module.__dict__)
+        return module.kernel, True
+    except OSError:
+        namespace: Dict[str, Callable] = {}
+        exec(source, namespace)
+        return namespace["kernel"], False
+
+
+def _compile(expr: str, n_inputs: int, n_scalars: int, reduce: bool) -> Callable:
+    from numba import njit
+
+    fn, file_backed = _load(_source(expr, n_inputs, n_scalars, reduce))
+    # Reductions use a float64 accumulator; reassociation and FMA contraction
+    # let LLVM vectorize the sum. No other fast-math flags: NaN and inf
+    # inputs must propagate as in the element-wise kernels.
+    fastmath = {"reassoc", "contract"} if reduce else False
+    # error_model="numpy": x / 0 gives inf/nan like the element-wise kernels
+    return njit(
+        fastmath=fastmath, error_model="numpy", boundscheck=False, cache=file_backed,
+    )(fn)
+
+
+def kernel(expr: str, n_inputs: int, n_scalars: int, reduce: bool) -> Callable:
+    """
+    Compiled kernel for ``expr``, built (or loaded from disk) on first request.
+
+    Element-wise kernels take ``(x0, ..., s0, ..., out)`` and fill ``out``;
+    reducing kernels take ``(x0, ..., s0, ...)`` and return the sum.
+    """
+    key = (expr, n_inputs, n_scalars, reduce)
+    fn = _kernels.get(key)
+    if fn is None:
+        fn = _kernels[key] = _compile(expr, n_inputs, n_scalars, reduce)
+    return fn
@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the numba fallback kernels.
+
+Compiles the kernel bodies from _numba_kernels into a plain extension module,
+corepy/ops/_corepy_aot, which _numba_kernels imports in preference to
+jitting. Importing it costs no compilation or cache lookup, and numba is
+only needed to build it:
+
+    python -m corepy.ops._kernels_aot
+
+Exported functions take exactly the declared types (C-contiguous float32),
+as the jitted versions do. numba.pycc has no parallel mode, so the AOT
+matmul runs on one thread; _numba_kernels uses it for small products only
+and keeps the parallel jitted matmul for large ones.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from . import _numba_kernels as _kernels
+
+cc = CC("_corepy_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+# No cc.target_cpu: the default baseline target runs on any CPU of the
+# architecture, so a packaged module cannot hit an illegal instruction.
+# These are fallbacks; the SIMD-specific paths are the C++ kernels'
+# runtime dispatch.
+
+cc.export("matmul_f32", _kernels.MATMUL_F32_SIG)(_kernels._matmul_f32)
+cc.export("dot_f32", _kernels.DOT_F32_SIG)(_kernels._dot_f32)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,132 @@
+"""
+Numba-jitted CPU kernels used as fallbacks when the Rust/C++ FFI is unavailable.
+
+Numba is an optional dependency. The kernels come from the ahead-of-time
+build (_corepy_aot, see _kernels_aot.py) when it is present, else they are
+jitted on their first call (or by warmup()), so importing this module never
+imports numba: with the Rust extension present the fallbacks are never
+compiled. The AOT matmul is single-threaded, so with the AOT build products
+of at least _PARALLEL_MATMUL_VOLUME multiply-adds still use the parallel
+jitted kernel when numba is installed. If neither is possible,
+NUMBA_AVAILABLE is False; callers must check the flag before calling the
+kernels.
+"""
+
+import importlib.util
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger("corepy.ops.numba")
+
+try:
+    # Ahead-of-time build of the same kernels (python -m corepy.ops._kernels_aot):
+    # plain native functions, so importing them neither jits nor imports numba
+    from . import _corepy_aot
+except ImportError:
+    _corepy_aot = None
+
+prange = range # What prange means outside parallel=True (and in the AOT build)
+NUMBA_AVAILABLE = _corepy_aot is not None or importlib.util.find_spec("numba") is not None
+
+
+def _matmul_f32(a, b, out):
+    """out = a @ b for C-contiguous float32 matrices (out is overwritten)."""
+    m, n = a.shape
+    p = b.shape[1]
+    for i in prange(m):
+        for j in range(p):
+            out[i, j] = 0.0
+        # i-k-j order: the inner loop streams rows of b and out contiguously
+        for k in range(n):
+            aik = a[i, k]
+            for j in range(p):
+                out[i, j] += aik * b[k, j]
+
+
+def _dot_f32(a, b):
+    """Dot product of two contiguous float32 vectors of equal length."""
+    # fastmath (jitted build) lets LLVM reassociate the sum into vector FMA accumulators
+    acc = np.float32(0.0)
+    for i in range(a.shape[0]):
+        acc += a[i] * b[i]
+    return acc
+
+
+# Signatures shared by the jitted kernels and the AOT build (_kernels_aot)
+MATMUL_F32_SIG = "void(f4[:, ::1], f4[:, ::1], f4[:, ::1])"
+DOT_F32_SIG = "f4(f4[::1], f4[::1])"
+
+# m*n*p from which the AOT build's single-threaded matmul hands over to the
+# parallel jitted one (smaller products finish before threads would start)
+_PARALLEL_MATMUL_VOLUME = 64 * 64 * 64
+
+
+def _jit_parallel_matmul():
+    """The parallel jitted matmul, or None without numba."""
+    global prange
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    # An explicit signature makes numba compile here (or load from the
+    # on-disk cache) instead of on the first call.
+    return njit(
+        [MATMUL_F32_SIG], parallel=True, fastmath=True, cache=True, boundscheck=False,
+    )(_matmul_f32)
+
+
+def _jit_dot():
+    """The jitted dot product (numba must be installed)."""
+    from numba import njit
+    return njit([DOT_F32_SIG], fastmath=True, cache=True, boundscheck=False)(_dot_f32)
+
+
+# Jitted kernels, compiled on first use
+_matmul_f32_parallel = None
+_dot_f32_jitted = None
+
+
+def matmul_f32(a, b, out):
+    """out = a @ b (see _matmul_f32): the AOT kernel for small products, else the parallel jitted one."""
+    global _matmul_f32_parallel
+    if _corepy_aot is not None and a.shape[0] * a.shape[1] * b.shape[1] < _PARALLEL_MATMUL_VOLUME:
+        _corepy_aot.matmul_f32(a, b, out)
+        return
+    if _matmul_f32_parallel is None:
+        _matmul_f32_parallel = _jit_parallel_matmul()
+        if _matmul_f32_parallel is None:
+            _matmul_f32_parallel = _corepy_aot.matmul_f32 # AOT build without numba
+    _matmul_f32_parallel(a, b, out)
+
+
+if _corepy_aot is not None:
+    dot_f32 = _corepy_aot.dot_f32
+else:
+    def dot_f32(a, b):
+        """Dot product (see _dot_f32), jitted on the first call."""
+        global _dot_f32_jitted
+        if _dot_f32_jitted is None:
+            _dot_f32_jitted = _jit_dot()
+        return _dot_f32_jitted(a, b)
+
+
+def warmup() -> None:
+    """
+    Compile each jitted kernel and run it once on tiny inputs.
+
+    Pays the compile (or cache load) and the remaining first-call costs
+    (dispatcher setup, parallel threading-layer start-up) up front, so they
+    do not land in the first user-visible op. Called at package import only
+    when the Rust extension is missing. AOT kernels have no such costs.
+    """
+    if not NUMBA_AVAILABLE or _corepy_aot is not None:
+        return
+
+    global _matmul_f32_parallel
+    if _matmul_f32_parallel is None:
+        _matmul_f32_parallel = _jit_parallel_matmul()
+    a = np.ones((2, 2), dtype=np.float32)
+    _matmul_f32_parallel(a, a, np.empty_like(a))
+    dot_f32(a[0], a[1])
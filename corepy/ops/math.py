@@ -1,7 +1,11 @@
-from typing import Any
+from typing import Any, Tuple
+
+import numpy as np
 
 from ..backend.dispatch import register_kernel
 from ..backend.types import BackendType
+from . import _numba_kernels
+from ._numba_kernels import NUMBA_AVAILABLE
 
 # ============================================================================
 # ARCHITECTURE COMPLIANCE NOTE:
@@ -17,6 +21,11 @@ from ..backend.types import BackendType
 # 1. Register operation names in the dispatch system
 # 2. Raise errors if Rust/C++ dispatch fails
 #
+# Exceptions, so the CPU path still works without the compiled extension:
+# - when numba is installed, matmul registers a jitted GEMM
+# - reductions (sum, mean, var, any, all, count_nonzero) run as single
+#   NumPy ufunc reductions over the tensor's array
+#
 # If you see these errors during normal execution, it means the FFI
 # dispatch is broken and needs to be fixed.
 # ============================================================================
@@ -36,36 +45,104 @@ def cpu_add(a: Any, b: Any) -> Any:
         "This is an architecture violation. Check lib.rs for tensor_add() function."
     )
 
-@register_kernel("matmul", BackendType.CPU)
-def cpu_matmul(a: Any, b: Any) -> Any:
-    """
-    Matrix multiplication stub.
-    
-    ARCHITECTURE VIOLATION: This should never execute!
-    Execution path should be: Python → Rust → C++ (GEMM kernel)
-    
-    If you see this error, the Rust/C++ dispatch layer is not working.
-    """
-    raise NotImplementedError(
-        "CPU matmul kernel should execute via Rust/C++ FFI, not Python. "
-        "This is an architecture violation. Check lib.rs for tensor_matmul() function."
-    )
+if NUMBA_AVAILABLE:
+    @register_kernel("matmul", BackendType.CPU)
+    def cpu_matmul(a: Any, b: Any, out: Any = None) -> Any:
+        """
+        Matrix multiplication fallback (numba-jitted GEMM / dot).
+
+        Used when the Rust/C++ FFI is unavailable (or has no kernel for the
+        shape) and numba is installed. Operands are 1D or 2D with NumPy
+        matmul semantics: 1D @ 1D is a dot product (returned as shape (1,),
+        like the FFI path), and a 1D operand on either side of a 2D one is
+        treated as a row/column vector and squeezed from the result. The
+        result is a float32 numpy array, written into `out` (2D @ 2D only)
+        when one is given.
+        """
+        a = np.ascontiguousarray(a, dtype=np.float32)
+        b = np.ascontiguousarray(b, dtype=np.float32)
+        if a.ndim not in (1, 2) or b.ndim not in (1, 2):
+            raise NotImplementedError("numba matmul fallback supports 1D/2D operands only")
+        if a.shape[-1] != b.shape[0]:
+            raise ValueError(f"Matrix dimension mismatch: {a.shape} @ {b.shape}")
+
+        if a.ndim == 1 and b.ndim == 1:
+            return np.array([_numba_kernels.dot_f32(a, b)], dtype=np.float32)
+        if a.ndim == 1 or b.ndim == 1:
+            if out is not None:
+                raise NotImplementedError("out= is only supported for 2D @ 2D")
+            result = np.empty((a.shape[0] if a.ndim == 2 else 1, b.shape[1] if b.ndim == 2 else 1), dtype=np.float32)
+            _numba_kernels.matmul_f32(a.reshape(-1, a.shape[-1]), b.reshape(b.shape[0], -1), result)
+            return result.ravel()
+
+        if out is None:
+            out = np.empty((a.shape[0], b.shape[1]), dtype=np.float32)
+        _numba_kernels.matmul_f32(a, b, out)
+        return out
+else:
+    @register_kernel("matmul", BackendType.CPU)
+    def cpu_matmul(a: Any, b: Any, out: Any = None) -> Any:
+        """
+        Matrix multiplication stub.
+        
+        ARCHITECTURE VIOLATION: This should never execute!
+        Execution path should be: Python → Rust → C++ (GEMM kernel)
+        
+        If you see this error, the Rust/C++ dispatch layer is not working.
+        """
+        raise NotImplementedError(
+            "CPU matmul kernel should execute via Rust/C++ FFI, not Python. "
+            "This is an architecture violation. Check lib.rs for tensor_matmul() function."
+        )
+
+# ============================================================================
+# Reductions without the FFI
+# ============================================================================
+# Tensor passes its data as an ndarray (bfloat16 already widened to float32),
+# so each kernel is one vectorized NumPy loop and returns a Python scalar.
+
+@register_kernel("sum", BackendType.CPU)
+def cpu_sum(a: Any) -> Any:
+    """Sum of all elements (integer inputs accumulate in int64)."""
+    return np.add.reduce(a, axis=None).item()
+
+@register_kernel("mean", BackendType.CPU)
+def cpu_mean(a: Any) -> float:
+    """Arithmetic mean of all elements."""
+    if a.size == 0:
+        raise ValueError("Cannot compute mean of empty tensor")
+    return float(np.add.reduce(a, axis=None, dtype=np.float64)) / a.size
+
+@register_kernel("var", BackendType.CPU)
+def cpu_var(a: Any) -> float:
+    """Population variance of all elements."""
+    if a.size == 0:
+        raise ValueError("Cannot compute variance of empty tensor")
+    return float(np.var(a, dtype=np.float64))
+
+@register_kernel("stats", BackendType.CPU)
+def cpu_stats(a: Any) -> Tuple[float, float, float]:
+    """(sum, min, max) of all elements."""
+    if a.size == 0:
+        raise ValueError("Cannot compute stats of empty tensor")
+    return float(np.add.reduce(a, axis=None, dtype=np.float64)), float(a.min()), float(a.max())
+
+@register_kernel("any", BackendType.CPU)
+def cpu_any(a: Any) -> bool:
+    """True if any element is nonzero."""
+    return bool(np.logical_or.reduce(a, axis=None))
 
 @register_kernel("all", BackendType.CPU)
 def cpu_all(a: Any) -> bool:
-    """
-    Reduction: all() operation stub.
-    
-    TEMPORARY FALLBACK: This executes in Python until Rust FFI is integrated.
-    
-    TODO: Once tensor.all() is updated to call _corepy_rust.tensor_all(),
-          this should raise NotImplementedError like the others.
-    """
-    # Temporary Python fallback for tensor.all()
-    # Will be removed once Python layer is updated to use raw pointer FFI
-    if isinstance(a, list):
-        return all(a)
-    else:
-        return bool(a)
+    """True if every element is nonzero (True for an empty tensor)."""
+    return bool(np.logical_and.reduce(a, axis=None))
+
+@register_kernel("count_nonzero", BackendType.CPU)
+def cpu_count_nonzero(a: Any) -> int:
+    """Number of nonzero elements."""
+    return int(np.count_nonzero(a))
 
 
+# The dispatcher holds the only reference these kernels need. Drop the module
+# names so they cannot be called directly, bypassing dispatch.
+del cpu_add, cpu_matmul, cpu_sum, cpu_mean, cpu_var, cpu_stats, cpu_any, cpu_all, cpu_count_nonzero
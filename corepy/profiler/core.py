@@ -5,10 +5,17 @@ Core profiling functionality and API.
 import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("corepy.profiler")
 
+# Field extractors for the per-operation rows of the text report
+_row_getter = itemgetter('operation', 'count', 'total_time_ms', 'avg_time_ms')
+_total_time_getter = itemgetter('total_time_ms')
+
 # Try to import Rust extension
 try:
     # Use relative import to ensure we share the same extension instance 
@@ -20,7 +27,12 @@ try:
     _disable_profiling = _corepy_rust.disable_profiling
     _clear_profile = _corepy_rust.clear_profile
     _get_profile_report = _corepy_rust.get_profile_report
-    _set_profile_context = _corepy_rust.set_profile_context
+    _get_profile_report_dict = _corepy_rust.get_profile_report_dict
+    _get_profile_report_arrays = _corepy_rust.get_profile_report_arrays
+    _push_profile_context = _corepy_rust.push_profile_context
+    _pop_profile_context = _corepy_rust.pop_profile_context
+    _profile_op_id = _corepy_rust.profile_op_id
+    _profile_record = _corepy_rust.profile_record
     _RUST_AVAILABLE = True
 except ImportError:
     _RUST_AVAILABLE = False
@@ -33,12 +45,65 @@ except ImportError:
     def _get_profile_report(ctx=None): return json.dumps({
         "metadata": {"session_id": "mock"}, 
         "operations": {}, 
-        "total_time_ms": 0.0
+        "total_time_ms": 0.0,
+        "functions": {}
     })
-    def _set_profile_context(ctx=None): pass
+    def _get_profile_report_dict(ctx=None): return json.loads(_get_profile_report(ctx))
+    def _get_profile_report_arrays(ctx=None): return ([], [], [], [], [])
+    def _push_profile_context(ctx): pass
+    def _pop_profile_context(): pass
+    def _profile_op_id(name): return 0
+    def _profile_record(op_id, elapsed_ns): pass
+
+
+# Mirrors the Rust profiler switch. Tensor checks it to run ops eagerly
+# (no deferred fusion) so each op is timed inside its ProfileContext.
+_profiling_active = False
+
+# Invariant-call hints: a reduction repeated on a tensor whose contents have
+# not changed (same version) recomputes the same value. Calls are counted
+# per thread and per (context, op, tensor version) while profiling; a key
+# reaching the threshold is reported by detect_bottlenecks(). The counts
+# are dropped once a thread tracks _MAX_TRACKED_CALLS keys, so a long run
+# over many distinct tensors keeps a bounded table. Versions only change
+# through corepy ops: writing a tensor's NumPy array directly (the one it
+# wraps, or a zero-copy np.asarray() view) is not seen, and can be reported
+# as an invariant call.
+_INVARIANT_CALL_THRESHOLD = 10
+_MAX_TRACKED_CALLS = 4096
+# (context, op, version) -> calls, for keys past the threshold
+_invariant_hints: Dict[Tuple[Optional[str], str, int], int] = {}
+_hints_lock = threading.Lock()
+# Bumped by clear_profile(); a thread holding older counts drops them
+_generation = 0
+
+
+class _ThreadState(threading.local):
+    """Per-thread profiling state; class attributes are the initial values."""
+    context: Optional[str] = None # Innermost ProfileContext, mirrored from Rust
+    calls: Optional[Dict[Tuple[Optional[str], str, int], int]] = None
+    generation = -1 # Never current: the first call creates `calls`
 
+_state = _ThreadState()
 
-def enable_profiling():
+
+def _note_call(op: str, version: int, _state=_state) -> None:
+    """Count a reduction ``op`` on tensor contents ``version`` (profiling only)."""
+    calls = _state.calls
+    if _state.generation != _generation or len(calls) >= _MAX_TRACKED_CALLS:
+        calls = _state.calls = {}
+        _state.generation = _generation
+    key = (_state.context, op, version)
+    count = calls[key] = calls.get(key, 0) + 1
+    if count >= _INVARIANT_CALL_THRESHOLD:
+        with _hints_lock:
+            _invariant_hints[key] = count
+
+
+# The public wrappers below bind their FFI target as a default argument so
+# each call is a local (LOAD_FAST) lookup rather than a module-global one.
+
+def enable_profiling(_fn=_enable_profiling):
     """
     Enable the global performance profiler.
     
@@ -47,21 +112,29 @@ def enable_profiling():
     
     Overhead: <2% when enabled, 0% when disabled.
     """
-    _enable_profiling()
+    global _profiling_active
+    _fn()
+    _profiling_active = True
 
 
-def disable_profiling():
+def disable_profiling(_fn=_disable_profiling):
     """
     Disable the global performance profiler.
     """
-    _disable_profiling()
+    global _profiling_active
+    _fn()
+    _profiling_active = False
 
 
-def clear_profile():
+def clear_profile(_fn=_clear_profile):
     """
     Clear all collected profiling data.
     """
-    _clear_profile()
+    global _generation
+    _fn()
+    with _hints_lock:
+        _generation += 1
+        _invariant_hints.clear()
 
 
 def profile_report(context: Optional[str] = None, format: str = 'table') -> Any:
@@ -75,40 +148,53 @@ def profile_report(context: Optional[str] = None, format: str = 'table') -> Any:
     Returns:
         String report (table/compact/json) or Dictionary (dict).
     """
-    json_str = _get_profile_report(context)
-    data = json.loads(json_str)
+    if format == 'json':
+        return _get_profile_report(context)
+    
+    # Structured data comes straight from Rust (no JSON round-trip)
+    data = _get_profile_report_dict(context)
     
     if format == 'dict':
         return data
-    elif format == 'json':
-        return json_str
     
     # Text formatting
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"COREPY PROFILE REPORT (Total: {data['total_time_ms']:.2f}ms)")
+    header = [
+        "=" * 80,
+        f"COREPY PROFILE REPORT (Total: {data['total_time_ms']:.2f}ms)",
+    ]
     if context:
-        lines.append(f"Context: {context}")
-    lines.append("=" * 80)
-    lines.append(f"{'Operation':<20} {'Count':<8} {'Total(ms)':<10} {'Avg(ms)':<10} {'%':<6} {'Backend'}")
-    lines.append("-" * 80)
+        header.append(f"Context: {context}")
+    header += [
+        "=" * 80,
+        f"{'Operation':<20} {'Count':<8} {'Total(ms)':<10} {'Avg(ms)':<10} {'%':<6} {'Backend'}",
+        "-" * 80,
+    ]
     
     ops = list(data.get('operations', {}).values())
     # Sort by total time descending
-    ops.sort(key=lambda x: x.get('total_time_ms', 0), reverse=True)
+    ops.sort(key=_total_time_getter, reverse=True)
     
-    for op in ops:
-        name = op['operation']
-        count = op['count']
-        total = op['total_time_ms']
-        avg = op['avg_time_ms']
-        percent = op.get('percent_total', 0.0)
-        backend = op.get('primary_backend', 'unknown')
-        
-        lines.append(f"{name:<20} {count:<8} {total:<10.2f} {avg:<10.3f} {percent:<6.1f} {backend}")
-        
-    lines.append("=" * 80)
-    return "\n".join(lines)
+    rows = [
+        f"{name:<20} {count:<8} {total:<10.2f} {avg:<10.3f} "
+        f"{op.get('percent_total', 0.0):<6.1f} {op.get('primary_backend', 'unknown')}"
+        for op in ops
+        for name, count, total, avg in (_row_getter(op),)
+    ]
+    
+    # @profile_operation functions: their time includes the ops above
+    functions = sorted(data.get('functions', {}).values(), key=_total_time_getter, reverse=True)
+    if functions:
+        rows += [
+            "-" * 80,
+            f"{'Function':<20} {'Count':<8} {'Total(ms)':<10} {'Avg(ms)':<10}",
+            "-" * 80,
+        ]
+        rows += [
+            f"{fn['function']:<20} {fn['count']:<8} {fn['total_time_ms']:<10.2f} {fn['avg_time_ms']:<10.3f}"
+            for fn in functions
+        ]
+    
+    return "\n".join(header + rows + ["=" * 80])
 
 
 def export_profile(filename: str, format: str = 'json', context: Optional[str] = None):
@@ -133,13 +219,12 @@ def export_profile(filename: str, format: str = 'json', context: Optional[str] =
             return
             
         keys = ['operation', 'count', 'total_time_ms', 'avg_time_ms', 'min_time_ms', 'max_time_ms', 'primary_backend', 'percent_total']
+        getter = itemgetter(*keys)
         with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            for op in ops:
-                # Filter keys
-                row = {k: op.get(k, 0) for k in keys}
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            # Rows as tuples in column order (no per-row dict building)
+            writer.writerows(getter(op) for op in ops)
                 
     elif format == 'flamegraph':
         # Speedscope format
@@ -155,30 +240,39 @@ def export_profile(filename: str, format: str = 'json', context: Optional[str] =
         pass
 
 def _convert_to_speedscope(report):
-    """Convert report to speedscope format (simplified)."""
+    """Convert report to speedscope's evented-profile format."""
     # Note: Real flamegraphs need hierarchy support in Rust profiler.
-    # For now, we visualize flat profile as a single stack frame per op.
-    
-    start_time = 0.0
+    # For now, we visualize flat profile as a single stack frame per op,
+    # laid out back to back on a synthetic timeline.
+    frames = []
+    frame_index = {}
     events = []
+    at = 0.0
     
     for op_name, op_data in report.get('operations', {}).items():
-        # Fake a simplified timeline
-        duration = op_data['total_time_ms']
-        events.append({
-            "type": "O", # Open
-            "frame": events.index({"name": op_name}) if {"name": op_name} in events else len(events), # This logic is buggy, fix frame index
-            "at": start_time
-        })
-        start_time += duration
-        # ... this requires a proper frame definition
-        # Use simple structure for now
+        idx = frame_index.get(op_name)
+        if idx is None:
+            idx = frame_index[op_name] = len(frames)
+            frames.append({"name": op_name})
+        
+        events.append({"type": "O", "frame": idx, "at": at})
+        at += op_data['total_time_ms']
+        events.append({"type": "C", "frame": idx, "at": at})
     
-    # Placeholder for valid internal structure:
-    # Speedscope requires a specific schema.
-    # Without full call stack data from Rust, we can't generate true flamegraphs yet.
-    # We will export a generic JSON compatible with speedscope if possible or just raw JSON.
-    return report # Fallback
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "evented",
+            "name": "corepy",
+            "unit": "milliseconds",
+            "startValue": 0.0,
+            "endValue": at,
+            "events": events,
+        }],
+        "name": "corepy profile",
+        "exporter": "corepy",
+    }
 
 
 class ProfileContext:
@@ -188,49 +282,147 @@ class ProfileContext:
     Usage:
         with ProfileContext("my_section"):
             expensive_operation()
+    
+    Contexts nest: leaving one restores the enclosing context, and a
+    context's report includes the ops of the contexts nested in it. Ops
+    inside a context are buffered per thread and merged into the shared
+    profile when the thread leaves its outermost context.
     """
     def __init__(self, name: str):
         self.name = name
-        self.prev_context = None
+        self._outer: List[Optional[str]] = []
 
     def __enter__(self):
-        # Set thread-local context in Rust
-        _set_profile_context(self.name)
+        # Push onto this thread's context stack in Rust
+        _push_profile_context(self.name)
+        self._outer.append(_state.context)
+        _state.context = self.name
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Clear context
-        _set_profile_context(None)
+        _pop_profile_context()
+        _state.context = self._outer.pop()
 
 
 def profile_operation(func):
     """
     Decorator to profile a specific Python function.
+    
+    Each call adds to the function's count and total time, reported under
+    'functions' rather than 'operations': that time already includes the
+    corepy ops the function runs, so it takes no share of their total.
+    Those ops are attributed to a context named after the function, nested
+    in (and rolled up into) the caller's context. The name is interned to
+    an op id once, here; a call then costs two clock reads and one FFI
+    call, and nothing beyond a flag check while profiling is disabled.
     """
+    name = func.__name__
+    op_id = _profile_op_id(name)
+    # Closure cells, not default arguments: those would take over callers'
+    # keyword arguments of the same names
+    clock = time.perf_counter_ns
+    record = _profile_record
+    push = _push_profile_context
+    pop = _pop_profile_context
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        ctx_name = func.__name__
-        with ProfileContext(ctx_name):
+        if not _profiling_active:
             return func(*args, **kwargs)
+        push(name)
+        outer = _state.context
+        _state.context = name
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            _state.context = outer
+            pop()
+            record(op_id, elapsed)
     return wrapper
 
+def _profile_arrays(context: Optional[str] = None):
+    """
+    Fetch per-operation metrics as a struct-of-arrays.
+
+    Returns (names, counts, totals_ms, avgs_ms, percents) where names is a
+    list and the rest are numpy arrays in the same order.
+    """
+    import numpy as np
+    
+    names, counts, totals, avgs, percents = _get_profile_report_arrays(context)
+    return (
+        names,
+        np.array(counts, dtype=np.int64),
+        np.array(totals, dtype=np.float64),
+        np.array(avgs, dtype=np.float64),
+        np.array(percents, dtype=np.float64),
+    )
+
+
+# Suggestion per operation for detect_bottlenecks (looked up, not built per row)
+_BOTTLENECK_SUGGESTIONS = {
+    "matmul": "Batch small matmuls or move them to a GPU backend",
+    "dot_product": "Batch small products into one matmul",
+    "add": "Fuse element-wise chains with cp.fuse()",
+    "sub": "Fuse element-wise chains with cp.fuse()",
+    "mul": "Fuse element-wise chains with cp.fuse()",
+    "div": "Fuse element-wise chains with cp.fuse()",
+    "sum": "Hoist repeated reductions out of loops, or use cp.reduce_stats",
+    "mean": "Hoist repeated reductions out of loops, or use cp.reduce_stats",
+}
+_DEFAULT_SUGGESTION = "Check input size or switch backend"
+
+
 # Stub for analysis functions (will be implemented in analysis.py but exposed here)
 def detect_bottlenecks(threshold: float = 0.20) -> List[Dict[str, Any]]:
-    """Detect operations taking more than {threshold} of total time."""
-    report = profile_report(format='dict')
+    """
+    Detect operations taking more than {threshold} of total time.
+    
+    Bottlenecks come slowest first. They are followed by one "HINT" entry
+    per reduction that was called at least _INVARIANT_CALL_THRESHOLD times
+    on the same unchanged tensor within one context (e.g. ``data.mean()``
+    inside a loop over something else).
+    """
+    import numpy as np
+    
+    names, _counts, totals, _avgs, percents = _profile_arrays()
+    
+    # Select and rank on the arrays; dicts are built for the result rows only
+    fractions = percents / 100.0
+    selected = np.flatnonzero(fractions > threshold)
+    selected = selected[np.argsort(-fractions[selected], kind="stable")]
+    
     bottlenecks = []
+    for i in selected:
+        name = names[i]
+        bottlenecks.append({
+            "operation": name,
+            "percent_total": float(percents[i]),
+            "time_ms": float(totals[i]),
+            "severity": "CRITICAL" if fractions[i] > 0.5 else "HIGH",
+            "reason": f"Takes {percents[i]:.1f}% of execution time",
+            "suggestion": _BOTTLENECK_SUGGESTIONS.get(name, _DEFAULT_SUGGESTION),
+        })
     
-    ops = report.get('operations', {}).values()
-    for op in ops:
-        percent = op.get('percent_total', 0.0) / 100.0
-        if percent > threshold:
+    with _hints_lock:
+        hints = list(_invariant_hints.items())
+    if hints:
+        rows = {name: i for i, name in enumerate(names)}
+        for (context, op, _version), calls in hints:
+            i = rows.get(op)
+            where = f" in context '{context}'" if context is not None else ""
             bottlenecks.append({
-                "operation": op['operation'],
-                "percent_total": op['percent_total'],
-                "time_ms": op['total_time_ms'],
-                "severity": "CRITICAL" if percent > 0.5 else "HIGH",
-                "reason": f"Takes {percent*100:.1f}% of execution time",
-                "suggestion": "Check input size or switch backend"
+                "operation": op,
+                "percent_total": float(percents[i]) if i is not None else 0.0,
+                "time_ms": float(totals[i]) if i is not None else 0.0,
+                "severity": "HINT",
+                "reason": (
+                    f"Invariant call detected: {op}() ran "
+                    f"{calls}x on an unchanged tensor{where}"
+                ),
+                "suggestion": f"Compute {op}() once and reuse the result",
             })
     return bottlenecks
 
@@ -254,23 +446,28 @@ def get_recommendations() -> List[Dict[str, Any]]:
 
 def detect_regressions(baseline: Dict[str, Any], threshold: float = 1.2) -> List[Dict[str, Any]]:
     """Compare current profile against a baseline."""
-    current = profile_report(format='dict')
+    import numpy as np
+    
+    names, _counts, _totals, curr_times, _percents = _profile_arrays()
+    base_ops = baseline.get('operations', {})
     regressions = []
     
-    for op_name, curr_op in current.get('operations', {}).items():
-        if op_name in baseline.get('operations', {}):
-            base_op = baseline['operations'][op_name]
-            base_time = base_op['avg_time_ms']
-            curr_time = curr_op['avg_time_ms']
-            
-            if base_time > 0 and curr_time / base_time > threshold:
-                regressions.append({
-                    "operation": op_name,
-                    "baseline_ms": base_time,
-                    "actual_ms": curr_time,
-                    "slowdown_factor": curr_time / base_time,
-                    "causes": ["Increased data size", "Change in algorithm"]
-                })
+    # Ops missing from the baseline get NaN and drop out of the comparison
+    base_times = np.array(
+        [base_ops[n]['avg_time_ms'] if n in base_ops else np.nan for n in names],
+        dtype=np.float64,
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = curr_times / base_times
+    
+    for i in np.flatnonzero((base_times > 0) & (ratios > threshold)):
+        regressions.append({
+            "operation": names[i],
+            "baseline_ms": float(base_times[i]),
+            "actual_ms": float(curr_times[i]),
+            "slowdown_factor": float(ratios[i]),
+            "causes": ["Increased data size", "Change in algorithm"]
+        })
     return regressions
 
 def compute_stats(data, metrics: List[str]):
@@ -0,0 +1,126 @@
+"""
+Op recording for batched kernel launches.
+
+Inside ``with corepy.batch():`` element-wise CPU ops on float32 tensors
+(``+ - * /`` with a tensor or a scalar) are recorded instead of run, and
+return placeholder tensors. When the block exits, the recorded graph runs in
+a single call into the Rust runtime, so loops over small tensors pay the
+Python/Rust crossing once instead of once per operator.
+
+Reading a placeholder's data inside the block computes that value on the
+spot; everything still pending runs together at exit.
+
+``with corepy.fuse():`` records the same way but compiles each chain into one
+fused loop instead (see corepy.ops._fusion), and ``corepy.batched(fn, n)``
+records ``fn`` once and replays its compiled chain ``n`` times.
+"""
+
+import threading
+from typing import Any, Callable, List, Optional
+
+_state = threading.local()
+
+
+def active_graph() -> Optional[List[Any]]:
+    """Node list of the batch being recorded on this thread, or None."""
+    return getattr(_state, "graph", None)
+
+
+def fusing() -> bool:
+    """Whether the batch being recorded on this thread is a ``fuse()`` block."""
+    return getattr(_state, "fused", False)
+
+
+class batch:
+    """
+    Context manager that records element-wise ops and launches them together.
+
+    Nested blocks join the outermost one. If the block raises, the recorded
+    ops are not launched; their placeholders still compute on first use.
+
+    Example:
+        >>> with corepy.batch():
+        ...     y = (a + b) * 2.0 - c
+        >>> y.sum()  # graph already executed at block exit
+    """
+
+    def __init__(self):
+        self._nodes: Optional[List[Any]] = None
+
+    def __enter__(self) -> "batch":
+        if active_graph() is None:
+            self._nodes = _state.graph = []
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        nodes = self._nodes
+        if nodes is None:
+            return # Nested block: the outer one launches
+        self._nodes = _state.graph = None
+        if exc_type is None and nodes:
+            from .tensor import _execute_graph
+            _execute_graph(nodes)
+
+
+class fuse(batch):
+    """
+    Context manager that records element-wise ops for fused execution.
+
+    Ops are recorded as in ``batch()``, but nothing is launched at exit.
+    Each pending value is computed on first use by one Numba-compiled loop
+    that evaluates its whole chain, and ``.sum()`` of a pending value folds
+    the reduction into that loop, so intermediates are never written.
+    Kernels are compiled once per distinct chain and cached on disk.
+    Without Numba, or for chains shorter than
+    ``corepy.ops._fusion.MIN_FUSED_ELEMENTS``, the chain runs one kernel
+    per op.
+
+    Nested blocks join the outermost one (a ``fuse()`` inside ``batch()``
+    records into the batch).
+
+    Example:
+        >>> with corepy.fuse():
+        ...     loss = (data * 2.0 + 1.0 - data).sum()  # one kernel
+    """
+
+    def __enter__(self) -> "fuse":
+        if active_graph() is None:
+            self._nodes = _state.graph = []
+            _state.fused = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._nodes is None:
+            return # Nested block: the outer one owns the recording
+        self._nodes = _state.graph = None
+        _state.fused = False
+
+
+def batched(fn: Callable[[], Any], iters: int) -> Any:
+    """
+    Run ``fn()`` ``iters`` times and return the last result.
+
+    The first call runs inside ``fuse()``. When it returns a pending
+    element-wise chain, the remaining iterations replay that chain's
+    compiled kernel into one output buffer instead of re-running ``fn``'s
+    Python body, so each costs one native call and no per-op dispatch.
+    Otherwise (no Numba, a result that is not a pending chain, too little
+    work to pay for a compiled kernel, or profiling enabled, which keeps
+    ops eager) ``fn`` is simply called ``iters`` times.
+
+    The replay reads the inputs ``fn`` used on its first call, so ``fn``
+    should not depend on state that changes between iterations.
+
+    Example:
+        >>> temp = corepy.batched(lambda: data + 1.0, 100)
+    """
+    if iters <= 0:
+        return None
+    with fuse():
+        result = fn()
+    from .tensor import _replay_fused
+    if _replay_fused(result, iters):
+        return result
+    for _ in range(iters - 1):
+        result = fn()
+    return result
@@ -1,19 +1,270 @@
+import array as _array
+import itertools
 import logging
 from collections.abc import Sequence
+from math import prod
 from typing import Any, Optional, Tuple, Union
 
+import numpy as np
+
+from .backend.dispatch import Dispatcher, dispatch_kernel
 from .backend.errors import BackendError
-from .backend.selector import select_backend
+from .backend.selector import select_backend_cached
 from .backend.session import get_session
-from .backend.types import BackendType, DataType, OperationProperties, OperationType
+from .backend.types import BackendType, DataType, OperationType
+from .profiler import core as _profiler_core
+from . import recording as _recording
 
 logger = logging.getLogger("corepy.tensor")
 
+# Rust runtime, bound once at import instead of per op (None if not built)
+try:
+    from . import _corepy_rust as _ffi
+except ImportError:
+    _ffi = None
+
+# Optional: ml_dtypes gives bfloat16 arrays a real NumPy dtype. Without it
+# they are stored as uint16 bit patterns (identical memory layout).
+try:
+    import ml_dtypes as _ml_dtypes
+    _BF16_STORAGE = np.dtype(_ml_dtypes.bfloat16)
+except ImportError:
+    _BF16_STORAGE = np.dtype(np.uint16)
+
+
+# ----------------------------------------------------------------------------
+# Input normalization for Tensor.__init__
+# Each helper returns (shape, element_count, backing_data).
+# ----------------------------------------------------------------------------
+
+# NumPy dtype for each DataType. Prebuilt dtype objects, not names: NumPy
+# parses a dtype string on every asarray()/comparison that receives one.
+_FLOAT32 = np.dtype(np.float32)
+_NUMPY_DTYPES = {
+    DataType.FLOAT32: _FLOAT32,
+    DataType.FLOAT64: np.dtype(np.float64),
+    DataType.INT32: np.dtype(np.int32),
+    DataType.INT64: np.dtype(np.int64),
+    DataType.INT8: np.dtype(np.int8),
+    DataType.BOOL: np.dtype(np.bool_),
+}
+
+def _init_from_sequence(data, dtype):
+    if dtype == DataType.BOOL:
+        arr = _bool_list_to_array(data)
+        if arr is not None:
+            return arr.shape, arr.size, arr
+    
+    # Fast path: rectangular numeric lists convert in one C-level call, and
+    # every later op can take the zero-copy ndarray path.
+    try:
+        arr = np.asarray(data, dtype=_NUMPY_DTYPES.get(dtype, _FLOAT32))
+    except (ValueError, TypeError):
+        pass # Ragged or non-numeric: keep the list as-is
+    else:
+        if dtype == DataType.BFLOAT16:
+            arr = _f32_to_bf16(arr)
+        return arr.shape, arr.size, arr
+    
+    # Recursive shape detection
+    shape = []
+    curr = data
+    while isinstance(curr, (list, tuple)) and len(curr) > 0:
+        shape.append(len(curr))
+        curr = curr[0]
+    shape = tuple(shape)
+    return shape, prod(shape), data
+
+def _bool_list_to_array(data):
+    """
+    Flat list of bools / small ints as a bool array, or None if not applicable.
+
+    bytearray() packs such a list in a tight C loop, about 3x faster than
+    NumPy's generic per-item conversion. Nested or non-integer items (and
+    ints outside 0..255) make it refuse.
+    """
+    try:
+        buf = bytearray(data)
+    except (TypeError, ValueError):
+        return None
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    if buf.count(0) + buf.count(1) != len(buf):
+        return arr != 0 # Other ints: normalize to 0/1 like np.asarray(..., bool)
+    return arr.view(np.bool_)
+
+def _flatten_nested(data):
+    """Yield the leaves of arbitrarily (and raggedly) nested lists/tuples in order."""
+    stack = [iter(data)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (list, tuple)):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
+
+def _init_from_bytes(data, dtype):
+    return (len(data),), len(data), data
+
+def _init_from_memoryview(data, dtype):
+    return data.shape, prod(data.shape), data
+
+def _init_from_array(data, dtype):
+    # array.array is always flat and contiguous; kept as-is (no NumPy copy)
+    return (len(data),), len(data), data
+
+def _init_from_other(data, dtype):
+    if isinstance(data, (list, tuple)):
+        return _init_from_sequence(data, dtype)
+    elif isinstance(data, (bytes, bytearray)):
+        return _init_from_bytes(data, dtype)
+    elif isinstance(data, memoryview):
+        return _init_from_memoryview(data, dtype)
+    elif isinstance(data, _array.array):
+        return _init_from_array(data, dtype)
+    elif isinstance(data, Tensor):
+        # Share the other tensor's data (its shape is already known); it can
+        # no longer be written in place
+        data._owns_data = False
+        return data._shape, data._element_count, data._backing_data
+    elif hasattr(data, 'shape'): # numpy compatibility
+        return data.shape, data.size, data
+    elif hasattr(data, '__array_interface__'):
+        # Foreign array exporter: np.asarray wraps the exported pointer
+        # without copying and keeps `data` alive as the view's base
+        arr = np.asarray(data)
+        return arr.shape, arr.size, arr
+    else:
+        try:
+            view = memoryview(data)  # Any other buffer exporter (ctypes arrays, ...)
+        except TypeError:
+            # scalar or error
+            return (1,), 1, [data]
+        return _init_from_memoryview(view, dtype)
+
+def _f32_to_bf16(values) -> np.ndarray:
+    """Round float32 values to bfloat16 (nearest-even), in _BF16_STORAGE."""
+    f32 = np.ascontiguousarray(values, dtype=np.float32)
+    bits = f32.view(np.uint32)
+    rounded = (bits + (0x7FFF + ((bits >> 16) & 1))) >> 16
+    # NaN: truncate and keep it quiet instead of rounding into Inf
+    rounded = np.where(np.isnan(f32), (bits >> 16) | 0x40, rounded)
+    return rounded.astype(np.uint16).view(_BF16_STORAGE)
+
+def _bf16_to_f32(values) -> np.ndarray:
+    """Widen bfloat16 values (any 2-byte storage) to float32 exactly."""
+    bits = np.ascontiguousarray(values).view(np.uint16)
+    return (bits.astype(np.uint32) << 16).view(np.float32)
+
+# NumPy dtype for each FFI buffer code used by _get_buffer_pointer
+_BUFFER_DTYPES = {
+    'u1': np.dtype(np.uint8),
+    'f4': _FLOAT32,
+    'i4': np.dtype(np.int32),
+    'i1': np.dtype(np.int8),
+    'b2': np.dtype(np.uint16),
+}
+
+# Result dtype of sum() where it differs from the input: bfloat16 is
+# accumulated in float32, int8 is summed exactly into int64
+_SUM_DTYPES = {
+    DataType.BFLOAT16: DataType.FLOAT32,
+    DataType.INT8: DataType.INT64,
+}
+
+# FFI buffer code used when a tensor of each DataType is viewed as an ndarray
+_DTYPE_BUFFER_CODES = {
+    DataType.FLOAT32: 'f4',
+    DataType.INT32: 'i4',
+    DataType.INT8: 'i1',
+    DataType.BOOL: 'u1',
+    DataType.BFLOAT16: 'b2',
+}
+
+# array.array typecodes matching those FFI buffer codes (read without NumPy)
+_ARRAY_TYPECODES = {'u1': 'B', 'f4': 'f', 'i4': 'i', 'i1': 'b'}
+_ARRAY_TYPECODES_INV = {code: char for char, code in _ARRAY_TYPECODES.items()}
+
+def _bind_elementwise(name_format):
+    """{op: Rust entry point} for add/sub/mul/div, resolved once at import."""
+    if _ffi is None:
+        return {}
+    return {op: getattr(_ffi, name_format.format(op)) for op in ("add", "sub", "mul", "div")}
+
+# Element-wise FFI kernels by op name: one dict lookup per call instead of
+# an if/elif chain on the op string or a getattr on a formatted name
+_BINARY_F32 = _bind_elementwise("tensor_{}_f32")
+_SCALAR_F32 = _bind_elementwise("tensor_{}_scalar_f32")
+_BINARY_BF16 = _bind_elementwise("tensor_{}_bf16")
+# Strided (non-contiguous) inputs
+_STRIDED_F32 = _bind_elementwise("tensor_{}_strided_f32")
+
+# matmul shapes up to this m*k*n use the single-threaded small kernel, whose
+# fixed cost is far below the blocked/BLAS path (mirrors SMALL_MATMUL_VOLUME in Rust)
+_SMALL_MATMUL_VOLUME = 32 * 32 * 32
+
+# Source of Tensor._version values (see Tensor._profile_version)
+_VERSIONS = itertools.count(1)
+
+def _coalesce_axes(shape, strides_a, strides_b):
+    """
+    Merge adjacent axes that are laid out contiguously in both operands.
+
+    Strides are in elements. Size-1 axes are dropped, so a C-contiguous pair
+    collapses to one axis and a transposed 2-D view stays two-dimensional.
+    Returns (shape, strides_a, strides_b) as lists with at least one axis.
+    """
+    out_shape, out_a, out_b = [], [], []
+    for n, sa, sb in zip(shape, strides_a, strides_b):
+        if n == 1:
+            continue
+        if out_shape and out_a[-1] == sa * n and out_b[-1] == sb * n:
+            out_shape[-1] *= n
+            out_a[-1], out_b[-1] = sa, sb
+        else:
+            out_shape.append(n)
+            out_a.append(sa)
+            out_b.append(sb)
+    if not out_shape:
+        return [1], [1], [1]
+    return out_shape, out_a, out_b
+
+def _resolve_backend_request(device, backend):
+    """Map Tensor's device/backend arguments to a BackendType (None = automatic)."""
+    if device:
+        if "cuda" in device or "gpu" in device:
+            return BackendType.GPU
+        elif "cpu" in device:
+            return BackendType.CPU
+        return None
+    elif backend:
+        if isinstance(backend, str):
+            return BackendType(backend.lower())
+        return backend
+    return None
+
+_INIT_DISPATCH = {
+    list: _init_from_sequence,
+    tuple: _init_from_sequence,
+    bytes: _init_from_bytes,
+    bytearray: _init_from_bytes,
+    memoryview: _init_from_memoryview,
+    _array.array: _init_from_array,
+}
+
+
 class Tensor:
     """
     A multi-dimensional array object that automatically selects the best
     execution backend (CPU/GPU) based on data size and operation complexity.
     """
+    __slots__ = (
+        "_dtype", "_shape", "_element_count", "_backing_data",
+        "_backend_type", "_device", "_mean_fn", "_buffers", "_is_contiguous",
+        "_version", "_owns_data",
+    )
+
     def __init__(
         self, 
         data: Union[Sequence[Any], 'Tensor'], 
@@ -25,7 +276,9 @@ class Tensor:
         Initialize a Tensor.
 
         Args:
-            data: Input data (list, tuple, or another Tensor).
+            data: Input data (list, tuple, another Tensor, or any object
+                  exposing __array_interface__ / the buffer protocol; array
+                  inputs are wrapped without copying).
             dtype: Data type (default: float32).
             backend: Explicitly requested backend ('cpu', 'gpu').
             device: Explicit device string (e.g. 'cuda:0', 'cpu').
@@ -33,93 +286,93 @@ class Tensor:
         """
         self._dtype = dtype
         
-        # Determine shape and element count (simplified for this implementation)
-        # In a real impl, we'd recursively check list depth/lengths
-        # Determine shape and element count
-        if isinstance(data, (list, tuple)):
-            # Recursive shape detection
-            shape = []
-            curr = data
-            while isinstance(curr, (list, tuple)) and len(curr) > 0:
-                shape.append(len(curr))
-                curr = curr[0]
-            
-            self._shape = tuple(shape)
-            # Calculate element count
-            count = 1
-            for dim in self._shape: count *= dim
-            self._element_count = count
-            self._backing_data = data
-        elif isinstance(data, (bytes, bytearray)):
-            self._shape = (len(data),)
-            self._element_count = len(data)
-            self._backing_data = data
-        elif isinstance(data, memoryview):
-            self._shape = data.shape
-            # Calculate size for ND memoryview
-            size = 1
-            for dim in data.shape: size *= dim
-            self._element_count = size
-            self._backing_data = data
-        elif hasattr(data, 'shape'): # numpy compatibility
-             self._shape = data.shape
-             self._element_count = data.size
-             self._backing_data = data
+        # Determine shape and element count (exact-type lookup first; the
+        # isinstance ladder only runs for subclasses, arrays and scalars)
+        init = _INIT_DISPATCH.get(type(data), _init_from_other)
+        self._shape, self._element_count, self._backing_data = init(data, dtype)
+        # Contiguity is fixed at construction, so the FFI hot path checks a
+        # bool instead of the ndarray flags object (non-arrays report True)
+        flags = getattr(self._backing_data, 'flags', None)
+        self._is_contiguous = flags is None or bool(flags.c_contiguous)
+
+        requested_backend = _resolve_backend_request(device, backend)
+
+        if requested_backend is not None:
+            # Explicit device/backend wins (select_backend would return it
+            # verbatim), so skip the policy entirely
+            self._backend_type = requested_backend
         else:
-            # scalar or error
-            self._shape = (1,)
-            self._element_count = 1
-            self._backing_data = [data]
-
-        # Resolve requested backend/device
-        requested_backend = None
-        if device:
-            if "cuda" in device or "gpu" in device:
-                requested_backend = BackendType.GPU
-            elif "cpu" in device:
-                requested_backend = BackendType.CPU
-        elif backend:
-            if isinstance(backend, str):
-                requested_backend = BackendType(backend.lower())
-            else:
-                requested_backend = backend
-
-        # Select Backend
-        # We classify Creation as MEMORY_BOUND or SCALAR usually, 
-        # but the meaningful decision happens for subsequent ops.
-        # However, we must decide where to allocations *now*. 
-        # Let's assume creation is MEMORY_BOUND.
-        op_props = OperationProperties(
-            element_count=self._element_count,
-            shape=self._shape,
-            # Approximating bytes: len * 4 bytes for float32
-            dtype_bytes=4 
-        )
-        
-        # We treat 'allocation' as a memory operation.
-        # However, for 'Correctness-First', we usually default to CPU for storage 
-        # unless explicitly told otherwise or if we are consuming GPU data.
-        # BUT, the goal is "Tensor(data) # auto". 
-        # So we should check if this data is "large enough" to justify GPU storage?
-        # Usually, just storing is not compute. So auto-placement should default CPU 
-        # unless immediate heavy compute is expected? 
-        # Actually, "Tensor(data)" usually implies "Ready for compute".
-        # Let's use COMPUTE_VECTOR as a proxy for "Will I use this for compute?" 
-        # to see if it qualifies for GPU memory residence.
-        # This is a heuristic. Stronger approach: Default CPU, move on demand.
-        # But per requirements: "Core Principles: Small data -> CPU always wins".
-        
-        session = get_session()
-        self._backend_type = select_backend(
-            OperationType.COMPUTE_VECTOR, # Probe: "If I treated this as a compute vector, where would it go?"
-            op_props,
-            session.device_info,
-            requested_backend=requested_backend
-        )
+            # Select Backend
+            # We classify Creation as MEMORY_BOUND or SCALAR usually, 
+            # but the meaningful decision happens for subsequent ops.
+            # However, we must decide where to allocations *now*. 
+            # Let's assume creation is MEMORY_BOUND.
+            # (Approximating bytes: len * 4 bytes for float32, the cached
+            # selector's default dtype_bytes.)
+
+            # We treat 'allocation' as a memory operation.
+            # However, for 'Correctness-First', we usually default to CPU for storage 
+            # unless explicitly told otherwise or if we are consuming GPU data.
+            # BUT, the goal is "Tensor(data) # auto". 
+            # So we should check if this data is "large enough" to justify GPU storage?
+            # Usually, just storing is not compute. So auto-placement should default CPU 
+            # unless immediate heavy compute is expected? 
+            # Actually, "Tensor(data)" usually implies "Ready for compute".
+            # Let's use COMPUTE_VECTOR as a proxy for "Will I use this for compute?" 
+            # to see if it qualifies for GPU memory residence.
+            # This is a heuristic. Stronger approach: Default CPU, move on demand.
+            # But per requirements: "Core Principles: Small data -> CPU always wins".
+
+            session = get_session()
+            self._backend_type = select_backend_cached(
+                OperationType.COMPUTE_VECTOR, # Probe: "If I treated this as a compute vector, where would it go?"
+                self._element_count,
+                self._shape,
+                session.device_info,
+            )
         self._device = device
+        # Resolved on first mean() call; see _resolve_mean()
+        self._mean_fn = None
+        # dtype_char -> (ptr, count, array) resolved by _get_buffer_pointer
+        self._buffers = {}
+        # Set by _from_output (see _inplace_op)
+        self._owns_data = False
         
         logger.debug(f"Tensor created on {self._backend_type}. Shape={self._shape}")
 
+    @staticmethod
+    def _from_scalar(value: Any, dtype: DataType, backend: BackendType) -> 'Tensor':
+        """
+        Wrap a reduction result as a shape-(1,) NumPy-backed Tensor.
+
+        Skips __init__: a single value needs no input normalization or
+        backend selection, and the result stays on the producing backend.
+        """
+        t = object.__new__(Tensor)
+        t._dtype = dtype
+        t._shape = (1,)
+        t._element_count = 1
+        t._backing_data = np.array([value], dtype=_NUMPY_DTYPES.get(dtype, _FLOAT32))
+        t._backend_type = backend
+        t._device = None
+        t._mean_fn = None
+        t._buffers = {}
+        t._is_contiguous = True
+        t._owns_data = False
+        return t
+
+    @staticmethod
+    def _from_output(arr: Any, dtype: DataType, backend: BackendType) -> 'Tensor':
+        """
+        Wrap an op result array from the session's get_output_buffer().
+
+        The tensor owns it: nothing outside corepy holds the array yet, so
+        ``x op= y`` may overwrite it (see _inplace_op).
+        """
+        t = Tensor(arr, dtype=dtype, backend=backend)
+        t._owns_data = True
+        return t
+
     @property
     def backend(self) -> BackendType:
         return self._backend_type
@@ -134,35 +387,184 @@ class Tensor:
         Arguments:
             device: 'cpu' or 'gpu'
         """
-        # Create a new Tensor with explicit backend
+        target = _resolve_backend_request(device, None)
+        if target is None:
+            # Unrecognized device string: let the selector place it
+            self._owns_data = False
+            return Tensor(self._backing_data, dtype=self._dtype, device=device)
+        if target == self._backend_type and (device == self._device or target == BackendType.CPU):
+            # Already there: no new object, no copy
+            return self
+        
+        # New Tensor on the explicit backend, reusing the known shape
         # In real impl, we would copy data buffer
-        return Tensor(self._backing_data, dtype=self._dtype, device=device)
+        self._owns_data = False
+        t = object.__new__(Tensor)
+        t._dtype = self._dtype
+        t._shape = self._shape
+        t._element_count = self._element_count
+        t._backing_data = self._backing_data
+        t._backend_type = target
+        t._device = device
+        t._mean_fn = None
+        t._buffers = dict(self._buffers)
+        t._is_contiguous = self._is_contiguous
+        t._owns_data = False
+        return t
+
+    def _as_ndarray(self) -> Any:
+        """
+        This tensor's data as an ndarray of its shape, without copying when possible.
+
+        NumPy-backed tensors return their array; other backings go through
+        the (cached) _get_buffer_pointer conversion for the tensor's dtype.
+        """
+        data = self._backing_data
+        if isinstance(data, np.ndarray):
+            return data
+        _ptr, count, arr = self._get_buffer_pointer(_DTYPE_BUFFER_CODES.get(self._dtype, 'f4'))
+        if not isinstance(arr, np.ndarray):
+            arr = np.frombuffer(arr, dtype=_BUFFER_DTYPES[_ARRAY_TYPECODES_INV[arr.typecode]])
+        return arr.reshape(self._shape) if count == self._element_count else arr
+
+    @property
+    def __array_interface__(self) -> dict:
+        """NumPy array interface: np.asarray(tensor) is a zero-copy view of its data."""
+        self._owns_data = False # The view must not see later in-place ops
+        return self._as_ndarray().__array_interface__
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> Any:
+        self._owns_data = False
+        arr = self._as_ndarray()
+        if dtype is not None and arr.dtype != dtype:
+            if copy is False:
+                raise ValueError(f"Cannot view {arr.dtype} tensor data as {np.dtype(dtype)} without a copy")
+            return arr.astype(dtype)
+        return arr.copy() if copy else arr
+
+    def to_bf16(self) -> 'Tensor':
+        """
+        Copy of this tensor stored as bfloat16 (2 bytes per element).
+
+        Element-wise ops between bfloat16 tensors run in dedicated kernels that
+        move half the bytes of float32, which pays off on large memory-bound
+        ops; values keep ~3 significant digits. Reductions widen to float32.
+        """
+        if self._dtype == DataType.BFLOAT16:
+            return self
+        data = _f32_to_bf16(self._as_ndarray()).reshape(self._shape)
+        return Tensor(data, dtype=DataType.BFLOAT16, backend=self._backend_type)
+
+    def to_float32(self) -> 'Tensor':
+        """Copy of this tensor stored as float32 (returns self if it already is)."""
+        if self._dtype == DataType.FLOAT32:
+            return self
+        arr = self._as_ndarray()
+        if self._dtype == DataType.BFLOAT16:
+            data = _bf16_to_f32(arr).reshape(self._shape)
+        else:
+            data = np.asarray(arr, dtype=np.float32)
+        return Tensor(data, dtype=DataType.FLOAT32, backend=self._backend_type)
 
     def __repr__(self):
         return f"Tensor({self._backing_data}, backend='{self._backend_type.value}')"
 
     def __add__(self, other: Any) -> 'Tensor':
         """Element-wise addition."""
-        return self._binary_op("add", other)
+        return self._deferrable_op("add", other)
 
     def __sub__(self, other: Any) -> 'Tensor':
         """Element-wise subtraction."""
-        return self._binary_op("sub", other)
+        return self._deferrable_op("sub", other)
 
     def __mul__(self, other: Any) -> 'Tensor':
         """Element-wise multiplication."""
-        return self._binary_op("mul", other)
+        return self._deferrable_op("mul", other)
 
     def __truediv__(self, other: Any) -> 'Tensor':
         """Element-wise division."""
-        return self._binary_op("div", other)
+        return self._deferrable_op("div", other)
+
+    def __iadd__(self, other: Any) -> 'Tensor':
+        """In-place addition when this tensor owns its buffer (see _inplace_op)."""
+        return self._inplace_op("add", other)
+
+    def __isub__(self, other: Any) -> 'Tensor':
+        """In-place subtraction when this tensor owns its buffer."""
+        return self._inplace_op("sub", other)
+
+    def __imul__(self, other: Any) -> 'Tensor':
+        """In-place multiplication when this tensor owns its buffer."""
+        return self._inplace_op("mul", other)
+
+    def __itruediv__(self, other: Any) -> 'Tensor':
+        """In-place division when this tensor owns its buffer."""
+        return self._inplace_op("div", other)
+
+    def _inplace_op(self, op: str, other: Any) -> 'Tensor':
+        """
+        ``x op= y`` written into x's own buffer instead of a new output.
+
+        Done when x owns its float32 buffer: it is an op result that was
+        never exported with np.asarray(), wrapped by another Tensor or used
+        by a pending batch()/fuse() op. y must be a scalar or a same-size
+        float32 CPU tensor. As with NumPy arrays, every reference to x then
+        sees the update. Otherwise, and inside batch()/fuse(), this is the
+        out-of-place op; its result owns its buffer, so in a loop only the
+        first ``x op= y`` allocates. Arrays passed in by the caller are
+        never written.
+        """
+        if (
+            self._owns_data
+            and self._dtype == DataType.FLOAT32
+            and _recording.active_graph() is None
+        ):
+            data = self._backing_data
+            ptr = data.__array_interface__['data'][0]
+            count = data.size
+            if isinstance(other, (int, float)):
+                _SCALAR_F32[op](ptr, float(other), ptr, count)
+                return self._written_in_place()
+            if (
+                isinstance(other, Tensor)
+                and other._backend_type == BackendType.CPU
+                and other._dtype == DataType.FLOAT32
+                and other._element_count == count
+                and count
+            ):
+                ptr_b, _count_b, _ref_b = other._get_buffer_pointer('f4')
+                _BINARY_F32[op](ptr, ptr_b, ptr, count)
+                return self._written_in_place()
+        return self._deferrable_op(op, other)
+
+    def _written_in_place(self) -> 'Tensor':
+        """Drop buffers converted from the old values after an in-place op (the 'f4' one is the data)."""
+        if any(code != 'f4' for code in self._buffers):
+            self._buffers = {}
+        self._version = next(_VERSIONS)
+        return self
+
+    def _profile_version(self) -> int:
+        """
+        Id of this tensor's current contents, for the profiler's invariant-call hints.
+
+        Assigned on first use from a process-wide counter, so a tensor
+        allocated where a freed one lived never inherits its id, and renewed
+        whenever the tensor is written in place.
+        """
+        try:
+            return self._version
+        except AttributeError:
+            version = self._version = next(_VERSIONS)
+            return version
 
     def _get_buffer_pointer(self, dtype_char='u1') -> Tuple[int, int, Any]:
         """
         Extract raw buffer pointer for zero-copy FFI.
         
         Args:
-            dtype_char: NumPy dtype character code ('u1'=uint8, 'f4'=float32, 'i4'=int32)
+            dtype_char: NumPy dtype character code ('u1'=uint8, 'f4'=float32, 'i4'=int32,
+                        'i1'=int8, 'b2'=bfloat16 bit patterns)
         
         Returns:
             tuple: (pointer: int, count: int, buffer_ref: Any)
@@ -171,179 +573,316 @@ class Tensor:
         Raises:
             ValueError: If backing data cannot be converted to buffer
         """
-        import ctypes
-        import numpy as np
+        # Reuse the result of an earlier call: the backing never moves, and
+        # __array_interface__ builds a new dict on every access
+        cached = self._buffers.get(dtype_char)
+        if cached is not None:
+            return cached
+        
+        data = self._backing_data
         
         # Case 1: NumPy array (fastest path)
-        if isinstance(self._backing_data, np.ndarray):
-            array = self._backing_data
-            
-            # SYSTEMS SAFETY CHECK:
-            # We must ensure the array is C-contiguous before extracting the raw pointer.
-            # Passing non-contiguous strides to a dense kernel results in data corruption.
-            if not array.flags['C_CONTIGUOUS']:
-                # Option A: Error
-                # raise ValueError("Non-contiguous arrays not supported yet")
-                
-                # Option B: Safe Copy (Performance Penalty, but Correct)
-                # We log this because hidden copies are a performance pitfall.
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"Copying non-contiguous array (shape={array.shape}) for zero-copy access")
-                
-                array = np.ascontiguousarray(array)
-            
-            # Validate dtype matches request?
-            if dtype_char == 'f4' and array.dtype != np.float32:
-                 pass # TODO: Handle dtype mismatch or define strict rules
-            
-            # __array_interface__ provides (ptr, readonly)
-            ptr = array.__array_interface__['data'][0]
-            count = array.size
-            return (ptr, count, array)
+        if isinstance(data, np.ndarray):
+            array = data
+            contiguous = self._is_contiguous
         
         # Case 2: bytes/bytearray/memoryview (buffer protocol)
-        elif isinstance(self._backing_data, (bytes, bytearray, memoryview)):
-            mv = memoryview(self._backing_data)
-            
-            # Get pointer via ctypes
-            if dtype_char == 'u1':
-                c_type = ctypes.c_uint8
-            elif dtype_char == 'f4':
-                c_type = ctypes.c_float
-            elif dtype_char == 'i4':
-                c_type = ctypes.c_int32
-            else:
-                raise ValueError(f"Unsupported dtype: {dtype_char}")
-            
-            # Cast memoryview to c_type array
-            c_buffer = (c_type * len(mv)).from_buffer(mv)
-            ptr = ctypes.addressof(c_buffer)
-            count = len(mv)
-            
-            return (ptr, count, (mv, c_buffer))
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            # Zero-copy typed view that honors the buffer's format and shape.
+            # The (cached) view holds a buffer export, so the pointer stays valid
+            array = np.asarray(memoryview(data))
+            contiguous = array.flags['C_CONTIGUOUS']
         
-        # Case 3: List (convert to bytearray)
-        elif isinstance(self._backing_data, list):
-            import struct
-            
-            if dtype_char == 'u1':
-                # Simplified flattening for POC
-                def flatten(l):
-                    for x in l:
-                        if isinstance(x, (list, tuple)): yield from flatten(x)
-                        else: yield x
-                buffer = bytearray(int(x) for x in flatten(self._backing_data))
-                count = len(buffer)
-            elif dtype_char == 'f4':
-                import struct
-                def flatten(l):
-                    for x in l:
-                        if isinstance(x, (list, tuple)): yield from flatten(x)
-                        else: yield x
-                buffer = bytearray()
-                for x in flatten(self._backing_data):
-                    buffer.extend(struct.pack('f', float(x)))
-                count = self._element_count
-            elif dtype_char == 'i4':
-                import struct
-                def flatten(l):
-                    for x in l:
-                        if isinstance(x, (list, tuple)): yield from flatten(x)
-                        else: yield x
-                buffer = bytearray()
-                for x in flatten(self._backing_data):
-                    buffer.extend(struct.pack('i', int(x)))
-                count = self._element_count
-            else:
+        # Case 3: List/tuple (ragged input that __init__ could not convert)
+        elif isinstance(data, (list, tuple)):
+            np_dtype = _BUFFER_DTYPES.get(dtype_char)
+            if np_dtype is None:
                 raise ValueError(f"Unsupported dtype: {dtype_char}")
             
-            c_buffer = (ctypes.c_uint8 * len(buffer)).from_buffer(buffer)
-            ptr = ctypes.addressof(c_buffer)
-            
-            return (ptr, count, (buffer, c_buffer))
+            # asarray flattens nested lists in C; the result is already contiguous.
+            # Ragged nesting makes it refuse, so walk those lists instead.
+            try:
+                array = np.ascontiguousarray(np.asarray(data, dtype=np_dtype))
+            except ValueError:
+                array = np.fromiter(_flatten_nested(data), dtype=np_dtype)
+            contiguous = True
+        
+        # Case 4: array.array of the requested type: buffer_info() is the
+        # raw pointer, so no NumPy view is needed (empty arrays may report a
+        # null address and take the generic path). Not cached: an array.array
+        # can be resized, which moves its buffer
+        elif (
+            isinstance(data, _array.array)
+            and data.typecode == _ARRAY_TYPECODES.get(dtype_char)
+            and len(data)
+        ):
+            ptr, count = data.buffer_info()
+            return (ptr, count, data)
         
-        # Case 4: Generic buffer protocol fallback
+        # Case 5: Generic buffer protocol fallback
         else:
             try:
-                mv = memoryview(self._backing_data)
-                # Recursive(ish) logic for memoryview path
-                # Just fail for now to keep simple, as case 2 handles mv
-                ptr = ctypes.addressof((ctypes.c_byte * len(mv)).from_buffer(mv))
-                return (ptr, len(mv), mv)
+                array = np.asarray(memoryview(data))
             except TypeError:
                 raise ValueError(
-                    f"Cannot extract buffer from {type(self._backing_data)}. "
+                    f"Cannot extract buffer from {type(data)}. "
                     "Object must support buffer protocol or be a list."
                 )
+            contiguous = array.flags['C_CONTIGUOUS']
+        
+        # SYSTEMS SAFETY CHECK:
+        # We must ensure the array is C-contiguous before extracting the raw pointer.
+        # Passing non-contiguous strides to a dense kernel results in data corruption.
+        if not contiguous:
+            # Option A: Error
+            # raise ValueError("Non-contiguous arrays not supported yet")
+            
+            # Option B: Safe Copy (Performance Penalty, but Correct)
+            # We log this because hidden copies are a performance pitfall.
+            # The copy is kept, so this only happens once per tensor.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Copying non-contiguous array (shape={array.shape}) for zero-copy access")
+            
+            array = np.ascontiguousarray(array)
+            if isinstance(data, np.ndarray):
+                # Same values, now contiguous: every later op is zero-copy
+                self._backing_data = array
+                self._is_contiguous = True
+        
+        # Kernels read raw memory, so the element type must match the
+        # request. Convert once (e.g. float32 data read as 'i4'); bool is
+        # already stored as 0/1 bytes, so the byte codes view it in place.
+        np_dtype = _BUFFER_DTYPES.get(dtype_char)
+        if np_dtype is not None and array.dtype != np_dtype:
+            if array.dtype == np.bool_ and np_dtype.itemsize == 1:
+                array = array.view(np_dtype)
+            else:
+                array = array.astype(np_dtype)
+        
+        # __array_interface__ provides (ptr, readonly)
+        entry = (array.__array_interface__['data'][0], array.size, array)
+        self._buffers[dtype_char] = entry
+        return entry
+
+    def _fallback_array(self) -> Any:
+        """
+        This tensor's data as an ndarray for the dispatcher's reduction kernels.
+
+        Used when the Rust extension is missing; bfloat16 is widened to
+        float32 first, since its storage array holds raw bit patterns.
+        """
+        t = self.to_float32() if self._dtype == DataType.BFLOAT16 else self
+        return t._as_ndarray()
 
     def all(self) -> 'Tensor':
         """Returns True if all elements evaluate to True."""
-        try:
-            from ._corepy_rust import tensor_all
-            
-            ptr, count, _ref = self._get_buffer_pointer('u1')
-            result = tensor_all(ptr, count)
-            
-            return Tensor(result, dtype=DataType.BOOL, backend=self.backend)
-            
-        except ImportError:
+        if _ffi is None:
             logger.warning("Rust extension not available.")
-            from .backend.dispatch import dispatch_kernel
-            result = dispatch_kernel("all", self.backend, self._backing_data)
-            return Tensor(result, dtype=DataType.BOOL, backend=self.backend)
+            result = dispatch_kernel("all", self.backend, self._fallback_array())
+            return Tensor._from_scalar(result, DataType.BOOL, self.backend)
+        
+        ptr, count, _ref = self._get_buffer_pointer('u1')
+        result = _ffi.tensor_all(ptr, count)
+        
+        return Tensor._from_scalar(result, DataType.BOOL, self.backend)
 
     def any(self) -> 'Tensor':
         """Returns True if any element evaluates to True."""
-        try:
-            from ._corepy_rust import tensor_any
-            
-            ptr, count, _ref = self._get_buffer_pointer('u1')
-            result = tensor_any(ptr, count)
-            
-            return Tensor(result, dtype=DataType.BOOL, backend=self.backend)
-        except ImportError:
-            from .backend.dispatch import dispatch_kernel
-            result = dispatch_kernel("any", self.backend, self._backing_data)
-            return Tensor(result, dtype=DataType.BOOL, backend=self.backend)
+        if _ffi is None:
+            result = dispatch_kernel("any", self.backend, self._fallback_array())
+            return Tensor._from_scalar(result, DataType.BOOL, self.backend)
+        
+        ptr, count, _ref = self._get_buffer_pointer('u1')
+        result = _ffi.tensor_any(ptr, count)
+        
+        return Tensor._from_scalar(result, DataType.BOOL, self.backend)
+
+    def count_nonzero(self) -> 'Tensor':
+        """Returns the number of elements that evaluate to True (INT64)."""
+        if _ffi is None:
+            result = dispatch_kernel("count_nonzero", self.backend, self._fallback_array())
+            return Tensor._from_scalar(result, DataType.INT64, self.backend)
+        
+        # Same byte view as all()/any()
+        ptr, count, _ref = self._get_buffer_pointer('u1')
+        result = _ffi.tensor_count_nonzero(ptr, count)
+        
+        return Tensor._from_scalar(result, DataType.INT64, self.backend)
 
     def sum(self) -> 'Tensor':
         """Returns sum of all elements."""
-        try:
-            from ._corepy_rust import tensor_sum_f32, tensor_sum_i32
-            
-            if self._dtype == DataType.INT32:
-                 ptr, count, _ref = self._get_buffer_pointer('i4')
-                 result = tensor_sum_i32(ptr, count)
+        result = self.sum_scalar()
+        return Tensor._from_scalar(result, _SUM_DTYPES.get(self._dtype, self._dtype), self.backend)
+
+    def sum_scalar(self) -> Union[float, int]:
+        """
+        Returns sum of all elements as a plain Python number.
+
+        Same kernels as sum(), without wrapping the result in a Tensor; use
+        it in loops where the per-call result object would outweigh a
+        small reduction.
+        """
+        if _profiler_core._profiling_active:
+            _profiler_core._note_call("sum", self._profile_version())
+        if _ffi is None:
+            return dispatch_kernel("sum", self.backend, self._fallback_array())
+        
+        if self._dtype == DataType.INT32:
+             ptr, count, _ref = self._get_buffer_pointer('i4')
+             return _ffi.tensor_sum_i32(ptr, count)
+        elif self._dtype == DataType.INT8:
+             # Exact: accumulated in 64-bit lanes
+             ptr, count, _ref = self._get_buffer_pointer('i1')
+             return _ffi.tensor_sum_i8(ptr, count)
+        elif self._dtype == DataType.BFLOAT16:
+             # Widened to float32 in registers, accumulated in float32
+             ptr, count, _ref = self._get_buffer_pointer('b2')
+             return _ffi.tensor_sum_bf16(ptr, count)
+        
+        # Default to float32
+        ptr, count, _ref = self._get_buffer_pointer('f4')
+        return _ffi.tensor_sum_f32(ptr, count)
+
+    @staticmethod
+    def sum_many(tensors: Any) -> list:
+        """
+        Sums of several tensors, as Python numbers in input order.
+
+        All float32 CPU tensors among them are reduced by one native call
+        (in parallel, with the GIL released) instead of one FFI round trip
+        each; any others go through sum_scalar() individually.
+        """
+        tensors = list(tensors)
+        if _ffi is None:
+            return [t.sum_scalar() for t in tensors]
+        
+        results: list = [None] * len(tensors)
+        # refs keeps any converted buffers alive until the native call returns
+        batch, ptrs, counts, refs = [], [], [], []
+        for i, t in enumerate(tensors):
+            if (
+                t._dtype == DataType.FLOAT32
+                and t._backend_type == BackendType.CPU
+                # Pending fused chains (e.g. (a * b)) keep their own kernels
+                and not (isinstance(t, _DeferredTensor) and t._op is not None)
+            ):
+                ptr, count, ref = t._get_buffer_pointer('f4')
+                batch.append(i)
+                ptrs.append(ptr)
+                counts.append(count)
+                refs.append(ref)
             else:
-                 # Default to float32
-                 ptr, count, _ref = self._get_buffer_pointer('f4')
-                 result = tensor_sum_f32(ptr, count)
-                 
-            return Tensor([result], dtype=self._dtype, backend=self.backend)
-        except ImportError:
-            from .backend.dispatch import dispatch_kernel
-            result = dispatch_kernel("sum", self.backend, self._backing_data)
-            return Tensor(result, dtype=self._dtype, backend=self.backend)
+                results[i] = t.sum_scalar()
+        
+        if batch:
+            for i, value in zip(batch, _ffi.tensor_sum_f32_many(ptrs, counts)):
+                results[i] = value
+        return results
 
     def mean(self) -> 'Tensor':
         """Returns arithmetic mean of all elements."""
-        try:
-            from ._corepy_rust import tensor_mean_f32
+        if _profiler_core._profiling_active:
+            _profiler_core._note_call("mean", self._profile_version())
+        mean_fn = self._mean_fn
+        if mean_fn is None:
+            mean_fn = self._mean_fn = self._resolve_mean()
+        return mean_fn(self)
+
+    def _resolve_mean(self):
+        """
+        Resolve the mean kernel for this tensor's backend once.
+
+        The returned function takes the tensor and is cached on it, so repeated
+        mean() calls skip the FFI attribute and dispatch-table lookups.
+        """
+        if _ffi is None:
+            kernel = Dispatcher.get_kernel("mean", self.backend)
             
+            def mean_fn(t: 'Tensor') -> 'Tensor':
+                result = kernel(t._fallback_array())
+                return Tensor._from_scalar(result, DataType.FLOAT32, t.backend)
+            return mean_fn
+        
+        if self._dtype == DataType.BFLOAT16:
+            tensor_sum_bf16 = _ffi.tensor_sum_bf16
+            
+            def bf16_mean_fn(t: 'Tensor') -> 'Tensor':
+                ptr, count, _ref = t._get_buffer_pointer('b2')
+                if count == 0:
+                    raise ValueError("Cannot compute mean of empty tensor")
+                result = tensor_sum_bf16(ptr, count) / count
+                return Tensor._from_scalar(result, DataType.FLOAT32, t.backend)
+            return bf16_mean_fn
+        
+        tensor_mean_f32 = _ffi.tensor_mean_f32
+        
+        def mean_fn(t: 'Tensor') -> 'Tensor':
             # Mean implies float result usually
-            ptr, count, _ref = self._get_buffer_pointer('f4')
+            ptr, count, _ref = t._get_buffer_pointer('f4')
             result = tensor_mean_f32(ptr, count)
-            
-            return Tensor(result, dtype=DataType.FLOAT32, backend=self.backend)
-        except ImportError:
-            from .backend.dispatch import dispatch_kernel
-            result = dispatch_kernel("mean", self.backend, self._backing_data)
-            return Tensor(result, dtype=DataType.FLOAT32, backend=self.backend)
+            return Tensor._from_scalar(result, DataType.FLOAT32, t.backend)
+        return mean_fn
+
+    def center(self) -> 'Tensor':
+        """
+        Returns ``self - self.mean()`` (float32) from a single native call.
+
+        Same values as the two-step form, without the intermediate mean
+        Tensor and a second FFI round trip.
+        """
+        if _ffi is None:
+            return self - self.mean()
+        
+        t = self.to_float32() if self._dtype == DataType.BFLOAT16 else self
+        ptr, count, _ref = t._get_buffer_pointer('f4')
+        if count == 0:
+            raise ValueError("Cannot center an empty tensor")
+        out_arr = get_session().get_output_buffer(np.float32, count)
+        _ffi.tensor_center_f32(ptr, out_arr.__array_interface__['data'][0], count)
+        return Tensor._from_output(out_arr, DataType.FLOAT32, self.backend)
+
+    def var(self) -> 'Tensor':
+        """Returns the population variance of all elements (float32)."""
+        if _profiler_core._profiling_active:
+            _profiler_core._note_call("var", self._profile_version())
+        if _ffi is None:
+            result = dispatch_kernel("var", self.backend, self._fallback_array())
+            return Tensor._from_scalar(result, DataType.FLOAT32, self.backend)
+        
+        t = self.to_float32() if self._dtype == DataType.BFLOAT16 else self
+        ptr, count, _ref = t._get_buffer_pointer('f4')
+        if count == 0:
+            raise ValueError("Cannot compute variance of empty tensor")
+        # One fused pass for E[x] and E[x^2]; clamp the rounding-level
+        # negatives E[x^2] - E[x]^2 can produce for near-constant data
+        total, total_sq = _ffi.tensor_moments_f32(ptr, count)
+        mean = total / count
+        result = max(total_sq / count - mean * mean, 0.0)
+        return Tensor._from_scalar(result, DataType.FLOAT32, self.backend)
 
     def _binary_op(self, op: str, other: Any) -> 'Tensor':
         """Helper for binary operations via Rust FFI."""
+        if self._dtype == DataType.BFLOAT16 or getattr(other, '_dtype', None) == DataType.BFLOAT16:
+            return self._bf16_binary_op(op, other)
+
+        # A one-element tensor (e.g. x.mean()) broadcasts like a scalar on
+        # either side: x - x.mean() runs the scalar-broadcast kernel
+        if isinstance(other, Tensor) and other._backend_type == self._backend_type:
+            if other._element_count == 1 and self._element_count != 1:
+                other = float(other._as_ndarray().reshape(-1)[0])
+            elif self._element_count == 1 and other._element_count != 1:
+                value = float(self._as_ndarray().reshape(-1)[0])
+                if op == "add" or op == "mul":
+                    return other._binary_op(op, value)
+                # s - x, s / x: no reversed scalar kernels, so fill s out
+                self = Tensor(np.full(other._element_count, value, dtype=np.float32), device=self._device)
+
         if isinstance(other, (int, float)):
-             other = Tensor([float(other)] * self._element_count, device=self._device)
+            if self.backend == BackendType.CPU and _ffi is not None:
+                return self._scalar_op(op, float(other))
+            
+            # Fallback to a materialized broadcast
+            other = Tensor(np.full(self._element_count, other, dtype=np.float32), device=self._device)
         
         if not isinstance(other, Tensor):
              raise ValueError("Binary ops require Tensor or scalar")
@@ -352,102 +891,618 @@ class Tensor:
              raise BackendError(f"Backend mismatch: {self.backend} vs {other.backend}")
 
         # Check if we can use optimized CPU Runtime
-        if self.backend == BackendType.CPU:
-            try:
-                from . import _corepy_rust as ffi
-                
-                # Get input buffers (f32 hardcoded for now)
-                ptr_a, count_a, _ref_a = self._get_buffer_pointer('f4')
-                ptr_b, count_b, _ref_b = other._get_buffer_pointer('f4')
-                
-                if count_a != count_b:
-                    raise ValueError(f"Shape mismatch: {count_a} vs {count_b}")
-                
-                # Prepare output buffer
-                import struct
-                import ctypes
-                # Allocate output buffer (bytearray for now, zero-init)
-                # size = count * 4 bytes
-                out_size = count_a * 4
-                buf_out = bytearray(out_size)
-                
-                c_out = (ctypes.c_char * out_size).from_buffer(buf_out)
-                ptr_out = ctypes.addressof(c_out)
-                
-                # Dispatch
-                if op == "add": ffi.tensor_add_f32(ptr_a, ptr_b, ptr_out, count_a)
-                elif op == "sub": ffi.tensor_sub_f32(ptr_a, ptr_b, ptr_out, count_a)
-                elif op == "mul": ffi.tensor_mul_f32(ptr_a, ptr_b, ptr_out, count_a)
-                elif op == "div": ffi.tensor_div_f32(ptr_a, ptr_b, ptr_out, count_a)
-                
-                # Convert output back to usable form
-                # In a real system, we'd wrap the buffer. For PoC, unpack to list.
-                out_floats = [struct.unpack('f', buf_out[i:i+4])[0] for i in range(0, len(buf_out), 4)]
-                return Tensor(out_floats, dtype=self._dtype, backend=self.backend)
-
-            except ImportError:
-                pass # Fallback to dispatch
+        if self.backend == BackendType.CPU and _ffi is not None:
+            out_arr = self._binary_out(op, other)
+            return Tensor._from_output(out_arr, self._dtype, self.backend)
         
         # Fallback to general dispatch (GPU, Custom, or if Rust missing)
-        from .backend.dispatch import dispatch_kernel
         result = dispatch_kernel(op, self.backend, self._backing_data, other._backing_data)
         return Tensor(result, dtype=self._dtype, backend=self.backend)
 
-    def matmul(self, other: 'Tensor') -> 'Tensor':
-        """Matrix multiplication (handles 1D dot product and 2D matmul)."""
+    def _bf16_binary_op(self, op: str, other: Any) -> 'Tensor':
+        """
+        Binary op with a bfloat16 operand.
+
+        Two same-size bfloat16 CPU tensors use the bf16 kernels directly.
+        Anything else is computed in float32; the result stays bfloat16 only
+        when no float32 tensor took part (bf16 with bf16 or with a scalar).
+        """
+        if (
+            isinstance(other, Tensor)
+            and self._dtype == other._dtype == DataType.BFLOAT16
+            and self._backend_type == other._backend_type == BackendType.CPU
+            and _ffi is not None
+        ):
+            ptr_a, count_a, _ref_a = self._get_buffer_pointer('b2')
+            ptr_b, count_b, _ref_b = other._get_buffer_pointer('b2')
+            if count_a != count_b:
+                raise ValueError(f"Shape mismatch: {count_a} vs {count_b}")
+            
+            out_arr = get_session().get_output_buffer(np.uint16, count_a)
+            ptr_out = out_arr.__array_interface__['data'][0]
+            _BINARY_BF16[op](ptr_a, ptr_b, ptr_out, count_a)
+            return Tensor._from_output(out_arr.view(_BF16_STORAGE), DataType.BFLOAT16, self.backend)
+        
+        narrow = self._dtype == DataType.BFLOAT16 and (
+            not isinstance(other, Tensor) or other._dtype == DataType.BFLOAT16
+        )
+        if isinstance(other, Tensor):
+            other = other.to_float32()
+        result = self.to_float32()._binary_op(op, other)
+        return result.to_bf16() if narrow else result
+
+    def _binary_out(self, op: str, other: 'Tensor') -> Any:
+        """Run a CPU binary kernel into a new float32 array (needs the Rust FFI)."""
+        # Strided inputs: iterate them in place rather than copying
+        if not (self._is_contiguous and other._is_contiguous):
+            out_arr = self._strided_binary_out(op, other)
+            if out_arr is not None:
+                return out_arr
+        
+        # Get input buffers (f32 hardcoded for now)
+        ptr_a, count_a, _ref_a = self._get_buffer_pointer('f4')
+        ptr_b, count_b, _ref_b = other._get_buffer_pointer('f4')
+        
+        if count_a != count_b:
+            raise ValueError(f"Shape mismatch: {count_a} vs {count_b}")
+        
+        # Prepare output buffer: kernel writes straight into a (pooled) NumPy array
+        out_arr = get_session().get_output_buffer(np.float32, count_a)
+        ptr_out = out_arr.__array_interface__['data'][0]
+        
+        _BINARY_F32[op](ptr_a, ptr_b, ptr_out, count_a)
+        
+        return out_arr
+
+    def _coalesced_view(self, other: 'Tensor') -> Optional[Tuple[int, list, int, list, list]]:
+        """
+        Raw strided layout of two same-shape float32 NumPy-backed tensors.
+
+        Returns (ptr_a, strides_a, ptr_b, strides_b, shape) with strides in
+        elements and axes coalesced (see _coalesce_axes), or None when the
+        pair cannot be iterated in place.
+        """
+        a, b = self._backing_data, other._backing_data
+        if not (
+            isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+            and a.dtype == np.float32 and b.dtype == np.float32
+            and a.shape == b.shape
+        ):
+            return None
+        
+        itemsize = a.itemsize
+        if any(st % itemsize for st in a.strides + b.strides):
+            return None # Unaligned byte strides (views into raw buffers)
+        
+        shape, strides_a, strides_b = _coalesce_axes(
+            a.shape,
+            [st // itemsize for st in a.strides],
+            [st // itemsize for st in b.strides],
+        )
+        return (
+            a.__array_interface__['data'][0], strides_a,
+            b.__array_interface__['data'][0], strides_b,
+            shape,
+        )
+
+    def _strided_binary_out(self, op: str, other: 'Tensor') -> Any:
+        """Binary op over strided inputs without a contiguous copy, or None if not applicable."""
+        view = self._coalesced_view(other)
+        if view is None:
+            return None
+        
+        ptr_a, strides_a, ptr_b, strides_b, shape = view
+        out_arr = get_session().get_output_buffer(np.float32, self._element_count)
+        if out_arr.size:
+            ptr_out = out_arr.__array_interface__['data'][0]
+            _STRIDED_F32[op](ptr_a, strides_a, ptr_b, strides_b, ptr_out, shape)
+        return out_arr
+
+    def _deferrable_op(self, op: str, other: Any) -> 'Tensor':
+        """
+        Binary op, recorded as a _DeferredTensor inside ``corepy.batch()``.
+
+        Inside ``corepy.batch()`` or ``corepy.fuse()`` any float32 CPU op with
+        a same-size tensor or a scalar is recorded into the active graph.
+        Everywhere else the op runs now, so results never depend on when
+        they are first read. While profiling is enabled ops also run eagerly
+        inside a block, so each is timed in its ProfileContext.
+        """
+        graph = _recording.active_graph()
+        if (
+            graph is not None
+            and self._backend_type == BackendType.CPU
+            and self._dtype == DataType.FLOAT32
+            and not _profiler_core._profiling_active
+            and _ffi is not None
+        ):
+            if isinstance(other, (int, float)):
+                node = _DeferredTensor(op, self, float(other), _recording.fusing())
+                graph.append(node)
+                return node
+            if (
+                isinstance(other, Tensor)
+                and other._backend_type == BackendType.CPU
+                and other._dtype == DataType.FLOAT32
+                and self._element_count == other._element_count
+            ):
+                node = _DeferredTensor(op, self, other, _recording.fusing())
+                graph.append(node)
+                return node
+        return self._binary_op(op, other)
+
+    def _scalar_out(self, op: str, scalar: float) -> Any:
+        """Run a tensor-scalar kernel into a new float32 array (needs the Rust FFI)."""
+        ptr_a, count, _ref_a = self._get_buffer_pointer('f4')
+        out_arr = get_session().get_output_buffer(np.float32, count)
+        ptr_out = out_arr.__array_interface__['data'][0]
+        
+        _SCALAR_F32[op](ptr_a, scalar, ptr_out, count)
+        
+        return out_arr
+
+    def _scalar_op(self, op: str, scalar: float) -> 'Tensor':
+        """Tensor-scalar op via the broadcast FFI kernels (no N-element scalar buffer)."""
+        return Tensor._from_output(self._scalar_out(op, scalar), self._dtype, self.backend)
+
+    def matmul(self, other: 'Tensor', out: Optional['Tensor'] = None) -> 'Tensor':
+        """
+        Matrix multiplication (handles 1D dot product and 2D matmul).
+
+        Args:
+            other: Right-hand operand.
+            out: Optional preallocated result for the 2D case. Must wrap a
+                 C-contiguous float32 numpy array of shape (m, n); it is
+                 written in place and returned, so repeated calls allocate
+                 nothing (mirrors ``np.matmul(a, b, out=c)``).
+
+        The 2D result wraps its (m, n) float32 array directly, so
+        ``np.asarray(result)`` is a view, not a reshaped copy.
+        """
         if not isinstance(other, Tensor): raise ValueError("matmul requires Tensor")
+        if out is not None and not isinstance(out, Tensor): raise ValueError("out must be a Tensor")
         
-        if self.backend == BackendType.CPU:
-            try:
-                from . import _corepy_rust as ffi
-                
-                # Case 1: Dot Product (1D @ 1D)
-                if len(self.shape) == 1 and len(other.shape) == 1:
-                    ptr_a, count_a, _ref_a = self._get_buffer_pointer('f4')
-                    ptr_b, count_b, _ref_b = other._get_buffer_pointer('f4')
-                    
+        if self.backend == BackendType.CPU and _ffi is not None:
+            # Case 1: Dot Product (1D @ 1D)
+            if len(self.shape) == 1 and len(other.shape) == 1:
+                # int8 @ int8 accumulates exactly in int32 (VNNI when available)
+                if self._dtype == other._dtype == DataType.INT8:
+                    ptr_a, count_a, _ref_a = self._get_buffer_pointer('i1')
+                    ptr_b, count_b, _ref_b = other._get_buffer_pointer('i1')
                     if count_a != count_b:
                         raise ValueError(f"Dot product size mismatch: {count_a} vs {count_b}")
-                    
-                    result = ffi.tensor_matmul_f32(ptr_a, ptr_b, count_a)
-                    return Tensor(result, dtype=self._dtype, backend=self.backend)
+                    result = _ffi.tensor_dot_product_i8(ptr_a, ptr_b, count_a)
+                    return Tensor._from_scalar(result, DataType.INT32, self.backend)
+                
+                # bf16 @ bf16 reads half the bytes and accumulates in float32
+                bf16 = self._dtype == other._dtype == DataType.BFLOAT16
+                code = 'b2' if bf16 else 'f4'
+                ptr_a, count_a, _ref_a = self._get_buffer_pointer(code)
+                ptr_b, count_b, _ref_b = other._get_buffer_pointer(code)
+                
+                if count_a != count_b:
+                    raise ValueError(f"Dot product size mismatch: {count_a} vs {count_b}")
+                
+                if bf16:
+                    result = _ffi.tensor_dot_product_bf16(ptr_a, ptr_b, count_a)
+                    return Tensor._from_scalar(result, DataType.FLOAT32, self.backend)
+                result = _ffi.tensor_matmul_f32(ptr_a, ptr_b, count_a)
+                return Tensor._from_scalar(result, self._dtype, self.backend)
+            
+            # Case 2: Matrix Multiplication (2D @ 2D)
+            elif len(self.shape) == 2 and len(other.shape) == 2:
+                m, k1 = self.shape
+                k2, n = other.shape
+                
+                if k1 != k2:
+                    raise ValueError(f"Matrix dimension mismatch: ({m}, {k1}) @ ({k2}, {n})")
                 
-                # Case 2: Matrix Multiplication (2D @ 2D)
-                elif len(self.shape) == 2 and len(other.shape) == 2:
-                    m, k1 = self.shape
-                    k2, n = other.shape
-                    
-                    if k1 != k2:
-                        raise ValueError(f"Matrix dimension mismatch: ({m}, {k1}) @ ({k2}, {n})")
-                    
-                    ptr_a, _c_a, _ref_a = self._get_buffer_pointer('f4')
-                    ptr_b, _c_b, _ref_b = other._get_buffer_pointer('f4')
-                    
-                    # Prepare output buffer (Zero-Copy Optimization)
-                    import numpy as np
-                    # Allocate uninitialized memory directly (fastest)
-                    # Note: C++ kernels (AVX2/OpenBLAS) will initialize this (beta=0.0)
-                    final_np = np.empty((m, n), dtype=np.float32)
-                    
-                    # Get raw pointer to the numpy array's data
-                    ptr_out = final_np.__array_interface__['data'][0]
-                    
-                    # Dispatch 2D kernel
-                    ffi.tensor_matmul_2d_f32(ptr_a, ptr_b, ptr_out, m, k1, n)
-                    
-                    # Return wrapped Tensor
-                    return Tensor(final_np, dtype=self._dtype, backend=self.backend)
+                ptr_a, _c_a, _ref_a = self._get_buffer_pointer('f4')
+                ptr_b, _c_b, _ref_b = other._get_buffer_pointer('f4')
                 
+                # Prepare output buffer (Zero-Copy Optimization)
+                if out is not None:
+                    final_np = out._matmul_out_array((m, n))
                 else:
-                    # Generic shapes not supported in optimized kernel yet
-                    pass 
-                    
-            except ImportError:
-                 pass # Fallback
+                    # Uninitialized (pooled) memory; the C++ kernels
+                    # (AVX2/OpenBLAS) overwrite all of it (beta=0.0)
+                    final_np = get_session().get_output_buffer(np.float32, m * n).reshape(m, n)
+                
+                # Get raw pointer to the numpy array's data
+                ptr_out = final_np.__array_interface__['data'][0]
+                
+                # Dispatch 2D kernel: tiny shapes skip the blocked/threaded path
+                if m * k1 * n <= _SMALL_MATMUL_VOLUME:
+                    _ffi.tensor_matmul_2d_f32_small(ptr_a, ptr_b, ptr_out, m, k1, n)
+                else:
+                    _ffi.tensor_matmul_2d_f32(ptr_a, ptr_b, ptr_out, m, k1, n)
+                
+                if out is not None:
+                    return out
+                
+                # Return wrapped Tensor
+                return Tensor._from_output(final_np, self._dtype, self.backend)
+            
+            # Generic shapes not supported in optimized kernel yet: fall through
 
-        from .backend.dispatch import dispatch_kernel
+        if out is not None:
+            dispatch_kernel(
+                "matmul", self.backend, self._backing_data, other._backing_data,
+                out=out._matmul_out_array((self.shape[0], other.shape[-1]))
+            )
+            return out
         result = dispatch_kernel("matmul", self.backend, self._backing_data, other._backing_data)
         return Tensor(result, dtype=self._dtype, backend=self.backend)
 
+    def release(self) -> None:
+        """
+        Hand this tensor's result buffer back to the session pool for reuse.
+
+        Only buffers this tensor owns (see _from_output) are pooled: op
+        results (+, -, *, /, matmul) whose data was never exported or shared.
+        For any other tensor this does nothing. A released tensor must not be
+        used again.
+        """
+        if self._owns_data and get_session().release_output_buffer(self._backing_data):
+            self._backing_data = None
+            self._buffers = {}
+        self._owns_data = False
+
+    def _matmul_out_array(self, shape: Tuple[int, ...]) -> Any:
+        """Validate this tensor as a matmul `out=` target and return its array."""
+        self._version = next(_VERSIONS) # Its contents are about to be overwritten
+        arr = self._backing_data
+        if not isinstance(arr, np.ndarray) or arr.dtype != np.float32 or not arr.flags['C_CONTIGUOUS']:
+            raise ValueError("out must wrap a C-contiguous float32 numpy array")
+        if arr.shape != tuple(shape):
+            raise ValueError(f"out has shape {arr.shape}, expected {tuple(shape)}")
+        return arr
+
+
+# Slot descriptor for Tensor._backing_data; _DeferredTensor shadows it with
+# a property and stores the materialized values through it.
+_BACKING_DATA = Tensor._backing_data
+
+
+class _DeferredTensor(Tensor):
+    """
+    Result of a CPU element-wise op whose values are computed on first use.
+
+    Only created for ops recorded inside ``corepy.batch()`` or
+    ``corepy.fuse()`` (``rhs`` may be a float). Nodes recorded in
+    ``corepy.fuse()`` evaluate their whole pending chain, or its sum, in
+    one compiled loop (``_fused_eval``). Without that, recognized chains
+    still run as a single pass over the inputs:
+
+    - ``d = a - b; (d * d).sum()`` -> ``tensor_sse_f32``
+    - ``(a * b).sum()`` -> ``tensor_dot_product_f32``
+    - ``t * a + b`` / ``t * a - b`` (scalars) -> ``tensor_axpb_f32``
+
+    Shape, dtype and backend are known up front; any access to the data
+    (printing, buffers, other ops) materializes the node through the
+    regular element-wise kernels. Until then the node keeps its inputs
+    alive and reads them only at that point, so in-place changes to a
+    NumPy array backing an input before then are visible in the result.
+    """
+    __slots__ = ("_op", "_lhs", "_rhs", "_fused")
+
+    def __init__(self, op: str, lhs: Tensor, rhs: Any, fused: bool = False):
+        # Same metadata as the eager result of Tensor._binary_op (a flat
+        # float32 CPU array), so nothing here depends on when we materialize
+        self._dtype = lhs._dtype
+        self._shape = (lhs._element_count,)
+        self._element_count = lhs._element_count
+        self._backend_type = BackendType.CPU
+        self._device = None
+        self._mean_fn = None
+        self._buffers = {}
+        self._is_contiguous = True
+        self._owns_data = False # Until materialized into a pooled buffer
+        self._op, self._lhs, self._rhs = op, lhs, rhs
+        self._fused = fused
+        # The inputs are read later: writing them in place would change the result
+        lhs._owns_data = False
+        if isinstance(rhs, Tensor):
+            rhs._owns_data = False
+
+    @property
+    def _backing_data(self) -> Any:
+        if self._op is not None:
+            self._materialize()
+        return _BACKING_DATA.__get__(self)
+
+    @_backing_data.setter
+    def _backing_data(self, value: Any) -> None:
+        _BACKING_DATA.__set__(self, value)
+
+    def _materialize(self) -> None:
+        if self._fused:
+            out_arr = _fused_eval(self, reduce=False)
+            if out_arr is not None:
+                self._op = self._lhs = self._rhs = None
+                _BACKING_DATA.__set__(self, out_arr)
+                self._owns_data = True
+                return
+            # Not fusable: run the chain one kernel per op, producers first
+            # (so none of these calls recurses)
+            for node in _pending_chain(self)[:-1]:
+                if node is not self._lhs or self._axpb_operands() is None:
+                    node._materialize()
+        
+        axpb = self._axpb_operands()
+        if axpb is not None:
+            # t * a + b in one scale-and-shift pass; the pending t * a stays pending
+            x, scale, shift = axpb
+            self._op = self._lhs = self._rhs = None
+            ptr_x, count, _ref_x = x._get_buffer_pointer('f4')
+            out_arr = get_session().get_output_buffer(np.float32, count)
+            _ffi.tensor_axpb_f32(ptr_x, scale, shift, out_arr.__array_interface__['data'][0], count)
+            _BACKING_DATA.__set__(self, out_arr)
+            self._owns_data = True
+            return
+        
+        op, lhs, rhs = self._op, self._lhs, self._rhs
+        # Drop the references first: the inputs are not needed afterwards
+        self._op = self._lhs = self._rhs = None
+        
+        if op == "sqdiff":
+            # (a - b) squared in place: two kernels, one temporary
+            out_arr = lhs._binary_out("sub", rhs)
+            ptr = out_arr.__array_interface__['data'][0]
+            _ffi.tensor_mul_f32(ptr, ptr, ptr, out_arr.size)
+        elif isinstance(rhs, float):
+            out_arr = lhs._scalar_out(op, rhs)
+        else:
+            out_arr = lhs._binary_out(op, rhs)
+        _BACKING_DATA.__set__(self, out_arr)
+        self._owns_data = True
+
+    def release(self) -> None:
+        # Never materialized: just drop the inputs
+        if self._op is not None:
+            self._op = self._lhs = self._rhs = None
+            _BACKING_DATA.__set__(self, None)
+            return
+        super().release()
+
+    def __mul__(self, other: Any) -> Tensor:
+        # diff * diff on a pending difference in fuse(): square it without a temporary
+        if other is self and self._op == "sub" and _recording.fusing():
+            graph = _recording.active_graph()
+            node = _DeferredTensor("sqdiff", self._lhs, self._rhs, True)
+            graph.append(node)
+            return node
+        return super().__mul__(other)
+
+    def _axpb_operands(self) -> Optional[Tuple[Tensor, float, float]]:
+        """``(t, a, b)`` when this node is ``t * a + b`` or ``t * a - b`` over a pending ``t * a`` (scalars)."""
+        lhs, rhs = self._lhs, self._rhs
+        if (
+            (self._op == "add" or self._op == "sub")
+            and isinstance(rhs, float)
+            and isinstance(lhs, _DeferredTensor)
+            and lhs._op == "mul"
+            and isinstance(lhs._rhs, float)
+        ):
+            return lhs._lhs, lhs._rhs, rhs if self._op == "add" else -rhs
+        return None
+
+    def sum_scalar(self) -> Union[float, int]:
+        """Returns sum of all elements, fusing sqdiff/mul chains into one kernel (sum() wraps this)."""
+        if self._fused and self._op is not None:
+            total = _fused_eval(self, reduce=True)
+            if total is not None:
+                return total
+        op = self._op
+        if (op == "sqdiff" or op == "mul") and isinstance(self._rhs, Tensor):
+            ptr_a, count, _ref_a = self._lhs._get_buffer_pointer('f4')
+            ptr_b, _count_b, _ref_b = self._rhs._get_buffer_pointer('f4')
+            
+            if op == "sqdiff":
+                return _ffi.tensor_sse_f32(ptr_a, ptr_b, count)
+            return _ffi.tensor_dot_product_f32(ptr_a, ptr_b, count)
+        return super().sum_scalar()
+
+
+# Expression templates of the ops a fused kernel inlines (operands {0}, {1})
+_FUSED_EXPRS = {
+    "add": "({0} + {1})",
+    "sub": "({0} - {1})",
+    "mul": "({0} * {1})",
+    "div": "({0} / {1})",
+    "sqdiff": "(({0} - {1}) * ({0} - {1}))",
+}
+# Longest chain (in expression terms) compiled as one kernel
+_FUSED_MAX_TERMS = 64
 
 
+def _pending_chain(node: _DeferredTensor) -> list:
+    """Pending nodes ``node`` depends on, itself last, producers before consumers."""
+    order, seen, stack = [], set(), [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if expanded:
+            order.append(current)
+            continue
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        stack.append((current, True))
+        for operand in (current._rhs, current._lhs):
+            if isinstance(operand, _DeferredTensor) and operand._op is not None:
+                stack.append((operand, False))
+    return order
+
+
+def _fused_plan(node: _DeferredTensor, reduce: bool, times: int = 1) -> Optional[Tuple[Any, list]]:
+    """
+    Compiled kernel for the pending chain ending at ``node``, and its inputs.
+
+    Returns ``(kernel, args)``: element-wise kernels are called as
+    ``kernel(*args, out)``, reducing ones as ``kernel(*args)``. None when
+    Numba is unavailable, the chain exceeds _FUSED_MAX_TERMS, or running
+    it ``times`` times processes fewer than _fusion.MIN_FUSED_ELEMENTS
+    elements (the per-op kernels are faster there).
+    """
+    from .ops import _fusion
+    if not _fusion.FUSION_AVAILABLE or node._element_count * times < _fusion.MIN_FUSED_ELEMENTS:
+        return None
+    
+    arrays, slots, scalars = [], {}, []
+    budget = [_FUSED_MAX_TERMS]
+    
+    def expr(operand: Any) -> Optional[str]:
+        budget[0] -= 1
+        if budget[0] < 0:
+            return None
+        if isinstance(operand, float):
+            scalars.append(np.float32(operand))
+            return f"s{len(scalars) - 1}"
+        if isinstance(operand, _DeferredTensor) and operand._op is not None:
+            lhs = expr(operand._lhs)
+            rhs = expr(operand._rhs) if lhs is not None else None
+            return None if rhs is None else _FUSED_EXPRS[operand._op].format(lhs, rhs)
+        # Concrete input: one kernel argument per distinct tensor
+        slot = slots.get(id(operand))
+        if slot is None:
+            slot = slots[id(operand)] = len(arrays)
+            _ptr, _count, ref = operand._get_buffer_pointer('f4')
+            arrays.append(np.asarray(ref, dtype=np.float32).reshape(-1))
+        return f"x{slot}[i]"
+    
+    body = expr(node)
+    if body is None:
+        return None
+    return _fusion.kernel(body, len(arrays), len(scalars), reduce), arrays + scalars
+
+
+def _fused_eval(node: _DeferredTensor, reduce: bool) -> Any:
+    """
+    Evaluate the pending chain ending at ``node`` in one compiled loop.
+
+    Returns a new float32 output array, or the float sum when ``reduce``;
+    None when the chain cannot be fused (see _fused_plan). Pending nodes
+    inside the chain stay pending.
+    """
+    plan = _fused_plan(node, reduce)
+    if plan is None:
+        return None
+    kernel, args = plan
+    if reduce:
+        return float(kernel(*args))
+    out_arr = get_session().get_output_buffer(np.float32, node._element_count)
+    kernel(*args, out_arr)
+    return out_arr
+
+
+def _replay_fused(node: Any, times: int) -> bool:
+    """
+    Materialize ``node`` by running its fused kernel ``times`` times into one buffer.
+
+    Used by ``corepy.batched()``. Returns False, leaving ``node`` as it
+    was, unless it is a pending chain recorded in ``corepy.fuse()`` that
+    can be compiled.
+    """
+    if not (isinstance(node, _DeferredTensor) and node._fused and node._op is not None):
+        return False
+    plan = _fused_plan(node, reduce=False, times=times)
+    if plan is None:
+        return False
+    kernel, args = plan
+    out_arr = get_session().get_output_buffer(np.float32, node._element_count)
+    for _ in range(times):
+        kernel(*args, out_arr)
+    node._op = node._lhs = node._rhs = None
+    _BACKING_DATA.__set__(node, out_arr)
+    node._owns_data = True
+    return True
+
+
+_GRAPH_OPS = {"add": 0, "sub": 1, "mul": 2, "div": 3}
+_GRAPH_OP_SCALAR = 4
+
+
+def _execute_graph(nodes: list) -> None:
+    """
+    Run the pending nodes recorded by ``corepy.batch()`` in one FFI call.
+
+    Nodes are laid out in creation order as rows of
+    ``(op, a_ptr, b_ptr, out_ptr, count)`` uint64 values; a node consuming an
+    earlier one reads that node's output buffer, which is allocated here
+    before the launch. For scalar ops ``b_ptr`` holds the float32 bits.
+    """
+    pending = [node for node in nodes if node._op is not None]
+    if not pending:
+        return
+    if len(pending) == 1:
+        pending[0]._materialize()
+        return
+    
+    table = np.empty((len(pending), 5), dtype=np.uint64)
+    keepalive = []
+    for row, node in zip(table, pending):
+        op, lhs, rhs = node._op, node._lhs, node._rhs
+        node._op = node._lhs = node._rhs = None
+        
+        # Pending producers have their outputs assigned already (creation order)
+        ptr_a, count, ref_a = lhs._get_buffer_pointer('f4')
+        if isinstance(rhs, float):
+            code = _GRAPH_OPS[op] + _GRAPH_OP_SCALAR
+            ptr_b, ref_b = int(np.float32(rhs).view(np.uint32)), None
+        else:
+            code = _GRAPH_OPS[op]
+            ptr_b, _count_b, ref_b = rhs._get_buffer_pointer('f4')
+        
+        out_arr = get_session().get_output_buffer(np.float32, count)
+        _BACKING_DATA.__set__(node, out_arr)
+        node._owns_data = True
+        row[:] = (code, ptr_a, ptr_b, out_arr.__array_interface__['data'][0], count)
+        keepalive.append((ref_a, ref_b))
+    
+    _ffi.tensor_execute_graph(table.__array_interface__['data'][0], len(pending))
+
+
+def arange(
+    start: Union[int, float],
+    stop: Optional[Union[int, float]] = None,
+    step: Union[int, float] = 1,
+    dtype: DataType = DataType.FLOAT32,
+    device: Optional[str] = None,
+) -> Tensor:
+    """
+    Evenly spaced values in [start, stop), like ``np.arange``.
+
+    ``arange(n)`` gives 0 .. n-1. The values are written straight into one
+    NumPy buffer that the Tensor wraps, instead of building ``n`` Python
+    floats for ``Tensor([float(i) for i in range(n)])`` to convert.
+    """
+    if stop is None:
+        start, stop = 0, start
+    values = np.arange(start, stop, step, dtype=_NUMPY_DTYPES.get(dtype, _FLOAT32))
+    if dtype == DataType.BFLOAT16:
+        values = _f32_to_bf16(values)
+    return Tensor(values, dtype=dtype, device=device)
+
+
+def reduce_stats(t: Tensor) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """
+    Returns ``(mean, sum, max, min)`` of all elements (float32).
+
+    The four come from one fused pass over the data, where calling
+    ``mean()``, ``sum()``, ``max()`` and ``min()`` would read it four times.
+    """
+    if _profiler_core._profiling_active:
+        _profiler_core._note_call("stats", t._profile_version())
+    if _ffi is None:
+        total, lo, hi = dispatch_kernel("stats", t.backend, t._fallback_array())
+        count = t._element_count
+    else:
+        src = t.to_float32() if t._dtype == DataType.BFLOAT16 else t
+        ptr, count, _ref = src._get_buffer_pointer('f4')
+        if count == 0:
+            raise ValueError("Cannot compute stats of empty tensor")
+        total, lo, hi = _ffi.tensor_stats_f32(ptr, count)
+    return tuple(
+        Tensor._from_scalar(value, DataType.FLOAT32, t.backend)
+        for value in (total / count, total, hi, lo)
+    )
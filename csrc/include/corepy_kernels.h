@@ -65,9 +65,36 @@ extern "C" {
     /// Sum reduction on i32 array
     int32_t sum_i32_cpu(const int32_t* data, size_t count);
     
-    /// Mean (average) of f32 array
-    /// Returns sum / count
-    float mean_f32_cpu(const float* data, size_t count);
+    /// Sum of squared differences: sum((a[i] - b[i])^2)
+    /// Fused sub -> square -> sum in a single pass
+    float sse_f32_cpu(const float* a, const float* b, size_t count);
+
+    /// Summation variants (accuracy/speed trade-off), see reduce.cpp
+    float sum_f32_naive_cpu(const float* data, size_t count);
+    float sum_f32_pairwise_cpu(const float* data, size_t count);
+    float sum_f32_kahan_cpu(const float* data, size_t count);
+
+    /// Fused single pass: out[0] = sum(data), out[1] = sum(data^2)
+    void moments_f32_cpu(const float* data, size_t count, float* out);
+
+    /// Fused single pass: out[0] = sum, out[1] = min, out[2] = max (count > 0)
+    void stats_f32_cpu(const float* data, size_t count, float* out);
+
+    /// BFloat16 (uint16 bit patterns) reductions with f32 accumulators
+    float sum_bf16_cpu(const uint16_t* data, size_t count);
+    float dot_bf16_cpu(const uint16_t* a, const uint16_t* b, size_t count);
+
+    /// int8 dot product with int32 accumulation (AVX-VNNI when the CPU has it)
+    int32_t dot_i8_cpu(const int8_t* a, const int8_t* b, size_t count);
+
+    /// Byte reductions (PSADBW): number of non-zero bytes, exact int8 sum
+    uint64_t count_nonzero_u8_cpu(const uint8_t* data, size_t count);
+    int64_t sum_i8_cpu(const int8_t* data, size_t count);
+
+    /// Instruction set picked at load time for sum_f32_cpu / sse_f32_cpu /
+    /// moments_f32_cpu:
+    /// "avx512", "avx2" or "scalar" (static string)
+    const char* corepy_simd_level(void);
 
     
     // ========================================================================
@@ -78,6 +105,26 @@ extern "C" {
     void mul_f32_cpu(const float* a, const float* b, float* out, size_t count);
     void div_f32_cpu(const float* a, const float* b, float* out, size_t count);
 
+    /// Scalar broadcast: out[i] = a[i] <op> scalar
+    void add_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count);
+    void sub_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count);
+    void mul_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count);
+    void div_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count);
+    /// Fused scale and shift: out[i] = a * x[i] + b (FMA, one pass)
+    void axpb_f32_cpu(const float* x, float a, float b, float* out, size_t count);
+
+    /// BFloat16 (uint16 bit patterns), computed in float with round-to-nearest-even
+    void add_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count);
+    void sub_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count);
+    void mul_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count);
+    void div_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count);
+
+    /// One strided row: out[i] = a[i * a_stride] <op> b[i * b_stride] (strides in elements)
+    void add_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride, float* out, size_t count);
+    void sub_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride, float* out, size_t count);
+    void mul_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride, float* out, size_t count);
+    void div_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride, float* out, size_t count);
+
     
     // ========================================================================
     // Matrix Operations (src/cpu/matmul.cpp)
@@ -13,6 +13,19 @@ float dot_product_f32(const float* a, const float* b, size_t count) {
 
 void matmul_f32(const float* a, const float* b, float* c,
                 size_t m, size_t k, size_t n) {
+    // Matrix-vector shapes: sgemv skips sgemm's packing/blocking setup
+    if (n == 1 && k > 0) {
+        cblas_sgemv(CblasRowMajor, CblasNoTrans,
+                    static_cast<int>(m), static_cast<int>(k),
+                    1.0f, a, static_cast<int>(k), b, 1, 0.0f, c, 1);
+        return;
+    }
+    if (m == 1 && k > 0) {
+        cblas_sgemv(CblasRowMajor, CblasTrans,
+                    static_cast<int>(k), static_cast<int>(n),
+                    1.0f, b, static_cast<int>(n), a, 1, 0.0f, c, 1);
+        return;
+    }
     cblas_sgemm(CblasRowMajor, CblasNoTrans, CblasNoTrans,
                 static_cast<int>(m), static_cast<int>(n), static_cast<int>(k),
                 1.0f, a, static_cast<int>(k), b, static_cast<int>(n), 0.0f, c, static_cast<int>(n));
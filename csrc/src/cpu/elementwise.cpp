@@ -1,6 +1,7 @@
 #include "corepy_kernels.h"
 #include <cstdint>
 #include <cstddef>
+#include <cstring>
 
 #if defined(__x86_64__) || defined(_M_X64) || defined(__i386) || defined(_M_IX86)
   #ifdef __AVX2__
@@ -124,3 +125,303 @@ extern "C" void div_f32_cpu(const float* a, const float* b, float* out, size_t c
     }
 #endif
 }
+
+// ============================================================================
+// Scalar-broadcast Operations: out[i] = a[i] <op> scalar
+// ============================================================================
+// The scalar is splatted into a register once, so no N-element broadcast
+// buffer has to be materialized by the caller.
+
+extern "C" void add_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count) {
+#ifdef __AVX2__
+    size_t avx_count = count / 8;
+    __m256 vs = _mm256_set1_ps(scalar);
+    
+    for (size_t i = 0; i < avx_count; ++i) {
+        __m256 va = _mm256_loadu_ps(a + i * 8);
+        _mm256_storeu_ps(out + i * 8, _mm256_add_ps(va, vs));
+    }
+    
+    for (size_t i = avx_count * 8; i < count; ++i) {
+        out[i] = a[i] + scalar;
+    }
+    
+#else
+    for (size_t i = 0; i < count; ++i) {
+        out[i] = a[i] + scalar;
+    }
+#endif
+}
+
+extern "C" void sub_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count) {
+#ifdef __AVX2__
+    size_t avx_count = count / 8;
+    __m256 vs = _mm256_set1_ps(scalar);
+    
+    for (size_t i = 0; i < avx_count; ++i) {
+        __m256 va = _mm256_loadu_ps(a + i * 8);
+        _mm256_storeu_ps(out + i * 8, _mm256_sub_ps(va, vs));
+    }
+    
+    for (size_t i = avx_count * 8; i < count; ++i) {
+        out[i] = a[i] - scalar;
+    }
+    
+#else
+    for (size_t i = 0; i < count; ++i) {
+        out[i] = a[i] - scalar;
+    }
+#endif
+}
+
+extern "C" void mul_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count) {
+#ifdef __AVX2__
+    size_t avx_count = count / 8;
+    __m256 vs = _mm256_set1_ps(scalar);
+    
+    for (size_t i = 0; i < avx_count; ++i) {
+        __m256 va = _mm256_loadu_ps(a + i * 8);
+        _mm256_storeu_ps(out + i * 8, _mm256_mul_ps(va, vs));
+    }
+    
+    for (size_t i = avx_count * 8; i < count; ++i) {
+        out[i] = a[i] * scalar;
+    }
+    
+#else
+    for (size_t i = 0; i < count; ++i) {
+        out[i] = a[i] * scalar;
+    }
+#endif
+}
+
+extern "C" void div_scalar_f32_cpu(const float* a, float scalar, float* out, size_t count) {
+#ifdef __AVX2__
+    size_t avx_count = count / 8;
+    __m256 vs = _mm256_set1_ps(scalar);
+    
+    for (size_t i = 0; i < avx_count; ++i) {
+        __m256 va = _mm256_loadu_ps(a + i * 8);
+        _mm256_storeu_ps(out + i * 8, _mm256_div_ps(va, vs));
+    }
+    
+    for (size_t i = avx_count * 8; i < count; ++i) {
+        out[i] = a[i] / scalar;
+    }
+    
+#else
+    for (size_t i = 0; i < count; ++i) {
+        out[i] = a[i] / scalar;
+    }
+#endif
+}
+
+// ============================================================================
+// axpb_f32_cpu: out[i] = a * x[i] + b
+// ============================================================================
+// Fused form of (x * a) + b: one pass over x instead of a multiply pass and
+// an add pass over its temporary. With FMA the product is not rounded before
+// the add, so results can differ from the two-step form in the last bit.
+// Four independent vectors per iteration keep loads and FMAs in flight.
+
+extern "C" void axpb_f32_cpu(const float* x, float a, float b, float* out, size_t count) {
+    size_t i = 0;
+#ifdef __AVX2__
+    __m256 va = _mm256_set1_ps(a);
+    __m256 vb = _mm256_set1_ps(b);
+    
+    for (; i + 32 <= count; i += 32) {
+    #ifdef __FMA__
+        __m256 r0 = _mm256_fmadd_ps(va, _mm256_loadu_ps(x + i), vb);
+        __m256 r1 = _mm256_fmadd_ps(va, _mm256_loadu_ps(x + i + 8), vb);
+        __m256 r2 = _mm256_fmadd_ps(va, _mm256_loadu_ps(x + i + 16), vb);
+        __m256 r3 = _mm256_fmadd_ps(va, _mm256_loadu_ps(x + i + 24), vb);
+    #else
+        __m256 r0 = _mm256_add_ps(_mm256_mul_ps(va, _mm256_loadu_ps(x + i)), vb);
+        __m256 r1 = _mm256_add_ps(_mm256_mul_ps(va, _mm256_loadu_ps(x + i + 8)), vb);
+        __m256 r2 = _mm256_add_ps(_mm256_mul_ps(va, _mm256_loadu_ps(x + i + 16)), vb);
+        __m256 r3 = _mm256_add_ps(_mm256_mul_ps(va, _mm256_loadu_ps(x + i + 24)), vb);
+    #endif
+        _mm256_storeu_ps(out + i, r0);
+        _mm256_storeu_ps(out + i + 8, r1);
+        _mm256_storeu_ps(out + i + 16, r2);
+        _mm256_storeu_ps(out + i + 24, r3);
+    }
+    for (; i + 8 <= count; i += 8) {
+    #ifdef __FMA__
+        _mm256_storeu_ps(out + i, _mm256_fmadd_ps(va, _mm256_loadu_ps(x + i), vb));
+    #else
+        _mm256_storeu_ps(out + i, _mm256_add_ps(_mm256_mul_ps(va, _mm256_loadu_ps(x + i)), vb));
+    #endif
+    }
+#endif
+    for (; i < count; ++i) {
+        out[i] = a * x[i] + b;
+    }
+}
+
+// ============================================================================
+// BFloat16 element-wise operations: out[i] = a[i] <op> b[i]
+// ============================================================================
+// bf16 values are stored as uint16 bit patterns (the upper half of a float).
+// Each lane is widened to float, computed in float, and rounded back to
+// nearest-even, so memory traffic is half that of the f32 kernels.
+
+static inline float bf16_to_f32(uint16_t h) {
+    uint32_t bits = static_cast<uint32_t>(h) << 16;
+    float f;
+    std::memcpy(&f, &bits, sizeof(f));
+    return f;
+}
+
+static inline uint16_t f32_to_bf16(float f) {
+    uint32_t bits;
+    std::memcpy(&bits, &f, sizeof(bits));
+    if ((bits & 0x7FFFFFFFu) > 0x7F800000u) {
+        return static_cast<uint16_t>((bits >> 16) | 0x40); // Keep NaN quiet
+    }
+    bits += 0x7FFFu + ((bits >> 16) & 1u);
+    return static_cast<uint16_t>(bits >> 16);
+}
+
+#ifdef __AVX2__
+static inline __m256 bf16x8_load(const uint16_t* p) {
+    __m128i h = _mm_loadu_si128(reinterpret_cast<const __m128i*>(p));
+    return _mm256_castsi256_ps(_mm256_slli_epi32(_mm256_cvtepu16_epi32(h), 16));
+}
+
+static inline void bf16x8_store(uint16_t* p, __m256 v) {
+    __m256i bits = _mm256_castps_si256(v);
+    __m256i lsb = _mm256_and_si256(_mm256_srli_epi32(bits, 16), _mm256_set1_epi32(1));
+    __m256i rounded = _mm256_add_epi32(bits, _mm256_add_epi32(lsb, _mm256_set1_epi32(0x7FFF)));
+    __m256i hi = _mm256_srli_epi32(rounded, 16);
+    
+    // NaN lanes: truncate and keep quiet instead of rounding into Inf
+    __m256i nan = _mm256_castps_si256(_mm256_cmp_ps(v, v, _CMP_UNORD_Q));
+    __m256i quiet = _mm256_or_si256(_mm256_srli_epi32(bits, 16), _mm256_set1_epi32(0x40));
+    hi = _mm256_blendv_epi8(hi, quiet, nan);
+    
+    // Pack 8 x u32 -> 8 x u16 (packus works per 128-bit lane; fix the order)
+    __m256i packed = _mm256_permute4x64_epi64(_mm256_packus_epi32(hi, hi), 0x08);
+    _mm_storeu_si128(reinterpret_cast<__m128i*>(p), _mm256_castsi256_si128(packed));
+}
+#endif
+
+template <typename ScalarOp, typename VecOp>
+static inline void binary_bf16(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count,
+                               ScalarOp op, VecOp vop) {
+    size_t i = 0;
+#ifdef __AVX2__
+    for (; i + 8 <= count; i += 8) {
+        bf16x8_store(out + i, vop(bf16x8_load(a + i), bf16x8_load(b + i)));
+    }
+#else
+    (void)vop;
+#endif
+    for (; i < count; ++i) {
+        out[i] = f32_to_bf16(op(bf16_to_f32(a[i]), bf16_to_f32(b[i])));
+    }
+}
+
+#ifdef __AVX2__
+  #define COREPY_BF16_VEC(intrin) [](__m256 x, __m256 y) { return intrin(x, y); }
+#else
+  #define COREPY_BF16_VEC(intrin) 0
+#endif
+
+extern "C" void add_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count) {
+    binary_bf16(a, b, out, count, [](float x, float y) { return x + y; }, COREPY_BF16_VEC(_mm256_add_ps));
+}
+
+extern "C" void sub_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count) {
+    binary_bf16(a, b, out, count, [](float x, float y) { return x - y; }, COREPY_BF16_VEC(_mm256_sub_ps));
+}
+
+extern "C" void mul_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count) {
+    binary_bf16(a, b, out, count, [](float x, float y) { return x * y; }, COREPY_BF16_VEC(_mm256_mul_ps));
+}
+
+extern "C" void div_bf16_cpu(const uint16_t* a, const uint16_t* b, uint16_t* out, size_t count) {
+    binary_bf16(a, b, out, count, [](float x, float y) { return x / y; }, COREPY_BF16_VEC(_mm256_div_ps));
+}
+
+#undef COREPY_BF16_VEC
+
+// ============================================================================
+// Strided element-wise operations: out[i] = a[i * sa] <op> b[i * sb]
+// ============================================================================
+// One row of a non-contiguous view (e.g. a[::2] + b[::2]). Strides are in
+// elements and may be negative; out is contiguous. Non-unit strides are
+// read with AVX2 gathers (8 lanes per instruction), unit strides with plain
+// loads. Strides too large for 32-bit gather indices use the scalar loop.
+
+#ifdef __AVX2__
+static inline __m256 strided_load8(const float* p, ptrdiff_t stride, __m256i vindex) {
+    if (stride == 1) {
+        return _mm256_loadu_ps(p);
+    }
+    return _mm256_i32gather_ps(p, vindex, 4);
+}
+
+static inline __m256i stride_index8(ptrdiff_t s) {
+    int32_t s32 = static_cast<int32_t>(s);
+    return _mm256_setr_epi32(0, s32, 2 * s32, 3 * s32, 4 * s32, 5 * s32, 6 * s32, 7 * s32);
+}
+#endif
+
+template <typename ScalarOp, typename VecOp>
+static inline void binary_strided_f32(const float* a, ptrdiff_t sa, const float* b, ptrdiff_t sb,
+                                      float* out, size_t count, ScalarOp op, VecOp vop) {
+    size_t i = 0;
+#ifdef __AVX2__
+    const ptrdiff_t limit = INT32_MAX / 8;
+    if (sa > -limit && sa < limit && sb > -limit && sb < limit) {
+        __m256i ia = stride_index8(sa);
+        __m256i ib = stride_index8(sb);
+        for (; i + 8 <= count; i += 8) {
+            const ptrdiff_t n = static_cast<ptrdiff_t>(i);
+            __m256 va = strided_load8(a + n * sa, sa, ia);
+            __m256 vb = strided_load8(b + n * sb, sb, ib);
+            _mm256_storeu_ps(out + i, vop(va, vb));
+        }
+    }
+#else
+    (void)vop;
+#endif
+    for (; i < count; ++i) {
+        const ptrdiff_t n = static_cast<ptrdiff_t>(i);
+        out[i] = op(a[n * sa], b[n * sb]);
+    }
+}
+
+#ifdef __AVX2__
+  #define COREPY_STRIDED_VEC(intrin) [](__m256 x, __m256 y) { return intrin(x, y); }
+#else
+  #define COREPY_STRIDED_VEC(intrin) 0
+#endif
+
+extern "C" void add_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride,
+                                    float* out, size_t count) {
+    binary_strided_f32(a, a_stride, b, b_stride, out, count,
+                       [](float x, float y) { return x + y; }, COREPY_STRIDED_VEC(_mm256_add_ps));
+}
+
+extern "C" void sub_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride,
+                                    float* out, size_t count) {
+    binary_strided_f32(a, a_stride, b, b_stride, out, count,
+                       [](float x, float y) { return x - y; }, COREPY_STRIDED_VEC(_mm256_sub_ps));
+}
+
+extern "C" void mul_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride,
+                                    float* out, size_t count) {
+    binary_strided_f32(a, a_stride, b, b_stride, out, count,
+                       [](float x, float y) { return x * y; }, COREPY_STRIDED_VEC(_mm256_mul_ps));
+}
+
+extern "C" void div_strided_f32_cpu(const float* a, ptrdiff_t a_stride, const float* b, ptrdiff_t b_stride,
+                                    float* out, size_t count) {
+    binary_strided_f32(a, a_stride, b, b_stride, out, count,
+                       [](float x, float y) { return x / y; }, COREPY_STRIDED_VEC(_mm256_div_ps));
+}
+
+#undef COREPY_STRIDED_VEC
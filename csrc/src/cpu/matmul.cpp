@@ -5,12 +5,13 @@
 //
 // OPERATIONS:
 // - dot_product_f32_cpu: 1D dot product (vector · vector)
-// - Future: matmul_f32_cpu: 2D matrix multiplication
+// - matmul_f32_cpu: 2D matrix multiplication (blocked, packed, 6x16 micro-kernel)
 //
 // OPTIMIZATION: AVX2 SIMD (8x f32 per instruction)
 
 #include "corepy_kernels.h"
 #include <cstddef>
+#include <vector>
 
 // Only include x86-specific SIMD headers on x86/x64 architectures
 #if defined(__x86_64__) || defined(_M_X64) || defined(__i386) || defined(_M_IX86)
@@ -21,22 +22,43 @@
 
 namespace corepy::backend::avx2 {
 
+#ifdef __AVX2__
+/// a * b + c, fused when FMA is available
+static inline __m256 fmadd_ps(__m256 a, __m256 b, __m256 c) {
+    #ifdef __FMA__
+    return _mm256_fmadd_ps(a, b, c);
+    #else
+    return _mm256_add_ps(_mm256_mul_ps(a, b), c);
+    #endif
+}
+#endif
+
 /// Compute dot product of two f32 arrays
 float dot_product_f32(const float* a, const float* b, size_t count) {
     #ifdef __AVX2__
     // AVX2 path: process 8 floats at a time
     
-    __m256 sum_vec = _mm256_setzero_ps();  // Initialize accumulator to 0
+    // Four independent accumulators: a single one would stall every
+    // iteration on the previous FMA's latency
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    __m256 acc2 = _mm256_setzero_ps();
+    __m256 acc3 = _mm256_setzero_ps();
     size_t avx_count = count / 8;          // Number of full AVX2 vectors
     size_t i = 0;
     
-    // Main loop: process 8 elements per iteration
+    // Main loop: process 32 elements per iteration
+    for (; i + 32 <= avx_count * 8; i += 32) {
+        acc0 = fmadd_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i), acc0);
+        acc1 = fmadd_ps(_mm256_loadu_ps(a + i + 8), _mm256_loadu_ps(b + i + 8), acc1);
+        acc2 = fmadd_ps(_mm256_loadu_ps(a + i + 16), _mm256_loadu_ps(b + i + 16), acc2);
+        acc3 = fmadd_ps(_mm256_loadu_ps(a + i + 24), _mm256_loadu_ps(b + i + 24), acc3);
+    }
+    // Remaining full vectors
     for (; i < avx_count * 8; i += 8) {
-        __m256 va = _mm256_loadu_ps(a + i);       // Load 8 floats from a
-        __m256 vb = _mm256_loadu_ps(b + i);       // Load 8 floats from b
-        __m256 prod = _mm256_mul_ps(va, vb);      // Multiply element-wise
-        sum_vec = _mm256_add_ps(sum_vec, prod);   // Accumulate
+        acc0 = fmadd_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i), acc0);
     }
+    __m256 sum_vec = _mm256_add_ps(_mm256_add_ps(acc0, acc1), _mm256_add_ps(acc2, acc3));
     
     // Horizontal sum: reduce 8 partial sums to 1 scalar
     // sum_vec = [s0, s1, s2, s3, s4, s5, s6, s7]
@@ -72,58 +94,267 @@ float dot_product_f32(const float* a, const float* b, size_t count) {
     #endif
 }
 
+// ----------------------------------------------------------------------------
+// matmul_f32: BLIS-style blocked GEMM (C = A @ B, row-major)
+// ----------------------------------------------------------------------------
+// Loop nest (outer to inner), block sizes sized for the cache hierarchy:
+//   jc: NC columns of B/C      -> packed B panel lives in L3
+//   pc: KC depth               -> one MR x KC sliver of A stays in L1
+//   ic: MC rows of A/C         -> packed A block lives in L2
+//   jr/ir: NR x MR micro-tiles -> 6x16 accumulator tile in 12 ymm registers
+// B and A are packed into contiguous, zero-padded micro-panels so the
+// micro-kernel streams both with unit stride and never handles edges itself.
+// Threading stays in Rust: each Rayon task calls this on a slab of rows.
+// Block sizes can be overridden at build time (-DCOREPY_MATMUL_MC=...).
+
+#ifndef COREPY_MATMUL_MC
+#define COREPY_MATMUL_MC 144
+#endif
+#ifndef COREPY_MATMUL_KC
+#define COREPY_MATMUL_KC 256
+#endif
+#ifndef COREPY_MATMUL_NC
+#define COREPY_MATMUL_NC 2048
+#endif
+
+#ifdef __AVX2__
+
+static constexpr size_t MR = 6;
+static constexpr size_t NR = 16;
+static constexpr size_t MC = COREPY_MATMUL_MC;
+static constexpr size_t KC = COREPY_MATMUL_KC;
+static constexpr size_t NC = COREPY_MATMUL_NC;
+static_assert(MC % MR == 0 && NC % NR == 0, "block sizes must be micro-tile multiples");
+
+/// Pack a kc x nc block of B (leading dim ldb) into NR-wide column panels
+static void pack_b(const float* b, size_t ldb, size_t kc, size_t nc, float* bp) {
+    for (size_t j = 0; j < nc; j += NR) {
+        size_t nr = nc - j < NR ? nc - j : NR;
+        for (size_t p = 0; p < kc; ++p) {
+            const float* src = b + p * ldb + j;
+            if (nr == NR) {
+                _mm256_storeu_ps(bp, _mm256_loadu_ps(src));
+                _mm256_storeu_ps(bp + 8, _mm256_loadu_ps(src + 8));
+            } else {
+                size_t c = 0;
+                for (; c < nr; ++c) bp[c] = src[c];
+                for (; c < NR; ++c) bp[c] = 0.0f;
+            }
+            bp += NR;
+        }
+    }
+}
+
+/// Pack an mc x kc block of A (leading dim lda) into MR-tall row panels
+static void pack_a(const float* a, size_t lda, size_t mc, size_t kc, float* ap) {
+    for (size_t i = 0; i < mc; i += MR) {
+        size_t mr = mc - i < MR ? mc - i : MR;
+        const float* src = a + i * lda;
+        for (size_t p = 0; p < kc; ++p) {
+            size_t r = 0;
+            for (; r < mr; ++r) ap[r] = src[r * lda + p];
+            for (; r < MR; ++r) ap[r] = 0.0f;
+            ap += MR;
+        }
+    }
+}
+
+/// 6x16 micro-kernel: C[0:mr, 0:nr] (+)= Ap sliver @ Bp sliver over kc
+static void micro_kernel_6x16(size_t kc, const float* ap, const float* bp,
+                              float* c, size_t ldc, size_t mr, size_t nr,
+                              bool accumulate) {
+    __m256 acc[MR][2];
+    for (size_t r = 0; r < MR; ++r) {
+        acc[r][0] = _mm256_setzero_ps();
+        acc[r][1] = _mm256_setzero_ps();
+    }
+
+    for (size_t p = 0; p < kc; ++p) {
+        __m256 b0 = _mm256_loadu_ps(bp);
+        __m256 b1 = _mm256_loadu_ps(bp + 8);
+        for (size_t r = 0; r < MR; ++r) {
+            __m256 av = _mm256_broadcast_ss(ap + r);
+            #ifdef __FMA__
+            acc[r][0] = _mm256_fmadd_ps(av, b0, acc[r][0]);
+            acc[r][1] = _mm256_fmadd_ps(av, b1, acc[r][1]);
+            #else
+            acc[r][0] = _mm256_add_ps(acc[r][0], _mm256_mul_ps(av, b0));
+            acc[r][1] = _mm256_add_ps(acc[r][1], _mm256_mul_ps(av, b1));
+            #endif
+        }
+        ap += MR;
+        bp += NR;
+    }
+
+    if (mr == MR && nr == NR) {
+        for (size_t r = 0; r < MR; ++r) {
+            float* cr = c + r * ldc;
+            if (accumulate) {
+                acc[r][0] = _mm256_add_ps(acc[r][0], _mm256_loadu_ps(cr));
+                acc[r][1] = _mm256_add_ps(acc[r][1], _mm256_loadu_ps(cr + 8));
+            }
+            _mm256_storeu_ps(cr, acc[r][0]);
+            _mm256_storeu_ps(cr + 8, acc[r][1]);
+        }
+        return;
+    }
+
+    // Edge tile: spill the full tile and copy back only the valid part
+    alignas(32) float tile[MR * NR];
+    for (size_t r = 0; r < MR; ++r) {
+        _mm256_store_ps(tile + r * NR, acc[r][0]);
+        _mm256_store_ps(tile + r * NR + 8, acc[r][1]);
+    }
+    for (size_t r = 0; r < mr; ++r) {
+        float* cr = c + r * ldc;
+        for (size_t j = 0; j < nr; ++j) {
+            cr[j] = accumulate ? cr[j] + tile[r * NR + j] : tile[r * NR + j];
+        }
+    }
+}
+
+static inline float hsum256_ps(__m256 v) {
+    __m128 sum128 = _mm_add_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+    sum128 = _mm_add_ps(sum128, _mm_movehl_ps(sum128, sum128));
+    sum128 = _mm_add_ss(sum128, _mm_movehdup_ps(sum128));
+    return _mm_cvtss_f32(sum128);
+}
+
+/// Matrix-vector (n == 1): y[i] = A[i, :] . x, four rows share each x load
+static void gemv_f32(const float* a, const float* x, float* y, size_t m, size_t k) {
+    size_t i = 0;
+    for (; i + 4 <= m; i += 4) {
+        const float* a0 = a + (i + 0) * k;
+        const float* a1 = a + (i + 1) * k;
+        const float* a2 = a + (i + 2) * k;
+        const float* a3 = a + (i + 3) * k;
+        __m256 acc0 = _mm256_setzero_ps();
+        __m256 acc1 = _mm256_setzero_ps();
+        __m256 acc2 = _mm256_setzero_ps();
+        __m256 acc3 = _mm256_setzero_ps();
+        size_t p = 0;
+        for (; p + 8 <= k; p += 8) {
+            __m256 xv = _mm256_loadu_ps(x + p);
+            acc0 = fmadd_ps(_mm256_loadu_ps(a0 + p), xv, acc0);
+            acc1 = fmadd_ps(_mm256_loadu_ps(a1 + p), xv, acc1);
+            acc2 = fmadd_ps(_mm256_loadu_ps(a2 + p), xv, acc2);
+            acc3 = fmadd_ps(_mm256_loadu_ps(a3 + p), xv, acc3);
+        }
+        float s0 = hsum256_ps(acc0), s1 = hsum256_ps(acc1);
+        float s2 = hsum256_ps(acc2), s3 = hsum256_ps(acc3);
+        for (; p < k; ++p) {
+            s0 += a0[p] * x[p];
+            s1 += a1[p] * x[p];
+            s2 += a2[p] * x[p];
+            s3 += a3[p] * x[p];
+        }
+        y[i + 0] = s0;
+        y[i + 1] = s1;
+        y[i + 2] = s2;
+        y[i + 3] = s3;
+    }
+    for (; i < m; ++i) {
+        y[i] = dot_product_f32(a + i * k, x, k);
+    }
+}
+
+/// Vector-matrix (m == 1): y = x @ B. Broadcast x[p] and FMA it into a
+/// register-resident strip of y while streaming row p of B (the
+/// column-major GEMV form: B's rows are the columns of B^T)
+static void gevm_f32(const float* x, const float* b, float* y, size_t k, size_t n) {
+    size_t j = 0;
+    for (; j + 32 <= n; j += 32) {
+        __m256 acc0 = _mm256_setzero_ps();
+        __m256 acc1 = _mm256_setzero_ps();
+        __m256 acc2 = _mm256_setzero_ps();
+        __m256 acc3 = _mm256_setzero_ps();
+        for (size_t p = 0; p < k; ++p) {
+            const float* rb = b + p * n + j;
+            __m256 xv = _mm256_broadcast_ss(x + p);
+            acc0 = fmadd_ps(_mm256_loadu_ps(rb), xv, acc0);
+            acc1 = fmadd_ps(_mm256_loadu_ps(rb + 8), xv, acc1);
+            acc2 = fmadd_ps(_mm256_loadu_ps(rb + 16), xv, acc2);
+            acc3 = fmadd_ps(_mm256_loadu_ps(rb + 24), xv, acc3);
+        }
+        _mm256_storeu_ps(y + j, acc0);
+        _mm256_storeu_ps(y + j + 8, acc1);
+        _mm256_storeu_ps(y + j + 16, acc2);
+        _mm256_storeu_ps(y + j + 24, acc3);
+    }
+    for (; j + 8 <= n; j += 8) {
+        __m256 acc = _mm256_setzero_ps();
+        for (size_t p = 0; p < k; ++p) {
+            acc = fmadd_ps(_mm256_loadu_ps(b + p * n + j), _mm256_broadcast_ss(x + p), acc);
+        }
+        _mm256_storeu_ps(y + j, acc);
+    }
+    for (; j < n; ++j) {
+        float sum = 0.0f;
+        for (size_t p = 0; p < k; ++p) sum += x[p] * b[p * n + j];
+        y[j] = sum;
+    }
+}
+
 void matmul_f32(
     const float* a, const float* b, float* c,
     size_t m, size_t k, size_t n
 ) {
-    // Zero-initialize output matrix
-    for (size_t i = 0; i < m * n; ++i) c[i] = 0.0f;
+    if (k == 0) {
+        for (size_t i = 0; i < m * n; ++i) c[i] = 0.0f;
+        return;
+    }
 
-    // Unrolled (i, p, j) implementation
-    // This order access row_b[p, :] and row_c[i, :] contiguously.
-    // Unrolling i by 4 reduces B bandwidth by 4x.
-    
-    size_t i = 0;
-    for (; i + 3 < m; i += 4) {
-        for (size_t p = 0; p < k; ++p) {
-            __m256 va0 = _mm256_set1_ps(a[(i + 0) * k + p]);
-            __m256 va1 = _mm256_set1_ps(a[(i + 1) * k + p]);
-            __m256 va2 = _mm256_set1_ps(a[(i + 2) * k + p]);
-            __m256 va3 = _mm256_set1_ps(a[(i + 3) * k + p]);
-
-            const float* rb = b + p * n;
-            float* rc0 = c + (i + 0) * n;
-            float* rc1 = c + (i + 1) * n;
-            float* rc2 = c + (i + 2) * n;
-            float* rc3 = c + (i + 3) * n;
-
-            size_t j = 0;
-            for (; j + 7 < n; j += 8) {
-                __m256 vb = _mm256_loadu_ps(rb + j);
-                
-                #ifdef __FMA__
-                _mm256_storeu_ps(rc0 + j, _mm256_fmadd_ps(va0, vb, _mm256_loadu_ps(rc0 + j)));
-                _mm256_storeu_ps(rc1 + j, _mm256_fmadd_ps(va1, vb, _mm256_loadu_ps(rc1 + j)));
-                _mm256_storeu_ps(rc2 + j, _mm256_fmadd_ps(va2, vb, _mm256_loadu_ps(rc2 + j)));
-                _mm256_storeu_ps(rc3 + j, _mm256_fmadd_ps(va3, vb, _mm256_loadu_ps(rc3 + j)));
-                #else
-                _mm256_storeu_ps(rc0 + j, _mm256_add_ps(_mm256_loadu_ps(rc0 + j), _mm256_mul_ps(va0, vb)));
-                _mm256_storeu_ps(rc1 + j, _mm256_add_ps(_mm256_loadu_ps(rc1 + j), _mm256_mul_ps(va1, vb)));
-                _mm256_storeu_ps(rc2 + j, _mm256_add_ps(_mm256_loadu_ps(rc2 + j), _mm256_mul_ps(va2, vb)));
-                _mm256_storeu_ps(rc3 + j, _mm256_add_ps(_mm256_loadu_ps(rc3 + j), _mm256_mul_ps(va3, vb)));
-                #endif
-            }
-            // Scalar remainder for j
-            for (; j < n; ++j) {
-                float bv = rb[j];
-                rc0[j] += va0[0] * bv; // va0[0] is not valid, use scalar part or broadcasted set
-                // Actually easier to just use a[i*k+p]
+    // Degenerate shapes are memory-bound: skip packing and stream once
+    if (n == 1) {
+        gemv_f32(a, b, c, m, k);
+        return;
+    }
+    if (m == 1) {
+        gevm_f32(a, b, c, k, n);
+        return;
+    }
+
+    // Packing buffers are reused across calls on the same (Rayon) thread
+    thread_local std::vector<float> a_pack(MC * KC);
+    thread_local std::vector<float> b_pack(KC * NC);
+    float* ap = a_pack.data();
+    float* bp = b_pack.data();
+
+    for (size_t jc = 0; jc < n; jc += NC) {
+        size_t nc = n - jc < NC ? n - jc : NC;
+        for (size_t pc = 0; pc < k; pc += KC) {
+            size_t kc = k - pc < KC ? k - pc : KC;
+            bool accumulate = pc != 0; // first depth block overwrites C
+            pack_b(b + pc * n + jc, n, kc, nc, bp);
+
+            for (size_t ic = 0; ic < m; ic += MC) {
+                size_t mc = m - ic < MC ? m - ic : MC;
+                pack_a(a + ic * k + pc, k, mc, kc, ap);
+
+                for (size_t jr = 0; jr < nc; jr += NR) {
+                    size_t nr = nc - jr < NR ? nc - jr : NR;
+                    for (size_t ir = 0; ir < mc; ir += MR) {
+                        size_t mr = mc - ir < MR ? mc - ir : MR;
+                        micro_kernel_6x16(
+                            kc, ap + ir * kc, bp + jr * kc,
+                            c + (ic + ir) * n + jc + jr, n, mr, nr, accumulate
+                        );
+                    }
+                }
             }
         }
     }
+}
 
-    // Remainder i
-    for (; i < m; ++i) {
+#else
+
+void matmul_f32(
+    const float* a, const float* b, float* c,
+    size_t m, size_t k, size_t n
+) {
+    // Scalar fallback: (i, p, j) order streams rows of B and C
+    for (size_t i = 0; i < m * n; ++i) c[i] = 0.0f;
+    for (size_t i = 0; i < m; ++i) {
         for (size_t p = 0; p < k; ++p) {
             float val_a = a[i * k + p];
             for (size_t j = 0; j < n; ++j) {
@@ -133,6 +364,8 @@ void matmul_f32(
     }
 }
 
+#endif // __AVX2__
+
 } // namespace corepy::backend::avx2
 
 extern "C" {
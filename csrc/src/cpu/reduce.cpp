@@ -1,6 +1,8 @@
 #include "corepy_kernels.h"
 #include <cstdint>
 #include <cstddef>
+#include <cstring>
+#include <limits>
 
 #if defined(__x86_64__) || defined(_M_X64) || defined(__i386) || defined(_M_IX86)
   #ifdef __AVX2__
@@ -8,6 +10,18 @@
   #endif
 #endif
 
+#ifdef __AVX2__
+// Horizontal sum of 8 floats: narrow to 128 bits first (extract + add), then
+// two shuffle + add steps. Each hadd_ps is 3 uops (two shuffles + add), so
+// this is shorter than the hadd pair on current x86 cores.
+static inline float hsum256_ps(__m256 v) {
+    __m128 s = _mm_add_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+    s = _mm_add_ps(s, _mm_movehl_ps(s, s));
+    s = _mm_add_ss(s, _mm_movehdup_ps(s));
+    return _mm_cvtss_f32(s);
+}
+#endif
+
 extern "C" bool all_bool_cpu(const uint8_t* data, size_t count) {
     // RUST LAYER CONTRACT:
     // - data is valid, non-null pointer
@@ -19,33 +33,35 @@ extern "C" bool all_bool_cpu(const uint8_t* data, size_t count) {
     // - Trust inputs are valid
     
 #ifdef __AVX2__
-    // AVX2 path: Check 32 bytes at once
-    // Strategy: Use vectorized comparison to find any zeros (false values)
-    size_t avx_count = count / 32;
-    size_t remainder = count % 32;
-    
-    // Process 32 bytes per iteration using AVX2
-    for (size_t i = 0; i < avx_count; ++i) {
-        // Load 32 bytes (256 bits) of boolean data
-        __m256i chunk = _mm256_loadu_si256(
-            reinterpret_cast<const __m256i*>(data + i * 32)
-        );
-        
-        // Compare with zero to find any false values
-        __m256i zeros = _mm256_setzero_si256();
-        __m256i cmp = _mm256_cmpeq_epi8(chunk, zeros);
-        
-        // Extract mask: if any byte is zero, corresponding bit is set
-        int mask = _mm256_movemask_epi8(cmp);
-        
-        // If any comparison matched (any zero found), return false immediately
-        if (mask != 0) {
+    // AVX2 path: 128 bytes per early-exit branch. The unsigned byte minimum
+    // of four 32-byte loads is zero iff any of the 128 bytes is zero
+    // (AND would not do: truthy bytes such as 1 and 2 AND to zero), so one
+    // cmpeq + movemask covers four vectors.
+    const __m256i zeros = _mm256_setzero_si256();
+    size_t i = 0;
+    
+    for (; i + 128 <= count; i += 128) {
+        const __m256i* p = reinterpret_cast<const __m256i*>(data + i);
+        __m256i lo = _mm256_min_epu8(_mm256_loadu_si256(p), _mm256_loadu_si256(p + 1));
+        __m256i hi = _mm256_min_epu8(_mm256_loadu_si256(p + 2), _mm256_loadu_si256(p + 3));
+        if (_mm256_movemask_epi8(_mm256_cmpeq_epi8(_mm256_min_epu8(lo, hi), zeros)) != 0) {
+            return false;
+        }
+    }
+    for (; i + 32 <= count; i += 32) {
+        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        if (_mm256_movemask_epi8(_mm256_cmpeq_epi8(chunk, zeros)) != 0) {
             return false;
         }
     }
     
-    // Process remaining elements with scalar loop
-    for (size_t i = avx_count * 32; i < count; ++i) {
+    // Tail: one load of the last 32 bytes (overlapping bytes already
+    // passed, so re-checking them is harmless)
+    if (i < count && count >= 32) {
+        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + count - 32));
+        return _mm256_movemask_epi8(_mm256_cmpeq_epi8(chunk, zeros)) == 0;
+    }
+    for (; i < count; ++i) {
         if (data[i] == 0) {
             return false;
         }
@@ -74,30 +90,32 @@ extern "C" bool any_bool_cpu(const uint8_t* data, size_t count) {
     // Early-exit optimization: return true on first non-zero element
     
 #ifdef __AVX2__
-    // AVX2 path: Check 32 bytes at once
-    size_t avx_count = count / 32;
-    size_t remainder = count % 32;
-    
-    for (size_t i = 0; i < avx_count; ++i) {
-        __m256i chunk = _mm256_loadu_si256(
-            reinterpret_cast<const __m256i*>(data + i * 32)
-        );
-        
-        // Compare with zero
-        __m256i zeros = _mm256_setzero_si256();
-        __m256i cmp = _mm256_cmpeq_epi8(chunk, zeros);
-        
-        // If not all bytes are zero, at least one is non-zero
-        int mask = _mm256_movemask_epi8(cmp);
-        
-        // mask == -1 means all bytes were zero, otherwise we found a non-zero
-        if (mask != -1) {
+    // AVX2 path: OR four 32-byte loads and test the result with vptest, so
+    // 128 bytes cost one branch (same layout as all_bool_cpu)
+    size_t i = 0;
+    
+    for (; i + 128 <= count; i += 128) {
+        const __m256i* p = reinterpret_cast<const __m256i*>(data + i);
+        __m256i lo = _mm256_or_si256(_mm256_loadu_si256(p), _mm256_loadu_si256(p + 1));
+        __m256i hi = _mm256_or_si256(_mm256_loadu_si256(p + 2), _mm256_loadu_si256(p + 3));
+        __m256i any = _mm256_or_si256(lo, hi);
+        if (!_mm256_testz_si256(any, any)) {
+            return true;
+        }
+    }
+    for (; i + 32 <= count; i += 32) {
+        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        if (!_mm256_testz_si256(chunk, chunk)) {
             return true;
         }
     }
     
-    // Check remainder
-    for (size_t i = avx_count * 32; i < count; ++i) {
+    // Tail: overlapping load of the last 32 bytes
+    if (i < count && count >= 32) {
+        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + count - 32));
+        return !_mm256_testz_si256(chunk, chunk);
+    }
+    for (; i < count; ++i) {
         if (data[i] != 0) {
             return true;
         }
@@ -119,38 +137,75 @@ extern "C" bool any_bool_cpu(const uint8_t* data, size_t count) {
 // ============================================================================
 // sum_f32_cpu: Sum reduction with Kahan summation for precision
 // ============================================================================
+// Baseline (build-time ISA) body; sum_f32_cpu itself dispatches at runtime,
+// see "Runtime ISA dispatch" below.
 
-extern "C" float sum_f32_cpu(const float* data, size_t count) {
-    if (count == 0) {
-        return 0.0f;
-    }
-    
+// Floats per accumulation block in the vector sums (see sum_f32_base): 16 KB,
+// so the per-block fold is noise next to the loads
+static constexpr size_t SUM_BLOCK = 4096;
+
+static float sum_f32_base(const float* data, size_t count) {
 #ifdef __AVX2__
-    // AVX2 path: Process 8 floats at once
-    size_t avx_count = count / 8;
-    size_t remainder = count % 8;
-    
-    // Accumulator for AVX2 sums
-    __m256 sum_vec = _mm256_setzero_ps();
-    
-    for (size_t i = 0; i < avx_count; ++i) {
-        __m256 chunk = _mm256_loadu_ps(data + i * 8);
-        sum_vec = _mm256_add_ps(sum_vec, chunk);
+    // AVX2 path: four independent accumulators (32 floats per iteration).
+    // One accumulator serializes on the 4-cycle add latency and leaves most
+    // add slots idle; four keep both FP add ports busy on cached data.
+    
+    // Peel up to 7 leading elements so the vector loads start on a 32-byte
+    // boundary. NumPy only guarantees 16-byte alignment, and a misaligned
+    // 32-byte load splits across two cache lines every other iteration
+    // (~1.8x slower on L2-resident data). Once aligned, loadu costs the same
+    // as load, so buffers that are not even float-aligned (raw byte views)
+    // share this loop unpeeled.
+    float head = 0.0f;
+    const uintptr_t addr = reinterpret_cast<uintptr_t>(data);
+    if ((addr & 3) == 0) {
+        size_t peel = ((32 - (addr & 31)) & 31) / sizeof(float);
+        if (peel > count) peel = count;
+        for (size_t j = 0; j < peel; ++j) {
+            head += data[j];
+        }
+        data += peel;
+        count -= peel;
     }
     
-    // Horizontal sum: reduce 8 lanes to single value
-    __m128 low = _mm256_castps256_ps128(sum_vec);
-    __m128 high = _mm256_extractf128_ps(sum_vec, 1);
-    __m128 sum128 = _mm_add_ps(low, high);
-    
-    sum128 = _mm_hadd_ps(sum128, sum128);
-    sum128 = _mm_hadd_ps(sum128, sum128);
-    
-    float sum = _mm_cvtss_f32(sum128);
+    // Blocked accumulation: each block of SUM_BLOCK floats starts from fresh
+    // accumulators, so a lane's running sum spans only SUM_BLOCK / 32 adds,
+    // and block results are folded into a per-lane compensated (Kahan)
+    // total. Error then grows with the block length instead of with n/32,
+    // for four extra vector ops per block.
+    size_t avx_end = count - count % 8;
+    size_t i = 0;
+    __m256 total = _mm256_setzero_ps();
+    __m256 comp = _mm256_setzero_ps();
+    
+    while (i < avx_end) {
+        size_t block_end = avx_end - i > SUM_BLOCK ? i + SUM_BLOCK : avx_end;
+        __m256 acc0 = _mm256_setzero_ps();
+        __m256 acc1 = _mm256_setzero_ps();
+        __m256 acc2 = _mm256_setzero_ps();
+        __m256 acc3 = _mm256_setzero_ps();
+        
+        for (; i + 32 <= block_end; i += 32) {
+            acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(data + i));
+            acc1 = _mm256_add_ps(acc1, _mm256_loadu_ps(data + i + 8));
+            acc2 = _mm256_add_ps(acc2, _mm256_loadu_ps(data + i + 16));
+            acc3 = _mm256_add_ps(acc3, _mm256_loadu_ps(data + i + 24));
+        }
+        for (; i < block_end; i += 8) {
+            acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(data + i));
+        }
+        
+        __m256 y = _mm256_sub_ps(_mm256_add_ps(_mm256_add_ps(acc0, acc1), _mm256_add_ps(acc2, acc3)), comp);
+        __m256 t = _mm256_add_ps(total, y);
+        comp = _mm256_sub_ps(_mm256_sub_ps(t, total), y);
+        total = t;
+    }
+    // Apply the last block's compensation; lanes then combine pairwise (hsum256_ps)
+    float sum = hsum256_ps(_mm256_sub_ps(total, comp)) + head;
     
     // Add remainder with Kahan summation
     float c = 0.0f;
-    for (size_t i = avx_count * 8; i < count; ++i) {
+    for (; i < count; ++i) {
         float y = data[i] - c;
         float t = sum + y;
         c = (t - sum) - y;
@@ -226,15 +281,642 @@ extern "C" int32_t sum_i32_cpu(const int32_t* data, size_t count) {
 }
 
 // ============================================================================
-// mean_f32_cpu: Mean (average) of f32 array
+// sse_f32_cpu: Sum of squared differences, sum((a - b)^2)
+// ============================================================================
+// Fused form of `d = a - b; (d * d).sum()`: one pass over a and b, no
+// intermediate arrays.
+
+static float sse_f32_base(const float* a, const float* b, size_t count) {
+#ifdef __AVX2__
+    // Four accumulators, as in sum_f32_base: one chain is add-latency bound
+    size_t avx_count = count / 8;
+    size_t i = 0;
+    __m256 acc[4] = {_mm256_setzero_ps(), _mm256_setzero_ps(), _mm256_setzero_ps(), _mm256_setzero_ps()};
+    
+    for (; i + 4 <= avx_count; i += 4) {
+        for (int k = 0; k < 4; ++k) {
+            __m256 diff = _mm256_sub_ps(_mm256_loadu_ps(a + (i + k) * 8), _mm256_loadu_ps(b + (i + k) * 8));
+            acc[k] = _mm256_add_ps(acc[k], _mm256_mul_ps(diff, diff));
+        }
+    }
+    for (; i < avx_count; ++i) {
+        __m256 diff = _mm256_sub_ps(_mm256_loadu_ps(a + i * 8), _mm256_loadu_ps(b + i * 8));
+        acc[0] = _mm256_add_ps(acc[0], _mm256_mul_ps(diff, diff));
+    }
+    
+    float sum = hsum256_ps(_mm256_add_ps(_mm256_add_ps(acc[0], acc[1]), _mm256_add_ps(acc[2], acc[3])));
+    
+    for (size_t i = avx_count * 8; i < count; ++i) {
+        float diff = a[i] - b[i];
+        sum += diff * diff;
+    }
+    
+    return sum;
+    
+#else
+    float sum = 0.0f;
+    for (size_t i = 0; i < count; ++i) {
+        float diff = a[i] - b[i];
+        sum += diff * diff;
+    }
+    return sum;
+#endif
+}
+
+// ============================================================================
+// Runtime ISA dispatch for the f32 reductions
 // ============================================================================
+// The library is built for one baseline (AVX2 on x86-64). Reductions whose
+// throughput scales with vector width also get an AVX-512 variant, compiled
+// with a target attribute (as dot_i8_cpu does for VNNI) so the rest of the
+// build keeps its baseline. The table is filled once at load time from cpuid;
+// sum_f32_cpu / sse_f32_cpu / moments_f32_cpu then make one indirect call.
+
+#if defined(__AVX2__) && (defined(__GNUC__) || defined(__clang__))
+#define COREPY_HAVE_AVX512_TARGET 1
+
+// Four zmm accumulators: 64 floats per iteration; the tail is one masked load
+__attribute__((target("avx512f")))
+static float sum_f32_avx512(const float* data, size_t count) {
+    // Same blocked, compensated accumulation as sum_f32_base
+    __m512 total = _mm512_setzero_ps();
+    __m512 comp = _mm512_setzero_ps();
+    size_t i = 0;
+    while (i < count) {
+        size_t block_end = count - i > SUM_BLOCK ? i + SUM_BLOCK : count;
+        __m512 acc0 = _mm512_setzero_ps();
+        __m512 acc1 = _mm512_setzero_ps();
+        __m512 acc2 = _mm512_setzero_ps();
+        __m512 acc3 = _mm512_setzero_ps();
+        for (; i + 64 <= block_end; i += 64) {
+            acc0 = _mm512_add_ps(acc0, _mm512_loadu_ps(data + i));
+            acc1 = _mm512_add_ps(acc1, _mm512_loadu_ps(data + i + 16));
+            acc2 = _mm512_add_ps(acc2, _mm512_loadu_ps(data + i + 32));
+            acc3 = _mm512_add_ps(acc3, _mm512_loadu_ps(data + i + 48));
+        }
+        for (; i + 16 <= block_end; i += 16) {
+            acc0 = _mm512_add_ps(acc0, _mm512_loadu_ps(data + i));
+        }
+        if (i < block_end) {
+            __mmask16 tail = static_cast<__mmask16>((1u << (block_end - i)) - 1);
+            acc1 = _mm512_add_ps(acc1, _mm512_maskz_loadu_ps(tail, data + i));
+            i = block_end;
+        }
+        
+        __m512 y = _mm512_sub_ps(_mm512_add_ps(_mm512_add_ps(acc0, acc1), _mm512_add_ps(acc2, acc3)), comp);
+        __m512 t = _mm512_add_ps(total, y);
+        comp = _mm512_sub_ps(_mm512_sub_ps(t, total), y);
+        total = t;
+    }
+    return _mm512_reduce_add_ps(_mm512_sub_ps(total, comp));
+}
+
+__attribute__((target("avx512f")))
+static float sse_f32_avx512(const float* a, const float* b, size_t count) {
+    __m512 acc0 = _mm512_setzero_ps();
+    __m512 acc1 = _mm512_setzero_ps();
+    size_t i = 0;
+    for (; i + 32 <= count; i += 32) {
+        __m512 d0 = _mm512_sub_ps(_mm512_loadu_ps(a + i), _mm512_loadu_ps(b + i));
+        __m512 d1 = _mm512_sub_ps(_mm512_loadu_ps(a + i + 16), _mm512_loadu_ps(b + i + 16));
+        acc0 = _mm512_fmadd_ps(d0, d0, acc0);
+        acc1 = _mm512_fmadd_ps(d1, d1, acc1);
+    }
+    for (; i < count; i += 16) {
+        __mmask16 m = count - i >= 16 ? static_cast<__mmask16>(0xFFFF)
+                                      : static_cast<__mmask16>((1u << (count - i)) - 1);
+        __m512 d = _mm512_sub_ps(_mm512_maskz_loadu_ps(m, a + i), _mm512_maskz_loadu_ps(m, b + i));
+        acc0 = _mm512_fmadd_ps(d, d, acc0);
+    }
+    return _mm512_reduce_add_ps(_mm512_add_ps(acc0, acc1));
+}
+
+// Two (sum, sumsq) accumulator pairs, 32 floats per iteration; masked tail
+__attribute__((target("avx512f")))
+static void moments_f32_avx512(const float* data, size_t count, float* out) {
+    __m512 s0 = _mm512_setzero_ps();
+    __m512 s1 = _mm512_setzero_ps();
+    __m512 q0 = _mm512_setzero_ps();
+    __m512 q1 = _mm512_setzero_ps();
+    size_t i = 0;
+    for (; i + 32 <= count; i += 32) {
+        __m512 x0 = _mm512_loadu_ps(data + i);
+        __m512 x1 = _mm512_loadu_ps(data + i + 16);
+        s0 = _mm512_add_ps(s0, x0);
+        s1 = _mm512_add_ps(s1, x1);
+        q0 = _mm512_fmadd_ps(x0, x0, q0);
+        q1 = _mm512_fmadd_ps(x1, x1, q1);
+    }
+    for (; i < count; i += 16) {
+        __mmask16 m = count - i >= 16 ? static_cast<__mmask16>(0xFFFF)
+                                      : static_cast<__mmask16>((1u << (count - i)) - 1);
+        __m512 x = _mm512_maskz_loadu_ps(m, data + i);
+        s0 = _mm512_add_ps(s0, x);
+        q0 = _mm512_fmadd_ps(x, x, q0);
+    }
+    out[0] = _mm512_reduce_add_ps(_mm512_add_ps(s0, s1));
+    out[1] = _mm512_reduce_add_ps(_mm512_add_ps(q0, q1));
+}
+#endif
+
+static void moments_f32_base(const float* data, size_t count, float* out);
+
+namespace {
+
+struct ReduceKernels {
+    const char* level;
+    float (*sum_f32)(const float*, size_t);
+    float (*sse_f32)(const float*, const float*, size_t);
+    void (*moments_f32)(const float*, size_t, float*);
+};
+
+ReduceKernels select_reduce_kernels() {
+#ifdef COREPY_HAVE_AVX512_TARGET
+    __builtin_cpu_init(); // Required before __builtin_cpu_supports in static init
+    if (__builtin_cpu_supports("avx512f")) {
+        return {"avx512", sum_f32_avx512, sse_f32_avx512, moments_f32_avx512};
+    }
+#endif
+#ifdef __AVX2__
+    return {"avx2", sum_f32_base, sse_f32_base, moments_f32_base};
+#else
+    return {"scalar", sum_f32_base, sse_f32_base, moments_f32_base};
+#endif
+}
+
+const ReduceKernels g_reduce = select_reduce_kernels();
+
+} // namespace
+
+extern "C" float sum_f32_cpu(const float* data, size_t count) {
+    if (count == 0) {
+        return 0.0f;
+    }
+    return g_reduce.sum_f32(data, count);
+}
 
-extern "C" float mean_f32_cpu(const float* data, size_t count) {
+extern "C" float sse_f32_cpu(const float* a, const float* b, size_t count) {
     if (count == 0) {
         return 0.0f;
     }
+    return g_reduce.sse_f32(a, b, count);
+}
+
+extern "C" void moments_f32_cpu(const float* data, size_t count, float* out) {
+    g_reduce.moments_f32(data, count, out);
+}
+
+extern "C" const char* corepy_simd_level() {
+    return g_reduce.level;
+}
+
+// ============================================================================
+// Summation variants: naive / pairwise / Kahan (f32)
+// ============================================================================
+// Same result type, different accuracy/speed trade-offs:
+// - naive:    4 independent AVX2 accumulators (breaks the add latency chain);
+//             error grows ~O(n) eps in the worst case
+// - pairwise: recursive halving down to 128-element blocks summed naively;
+//             error ~O(log n) eps at nearly naive speed
+// - kahan:    per-lane compensated summation; error ~O(1) eps, ~2x the
+//             instructions of naive, hidden behind memory traffic by using
+//             4 independent chains plus software prefetch
+
+extern "C" float sum_f32_naive_cpu(const float* data, size_t count) {
+    size_t i = 0;
+    float sum = 0.0f;
+#ifdef __AVX2__
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    __m256 acc2 = _mm256_setzero_ps();
+    __m256 acc3 = _mm256_setzero_ps();
+    
+    for (; i + 32 <= count; i += 32) {
+        acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(data + i));
+        acc1 = _mm256_add_ps(acc1, _mm256_loadu_ps(data + i + 8));
+        acc2 = _mm256_add_ps(acc2, _mm256_loadu_ps(data + i + 16));
+        acc3 = _mm256_add_ps(acc3, _mm256_loadu_ps(data + i + 24));
+    }
+    for (; i + 8 <= count; i += 8) {
+        acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(data + i));
+    }
+    
+    sum = hsum256_ps(_mm256_add_ps(_mm256_add_ps(acc0, acc1), _mm256_add_ps(acc2, acc3)));
+#endif
+    for (; i < count; ++i) {
+        sum += data[i];
+    }
+    return sum;
+}
+
+extern "C" float sum_f32_pairwise_cpu(const float* data, size_t count) {
+    // Block size matches NumPy's pairwise sum: small enough that the naive
+    // block error stays tiny, large enough to amortize the recursion
+    const size_t block = 128;
+    if (count <= block) {
+        return sum_f32_naive_cpu(data, count);
+    }
+    // Split on a multiple of 8 so both halves start vector-aligned relative to data
+    size_t half = (count / 2) & ~static_cast<size_t>(7);
+    return sum_f32_pairwise_cpu(data, half) + sum_f32_pairwise_cpu(data + half, count - half);
+}
+
+// Software prefetch distance for the Kahan loop, in floats (1 KiB ahead)
+static constexpr size_t KAHAN_PREFETCH_DIST = 256;
+
+extern "C" float sum_f32_kahan_cpu(const float* data, size_t count) {
+    size_t i = 0;
+    float sum = 0.0f;
+    float c = 0.0f;
+#ifdef __AVX2__
+    // Four independent compensated vector sums (32 lanes): a single chain
+    // is bound by the 4-deep add/sub dependency, not by memory
+    __m256 vsum[4], vc[4];
+    for (int k = 0; k < 4; ++k) {
+        vsum[k] = _mm256_setzero_ps();
+        vc[k] = _mm256_setzero_ps();
+    }
+    
+    for (; i + 32 <= count; i += 32) {
+        // 32 floats = 2 cache lines per iteration; request them well ahead
+        // so DRAM latency overlaps the compensation arithmetic
+        _mm_prefetch(reinterpret_cast<const char*>(data + i + KAHAN_PREFETCH_DIST), _MM_HINT_T0);
+        _mm_prefetch(reinterpret_cast<const char*>(data + i + KAHAN_PREFETCH_DIST + 16), _MM_HINT_T0);
+        for (int k = 0; k < 4; ++k) {
+            __m256 y = _mm256_sub_ps(_mm256_loadu_ps(data + i + 8 * k), vc[k]);
+            __m256 t = _mm256_add_ps(vsum[k], y);
+            vc[k] = _mm256_sub_ps(_mm256_sub_ps(t, vsum[k]), y);
+            vsum[k] = t;
+        }
+    }
+    for (; i + 8 <= count; i += 8) {
+        __m256 y = _mm256_sub_ps(_mm256_loadu_ps(data + i), vc[0]);
+        __m256 t = _mm256_add_ps(vsum[0], y);
+        vc[0] = _mm256_sub_ps(_mm256_sub_ps(t, vsum[0]), y);
+        vsum[0] = t;
+    }
     
-    float sum = sum_f32_cpu(data, count);
-    return sum / static_cast<float>(count);
+    // Fold the lanes (and their pending corrections) with scalar Kahan
+    alignas(32) float lanes[32];
+    alignas(32) float comps[32];
+    for (int k = 0; k < 4; ++k) {
+        _mm256_store_ps(lanes + 8 * k, vsum[k]);
+        _mm256_store_ps(comps + 8 * k, vc[k]);
+    }
+    for (int l = 0; l < 32; ++l) {
+        float y = (lanes[l] - comps[l]) - c;
+        float t = sum + y;
+        c = (t - sum) - y;
+        sum = t;
+    }
+#endif
+    for (; i < count; ++i) {
+        float y = data[i] - c;
+        float t = sum + y;
+        c = (t - sum) - y;
+        sum = t;
+    }
+    return sum;
+}
+
+// ============================================================================
+// moments_f32_cpu: fused sum and sum of squares
+// ============================================================================
+// out[0] = sum(x), out[1] = sum(x * x) from one pass over the data, so
+// mean/variance read it once instead of twice. Two (sum, sumsq) chain pairs
+// per iteration hide the add/FMA latency.
+
+static void moments_f32_base(const float* data, size_t count, float* out) {
+    float sum = 0.0f;
+    float sumsq = 0.0f;
+    size_t i = 0;
+#ifdef __AVX2__
+    __m256 s0 = _mm256_setzero_ps();
+    __m256 s1 = _mm256_setzero_ps();
+    __m256 q0 = _mm256_setzero_ps();
+    __m256 q1 = _mm256_setzero_ps();
+    for (; i + 16 <= count; i += 16) {
+        __m256 x0 = _mm256_loadu_ps(data + i);
+        __m256 x1 = _mm256_loadu_ps(data + i + 8);
+        s0 = _mm256_add_ps(s0, x0);
+        s1 = _mm256_add_ps(s1, x1);
+    #ifdef __FMA__
+        q0 = _mm256_fmadd_ps(x0, x0, q0);
+        q1 = _mm256_fmadd_ps(x1, x1, q1);
+    #else
+        q0 = _mm256_add_ps(q0, _mm256_mul_ps(x0, x0));
+        q1 = _mm256_add_ps(q1, _mm256_mul_ps(x1, x1));
+    #endif
+    }
+    sum = hsum256_ps(_mm256_add_ps(s0, s1));
+    sumsq = hsum256_ps(_mm256_add_ps(q0, q1));
+#endif
+    for (; i < count; ++i) {
+        sum += data[i];
+        sumsq += data[i] * data[i];
+    }
+    out[0] = sum;
+    out[1] = sumsq;
+}
+
+// ============================================================================
+// stats_f32_cpu: fused sum, min and max
+// ============================================================================
+// out[0] = sum(x), out[1] = min(x), out[2] = max(x) from one pass, for
+// summaries that would otherwise stream the data three times. count must be
+// > 0. The min/max chains seed from the first vectors, so no sentinel values.
+// minps/maxps return their second operand when either is NaN, so a NaN can
+// drop out of the chains: NaNs are tracked separately and, as in NumPy,
+// make both min and max NaN.
+
+#ifdef __AVX2__
+static inline float hmin256_ps(__m256 v) {
+    __m128 m = _mm_min_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+    m = _mm_min_ps(m, _mm_movehl_ps(m, m));
+    m = _mm_min_ss(m, _mm_movehdup_ps(m));
+    return _mm_cvtss_f32(m);
+}
+
+static inline float hmax256_ps(__m256 v) {
+    __m128 m = _mm_max_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+    m = _mm_max_ps(m, _mm_movehl_ps(m, m));
+    m = _mm_max_ss(m, _mm_movehdup_ps(m));
+    return _mm_cvtss_f32(m);
+}
+#endif
+
+extern "C" void stats_f32_cpu(const float* data, size_t count, float* out) {
+    float sum = 0.0f;
+    float lo = data[0];
+    float hi = data[0];
+    bool nan = false;
+    size_t i = 0;
+#ifdef __AVX2__
+    if (count >= 16) {
+        __m256 s0 = _mm256_setzero_ps();
+        __m256 s1 = _mm256_setzero_ps();
+        __m256 lo0 = _mm256_loadu_ps(data);
+        __m256 lo1 = _mm256_loadu_ps(data + 8);
+        __m256 hi0 = lo0;
+        __m256 hi1 = lo1;
+        __m256 unord = _mm256_setzero_ps(); // Lanes where x0 or x1 was ever NaN
+        for (; i + 16 <= count; i += 16) {
+            __m256 x0 = _mm256_loadu_ps(data + i);
+            __m256 x1 = _mm256_loadu_ps(data + i + 8);
+            s0 = _mm256_add_ps(s0, x0);
+            s1 = _mm256_add_ps(s1, x1);
+            lo0 = _mm256_min_ps(lo0, x0);
+            lo1 = _mm256_min_ps(lo1, x1);
+            hi0 = _mm256_max_ps(hi0, x0);
+            hi1 = _mm256_max_ps(hi1, x1);
+            unord = _mm256_or_ps(unord, _mm256_cmp_ps(x0, x1, _CMP_UNORD_Q));
+        }
+        sum = hsum256_ps(_mm256_add_ps(s0, s1));
+        lo = hmin256_ps(_mm256_min_ps(lo0, lo1));
+        hi = hmax256_ps(_mm256_max_ps(hi0, hi1));
+        nan = _mm256_movemask_ps(unord) != 0;
+    }
+#endif
+    for (; i < count; ++i) {
+        float x = data[i];
+        sum += x;
+        lo = x < lo ? x : lo;
+        hi = x > hi ? x : hi;
+        nan |= x != x;
+    }
+    if (nan) {
+        lo = hi = std::numeric_limits<float>::quiet_NaN();
+    }
+    out[0] = sum;
+    out[1] = lo;
+    out[2] = hi;
+}
+
+// ============================================================================
+// BFloat16 reductions: sum / dot over uint16 bit patterns, f32 accumulators
+// ============================================================================
+// bf16 is the upper half of a float, so widening is a 16-bit shift. Reading
+// half the bytes of the f32 kernels matters once the input is DRAM-resident.
+// Interleaving each 16-bit lane with zero (unpacklo/hi) yields the floats in
+// a lane-permuted order; the permutation is the same for every input vector,
+// so sums and pairwise products are unaffected.
+
+static inline float bf16_bits_to_f32(uint16_t h) {
+    uint32_t bits = static_cast<uint32_t>(h) << 16;
+    float f;
+    std::memcpy(&f, &bits, sizeof(f));
+    return f;
+}
+
+extern "C" float sum_bf16_cpu(const uint16_t* data, size_t count) {
+    size_t i = 0;
+    float sum = 0.0f;
+#ifdef __AVX2__
+    const __m256i zero = _mm256_setzero_si256();
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    __m256 acc2 = _mm256_setzero_ps();
+    __m256 acc3 = _mm256_setzero_ps();
+    
+    // 32 bf16 (64 bytes) per iteration -> four 8-float vectors
+    for (; i + 32 <= count; i += 32) {
+        __m256i v0 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        __m256i v1 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i + 16));
+        acc0 = _mm256_add_ps(acc0, _mm256_castsi256_ps(_mm256_unpacklo_epi16(zero, v0)));
+        acc1 = _mm256_add_ps(acc1, _mm256_castsi256_ps(_mm256_unpackhi_epi16(zero, v0)));
+        acc2 = _mm256_add_ps(acc2, _mm256_castsi256_ps(_mm256_unpacklo_epi16(zero, v1)));
+        acc3 = _mm256_add_ps(acc3, _mm256_castsi256_ps(_mm256_unpackhi_epi16(zero, v1)));
+    }
+    sum = hsum256_ps(_mm256_add_ps(_mm256_add_ps(acc0, acc1), _mm256_add_ps(acc2, acc3)));
+#endif
+    // Remainder with Kahan summation, as in sum_f32_cpu
+    float c = 0.0f;
+    for (; i < count; ++i) {
+        float y = bf16_bits_to_f32(data[i]) - c;
+        float t = sum + y;
+        c = (t - sum) - y;
+        sum = t;
+    }
+    return sum;
+}
+
+extern "C" float dot_bf16_cpu(const uint16_t* a, const uint16_t* b, size_t count) {
+    size_t i = 0;
+    float sum = 0.0f;
+#ifdef __AVX2__
+    const __m256i zero = _mm256_setzero_si256();
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    
+    for (; i + 16 <= count; i += 16) {
+        __m256i va = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(a + i));
+        __m256i vb = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(b + i));
+        __m256 a_lo = _mm256_castsi256_ps(_mm256_unpacklo_epi16(zero, va));
+        __m256 a_hi = _mm256_castsi256_ps(_mm256_unpackhi_epi16(zero, va));
+        __m256 b_lo = _mm256_castsi256_ps(_mm256_unpacklo_epi16(zero, vb));
+        __m256 b_hi = _mm256_castsi256_ps(_mm256_unpackhi_epi16(zero, vb));
+#ifdef __FMA__
+        acc0 = _mm256_fmadd_ps(a_lo, b_lo, acc0);
+        acc1 = _mm256_fmadd_ps(a_hi, b_hi, acc1);
+#else
+        acc0 = _mm256_add_ps(acc0, _mm256_mul_ps(a_lo, b_lo));
+        acc1 = _mm256_add_ps(acc1, _mm256_mul_ps(a_hi, b_hi));
+#endif
+    }
+    sum = hsum256_ps(_mm256_add_ps(acc0, acc1));
+#endif
+    for (; i < count; ++i) {
+        sum += bf16_bits_to_f32(a[i]) * bf16_bits_to_f32(b[i]);
+    }
+    return sum;
+}
+
+// ============================================================================
+// dot_i8_cpu: int8 dot product, int32 accumulation
+// ============================================================================
+// Exact for every int8 input; the int32 result wraps like sum_i32_cpu.
+// - AVX2: sign-extend 16 int8 -> int16 and multiply-add pairs (madd_epi16).
+// - AVX-VNNI: vpdpbusd multiplies u8 x s8 in groups of four straight into
+//   int32 lanes. a is biased to unsigned (a ^ 0x80 == a + 128) and the
+//   128 * sum(b) term is removed at the end, so no input range is lost.
+// The VNNI variant is compiled with a target attribute and picked at runtime,
+// so the library itself still only requires AVX2.
+
+#ifdef __AVX2__
+static inline int32_t hsum256_epi32(__m256i v) {
+    __m128i s = _mm_add_epi32(_mm256_castsi256_si128(v), _mm256_extracti128_si256(v, 1));
+    s = _mm_add_epi32(s, _mm_shuffle_epi32(s, _MM_SHUFFLE(1, 0, 3, 2)));
+    s = _mm_add_epi32(s, _mm_shuffle_epi32(s, _MM_SHUFFLE(2, 3, 0, 1)));
+    return _mm_cvtsi128_si32(s);
+}
+
+static int32_t dot_i8_avx2(const int8_t* a, const int8_t* b, size_t count, size_t* done) {
+    __m256i acc0 = _mm256_setzero_si256();
+    __m256i acc1 = _mm256_setzero_si256();
+    size_t i = 0;
+    for (; i + 32 <= count; i += 32) {
+        __m256i a0 = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(a + i)));
+        __m256i b0 = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(b + i)));
+        __m256i a1 = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(a + i + 16)));
+        __m256i b1 = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(b + i + 16)));
+        acc0 = _mm256_add_epi32(acc0, _mm256_madd_epi16(a0, b0));
+        acc1 = _mm256_add_epi32(acc1, _mm256_madd_epi16(a1, b1));
+    }
+    *done = i;
+    return hsum256_epi32(_mm256_add_epi32(acc0, acc1));
+}
+
+#if defined(__GNUC__) && !defined(__clang__) && __GNUC__ >= 11 || defined(__clang__) && __clang_major__ >= 12
+#define COREPY_HAVE_AVXVNNI_TARGET 1
+
+__attribute__((target("avx2,avxvnni")))
+static int32_t dot_i8_avxvnni(const int8_t* a, const int8_t* b, size_t count, size_t* done) {
+    const __m256i bias = _mm256_set1_epi8(static_cast<char>(0x80));
+    const __m256i ones = _mm256_set1_epi8(1);
+    // Four product chains and four sum(b) chains: vpdpbusd has ~5 cycles of
+    // latency, so fewer chains leave the two VNNI ports idle
+    __m256i acc[4], bsum[4];
+    for (int k = 0; k < 4; ++k) {
+        acc[k] = _mm256_setzero_si256();
+        bsum[k] = _mm256_setzero_si256();
+    }
+    size_t i = 0;
+    for (; i + 128 <= count; i += 128) {
+        for (int k = 0; k < 4; ++k) {
+            __m256i va = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(a + i + 32 * k));
+            __m256i vb = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(b + i + 32 * k));
+            acc[k] = _mm256_dpbusd_avx_epi32(acc[k], _mm256_xor_si256(va, bias), vb);
+            bsum[k] = _mm256_dpbusd_avx_epi32(bsum[k], ones, vb);
+        }
+    }
+    *done = i;
+    __m256i total = _mm256_add_epi32(_mm256_add_epi32(acc[0], acc[1]), _mm256_add_epi32(acc[2], acc[3]));
+    __m256i btotal = _mm256_add_epi32(_mm256_add_epi32(bsum[0], bsum[1]), _mm256_add_epi32(bsum[2], bsum[3]));
+    return hsum256_epi32(_mm256_sub_epi32(total, _mm256_slli_epi32(btotal, 7)));
+}
+#endif
+#endif // __AVX2__
+
+extern "C" int32_t dot_i8_cpu(const int8_t* a, const int8_t* b, size_t count) {
+    size_t i = 0;
+    uint32_t sum = 0; // unsigned: wraparound is well-defined
+#ifdef __AVX2__
+#ifdef COREPY_HAVE_AVXVNNI_TARGET
+    static const bool has_vnni = __builtin_cpu_supports("avxvnni");
+    sum = static_cast<uint32_t>(has_vnni ? dot_i8_avxvnni(a, b, count, &i) : dot_i8_avx2(a, b, count, &i));
+#else
+    sum = static_cast<uint32_t>(dot_i8_avx2(a, b, count, &i));
+#endif
+#endif
+    for (; i < count; ++i) {
+        sum += static_cast<uint32_t>(static_cast<int32_t>(a[i]) * b[i]);
+    }
+    return static_cast<int32_t>(sum);
 }
 
+// ============================================================================
+// Byte reductions with PSADBW: count_nonzero_u8_cpu / sum_i8_cpu
+// ============================================================================
+// _mm256_sad_epu8(v, 0) adds each group of 8 bytes into a 64-bit lane: one
+// uop per 32 byte additions, and the u64 lanes cannot overflow.
+// - count_nonzero: min(v, 1) maps every truthy byte to 1 first
+// - sum_i8: bias to unsigned (x ^ 0x80 == x + 128), remove 128 * n at the
+//   end; exact int64 result
+
+#ifdef __AVX2__
+static inline uint64_t hsum256_epi64(__m256i v) {
+    __m128i s = _mm_add_epi64(_mm256_castsi256_si128(v), _mm256_extracti128_si256(v, 1));
+    s = _mm_add_epi64(s, _mm_unpackhi_epi64(s, s));
+    return static_cast<uint64_t>(_mm_cvtsi128_si64(s));
+}
+#endif
+
+extern "C" uint64_t count_nonzero_u8_cpu(const uint8_t* data, size_t count) {
+    uint64_t total = 0;
+    size_t i = 0;
+#ifdef __AVX2__
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i one = _mm256_set1_epi8(1);
+    __m256i acc0 = zero;
+    __m256i acc1 = zero;
+    for (; i + 64 <= count; i += 64) {
+        const __m256i* p = reinterpret_cast<const __m256i*>(data + i);
+        acc0 = _mm256_add_epi64(acc0, _mm256_sad_epu8(_mm256_min_epu8(_mm256_loadu_si256(p), one), zero));
+        acc1 = _mm256_add_epi64(acc1, _mm256_sad_epu8(_mm256_min_epu8(_mm256_loadu_si256(p + 1), one), zero));
+    }
+    for (; i + 32 <= count; i += 32) {
+        __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        acc0 = _mm256_add_epi64(acc0, _mm256_sad_epu8(_mm256_min_epu8(v, one), zero));
+    }
+    total = hsum256_epi64(_mm256_add_epi64(acc0, acc1));
+#endif
+    for (; i < count; ++i) {
+        total += data[i] != 0;
+    }
+    return total;
+}
+
+extern "C" int64_t sum_i8_cpu(const int8_t* data, size_t count) {
+    int64_t total = 0;
+    size_t i = 0;
+#ifdef __AVX2__
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i bias = _mm256_set1_epi8(static_cast<char>(0x80));
+    __m256i acc0 = zero;
+    __m256i acc1 = zero;
+    for (; i + 64 <= count; i += 64) {
+        const __m256i* p = reinterpret_cast<const __m256i*>(data + i);
+        acc0 = _mm256_add_epi64(acc0, _mm256_sad_epu8(_mm256_xor_si256(_mm256_loadu_si256(p), bias), zero));
+        acc1 = _mm256_add_epi64(acc1, _mm256_sad_epu8(_mm256_xor_si256(_mm256_loadu_si256(p + 1), bias), zero));
+    }
+    for (; i + 32 <= count; i += 32) {
+        __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        acc0 = _mm256_add_epi64(acc0, _mm256_sad_epu8(_mm256_xor_si256(v, bias), zero));
+    }
+    total = static_cast<int64_t>(hsum256_epi64(_mm256_add_epi64(acc0, acc1))) - 128 * static_cast<int64_t>(i);
+#endif
+    for (; i < count; ++i) {
+        total += data[i];
+    }
+    return total;
+}
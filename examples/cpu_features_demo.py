@@ -187,8 +187,8 @@ except Exception as e:
 
 print("\n6.2 Running operations with profiling:")
 # Create large tensors for meaningful profiling
-large_a = cp.Tensor([float(i) for i in range(10000)])
-large_b = cp.Tensor([float(i) for i in range(10000)])
+large_a = cp.arange(10000)
+large_b = cp.arange(10000)
 
 # Perform operations
 start = time.perf_counter()
@@ -292,8 +292,8 @@ print(f"{'Size':<10} {'Add (ms)':<15} {'Mul (ms)':<15} {'Sum (ms)':<15}")
 print("-" * 60)
 
 for size in sizes:
-    x = cp.Tensor([float(i) for i in range(size)])
-    y = cp.Tensor([float(i) for i in range(size)])
+    x = cp.arange(size)
+    y = cp.arange(size)
     
     # Addition
     start = time.perf_counter()
@@ -31,6 +31,47 @@ lazy_static! {
 
     /// Storage for detailed dispatch info (rich tracking)
     static ref LAST_DISPATCH_DETAILED: Mutex<Option<DispatchInfo>> = Mutex::new(None);
+
+    /// Recently chosen matmul backends, most recent first
+    static ref MATMUL_DISPATCH_CACHE: Mutex<Vec<(MatmulKey, u8)>> =
+        Mutex::new(Vec::with_capacity(DISPATCH_CACHE_CAPACITY));
+}
+
+/// Number of (shape, policy) -> backend decisions kept for matmul
+const DISPATCH_CACHE_CAPACITY: usize = 32;
+
+/// Cache key for a matmul dispatch decision: (M, N, K, policy)
+type MatmulKey = (usize, usize, usize, u8);
+
+/// Return the backend ID for a matmul of this shape under `policy`.
+///
+/// Decisions are kept in a small move-to-front LRU, so repeated calls at a
+/// known shape skip `select` entirely. `select` must be deterministic for a
+/// given key (it may consult the policy and backend availability).
+pub fn cached_matmul_backend<F: FnOnce() -> u8>(
+    m: usize, n: usize, k: usize,
+    policy: BackendPolicy,
+    select: F,
+) -> u8 {
+    let key = (m, n, k, policy as u8);
+
+    if let Ok(mut cache) = MATMUL_DISPATCH_CACHE.lock() {
+        if let Some(pos) = cache.iter().position(|(cached, _)| *cached == key) {
+            let entry = cache.remove(pos);
+            cache.insert(0, entry);
+            return entry.1;
+        }
+
+        let backend_id = select();
+        if cache.len() == DISPATCH_CACHE_CAPACITY {
+            cache.pop();
+        }
+        cache.insert(0, (key, backend_id));
+        return backend_id;
+    }
+
+    // Poisoned lock: decide without caching
+    select()
 }
 
 /// Get the current global backend selection policy
@@ -74,6 +115,22 @@ pub fn record_detailed_dispatch(
     }
 }
 
+/// Display name for a backend ID
+pub fn backend_name(backend_id: u8) -> &'static str {
+    match backend_id {
+        0 => "Corepy AVX2",
+        1 => "OpenBLAS",
+        2 => "BLAS",
+        3 => "CUDA",
+        _ => "Unknown",
+    }
+}
+
+/// Name of the last backend used, without formatting or locking
+pub fn get_last_backend_name() -> &'static str {
+    backend_name(LAST_DISPATCH.load(Ordering::Relaxed))
+}
+
 /// Get description of last backend used (Simple string)
 pub fn get_last_dispatch() -> String {
     // Check detailed info first
@@ -84,13 +141,7 @@ pub fn get_last_dispatch() -> String {
              return format!(
                 "{} → {} (size={}x{}x{}, policy={:?}, {}µs ago)",
                 info.operation,
-                match info.backend_id {
-                    0 => "Corepy AVX2",
-                    1 => "OpenBLAS",
-                    2 => "BLAS",
-                    3 => "CUDA",
-                    _ => "Unknown",
-                },
+                backend_name(info.backend_id),
                 m, n, k,
                 info.policy,
                 elapsed.as_micros()
@@ -107,3 +158,33 @@ pub fn get_last_dispatch() -> String {
         id => format!("Unknown backend ({})", id),
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_cached_matmul_backend() {
+        let mut calls = 0;
+        let id = cached_matmul_backend(7, 11, 13, BackendPolicy::DEFAULT, || { calls += 1; 1 });
+        assert_eq!(id, 1);
+
+        // Same key: served from the cache, selector not called again
+        let id = cached_matmul_backend(7, 11, 13, BackendPolicy::DEFAULT, || { calls += 1; 0 });
+        assert_eq!(id, 1);
+        assert_eq!(calls, 1);
+
+        // Different policy is a different key
+        let id = cached_matmul_backend(7, 11, 13, BackendPolicy::BLAS, || 0);
+        assert_eq!(id, 0);
+    }
+
+    #[test]
+    fn test_cached_matmul_backend_eviction() {
+        for i in 0..(DISPATCH_CACHE_CAPACITY + 1) {
+            cached_matmul_backend(1000 + i, 1, 1, BackendPolicy::DEFAULT, || 1);
+        }
+        let len = MATMUL_DISPATCH_CACHE.lock().unwrap().len();
+        assert!(len <= DISPATCH_CACHE_CAPACITY);
+    }
+}
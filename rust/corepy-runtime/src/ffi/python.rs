@@ -4,41 +4,110 @@
 // This module handles PyO3 integration and exports Rust functions to Python.
 
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
 
 // Global profiler instance for this module (and the process)
 lazy_static::lazy_static! {
     static ref GLOBAL_PROFILER: crate::profiler::Profiler = crate::profiler::Profiler::new();
 }
 
+/// Element count from which kernels run with the GIL released.
+///
+/// Dropping and re-taking the GIL costs on the order of 100 ns, about what
+/// a few thousand elements of SIMD work take; below this the call keeps
+/// the GIL (the kernel finishes before another thread could use it). At
+/// 4096 elements, 10K-element element-wise ops and sums already release it.
+const GIL_RELEASE_THRESHOLD: usize = 1 << 12;
+
+/// Run `f` with the GIL released when `count` is at least GIL_RELEASE_THRESHOLD.
+///
+/// The kernels only touch the caller's buffers and never call back into
+/// Python, so other Python threads (and, on free-threaded builds, other
+/// kernel calls) can run meanwhile. The caller keeps the buffers alive for
+/// the duration of the call, as for any kernel.
+fn release_gil<T, F>(py: Python<'_>, count: usize, f: F) -> T
+where
+    F: pyo3::marker::Ungil + FnOnce() -> T,
+    T: pyo3::marker::Ungil,
+{
+    if count >= GIL_RELEASE_THRESHOLD {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
 /// Export all FFI functions to Python
 pub fn register_functions(m: &PyModule) -> PyResult<()> {
     // Reduction operations
     m.add_function(wrap_pyfunction!(tensor_all, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_any, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_count_nonzero, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_i8, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_sum_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_f32_naive, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_f32_pairwise, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_f32_kahan, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_moments_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_stats_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_bf16, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_sum_i32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_mean_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_center_f32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_matmul_f32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_matmul_2d_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_matmul_2d_f32_small, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_dot_product_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_dot_product_bf16, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_dot_product_i8, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sse_f32, m)?)?;
+    
+    // Benchmark harness
+    m.add_function(wrap_pyfunction!(time_matmul_2d_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_f32_many, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sum_f32_repeat, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_dot_product_f32_repeat, m)?)?;
     
     // Backend control
     m.add_function(wrap_pyfunction!(set_backend_policy, m)?)?;
     m.add_function(wrap_pyfunction!(get_backend_policy, m)?)?;
     m.add_function(wrap_pyfunction!(explain_last_dispatch, m)?)?;
+    m.add_function(wrap_pyfunction!(last_backend_name, m)?)?;
+    m.add_function(wrap_pyfunction!(simd_level, m)?)?;
     
     // Element-wise operations
     m.add_function(wrap_pyfunction!(tensor_add_f32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_sub_f32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_mul_f32, m)?)?;
     m.add_function(wrap_pyfunction!(tensor_div_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_add_scalar_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sub_scalar_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_mul_scalar_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_div_scalar_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_axpb_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_add_strided_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sub_strided_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_mul_strided_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_div_strided_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_execute_graph, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_add_bf16, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_sub_bf16, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_mul_bf16, m)?)?;
+    m.add_function(wrap_pyfunction!(tensor_div_bf16, m)?)?;
     
     // Profiling functions
     m.add_function(wrap_pyfunction!(enable_profiling, m)?)?;
     m.add_function(wrap_pyfunction!(disable_profiling, m)?)?;
     m.add_function(wrap_pyfunction!(clear_profile, m)?)?;
     m.add_function(wrap_pyfunction!(get_profile_report, m)?)?;
+    m.add_function(wrap_pyfunction!(get_profile_report_dict, m)?)?;
+    m.add_function(wrap_pyfunction!(get_profile_report_arrays, m)?)?;
     m.add_function(wrap_pyfunction!(set_profile_context, m)?)?;
+    m.add_function(wrap_pyfunction!(get_profile_context, m)?)?;
+    m.add_function(wrap_pyfunction!(push_profile_context, m)?)?;
+    m.add_function(wrap_pyfunction!(pop_profile_context, m)?)?;
+    m.add_function(wrap_pyfunction!(profile_op_id, m)?)?;
+    m.add_function(wrap_pyfunction!(profile_record, m)?)?;
     
     // Demo functions (backward compatibility)
     m.add_function(wrap_pyfunction!(sum_as_string, m)?)?;
@@ -74,12 +143,121 @@ fn get_profile_report(context: Option<String>) -> PyResult<String> {
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e))
 }
 
+/// Build the profile report directly as a Python dict.
+///
+/// Same layout as `get_profile_report`, but skips the JSON serialize/parse
+/// round-trip for callers that want structured data.
+#[pyfunction]
+fn get_profile_report_dict<'py>(py: Python<'py>, context: Option<String>) -> PyResult<&'py PyDict> {
+    let report = GLOBAL_PROFILER.generate_report(context.as_deref());
+    
+    let metadata = PyDict::new(py);
+    metadata.set_item("session_id", &report.metadata.session_id)?;
+    metadata.set_item("start_timestamp", &report.metadata.start_timestamp)?;
+    metadata.set_item("version", &report.metadata.version)?;
+    metadata.set_item("context", &report.metadata.context)?;
+    
+    let operations = PyDict::new(py);
+    for (name, m) in &report.operations {
+        let op = PyDict::new(py);
+        op.set_item("operation", &m.operation)?;
+        op.set_item("count", m.count)?;
+        op.set_item("total_time_ms", m.total_time_ms)?;
+        op.set_item("avg_time_ms", m.avg_time_ms)?;
+        op.set_item("min_time_ms", m.min_time_ms)?;
+        op.set_item("max_time_ms", m.max_time_ms)?;
+        op.set_item("primary_backend", &m.primary_backend)?;
+        op.set_item("percent_total", m.percent_total)?;
+        operations.set_item(name, op)?;
+    }
+    
+    let functions = PyDict::new(py);
+    for (name, f) in &report.functions {
+        let func = PyDict::new(py);
+        func.set_item("function", &f.function)?;
+        func.set_item("count", f.count)?;
+        func.set_item("total_time_ms", f.total_time_ms)?;
+        func.set_item("avg_time_ms", f.avg_time_ms)?;
+        functions.set_item(name, func)?;
+    }
+    
+    let out = PyDict::new(py);
+    out.set_item("metadata", metadata)?;
+    out.set_item("operations", operations)?;
+    out.set_item("total_time_ms", report.total_time_ms)?;
+    out.set_item("operation_count", report.operation_count)?;
+    out.set_item("functions", functions)?;
+    Ok(out)
+}
+
+/// Per-operation metrics as parallel arrays (struct-of-arrays).
+///
+/// Returns `(names, counts, total_time_ms, avg_time_ms, percent_total)`,
+/// all in the same operation order. Analysis code turns the numeric columns
+/// into numpy arrays and selects rows with vectorized masks.
+#[pyfunction]
+fn get_profile_report_arrays(
+    context: Option<String>,
+) -> PyResult<(Vec<String>, Vec<usize>, Vec<f64>, Vec<f64>, Vec<f64>)> {
+    let report = GLOBAL_PROFILER.generate_report(context.as_deref());
+    let n = report.operations.len();
+    
+    let mut names = Vec::with_capacity(n);
+    let mut counts = Vec::with_capacity(n);
+    let mut totals = Vec::with_capacity(n);
+    let mut avgs = Vec::with_capacity(n);
+    let mut percents = Vec::with_capacity(n);
+    
+    for (name, m) in report.operations {
+        names.push(name);
+        counts.push(m.count);
+        totals.push(m.total_time_ms);
+        avgs.push(m.avg_time_ms);
+        percents.push(m.percent_total);
+    }
+    
+    Ok((names, counts, totals, avgs, percents))
+}
+
 #[pyfunction]
 fn set_profile_context(context: Option<String>) -> PyResult<()> {
     crate::profiler::set_context(context);
     Ok(())
 }
 
+/// Name of this thread's innermost profiling context, or None
+#[pyfunction]
+fn get_profile_context() -> Option<String> {
+    crate::profiler::get_context()
+}
+
+/// Enter a (possibly nested) profiling context on this thread
+#[pyfunction]
+fn push_profile_context(context: &str) {
+    crate::profiler::push_context(context);
+}
+
+/// Leave the innermost profiling context, restoring the enclosing one
+#[pyfunction]
+fn pop_profile_context() {
+    crate::profiler::pop_context();
+}
+
+/// Interned id of an operation name, taken once when a function is decorated
+#[pyfunction]
+fn profile_op_id(name: &str) -> u32 {
+    crate::profiler::operation_id(name)
+}
+
+/// Add a call of `elapsed_ns` nanoseconds to function `op_id`'s totals.
+///
+/// The per-call half of `@profile_operation`: no name lookup, no
+/// allocation, and a no-op while profiling is disabled.
+#[pyfunction]
+fn profile_record(op_id: u32, elapsed_ns: u64) {
+    GLOBAL_PROFILER.record_elapsed(op_id, elapsed_ns);
+}
+
 // ============================================================================
 // Reduction Operations
 // ============================================================================
@@ -98,9 +276,9 @@ fn tensor_all(data_ptr: usize, count: usize) -> PyResult<bool> {
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "all".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "all",
+        "CPU",
         count,
     );
     
@@ -125,9 +303,9 @@ fn tensor_any(data_ptr: usize, count: usize) -> PyResult<bool> {
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "any".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "any",
+        "CPU",
         count,
     );
     
@@ -138,8 +316,56 @@ fn tensor_any(data_ptr: usize, count: usize) -> PyResult<bool> {
     Ok(result)
 }
 
+/// Number of non-zero (truthy) bytes
+#[pyfunction]
+fn tensor_count_nonzero(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<u64> {
+    use crate::ops::reduce::count_nonzero_u8_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_count_nonzero"));
+    }
+    
+    if count == 0 {
+        return Ok(0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "count_nonzero",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { count_nonzero_u8_cpu_dispatch(data_ptr as *const u8, count) }))
+}
+
+/// Exact sum of int8 data, returned as i64
+#[pyfunction]
+fn tensor_sum_i8(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<i64> {
+    use crate::ops::reduce::sum_i8_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_sum_i8"));
+    }
+    
+    if count == 0 {
+        return Ok(0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "sum",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { sum_i8_cpu_dispatch(data_ptr as *const i8, count) }))
+}
+
 #[pyfunction]
-fn tensor_sum_f32(data_ptr: usize, count: usize) -> PyResult<f32> {
+fn tensor_sum_f32(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
     use crate::ops::reduce::sum_f32_cpu_dispatch;
     
     if data_ptr == 0 {
@@ -152,21 +378,165 @@ fn tensor_sum_f32(data_ptr: usize, count: usize) -> PyResult<f32> {
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "sum".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "sum",
+        "CPU",
         count,
     );
     
-    let result = unsafe {
-        sum_f32_cpu_dispatch(data_ptr as *const f32, count)
-    };
+    let result = release_gil(py, count, || unsafe { sum_f32_cpu_dispatch(data_ptr as *const f32, count) });
     
     Ok(result)
 }
 
+/// Shared body for the `tensor_sum_f32_<method>` wrappers
+fn sum_method_f32(py: Python<'_>, method: &str, data_ptr: usize, count: usize) -> PyResult<f32> {
+    use crate::ops::reduce::sum_f32_method_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("Null pointer passed to tensor_sum_f32_{}", method)
+        ));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "sum",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { sum_f32_method_cpu_dispatch(method, data_ptr as *const f32, count) }))
+}
+
+/// Sums of several f32 buffers from one call: `ptrs[j]` holds `counts[j]` elements
+///
+/// One FFI crossing for a whole list of reductions (Tensor.sum_many). The
+/// GIL is released while the sums run, in parallel across buffers.
+#[pyfunction]
+fn tensor_sum_f32_many(py: Python<'_>, ptrs: Vec<usize>, counts: Vec<usize>) -> PyResult<Vec<f32>> {
+    use crate::ops::reduce::sum_many_f32_cpu_dispatch;
+    
+    if ptrs.len() != counts.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("tensor_sum_f32_many got {} pointers but {} counts", ptrs.len(), counts.len())
+        ));
+    }
+    
+    if ptrs.iter().zip(&counts).any(|(&ptr, &count)| ptr == 0 && count != 0) {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_sum_f32_many"));
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "sum_many",
+        "CPU",
+        counts.iter().sum(),
+    );
+    
+    Ok(py.allow_threads(|| unsafe { sum_many_f32_cpu_dispatch(&ptrs, &counts) }))
+}
+
+/// Sum with 4 independent SIMD accumulators (fastest, least accurate)
+#[pyfunction]
+fn tensor_sum_f32_naive(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
+    sum_method_f32(py, "naive", data_ptr, count)
+}
+
+/// Pairwise sum: O(log n) error growth at close to naive speed
+#[pyfunction]
+fn tensor_sum_f32_pairwise(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
+    sum_method_f32(py, "pairwise", data_ptr, count)
+}
+
+/// Kahan (compensated) sum: most accurate, roughly twice the work of naive
+#[pyfunction]
+fn tensor_sum_f32_kahan(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
+    sum_method_f32(py, "kahan", data_ptr, count)
+}
+
+/// Fused single pass over f32 data: returns (sum, sum of squares)
+#[pyfunction]
+fn tensor_moments_f32(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<(f32, f32)> {
+    use crate::ops::reduce::moments_f32_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_moments_f32"));
+    }
+    
+    if count == 0 {
+        return Ok((0.0, 0.0));
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "moments",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { moments_f32_cpu_dispatch(data_ptr as *const f32, count) }))
+}
+
+/// Fused single pass over f32 data: returns (sum, min, max)
+///
+/// min and max are NaN for an empty input.
+#[pyfunction]
+fn tensor_stats_f32(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<(f32, f32, f32)> {
+    use crate::ops::reduce::stats_f32_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_stats_f32"));
+    }
+    
+    if count == 0 {
+        return Ok((0.0, f32::NAN, f32::NAN));
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "stats",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { stats_f32_cpu_dispatch(data_ptr as *const f32, count) }))
+}
+
+/// Sum of bfloat16 data (u16 bit patterns), accumulated and returned as f32
 #[pyfunction]
-fn tensor_sum_i32(data_ptr: usize, count: usize) -> PyResult<i32> {
+fn tensor_sum_bf16(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
+    use crate::ops::reduce::sum_bf16_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_sum_bf16"));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "sum",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { sum_bf16_cpu_dispatch(data_ptr as *const u16, count) }))
+}
+
+#[pyfunction]
+fn tensor_sum_i32(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<i32> {
     use crate::ops::reduce::sum_i32_cpu_dispatch;
     
     if data_ptr == 0 {
@@ -179,21 +549,21 @@ fn tensor_sum_i32(data_ptr: usize, count: usize) -> PyResult<i32> {
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "sum".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "sum",
+        "CPU",
         count,
     );
     
-    let result = unsafe {
+    let result = release_gil(py, count, || unsafe {
         sum_i32_cpu_dispatch(data_ptr as *const i32, count)
-    };
+    });
     
     Ok(result)
 }
 
 #[pyfunction]
-fn tensor_mean_f32(data_ptr: usize, count: usize) -> PyResult<f32> {
+fn tensor_mean_f32(py: Python<'_>, data_ptr: usize, count: usize) -> PyResult<f32> {
     use crate::ops::reduce::mean_f32_cpu_dispatch;
     
     if data_ptr == 0 {
@@ -206,21 +576,43 @@ fn tensor_mean_f32(data_ptr: usize, count: usize) -> PyResult<f32> {
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "mean".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "mean",
+        "CPU",
         count,
     );
     
-    let result = unsafe {
-        mean_f32_cpu_dispatch(data_ptr as *const f32, count)
-    };
+    let result = release_gil(py, count, || unsafe { mean_f32_cpu_dispatch(data_ptr as *const f32, count) });
     
     Ok(result)
 }
 
+/// out = data - mean(data) in one call (out may equal data); returns the mean
+#[pyfunction]
+fn tensor_center_f32(py: Python<'_>, data_ptr: usize, out_ptr: usize, count: usize) -> PyResult<f32> {
+    use crate::ops::reduce::center_f32_cpu_dispatch;
+    
+    if data_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_center_f32"));
+    }
+    
+    if count == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Cannot center an empty tensor"));
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "center",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { center_f32_cpu_dispatch(data_ptr as *const f32, out_ptr as *mut f32, count) }))
+}
+
 #[pyfunction]
-fn tensor_dot_product_f32(a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
+fn tensor_dot_product_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
     use crate::ops::matmul::dot_product_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 {
@@ -233,21 +625,92 @@ fn tensor_dot_product_f32(a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "dot_product".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "dot_product",
+        "CPU",
         count,
     );
     
-    let result = unsafe {
-        dot_product_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, count)
-    };
+    let result = release_gil(py, count, || unsafe { dot_product_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, count) });
+    
+    Ok(result)
+}
+
+/// Dot product of two bfloat16 arrays (u16 bit patterns), accumulated in f32
+#[pyfunction]
+fn tensor_dot_product_bf16(py: Python<'_>, a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
+    use crate::ops::reduce::dot_bf16_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_dot_product_bf16"));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "dot_product",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { dot_bf16_cpu_dispatch(a_ptr as *const u16, b_ptr as *const u16, count) }))
+}
+
+/// Dot product of two int8 arrays, accumulated in (wrapping) int32
+#[pyfunction]
+fn tensor_dot_product_i8(py: Python<'_>, a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<i32> {
+    use crate::ops::reduce::dot_i8_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_dot_product_i8"));
+    }
+    
+    if count == 0 {
+        return Ok(0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "dot_product",
+        "CPU",
+        count,
+    );
+    
+    Ok(release_gil(py, count, || unsafe { dot_i8_cpu_dispatch(a_ptr as *const i8, b_ptr as *const i8, count) }))
+}
+
+#[pyfunction]
+fn tensor_sse_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
+    use crate::ops::reduce::sse_f32_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_sse_f32"));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "sse",
+        "CPU",
+        count,
+    );
+    
+    let result = release_gil(py, count, || unsafe { sse_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, count) });
     
     Ok(result)
 }
 
 #[pyfunction]
-fn tensor_matmul_2d_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, m: usize, k: usize, n: usize) -> PyResult<()> {
+fn tensor_matmul_2d_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, m: usize, k: usize, n: usize) -> PyResult<()> {
     use crate::ops::matmul::matmul_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
@@ -256,28 +719,161 @@ fn tensor_matmul_2d_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, m: usize, k:
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "matmul_2d".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "matmul_2d",
+        "CPU",
         m * k * n, // FLOPs approximation
     );
     
-    unsafe {
+    release_gil(py, m * k * n, || unsafe {
         matmul_f32_cpu_dispatch(
             a_ptr as *const f32,
             b_ptr as *const f32,
             out_ptr as *mut f32,
             m, k, n
         );
+    });
+    
+    Ok(())
+}
+
+/// 2D matmul for small shapes (m*k*n <= 32^3): single-threaded loops with
+/// no blocking, thread split or backend selection.
+#[pyfunction]
+fn tensor_matmul_2d_f32_small(a_ptr: usize, b_ptr: usize, out_ptr: usize, m: usize, k: usize, n: usize) -> PyResult<()> {
+    use crate::ops::matmul::{matmul_small_f32_cpu_dispatch, SMALL_MATMUL_VOLUME};
+    
+    if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_matmul_2d_f32_small"));
+    }
+    
+    if m.saturating_mul(k).saturating_mul(n) > SMALL_MATMUL_VOLUME {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("tensor_matmul_2d_f32_small: ({}, {}) @ ({}, {}) is not a small matmul", m, k, k, n)
+        ));
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "matmul_2d",
+        "CPU",
+        m * k * n, // FLOPs approximation
+    );
+    
+    unsafe {
+        matmul_small_f32_cpu_dispatch(
+            a_ptr as *const f32,
+            b_ptr as *const f32,
+            out_ptr as *mut f32,
+            m, k, n
+        );
     }
     
     Ok(())
 }
 
 #[pyfunction]
-fn tensor_matmul_f32(a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
+fn tensor_matmul_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32> {
     // Legacy/Existing wrapper that calls the same kernel
-    tensor_dot_product_f32(a_ptr, b_ptr, count)
+    tensor_dot_product_f32(py, a_ptr, b_ptr, count)
+}
+
+// ============================================================================
+// Benchmark Harness
+// ============================================================================
+
+/// Time `n_iter` back-to-back 2D matmuls entirely inside Rust.
+///
+/// Keeps the Python loop and FFI transitions out of the measurement.
+/// Returns `(min_ns, mean_ns)` over the iterations.
+#[pyfunction]
+fn time_matmul_2d_f32(
+    a_ptr: usize, b_ptr: usize, out_ptr: usize,
+    m: usize, k: usize, n: usize,
+    n_iter: usize,
+) -> PyResult<(u64, f64)> {
+    use crate::ops::matmul::matmul_f32_cpu_dispatch;
+    use std::time::Instant;
+    
+    if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to time_matmul_2d_f32"));
+    }
+    if n_iter == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("n_iter must be at least 1"));
+    }
+    
+    let mut min_ns = u64::MAX;
+    let mut total_ns: u128 = 0;
+    
+    for _ in 0..n_iter {
+        let start = Instant::now();
+        unsafe {
+            matmul_f32_cpu_dispatch(
+                a_ptr as *const f32,
+                b_ptr as *const f32,
+                out_ptr as *mut f32,
+                m, k, n
+            );
+        }
+        std::hint::black_box(out_ptr);
+        let elapsed = start.elapsed().as_nanos();
+        
+        min_ns = min_ns.min(elapsed as u64);
+        total_ns += elapsed;
+    }
+    
+    Ok((min_ns, total_ns as f64 / n_iter as f64))
+}
+
+/// Run the f32 sum kernel `n_iter` times back-to-back and return the last sum.
+///
+/// Benchmarks time this single call instead of a Python loop around
+/// `tensor_sum_f32`, so small sizes measure the kernel rather than the
+/// per-call FFI cost. Not profiled: the profiler scope is part of that cost.
+#[pyfunction]
+fn tensor_sum_f32_repeat(data_ptr: usize, count: usize, n_iter: usize) -> PyResult<f32> {
+    use crate::ops::reduce::sum_f32_cpu_dispatch;
+    
+    if data_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_sum_f32_repeat"));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    let mut result = 0.0f32;
+    for _ in 0..n_iter {
+        // black_box the pointer too, so the calls cannot be merged or hoisted
+        let ptr = std::hint::black_box(data_ptr) as *const f32;
+        result = std::hint::black_box(unsafe { sum_f32_cpu_dispatch(ptr, count) });
+    }
+    
+    Ok(result)
+}
+
+/// Run the f32 dot product kernel `n_iter` times back-to-back and return the
+/// last result (the dot product counterpart of `tensor_sum_f32_repeat`).
+#[pyfunction]
+fn tensor_dot_product_f32_repeat(a_ptr: usize, b_ptr: usize, count: usize, n_iter: usize) -> PyResult<f32> {
+    use crate::ops::matmul::dot_product_f32_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_dot_product_f32_repeat"));
+    }
+    
+    if count == 0 {
+        return Ok(0.0);
+    }
+    
+    let mut result = 0.0f32;
+    for _ in 0..n_iter {
+        let a = std::hint::black_box(a_ptr) as *const f32;
+        result = std::hint::black_box(unsafe { dot_product_f32_cpu_dispatch(a, b_ptr as *const f32, count) });
+    }
+    
+    Ok(result)
 }
 
 // ============================================================================
@@ -285,7 +881,7 @@ fn tensor_matmul_f32(a_ptr: usize, b_ptr: usize, count: usize) -> PyResult<f32>
 // ============================================================================
 
 #[pyfunction]
-fn tensor_add_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+fn tensor_add_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
     use crate::ops::elementwise::add_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
@@ -298,21 +894,21 @@ fn tensor_add_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> P
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "add".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "add",
+        "CPU",
         count,
     );
     
-    unsafe {
+    release_gil(py, count, || unsafe {
         add_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, out_ptr as *mut f32, count);
-    }
+    });
     
     Ok(())
 }
 
 #[pyfunction]
-fn tensor_sub_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+fn tensor_sub_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
     use crate::ops::elementwise::sub_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
@@ -325,21 +921,21 @@ fn tensor_sub_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> P
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "sub".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "sub",
+        "CPU",
         count,
     );
     
-    unsafe {
+    release_gil(py, count, || unsafe {
         sub_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, out_ptr as *mut f32, count);
-    }
+    });
     
     Ok(())
 }
 
 #[pyfunction]
-fn tensor_mul_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+fn tensor_mul_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
     use crate::ops::elementwise::mul_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
@@ -352,21 +948,21 @@ fn tensor_mul_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> P
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "mul".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "mul",
+        "CPU",
         count,
     );
     
-    unsafe {
+    release_gil(py, count, || unsafe {
         mul_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, out_ptr as *mut f32, count);
-    }
+    });
     
     Ok(())
 }
 
 #[pyfunction]
-fn tensor_div_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+fn tensor_div_f32(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
     use crate::ops::elementwise::div_f32_cpu_dispatch;
     
     if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
@@ -379,16 +975,272 @@ fn tensor_div_f32(a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> P
     
     // PROFILING
     let _scope = crate::profiler::ProfileScope::new(
-        GLOBAL_PROFILER.clone(),
-        "div".to_string(),
-        "CPU".to_string(),
+        &GLOBAL_PROFILER,
+        "div",
+        "CPU",
         count,
     );
     
-    unsafe {
+    release_gil(py, count, || unsafe {
         div_f32_cpu_dispatch(a_ptr as *const f32, b_ptr as *const f32, out_ptr as *mut f32, count);
+    });
+    
+    Ok(())
+}
+
+// ============================================================================
+// Scalar-broadcast Operations
+// ============================================================================
+
+/// Shared body for the `tensor_<op>_scalar_f32` wrappers
+fn scalar_op_f32(py: Python<'_>, op: &str, a_ptr: usize, scalar: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    use crate::ops::elementwise::scalar_f32_cpu_dispatch;
+    
+    if a_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("Null pointer passed to tensor_{}_scalar_f32", op)
+        ));
+    }
+    
+    if count == 0 {
+        return Ok(());
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        op,
+        "CPU",
+        count,
+    );
+    
+    release_gil(py, count, || unsafe {
+        scalar_f32_cpu_dispatch(op, a_ptr as *const f32, scalar, out_ptr as *mut f32, count);
+    });
+    
+    Ok(())
+}
+
+#[pyfunction]
+fn tensor_add_scalar_f32(py: Python<'_>, a_ptr: usize, scalar: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    scalar_op_f32(py, "add", a_ptr, scalar, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_sub_scalar_f32(py: Python<'_>, a_ptr: usize, scalar: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    scalar_op_f32(py, "sub", a_ptr, scalar, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_mul_scalar_f32(py: Python<'_>, a_ptr: usize, scalar: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    scalar_op_f32(py, "mul", a_ptr, scalar, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_div_scalar_f32(py: Python<'_>, a_ptr: usize, scalar: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    scalar_op_f32(py, "div", a_ptr, scalar, out_ptr, count)
+}
+
+/// Fused scale and shift: out[i] = a * x[i] + b in one pass
+///
+/// Backs `(t * a) + b` chains in the Python layer, which would otherwise
+/// write and re-read a full temporary.
+#[pyfunction]
+fn tensor_axpb_f32(py: Python<'_>, x_ptr: usize, a: f32, b: f32, out_ptr: usize, count: usize) -> PyResult<()> {
+    use crate::ops::elementwise::axpb_f32_cpu_dispatch;
+    
+    if x_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Null pointer passed to tensor_axpb_f32"
+        ));
+    }
+    
+    if count == 0 {
+        return Ok(());
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "axpb",
+        "CPU",
+        count,
+    );
+    
+    release_gil(py, count, || unsafe {
+        axpb_f32_cpu_dispatch(x_ptr as *const f32, a, b, out_ptr as *mut f32, count);
+    });
+    
+    Ok(())
+}
+
+/// Shared body of the tensor_<op>_strided_f32 entry points: validate, profile, dispatch.
+/// Strides are in elements; the output is contiguous in C order.
+fn strided_op_f32(py: Python<'_>, 
+    op: &str,
+    a_ptr: usize, a_strides: Vec<isize>,
+    b_ptr: usize, b_strides: Vec<isize>,
+    out_ptr: usize, shape: Vec<usize>,
+) -> PyResult<()> {
+    use crate::ops::elementwise::binary_strided_f32_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("Null pointer passed to tensor_{}_strided_f32", op)
+        ));
+    }
+    
+    if shape.is_empty() || a_strides.len() != shape.len() || b_strides.len() != shape.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("tensor_{}_strided_f32: strides must match a non-empty shape", op)
+        ));
+    }
+    
+    let count: usize = shape.iter().product();
+    if count == 0 {
+        return Ok(());
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        op,
+        "CPU",
+        count,
+    );
+    
+    release_gil(py, count, || unsafe {
+        binary_strided_f32_cpu_dispatch(
+            op,
+            a_ptr as *const f32, &a_strides,
+            b_ptr as *const f32, &b_strides,
+            out_ptr as *mut f32, &shape,
+        );
+    });
+    
+    Ok(())
+}
+
+#[pyfunction]
+fn tensor_add_strided_f32(py: Python<'_>, a_ptr: usize, a_strides: Vec<isize>, b_ptr: usize, b_strides: Vec<isize>, out_ptr: usize, shape: Vec<usize>) -> PyResult<()> {
+    strided_op_f32(py, "add", a_ptr, a_strides, b_ptr, b_strides, out_ptr, shape)
+}
+
+#[pyfunction]
+fn tensor_sub_strided_f32(py: Python<'_>, a_ptr: usize, a_strides: Vec<isize>, b_ptr: usize, b_strides: Vec<isize>, out_ptr: usize, shape: Vec<usize>) -> PyResult<()> {
+    strided_op_f32(py, "sub", a_ptr, a_strides, b_ptr, b_strides, out_ptr, shape)
+}
+
+#[pyfunction]
+fn tensor_mul_strided_f32(py: Python<'_>, a_ptr: usize, a_strides: Vec<isize>, b_ptr: usize, b_strides: Vec<isize>, out_ptr: usize, shape: Vec<usize>) -> PyResult<()> {
+    strided_op_f32(py, "mul", a_ptr, a_strides, b_ptr, b_strides, out_ptr, shape)
+}
+
+#[pyfunction]
+fn tensor_div_strided_f32(py: Python<'_>, a_ptr: usize, a_strides: Vec<isize>, b_ptr: usize, b_strides: Vec<isize>, out_ptr: usize, shape: Vec<usize>) -> PyResult<()> {
+    strided_op_f32(py, "div", a_ptr, a_strides, b_ptr, b_strides, out_ptr, shape)
+}
+
+// ============================================================================
+// BFloat16 Operations
+// ============================================================================
+
+/// Shared body for the `tensor_<op>_bf16` wrappers (pointers to u16 bit patterns)
+fn binary_op_bf16(py: Python<'_>, op: &str, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+    use crate::ops::elementwise::binary_bf16_cpu_dispatch;
+    
+    if a_ptr == 0 || b_ptr == 0 || out_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            format!("Null pointer passed to tensor_{}_bf16", op)
+        ));
+    }
+    
+    if count == 0 {
+        return Ok(());
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        op,
+        "CPU",
+        count,
+    );
+    
+    release_gil(py, count, || unsafe {
+        binary_bf16_cpu_dispatch(op, a_ptr as *const u16, b_ptr as *const u16, out_ptr as *mut u16, count);
+    });
+    
+    Ok(())
+}
+
+#[pyfunction]
+fn tensor_add_bf16(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+    binary_op_bf16(py, "add", a_ptr, b_ptr, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_sub_bf16(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+    binary_op_bf16(py, "sub", a_ptr, b_ptr, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_mul_bf16(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+    binary_op_bf16(py, "mul", a_ptr, b_ptr, out_ptr, count)
+}
+
+#[pyfunction]
+fn tensor_div_bf16(py: Python<'_>, a_ptr: usize, b_ptr: usize, out_ptr: usize, count: usize) -> PyResult<()> {
+    binary_op_bf16(py, "div", a_ptr, b_ptr, out_ptr, count)
+}
+
+/// Execute a recorded graph of element-wise f32 ops in one call.
+///
+/// `nodes_ptr` points to `n_nodes` rows of five u64 values
+/// (op, a_ptr, b_ptr or scalar bits, out_ptr, count); see `GraphNode`.
+#[pyfunction]
+fn tensor_execute_graph(py: Python<'_>, nodes_ptr: usize, n_nodes: usize) -> PyResult<()> {
+    use crate::ops::elementwise::{execute_graph_f32, GraphNode, GRAPH_OP_SCALAR};
+    
+    if nodes_ptr == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err("Null pointer passed to tensor_execute_graph"));
     }
     
+    if n_nodes == 0 {
+        return Ok(());
+    }
+    
+    let nodes = unsafe { std::slice::from_raw_parts(nodes_ptr as *const GraphNode, n_nodes) };
+    
+    // Validate every node before running any of them
+    let mut total = 0usize;
+    for (i, node) in nodes.iter().enumerate() {
+        if node.op >= GRAPH_OP_SCALAR * 2 {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                format!("tensor_execute_graph: node {} has unknown op {}", i, node.op)
+            ));
+        }
+        let b_is_ptr = node.op < GRAPH_OP_SCALAR;
+        if node.count > 0 && (node.a == 0 || node.out == 0 || (b_is_ptr && node.b == 0)) {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                format!("Null pointer in tensor_execute_graph node {}", i)
+            ));
+        }
+        total += node.count as usize;
+    }
+    
+    // PROFILING
+    let _scope = crate::profiler::ProfileScope::new(
+        &GLOBAL_PROFILER,
+        "graph",
+        "CPU",
+        total,
+    );
+    
+    release_gil(py, total, || unsafe {
+        execute_graph_f32(nodes);
+    });
+    
     Ok(())
 }
 
@@ -419,6 +1271,16 @@ fn explain_last_dispatch() -> String {
     crate::backend::get_last_dispatch()
 }
 
+#[pyfunction]
+fn last_backend_name() -> &'static str {
+    crate::backend::get_last_backend_name()
+}
+
+#[pyfunction]
+fn simd_level() -> &'static str {
+    crate::ops::reduce::simd_level()
+}
+
 // ============================================================================
 // Demo Functions (Backward Compatibility)
 // ============================================================================
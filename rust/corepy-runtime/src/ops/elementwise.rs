@@ -23,6 +23,27 @@ extern "C" {
     
     /// Element-wise division: out[i] = a[i] / b[i]
     pub fn div_f32_cpu(a: *const f32, b: *const f32, out: *mut f32, count: usize);
+    
+    // Float32 scalar-broadcast operations: out[i] = a[i] <op> scalar
+    pub fn add_scalar_f32_cpu(a: *const f32, scalar: f32, out: *mut f32, count: usize);
+    pub fn sub_scalar_f32_cpu(a: *const f32, scalar: f32, out: *mut f32, count: usize);
+    pub fn mul_scalar_f32_cpu(a: *const f32, scalar: f32, out: *mut f32, count: usize);
+    pub fn div_scalar_f32_cpu(a: *const f32, scalar: f32, out: *mut f32, count: usize);
+    
+    /// Fused scale and shift: out[i] = a * x[i] + b
+    pub fn axpb_f32_cpu(x: *const f32, a: f32, b: f32, out: *mut f32, count: usize);
+    
+    // BFloat16 operations on u16 bit patterns, computed in f32
+    pub fn add_bf16_cpu(a: *const u16, b: *const u16, out: *mut u16, count: usize);
+    pub fn sub_bf16_cpu(a: *const u16, b: *const u16, out: *mut u16, count: usize);
+    pub fn mul_bf16_cpu(a: *const u16, b: *const u16, out: *mut u16, count: usize);
+    pub fn div_bf16_cpu(a: *const u16, b: *const u16, out: *mut u16, count: usize);
+    
+    // Float32 strided rows: out[i] = a[i * a_stride] <op> b[i * b_stride] (AVX2 gather)
+    pub fn add_strided_f32_cpu(a: *const f32, a_stride: isize, b: *const f32, b_stride: isize, out: *mut f32, count: usize);
+    pub fn sub_strided_f32_cpu(a: *const f32, a_stride: isize, b: *const f32, b_stride: isize, out: *mut f32, count: usize);
+    pub fn mul_strided_f32_cpu(a: *const f32, a_stride: isize, b: *const f32, b_stride: isize, out: *mut f32, count: usize);
+    pub fn div_strided_f32_cpu(a: *const f32, a_stride: isize, b: *const f32, b_stride: isize, out: *mut f32, count: usize);
 }
 
 /// Dispatch add operation to CPU kernel
@@ -30,7 +51,8 @@ extern "C" {
 /// # Safety
 /// Caller must ensure:
 /// - a, b are valid for `count` elements
-/// - out is valid for `count` elements and non-overlapping with inputs
+/// - out is valid for `count` elements; it may equal a or b (in-place ops)
+///   but must not partially overlap them
 /// - All pointers' lifetimes exceed this function call
 pub unsafe fn add_f32_cpu_dispatch(a: *const f32, b: *const f32, out: *mut f32, count: usize) {
     add_f32_cpu(a, b, out, count);
@@ -50,3 +72,164 @@ pub unsafe fn mul_f32_cpu_dispatch(a: *const f32, b: *const f32, out: *mut f32,
 pub unsafe fn div_f32_cpu_dispatch(a: *const f32, b: *const f32, out: *mut f32, count: usize) {
     div_f32_cpu(a, b, out, count);
 }
+
+/// Dispatch scalar-broadcast operation to CPU kernel
+///
+/// `op` is one of "add", "sub", "mul", "div".
+///
+/// # Safety
+/// Caller must ensure:
+/// - a is valid for `count` elements
+/// - out is valid for `count` elements
+pub unsafe fn scalar_f32_cpu_dispatch(op: &str, a: *const f32, scalar: f32, out: *mut f32, count: usize) {
+    match op {
+        "add" => add_scalar_f32_cpu(a, scalar, out, count),
+        "sub" => sub_scalar_f32_cpu(a, scalar, out, count),
+        "mul" => mul_scalar_f32_cpu(a, scalar, out, count),
+        "div" => div_scalar_f32_cpu(a, scalar, out, count),
+        _ => unreachable!("unknown scalar op: {}", op),
+    }
+}
+
+/// Dispatch fused scale-and-shift to CPU kernel: out[i] = a * x[i] + b
+///
+/// # Safety
+/// Caller must ensure:
+/// - x is valid for `count` elements
+/// - out is valid for `count` elements; it may equal x
+pub unsafe fn axpb_f32_cpu_dispatch(x: *const f32, a: f32, b: f32, out: *mut f32, count: usize) {
+    axpb_f32_cpu(x, a, b, out, count);
+}
+
+/// Dispatch a bf16 binary operation to CPU kernel
+///
+/// `op` is one of "add", "sub", "mul", "div". Values are bfloat16 bit
+/// patterns; each result is rounded to nearest-even from the f32 result.
+///
+/// # Safety
+/// Caller must ensure:
+/// - a, b and out are valid for `count` u16 elements
+pub unsafe fn binary_bf16_cpu_dispatch(op: &str, a: *const u16, b: *const u16, out: *mut u16, count: usize) {
+    match op {
+        "add" => add_bf16_cpu(a, b, out, count),
+        "sub" => sub_bf16_cpu(a, b, out, count),
+        "mul" => mul_bf16_cpu(a, b, out, count),
+        "div" => div_bf16_cpu(a, b, out, count),
+        _ => unreachable!("unknown bf16 op: {}", op),
+    }
+}
+
+/// Dispatch a binary operation over strided (non-contiguous) f32 inputs
+///
+/// `shape` is the iteration space after axis coalescing, and `a_strides` /
+/// `b_strides` are per-axis steps in elements (negative for reversed views).
+/// `out` is written contiguously in C order. Innermost rows with unit stride
+/// in both inputs go through the contiguous SIMD kernel; other rows use the
+/// AVX2 gather kernel. No input is copied.
+///
+/// # Safety
+/// Caller must ensure:
+/// - every element addressed by `shape` and the strides lies inside a / b
+/// - out is valid for `shape.iter().product()` elements
+/// - `a_strides`, `b_strides` and `shape` have the same non-zero length
+pub unsafe fn binary_strided_f32_cpu_dispatch(
+    op: &str,
+    a: *const f32, a_strides: &[isize],
+    b: *const f32, b_strides: &[isize],
+    out: *mut f32, shape: &[usize],
+) {
+    type StridedRow = unsafe extern "C" fn(*const f32, isize, *const f32, isize, *mut f32, usize);
+    let (row_kernel, strided_kernel): (unsafe extern "C" fn(*const f32, *const f32, *mut f32, usize), StridedRow) = match op {
+        "add" => (add_f32_cpu, add_strided_f32_cpu),
+        "sub" => (sub_f32_cpu, sub_strided_f32_cpu),
+        "mul" => (mul_f32_cpu, mul_strided_f32_cpu),
+        "div" => (div_f32_cpu, div_strided_f32_cpu),
+        _ => unreachable!("unknown strided op: {}", op),
+    };
+    
+    let ndim = shape.len();
+    let inner = shape[ndim - 1];
+    let (inner_a, inner_b) = (a_strides[ndim - 1], b_strides[ndim - 1]);
+    
+    // Odometer over the outer axes; pointers are stepped with wrapping
+    // arithmetic because they pass one row beyond the data before rewinding
+    let mut index = vec![0usize; ndim - 1];
+    let (mut pa, mut pb, mut po) = (a, b, out);
+    loop {
+        if inner_a == 1 && inner_b == 1 {
+            row_kernel(pa, pb, po, inner);
+        } else {
+            strided_kernel(pa, inner_a, pb, inner_b, po, inner);
+        }
+        po = po.add(inner);
+        
+        let mut axis = ndim - 1;
+        loop {
+            if axis == 0 {
+                return;
+            }
+            axis -= 1;
+            index[axis] += 1;
+            pa = pa.wrapping_offset(a_strides[axis]);
+            pb = pb.wrapping_offset(b_strides[axis]);
+            if index[axis] < shape[axis] {
+                break;
+            }
+            // Axis exhausted: rewind it and carry into the next outer axis
+            let extent = shape[axis] as isize;
+            pa = pa.wrapping_offset(-a_strides[axis] * extent);
+            pb = pb.wrapping_offset(-b_strides[axis] * extent);
+            index[axis] = 0;
+        }
+    }
+}
+
+/// One element-wise op in a recorded graph (see `execute_graph_f32`)
+///
+/// Layout matches a row of the uint64 node table built by `corepy.batch()`:
+/// `op` is 0..=3 for add/sub/mul/div on two arrays, plus `GRAPH_OP_SCALAR`
+/// for the scalar-broadcast forms, in which case `b` holds the f32 bits of
+/// the scalar instead of a pointer.
+#[repr(C)]
+pub struct GraphNode {
+    pub op: u64,
+    pub a: u64,
+    pub b: u64,
+    pub out: u64,
+    pub count: u64,
+}
+
+/// Offset added to a graph op code for its scalar-broadcast form
+pub const GRAPH_OP_SCALAR: u64 = 4;
+
+/// Run a recorded graph of f32 element-wise ops in order
+///
+/// Nodes are topologically sorted by construction (an op is recorded after
+/// its inputs), so a node may read the output of any earlier node.
+///
+/// # Safety
+/// Every node must satisfy the contract of the kernel it selects: pointers
+/// valid for `count` elements, op code in 0..GRAPH_OP_SCALAR * 2.
+pub unsafe fn execute_graph_f32(nodes: &[GraphNode]) {
+    for node in nodes {
+        let count = node.count as usize;
+        if count == 0 {
+            continue;
+        }
+        let a = node.a as usize as *const f32;
+        let out = node.out as usize as *mut f32;
+        let b = node.b as usize as *const f32;
+        let scalar = f32::from_bits(node.b as u32);
+        match node.op {
+            0 => add_f32_cpu(a, b, out, count),
+            1 => sub_f32_cpu(a, b, out, count),
+            2 => mul_f32_cpu(a, b, out, count),
+            3 => div_f32_cpu(a, b, out, count),
+            4 => add_scalar_f32_cpu(a, scalar, out, count),
+            5 => sub_scalar_f32_cpu(a, scalar, out, count),
+            6 => mul_scalar_f32_cpu(a, scalar, out, count),
+            7 => div_scalar_f32_cpu(a, scalar, out, count),
+            op => unreachable!("unknown graph op: {}", op),
+        }
+    }
+}
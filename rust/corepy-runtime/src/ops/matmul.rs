@@ -37,10 +37,8 @@ impl<T> SendPtrMut<T> {
 
 /// Dispatch dot product operation to CPU kernel
 pub unsafe fn dot_product_f32_cpu_dispatch(a: *const f32, b: *const f32, count: usize) -> f32 {
-    use crate::scheduler::arena::with_arena;
-    with_arena(|_arena| {
-        dot_product_f32_cpu(a, b, count)
-    })
+    // A reduction like sum(): no scratch memory, so no arena scope
+    dot_product_f32_cpu(a, b, count)
 }
 
 /// Dispatch 2D matrix multiplication to CPU kernel
@@ -49,22 +47,28 @@ pub unsafe fn matmul_f32_cpu_dispatch(
     m: usize, k: usize, n: usize
 ) {
     use crate::scheduler::arena::with_arena;
-    use crate::backend::{get_policy, BackendPolicy, record_dispatch, record_detailed_dispatch};
+    use crate::backend::{
+        cached_matmul_backend, get_policy, BackendPolicy, record_dispatch, record_detailed_dispatch,
+    };
     
     let policy = get_policy();
     
-    let use_blas = match policy {
-        BackendPolicy::BLAS => true,     // User forced BLAS
-        BackendPolicy::OPENBLAS => true, // User forced OpenBLAS
-        BackendPolicy::DEFAULT => {
-            // Heuristic flip point based on benchmarks (Large matrices > 256x256)
-            m > 256 || n > 256 || k > 256
-        }
-        _ => false, // CUDA etc not handled here yet
-    };
+    // Backend choice depends only on shape and policy: cache it per shape
+    let backend_id = cached_matmul_backend(m, n, k, policy, || {
+        let use_blas = match policy {
+            BackendPolicy::BLAS => true,     // User forced BLAS
+            BackendPolicy::OPENBLAS => true, // User forced OpenBLAS
+            BackendPolicy::DEFAULT => {
+                // Heuristic flip point based on benchmarks (Large matrices > 256x256)
+                m > 256 || n > 256 || k > 256
+            }
+            _ => false, // CUDA etc not handled here yet
+        };
+        // Check if we should use BLAS or native Rayon dispatch
+        if use_blas && unsafe { corepy_is_blas_enabled() } { 1 } else { 0 }
+    });
 
-    // Check if we should use BLAS or native Rayon dispatch
-    if use_blas && corepy_is_blas_enabled() {
+    if backend_id == 1 {
         record_dispatch(1); // OpenBLAS ID (Mapping: 1=OpenBLAS)
         record_detailed_dispatch(1, "matmul", m, n, k, policy);
         
@@ -106,3 +110,52 @@ pub unsafe fn matmul_f32_cpu_dispatch(
         });
     }
 }
+
+/// Largest m*k*n routed to `matmul_small_f32_cpu_dispatch` by the Python layer
+pub const SMALL_MATMUL_VOLUME: usize = 32 * 32 * 32;
+
+/// One output row: c_row = a_row @ b, (p, j) order so b and c_row stream contiguously
+#[inline(always)]
+unsafe fn matmul_small_row(a_row: *const f32, b: *const f32, c_row: *mut f32, k: usize, n: usize) {
+    let c_row = std::slice::from_raw_parts_mut(c_row, n);
+    c_row.fill(0.0);
+    for p in 0..k {
+        let av = *a_row.add(p);
+        let b_row = std::slice::from_raw_parts(b.add(p * n), n);
+        // Plain multiply-add so LLVM vectorizes it; f32::mul_add becomes a
+        // libm call when the crate is not built with target-feature=+fma
+        for (c, &bv) in c_row.iter_mut().zip(b_row) {
+            *c += av * bv;
+        }
+    }
+}
+
+/// Dispatch a small 2D matrix multiplication (m*k*n <= SMALL_MATMUL_VOLUME)
+///
+/// Runs on the calling thread with plain nested loops: no arena, no Rayon
+/// split and no backend lookup, whose fixed cost dominates tiny shapes.
+/// A forced BLAS policy is still honored via `matmul_f32_cpu_dispatch`.
+///
+/// # Safety
+/// Caller must ensure a is m*k, b is k*n and c is m*n valid f32 elements,
+/// with c not overlapping the inputs.
+pub unsafe fn matmul_small_f32_cpu_dispatch(
+    a: *const f32, b: *const f32, c: *mut f32,
+    m: usize, k: usize, n: usize
+) {
+    use crate::backend::{get_policy, record_dispatch, record_detailed_dispatch, BackendPolicy};
+    
+    let policy = get_policy();
+    match policy {
+        BackendPolicy::BLAS | BackendPolicy::OPENBLAS => {
+            return matmul_f32_cpu_dispatch(a, b, c, m, k, n);
+        }
+        _ => {}
+    }
+    
+    record_dispatch(0); // Corepy ID
+    record_detailed_dispatch(0, "matmul", m, n, k, policy);
+    for i in 0..m {
+        matmul_small_row(a.add(i * k), b, c.add(i * n), k, n);
+    }
+}
@@ -7,6 +7,10 @@
 // - Validate operation parameters
 // - Dispatch to appropriate C++ kernel
 // - Handle different data types and backends
+//
+// Reductions never enter an arena scope: the kernels keep their partial sums
+// and Kahan compensation in registers and allocate nothing, so the
+// RefCell borrow + reset of `with_arena` would be pure per-call overhead.
 
 /// Threshold for parallel dispatch (elements)
 /// Below this: sequential C++ kernel  
@@ -14,6 +18,11 @@
 const PARALLEL_THRESHOLD_F32: usize = 1_000_000;
 const PARALLEL_THRESHOLD_I32: usize = 1_000_000;
 
+/// Threshold for the scalar fast path (elements)
+/// At or below this, call setup (C++ FFI, SIMD prologue)
+/// costs more than the reduction itself, so reduce inline in Rust.
+const SMALL_REDUCTION_THRESHOLD: usize = 16;
+
 // FFI declaration for C++ kernels
 extern "C" {
     /// CPU kernel for all() reduction
@@ -34,9 +43,43 @@ extern "C" {
     /// CPU kernel for sum() reduction on i32
     pub fn sum_i32_cpu(data_ptr: *const i32, count: usize) -> i32;
     
-    /// CPU kernel for mean() reduction on f32
-    /// Returns arithmetic mean of all elements
-    pub fn mean_f32_cpu(data_ptr: *const f32, count: usize) -> f32;
+    /// CPU kernel for the fused sum((a - b)^2) reduction on f32
+    pub fn sse_f32_cpu(a_ptr: *const f32, b_ptr: *const f32, count: usize) -> f32;
+    
+    /// Summation variants on f32 (accuracy/speed trade-off)
+    pub fn sum_f32_naive_cpu(data_ptr: *const f32, count: usize) -> f32;
+    pub fn sum_f32_pairwise_cpu(data_ptr: *const f32, count: usize) -> f32;
+    pub fn sum_f32_kahan_cpu(data_ptr: *const f32, count: usize) -> f32;
+    
+    /// Fused one-pass sum and sum of squares: out[0] = sum, out[1] = sumsq
+    pub fn moments_f32_cpu(data_ptr: *const f32, count: usize, out: *mut f32);
+    
+    /// Fused one-pass sum, min and max: out = [sum, min, max] (count > 0)
+    pub fn stats_f32_cpu(data_ptr: *const f32, count: usize, out: *mut f32);
+    
+    /// BFloat16 reductions (u16 bit patterns) with f32 accumulators
+    pub fn sum_bf16_cpu(data_ptr: *const u16, count: usize) -> f32;
+    pub fn dot_bf16_cpu(a_ptr: *const u16, b_ptr: *const u16, count: usize) -> f32;
+    
+    /// int8 dot product, int32 accumulation (AVX-VNNI selected at runtime)
+    pub fn dot_i8_cpu(a_ptr: *const i8, b_ptr: *const i8, count: usize) -> i32;
+    
+    /// Byte reductions (PSADBW): count of non-zero bytes, exact int8 sum
+    pub fn count_nonzero_u8_cpu(data_ptr: *const u8, count: usize) -> u64;
+    pub fn sum_i8_cpu(data_ptr: *const i8, count: usize) -> i64;
+    
+    /// ISA the C++ library selected at load time for sum_f32_cpu / sse_f32_cpu
+    /// ("avx512", "avx2" or "scalar"; static NUL-terminated string)
+    pub fn corepy_simd_level() -> *const std::os::raw::c_char;
+}
+
+/// Name of the instruction set the f32 reductions run on (picked once by the
+/// C++ library from cpuid, so AVX-512 is used wherever the CPU has it)
+pub fn simd_level() -> &'static str {
+    // SAFETY: corepy_simd_level returns a pointer to a static ASCII literal
+    unsafe { std::ffi::CStr::from_ptr(corepy_simd_level()) }
+        .to_str()
+        .unwrap_or("unknown")
 }
 
 /// Dispatch all() operation to CPU kernel
@@ -49,43 +92,59 @@ extern "C" {
 /// - data_ptr lifetime exceeds this function call
 /// - No concurrent mutations to the buffer
 pub unsafe fn all_bool_cpu_dispatch(data_ptr: *const u8, count: usize) -> bool {
-    use crate::scheduler::arena::with_arena;
-    
     // RUST LAYER RESPONSIBILITY:
     // We validated the pointer and count in ffi/python.rs
     // Now we trust the C++ layer to execute correctly
-    //
-    // PERFORMANCE: Arena scope ensures thread-local allocations are available
-    // for future optimizations (e.g., temporary buffers)
-    
-    with_arena(|_arena| {
-        all_bool_cpu(data_ptr, count)
-    })
+    all_bool_cpu(data_ptr, count)
 }
 
 /// Dispatch any() operation to CPU kernel
 pub unsafe fn any_bool_cpu_dispatch(data_ptr: *const u8, count: usize) -> bool {
-    use crate::scheduler::arena::with_arena;
-    
-    with_arena(|_arena| {
-        any_bool_cpu(data_ptr, count)
-    })
+    any_bool_cpu(data_ptr, count)
+}
+
+/// Dispatch the count of non-zero (truthy) bytes to CPU kernel
+pub unsafe fn count_nonzero_u8_cpu_dispatch(data_ptr: *const u8, count: usize) -> u64 {
+    count_nonzero_u8_cpu(data_ptr, count)
+}
+
+/// Dispatch sum() on int8 to CPU kernel (exact, widened to i64)
+pub unsafe fn sum_i8_cpu_dispatch(data_ptr: *const i8, count: usize) -> i64 {
+    sum_i8_cpu(data_ptr, count)
 }
 
 /// Dispatch sum() operation to CPU kernel (f32)
 /// Automatically parallelizes for large arrays (>100K elements)
 pub unsafe fn sum_f32_cpu_dispatch(data_ptr: *const f32, count: usize) -> f32 {
-    use crate::scheduler::arena::with_arena;
+    // Tiny inputs: a handful of scalar adds beats any dispatch
+    if count <= SMALL_REDUCTION_THRESHOLD {
+        let slice = std::slice::from_raw_parts(data_ptr, count);
+        return slice.iter().sum::<f32>();
+    }
     
-    with_arena(|_arena| {
-        if count >= PARALLEL_THRESHOLD_F32 {
-            // Parallel path: use Rayon
-            parallel_sum_f32_cpu(data_ptr, count)
-        } else {
-            // Sequential path: direct C++ kernel
-            sum_f32_cpu(data_ptr, count)
-        }
-    })
+    if count >= PARALLEL_THRESHOLD_F32 {
+        // Parallel path: use Rayon
+        parallel_sum_f32_cpu(data_ptr, count)
+    } else {
+        // Sequential path: direct C++ kernel
+        sum_f32_cpu(data_ptr, count)
+    }
+}
+
+/// Dispatch an explicit f32 summation variant to its CPU kernel (sequential)
+///
+/// `method` is one of "naive" (4 SIMD accumulators), "pairwise" (recursive
+/// halving over 128-element blocks) or "kahan" (compensated).
+///
+/// # Safety
+/// Caller must ensure data_ptr is valid for `count` elements.
+pub unsafe fn sum_f32_method_cpu_dispatch(method: &str, data_ptr: *const f32, count: usize) -> f32 {
+    match method {
+        "naive" => sum_f32_naive_cpu(data_ptr, count),
+        "pairwise" => sum_f32_pairwise_cpu(data_ptr, count),
+        "kahan" => sum_f32_kahan_cpu(data_ptr, count),
+        _ => unreachable!("unknown summation method: {}", method),
+    }
 }
 
 /// Parallel sum implementation using Rayon
@@ -107,18 +166,34 @@ unsafe fn parallel_sum_f32_cpu(data_ptr: *const f32, count: usize) -> f32 {
          .sum()
 }
 
+/// Sum several f32 buffers: out[j] = sum of the `counts[j]` elements at `ptrs[j]`
+///
+/// Buffers are spread over the Rayon pool; each sum goes through
+/// sum_f32_cpu_dispatch, so one large buffer still splits across threads.
+///
+/// # Safety
+/// Caller must ensure each `ptrs[j]` is valid for `counts[j]` f32 elements
+/// and that `ptrs` and `counts` have the same length.
+pub unsafe fn sum_many_f32_cpu_dispatch(ptrs: &[usize], counts: &[usize]) -> Vec<f32> {
+    use rayon::prelude::*;
+    
+    // Pointers cross threads as usize (raw pointers are not Send)
+    ptrs.par_iter()
+        .zip(counts.par_iter())
+        .map(|(&ptr, &count)| unsafe {
+            if count == 0 { 0.0 } else { sum_f32_cpu_dispatch(ptr as *const f32, count) }
+        })
+        .collect()
+}
+
 /// Dispatch sum() operation to CPU kernel (i32)
 /// Automatically parallelizes for large arrays (>100K elements)
 pub unsafe fn sum_i32_cpu_dispatch(data_ptr: *const i32, count: usize) -> i32 {
-    use crate::scheduler::arena::with_arena;
-    
-    with_arena(|_arena| {
-        if count >= PARALLEL_THRESHOLD_I32 {
-            parallel_sum_i32_cpu(data_ptr, count)
-        } else {
-            sum_i32_cpu(data_ptr, count)
-        }
-    })
+    if count >= PARALLEL_THRESHOLD_I32 {
+        parallel_sum_i32_cpu(data_ptr, count)
+    } else {
+        sum_i32_cpu(data_ptr, count)
+    }
 }
 
 /// Parallel sum implementation for i32
@@ -138,17 +213,129 @@ unsafe fn parallel_sum_i32_cpu(data_ptr: *const i32, count: usize) -> i32 {
 }
 
 /// Dispatch mean() operation to CPU kernel (f32)
-/// Automatically parallelizes for large arrays (>100K elements)
+/// Mean is sum / count: shares the sum kernel, thresholds and parallel path
 pub unsafe fn mean_f32_cpu_dispatch(data_ptr: *const f32, count: usize) -> f32 {
-    use crate::scheduler::arena::with_arena;
-    
-    with_arena(|_arena| {
-        if count >= PARALLEL_THRESHOLD_F32 {
-            // Parallel sum + divide
-            let sum = parallel_sum_f32_cpu(data_ptr, count);
-            sum / (count as f32)
-        } else {
-            mean_f32_cpu(data_ptr, count)
-        }
-    })
+    sum_f32_cpu_dispatch(data_ptr, count) / (count as f32)
+}
+
+/// Dispatch center(): out[i] = data[i] - mean(data), returns the mean
+/// The mean comes from mean_f32_cpu_dispatch, so the result matches a
+/// separate mean() + scalar sub; out may alias data (in place).
+pub unsafe fn center_f32_cpu_dispatch(data_ptr: *const f32, out_ptr: *mut f32, count: usize) -> f32 {
+    use crate::ops::elementwise::scalar_f32_cpu_dispatch;
+    
+    let mean = mean_f32_cpu_dispatch(data_ptr, count);
+    scalar_f32_cpu_dispatch("sub", data_ptr, mean, out_ptr, count);
+    mean
+}
+
+/// Dispatch sum() on bfloat16 data (u16 bit patterns), accumulating in f32
+/// Half the bytes of the f32 sum; parallelizes like sum_f32_cpu_dispatch
+pub unsafe fn sum_bf16_cpu_dispatch(data_ptr: *const u16, count: usize) -> f32 {
+    use rayon::prelude::*;
+    
+    if count < PARALLEL_THRESHOLD_F32 {
+        return sum_bf16_cpu(data_ptr, count);
+    }
+    
+    let slice = std::slice::from_raw_parts(data_ptr, count);
+    let num_threads = num_cpus::get();
+    let chunk_size = (count + num_threads - 1) / num_threads;
+    
+    slice.par_chunks(chunk_size)
+         .map(|chunk| unsafe { sum_bf16_cpu(chunk.as_ptr(), chunk.len()) })
+         .sum()
+}
+
+/// Dispatch the fused (sum, sum of squares) reduction on f32
+/// Automatically parallelizes for large arrays, like sum()
+pub unsafe fn moments_f32_cpu_dispatch(data_ptr: *const f32, count: usize) -> (f32, f32) {
+    use rayon::prelude::*;
+    
+    let moments = |ptr: *const f32, len: usize| {
+        let mut out = [0.0f32; 2];
+        moments_f32_cpu(ptr, len, out.as_mut_ptr());
+        (out[0], out[1])
+    };
+    
+    if count < PARALLEL_THRESHOLD_F32 {
+        return moments(data_ptr, count);
+    }
+    
+    let slice = std::slice::from_raw_parts(data_ptr, count);
+    let num_threads = num_cpus::get();
+    let chunk_size = (count + num_threads - 1) / num_threads;
+    
+    slice.par_chunks(chunk_size)
+         .map(|chunk| unsafe { moments(chunk.as_ptr(), chunk.len()) })
+         .reduce(|| (0.0, 0.0), |a, b| (a.0 + b.0, a.1 + b.1))
+}
+
+/// Dispatch the fused (sum, min, max) reduction on f32 (count > 0)
+/// Automatically parallelizes for large arrays, like sum()
+pub unsafe fn stats_f32_cpu_dispatch(data_ptr: *const f32, count: usize) -> (f32, f32, f32) {
+    use rayon::prelude::*;
+    
+    let stats = |ptr: *const f32, len: usize| {
+        let mut out = [0.0f32; 3];
+        stats_f32_cpu(ptr, len, out.as_mut_ptr());
+        (out[0], out[1], out[2])
+    };
+    
+    if count < PARALLEL_THRESHOLD_F32 {
+        return stats(data_ptr, count);
+    }
+    
+    let slice = std::slice::from_raw_parts(data_ptr, count);
+    let num_threads = num_cpus::get();
+    let chunk_size = (count + num_threads - 1) / num_threads;
+    
+    // f32::min/max return the other operand for NaN; a chunk's NaN min and
+    // max (see stats_f32_cpu) must win instead
+    let min = |a: f32, b: f32| if a.is_nan() || b.is_nan() { f32::NAN } else { a.min(b) };
+    let max = |a: f32, b: f32| if a.is_nan() || b.is_nan() { f32::NAN } else { a.max(b) };
+    
+    slice.par_chunks(chunk_size)
+         .map(|chunk| unsafe { stats(chunk.as_ptr(), chunk.len()) })
+         .reduce(
+             || (0.0, f32::INFINITY, f32::NEG_INFINITY),
+             |a, b| (a.0 + b.0, min(a.1, b.1), max(a.2, b.2)),
+         )
+}
+
+/// Dispatch the bfloat16 dot product to CPU kernel (f32 accumulation)
+pub unsafe fn dot_bf16_cpu_dispatch(a_ptr: *const u16, b_ptr: *const u16, count: usize) -> f32 {
+    dot_bf16_cpu(a_ptr, b_ptr, count)
+}
+
+/// Dispatch the int8 dot product to CPU kernel (wrapping int32 result)
+pub unsafe fn dot_i8_cpu_dispatch(a_ptr: *const i8, b_ptr: *const i8, count: usize) -> i32 {
+    dot_i8_cpu(a_ptr, b_ptr, count)
+}
+
+/// Dispatch the fused sum-of-squared-differences reduction (f32)
+/// Automatically parallelizes for large arrays, like sum()
+pub unsafe fn sse_f32_cpu_dispatch(a_ptr: *const f32, b_ptr: *const f32, count: usize) -> f32 {
+    if count >= PARALLEL_THRESHOLD_F32 {
+        parallel_sse_f32_cpu(a_ptr, b_ptr, count)
+    } else {
+        sse_f32_cpu(a_ptr, b_ptr, count)
+    }
+}
+
+/// Parallel sum of squared differences using Rayon
+unsafe fn parallel_sse_f32_cpu(a_ptr: *const f32, b_ptr: *const f32, count: usize) -> f32 {
+    use rayon::prelude::*;
+    
+    let a = std::slice::from_raw_parts(a_ptr, count);
+    let b = std::slice::from_raw_parts(b_ptr, count);
+    let num_threads = num_cpus::get();
+    let chunk_size = (count + num_threads - 1) / num_threads;
+    
+    a.par_chunks(chunk_size)
+     .zip(b.par_chunks(chunk_size))
+     .map(|(ca, cb)| unsafe {
+         sse_f32_cpu(ca.as_ptr(), cb.as_ptr(), ca.len())
+     })
+     .sum()
 }
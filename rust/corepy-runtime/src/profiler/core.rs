@@ -3,50 +3,362 @@
 //! Provides a global profiler instance that can be safely accessed from
 //! multiple threads. Profiling is disabled by default and has zero overhead
 //! when disabled.
+//!
+//! Events are stored column-wise (one Vec per field) with operation, backend
+//! and context names interned to u32 ids, so recording an event is a few
+//! pushes and no heap allocation. Names are resolved, and OperationEvents
+//! built, only when a report or the event list is requested.
+//!
+//! Ops recorded inside a ProfileContext go to a buffer owned by the
+//! recording thread and are merged into the shared store under a single
+//! write lock when the thread leaves its outermost context, so threads
+//! profiling concurrently do not contend on the store per op.
+//!
+//! An event's context is a frame: a context name plus the frame enclosing
+//! it. A report filtered to one context includes the events of every
+//! context nested inside it.
+//!
+//! Spans timed on the Python side (`@profile_operation`) enclose the ops
+//! they call, so they are kept apart from the events, as a count and total
+//! per operation id, and never add to the events' total time.
 
-use super::metrics::{OperationEvent, ProfileReport};
-use parking_lot::RwLock;
+use super::metrics::{FunctionMetrics, OperationEvent, ProfileReport};
+use parking_lot::{Mutex, RwLock};
+use std::cell::{Cell, RefCell};
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::Arc;
 use std::time::{SystemTime, UNIX_EPOCH};
 
+/// Context id of events recorded outside any ProfileContext
+const NO_CONTEXT: u32 = u32::MAX;
+
+/// Process-wide string table for operation, backend and context names
+#[derive(Default)]
+struct Interner {
+    ids: HashMap<String, u32>,
+    names: Vec<String>,
+}
+
+impl Interner {
+    /// Id of `name`, allocating a copy of it only the first time it is seen
+    fn intern(&mut self, name: &str) -> u32 {
+        if let Some(&id) = self.ids.get(name) {
+            return id;
+        }
+        let id = self.names.len() as u32;
+        self.names.push(name.to_string());
+        self.ids.insert(name.to_string(), id);
+        id
+    }
+    
+    fn name(&self, id: u32) -> &str {
+        &self.names[id as usize]
+    }
+    
+    /// Id of `name` if it was ever interned (never allocates)
+    fn lookup(&self, name: &str) -> Option<u32> {
+        self.ids.get(name).copied()
+    }
+}
+
+/// Process-wide table of context frames
+///
+/// A frame is a (context name id, enclosing frame) pair; frame ids are
+/// allocated once per distinct nesting, so entering a context costs a
+/// lookup and events still carry a single u32.
+#[derive(Default)]
+struct Frames {
+    ids: HashMap<(u32, u32), u32>,
+    frames: Vec<(u32, u32)>,
+}
+
+impl Frames {
+    /// Id of the frame for context `name` entered inside frame `parent`
+    fn frame(&mut self, name: u32, parent: u32) -> u32 {
+        if let Some(&id) = self.ids.get(&(name, parent)) {
+            return id;
+        }
+        let id = self.frames.len() as u32;
+        self.frames.push((name, parent));
+        self.ids.insert((name, parent), id);
+        id
+    }
+    
+    /// Context name id of a frame
+    fn name(&self, frame: u32) -> u32 {
+        self.frames[frame as usize].0
+    }
+    
+    /// Context name ids of `frame` and its enclosing frames, innermost
+    /// first and without repeats, into `out`
+    fn names_of(&self, frame: u32, out: &mut Vec<u32>) {
+        out.clear();
+        let mut frame = frame;
+        while frame != NO_CONTEXT {
+            let (name, parent) = self.frames[frame as usize];
+            if !out.contains(&name) {
+                out.push(name);
+            }
+            frame = parent;
+        }
+    }
+}
+
+// Lock order: an event store, then NAMES, then FRAMES. Never call intern()
+// (or take NAMES) while holding FRAMES: intern into a local first.
+lazy_static::lazy_static! {
+    static ref NAMES: Mutex<Interner> = Mutex::new(Interner::default());
+    static ref FRAMES: Mutex<Frames> = Mutex::new(Frames::default());
+}
+
+/// Intern a name (see Interner::intern)
+fn intern(name: &str) -> u32 {
+    NAMES.lock().intern(name)
+}
+
+/// Id of an operation name, for callers that record by id (record_elapsed)
+pub fn operation_id(name: &str) -> u32 {
+    intern(name)
+}
+
+/// Recorded events, one column per field (struct of arrays)
+#[derive(Default)]
+struct EventColumns {
+    operations: Vec<u32>,
+    backends: Vec<u32>,
+    data_sizes: Vec<usize>,
+    start_times_us: Vec<u64>,
+    end_times_us: Vec<u64>,
+    /// Context frame; NO_CONTEXT when recorded outside a context
+    contexts: Vec<u32>,
+}
+
+impl EventColumns {
+    fn push(&mut self, operation: u32, backend: u32, data_size: usize, start_time_us: u64, end_time_us: u64, context: u32) {
+        self.operations.push(operation);
+        self.backends.push(backend);
+        self.data_sizes.push(data_size);
+        self.start_times_us.push(start_time_us);
+        self.end_times_us.push(end_time_us);
+        self.contexts.push(context);
+    }
+    
+    fn len(&self) -> usize {
+        self.operations.len()
+    }
+    
+    /// Move all of `other`'s events to the end of these, leaving it empty
+    fn append(&mut self, other: &mut EventColumns) {
+        self.operations.append(&mut other.operations);
+        self.backends.append(&mut other.backends);
+        self.data_sizes.append(&mut other.data_sizes);
+        self.start_times_us.append(&mut other.start_times_us);
+        self.end_times_us.append(&mut other.end_times_us);
+        self.contexts.append(&mut other.contexts);
+    }
+    
+    fn clear(&mut self) {
+        self.operations.clear();
+        self.backends.clear();
+        self.data_sizes.clear();
+        self.start_times_us.clear();
+        self.end_times_us.clear();
+        self.contexts.clear();
+    }
+    
+    /// Rebuild the events as OperationEvent rows (report time only)
+    fn to_events(&self) -> Vec<OperationEvent> {
+        self.rows_to_events(0..self.len())
+    }
+    
+    /// Rebuild the given rows as OperationEvents
+    fn rows_to_events(&self, rows: impl Iterator<Item = usize>) -> Vec<OperationEvent> {
+        let names = NAMES.lock();
+        let frames = FRAMES.lock();
+        rows
+            .map(|i| OperationEvent {
+                operation: names.name(self.operations[i]).to_string(),
+                backend: names.name(self.backends[i]).to_string(),
+                data_size: self.data_sizes[i],
+                start_time_us: self.start_times_us[i],
+                end_time_us: self.end_times_us[i],
+                context: match self.contexts[i] {
+                    NO_CONTEXT => None,
+                    frame => Some(names.name(frames.name(frame)).to_string()),
+                },
+            })
+            .collect()
+    }
+}
+
+/// The profiler's shared event store: the columns plus, per context name
+/// id, the rows recorded in that context or in one nested inside it
+///
+/// The index is maintained as events arrive, so a report filtered to one
+/// context reads only that context's rows instead of scanning every event.
+#[derive(Default)]
+struct EventStore {
+    columns: EventColumns,
+    context_rows: HashMap<u32, Vec<usize>>,
+    /// Number of clears so far; batches buffered before a clear are dropped
+    epoch: u64,
+}
+
+impl EventStore {
+    fn push(&mut self, operation: u32, backend: u32, data_size: usize, start_time_us: u64, end_time_us: u64, context: u32) {
+        if context != NO_CONTEXT {
+            let mut names = Vec::new();
+            FRAMES.lock().names_of(context, &mut names);
+            let row = self.columns.len();
+            for name in names {
+                self.context_rows.entry(name).or_default().push(row);
+            }
+        }
+        self.columns.push(operation, backend, data_size, start_time_us, end_time_us, context);
+    }
+    
+    /// Move a thread's buffered events in, indexing them by context
+    fn append(&mut self, other: &mut EventColumns) {
+        let first = self.columns.len();
+        let frames = FRAMES.lock();
+        let mut last_frame = NO_CONTEXT;
+        let mut names = Vec::new();
+        for (offset, &frame) in other.contexts.iter().enumerate() {
+            if frame == NO_CONTEXT {
+                continue;
+            }
+            // Buffered events come in runs of one frame: walk it once per run
+            if frame != last_frame {
+                last_frame = frame;
+                frames.names_of(frame, &mut names);
+            }
+            for &name in &names {
+                self.context_rows.entry(name).or_default().push(first + offset);
+            }
+        }
+        drop(frames);
+        self.columns.append(other);
+    }
+    
+    fn len(&self) -> usize {
+        self.columns.len()
+    }
+    
+    fn clear(&mut self) {
+        self.columns.clear();
+        self.context_rows.clear();
+        self.epoch += 1;
+    }
+    
+    /// Events of one context, or of all when `context` is None
+    fn to_events(&self, context: Option<&str>) -> Vec<OperationEvent> {
+        let Some(name) = context else {
+            return self.columns.to_events();
+        };
+        let rows = NAMES
+            .lock()
+            .lookup(name)
+            .and_then(|id| self.context_rows.get(&id));
+        match rows {
+            Some(rows) => self.columns.rows_to_events(rows.iter().copied()),
+            None => Vec::new(),
+        }
+    }
+}
+
+/// Buffered events after which a thread merges them even inside a context
+const LOCAL_FLUSH_EVENTS: usize = 4096;
+
+/// Events this thread recorded inside a context, not yet merged
+struct LocalEvents {
+    /// Store of the profiler the buffered events belong to
+    target: Option<Arc<RwLock<EventStore>>>,
+    /// The store's epoch when the first buffered event was recorded
+    epoch: u64,
+    events: EventColumns,
+}
+
+impl LocalEvents {
+    /// Merge the buffered events into their profiler's store
+    ///
+    /// A batch started before the store was last cleared (by any thread) is
+    /// discarded whole, including events recorded after the clear.
+    fn flush(&mut self) {
+        if let Some(target) = &self.target {
+            if self.events.len() > 0 {
+                let mut store = target.write();
+                if store.epoch == self.epoch {
+                    store.append(&mut self.events);
+                } else {
+                    self.events.clear();
+                }
+            }
+        }
+    }
+}
+
+impl Drop for LocalEvents {
+    // A thread that exits inside a context still delivers its events
+    fn drop(&mut self) {
+        self.flush();
+    }
+}
+
+/// Calls and total time of one `@profile_operation` function
+#[derive(Clone, Copy, Default)]
+struct SpanSlot {
+    count: u64,
+    total_ns: u64,
+}
+
 /// Thread-safe global profiler state
 #[derive(Clone)]
 pub struct Profiler {
     /// Whether profiling is currently enabled
-    enabled: Arc<RwLock<bool>>,
+    ///
+    /// An atomic flag rather than a lock: every op checks it, so the disabled
+    /// path is a single relaxed load with no lock acquisition.
+    enabled: Arc<AtomicBool>,
     
     /// Collected profiling events
-    events: Arc<RwLock<Vec<OperationEvent>>>,
+    events: Arc<RwLock<EventStore>>,
+    
+    /// Python-timed spans, indexed by operation id (see record_elapsed)
+    spans: Arc<Mutex<Vec<SpanSlot>>>,
 }
 
 impl Profiler {
     /// Create a new profiler (disabled by default)
     pub fn new() -> Self {
         Self {
-            enabled: Arc::new(RwLock::new(false)),
-            events: Arc::new(RwLock::new(Vec::new())),
+            enabled: Arc::new(AtomicBool::new(false)),
+            events: Arc::new(RwLock::new(EventStore::default())),
+            spans: Arc::new(Mutex::new(Vec::new())),
         }
     }
     
     /// Enable profiling
     pub fn enable(&self) {
-        *self.enabled.write() = true;
+        self.enabled.store(true, Ordering::Release);
     }
     
     /// Disable profiling
     pub fn disable(&self) {
-        *self.enabled.write() = false;
+        self.enabled.store(false, Ordering::Release);
     }
     
     /// Check if profiling is enabled
     #[inline]
     pub fn is_enabled(&self) -> bool {
-        *self.enabled.read()
+        self.enabled.load(Ordering::Relaxed)
     }
     
     /// Record an operation event
     ///
-    /// This is a hot path function - optimized for minimal overhead
+    /// Interns the names on every call; ProfileScope interns once per scope
+    /// and records through record_interned.
+    #[allow(dead_code)]
     pub fn record_operation(
         &self,
         operation: String,
@@ -61,33 +373,125 @@ impl Profiler {
             return;
         }
         
-        let event = OperationEvent {
-            operation,
-            backend,
-            data_size,
-            start_time_us,
-            end_time_us,
-            context,
-        };
+        let context = context.map_or(NO_CONTEXT, |ctx| {
+            let name = intern(&ctx);
+            FRAMES.lock().frame(name, NO_CONTEXT)
+        });
+        self.record_interned(intern(&operation), intern(&backend), data_size, start_time_us, end_time_us, context);
+    }
+    
+    /// Record an event whose names are already interned
+    ///
+    /// This is the hot path: six pushes under one (uncontended) write lock
+    #[inline]
+    fn record_interned(
+        &self,
+        operation: u32,
+        backend: u32,
+        data_size: usize,
+        start_time_us: u64,
+        end_time_us: u64,
+        context: u32,
+    ) {
+        if !self.is_enabled() {
+            return;
+        }
+        if context == NO_CONTEXT {
+            self.events.write().push(operation, backend, data_size, start_time_us, end_time_us, context);
+            return;
+        }
         
-        self.events.write().push(event);
+        LOCAL_EVENTS.with(|local| {
+            let mut local = local.borrow_mut();
+            if !local.target.as_ref().map_or(false, |t| Arc::ptr_eq(t, &self.events)) {
+                local.flush();
+                local.target = Some(Arc::clone(&self.events));
+            }
+            if local.events.len() == 0 {
+                local.epoch = self.events.read().epoch;
+            }
+            local.events.push(operation, backend, data_size, start_time_us, end_time_us, context);
+            if local.events.len() >= LOCAL_FLUSH_EVENTS {
+                local.flush();
+            }
+        });
+    }
+    
+    /// Add a span the caller timed itself to operation `operation`'s slot
+    ///
+    /// Used by `@profile_operation`: the operation id comes from
+    /// operation_id() at decoration time, so a call interns nothing and
+    /// bumps one count and one total. Spans are reported as functions, not
+    /// events, because they already contain the ops run inside them.
+    pub fn record_elapsed(&self, operation: u32, elapsed_ns: u64) {
+        if !self.is_enabled() {
+            return;
+        }
+        let mut spans = self.spans.lock();
+        let i = operation as usize;
+        if i >= spans.len() {
+            spans.resize(i + 1, SpanSlot::default());
+        }
+        spans[i].count += 1;
+        spans[i].total_ns += elapsed_ns;
+    }
+    
+    /// Per-function metrics of the spans recorded so far
+    fn function_metrics(&self) -> HashMap<String, FunctionMetrics> {
+        let spans = self.spans.lock();
+        let names = NAMES.lock();
+        spans
+            .iter()
+            .enumerate()
+            .filter(|(_, slot)| slot.count > 0)
+            .map(|(id, slot)| {
+                let name = names.name(id as u32).to_string();
+                let total_time_ms = slot.total_ns as f64 / 1e6;
+                let metrics = FunctionMetrics {
+                    function: name.clone(),
+                    count: slot.count as usize,
+                    total_time_ms,
+                    avg_time_ms: total_time_ms / slot.count as f64,
+                };
+                (name, metrics)
+            })
+            .collect()
     }
     
-    /// Clear all recorded events
+    /// Clear all recorded events and spans
+    ///
+    /// Events other threads still buffer inside a context are dropped when
+    /// those threads flush them (see LocalEvents::flush).
     pub fn clear(&self) {
+        flush_local_events();
         self.events.write().clear();
+        self.spans.lock().clear();
     }
     
     /// Get the number of recorded events
     #[allow(dead_code)]
     pub fn event_count(&self) -> usize {
+        flush_local_events();
         self.events.read().len()
     }
     
     /// Generate a profiling report
+    ///
+    /// Includes this thread's buffered events; other threads' events appear
+    /// once they leave their contexts. A context's report covers the
+    /// contexts nested in it; function spans are session-wide and only
+    /// appear in the unfiltered report.
     pub fn generate_report(&self, context_filter: Option<&str>) -> ProfileReport {
-        let events = self.events.read();
-        ProfileReport::from_events(&events, context_filter)
+        flush_local_events();
+        // Only the context's rows (via the store's index) become events, so
+        // they are not filtered again by their innermost context
+        let events = self.events.read().to_events(context_filter);
+        let mut report = ProfileReport::from_events(&events, None);
+        report.metadata.context = context_filter.map(String::from);
+        if context_filter.is_none() {
+            report.functions = self.function_metrics();
+        }
+        report
     }
     
     /// Export events as JSON
@@ -99,7 +503,8 @@ impl Profiler {
     /// Get all events (for advanced use cases)
     #[allow(dead_code)]
     pub fn get_events(&self) -> Vec<OperationEvent> {
-        self.events.read().clone()
+        flush_local_events();
+        self.events.read().to_events(None)
     }
 }
 
@@ -109,9 +514,21 @@ impl Default for Profiler {
     }
 }
 
-// Thread-local profiler instance for zero overhead when disabled
 thread_local! {
-    static PROFILER_CONTEXT: std::cell::RefCell<Option<String>> = std::cell::RefCell::new(None);
+    // Current context frame of this thread (NO_CONTEXT if none)
+    static PROFILER_CONTEXT: Cell<u32> = Cell::new(NO_CONTEXT);
+    // Frames enclosing the current one (innermost last)
+    static CONTEXT_STACK: RefCell<Vec<u32>> = RefCell::new(Vec::new());
+    static LOCAL_EVENTS: RefCell<LocalEvents> = RefCell::new(LocalEvents {
+        target: None,
+        epoch: 0,
+        events: EventColumns::default(),
+    });
+}
+
+/// Merge this thread's buffered events into their profiler's store
+fn flush_local_events() {
+    LOCAL_EVENTS.with(|local| local.borrow_mut().flush());
 }
 
 /// Get current timestamp in microseconds
@@ -125,68 +542,126 @@ pub fn now_micros() -> u64 {
 
 /// RAII guard for profiling a scope
 ///
-/// Automatically records the operation when dropped
-pub struct ProfileScope {
-    profiler: Profiler,
-    operation: String,
-    backend: String,
+/// Automatically records the operation when dropped. Borrows the profiler,
+/// so opening a scope touches no reference counts.
+pub struct ProfileScope<'a> {
+    profiler: &'a Profiler,
+    operation: u32,
+    backend: u32,
     data_size: usize,
     start_time_us: u64,
-    context: Option<String>,
+    context: u32,
+    /// Whether profiling was enabled when the scope was opened. Inactive
+    /// scopes skip the interning, timestamp, context lookup and recording.
+    active: bool,
 }
 
-impl ProfileScope {
+impl<'a> ProfileScope<'a> {
     /// Create a new profile scope
     pub fn new(
-        profiler: Profiler,
-        operation: String,
-        backend: String,
+        profiler: &'a Profiler,
+        operation: &str,
+        backend: &str,
         data_size: usize,
     ) -> Self {
-        let context = PROFILER_CONTEXT.with(|ctx: &std::cell::RefCell<Option<String>>| ctx.borrow().clone());
+        // Fast path: when disabled, the scope is an inert guard
+        if !profiler.is_enabled() {
+            return Self {
+                profiler,
+                operation: 0,
+                backend: 0,
+                data_size,
+                start_time_us: 0,
+                context: NO_CONTEXT,
+                active: false,
+            };
+        }
+        
+        let (operation, backend) = {
+            let mut names = NAMES.lock();
+            (names.intern(operation), names.intern(backend))
+        };
         
         Self {
             profiler,
             operation,
             backend,
             data_size,
+            context: PROFILER_CONTEXT.with(Cell::get),
             start_time_us: now_micros(),
-            context,
+            active: true,
         }
     }
 }
 
-impl Drop for ProfileScope {
+impl Drop for ProfileScope<'_> {
     fn drop(&mut self) {
+        if !self.active {
+            return;
+        }
+        
         let end_time_us = now_micros();
         
-        self.profiler.record_operation(
-            self.operation.clone(),
-            self.backend.clone(),
+        self.profiler.record_interned(
+            self.operation,
+            self.backend,
             self.data_size,
             self.start_time_us,
             end_time_us,
-            self.context.clone(),
+            self.context,
         );
     }
 }
 
 /// Set the current profiling context
 pub fn set_context(context: Option<String>) {
-    PROFILER_CONTEXT.with(|ctx: &std::cell::RefCell<Option<String>>| {
-        *ctx.borrow_mut() = context;
+    let id = context.map_or(NO_CONTEXT, |ctx| {
+        let name = intern(&ctx);
+        FRAMES.lock().frame(name, NO_CONTEXT)
     });
+    PROFILER_CONTEXT.with(|ctx| ctx.set(id));
+    if id == NO_CONTEXT {
+        flush_local_events();
+    }
+}
+
+/// Enter a nested context; pop_context restores the enclosing one
+pub fn push_context(context: &str) {
+    let name = intern(context);
+    let outer = PROFILER_CONTEXT.with(Cell::get);
+    let frame = FRAMES.lock().frame(name, outer);
+    PROFILER_CONTEXT.with(|ctx| ctx.set(frame));
+    CONTEXT_STACK.with(|stack| stack.borrow_mut().push(outer));
+}
+
+/// Leave the innermost context
+///
+/// Leaving the outermost one merges the events this thread buffered.
+pub fn pop_context() {
+    let outer = CONTEXT_STACK
+        .with(|stack| stack.borrow_mut().pop())
+        .unwrap_or(NO_CONTEXT);
+    PROFILER_CONTEXT.with(|ctx| ctx.set(outer));
+    if outer == NO_CONTEXT {
+        flush_local_events();
+    }
 }
 
 /// Get the current profiling context
-#[allow(dead_code)]
 pub fn get_context() -> Option<String> {
-    PROFILER_CONTEXT.with(|ctx: &std::cell::RefCell<Option<String>>| ctx.borrow().clone())
+    match PROFILER_CONTEXT.with(Cell::get) {
+        NO_CONTEXT => None,
+        frame => {
+            let name = FRAMES.lock().name(frame);
+            Some(NAMES.lock().name(name).to_string())
+        }
+    }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::sync::mpsc;
     use std::thread;
     use std::time::Duration;
     
@@ -261,6 +736,37 @@ mod tests {
         assert_eq!(profiler.event_count(), 0);
     }
     
+    #[test]
+    fn test_clear_drops_events_other_threads_buffered() {
+        let profiler = Profiler::new();
+        profiler.enable();
+        let (recorded_tx, recorded_rx) = mpsc::channel();
+        let (cleared_tx, cleared_rx) = mpsc::channel();
+        
+        let worker = {
+            let profiler = profiler.clone();
+            thread::spawn(move || {
+                push_context("worker");
+                drop(ProfileScope::new(&profiler, "before_clear", "CPU", 1));
+                recorded_tx.send(()).unwrap();
+                cleared_rx.recv().unwrap();
+                pop_context();
+                
+                // The next batch starts after the clear and is kept
+                push_context("worker");
+                drop(ProfileScope::new(&profiler, "after_clear", "CPU", 1));
+                pop_context();
+            })
+        };
+        recorded_rx.recv().unwrap();
+        profiler.clear();
+        cleared_tx.send(()).unwrap();
+        worker.join().unwrap();
+        
+        let ops: Vec<String> = profiler.get_events().into_iter().map(|e| e.operation).collect();
+        assert_eq!(ops, vec!["after_clear".to_string()]);
+    }
+    
     #[test]
     fn test_profile_scope() {
         let profiler = Profiler::new();
@@ -268,9 +774,9 @@ mod tests {
         
         {
             let _scope = ProfileScope::new(
-                profiler.clone(),
-                "scoped_op".to_string(),
-                "CPU".to_string(),
+                &profiler,
+                "scoped_op",
+                "CPU",
                 100,
             );
             
@@ -284,6 +790,22 @@ mod tests {
         assert!(events[0].duration_us() >= 1000); // At least 1ms
     }
     
+    #[test]
+    fn test_profile_scope_when_disabled() {
+        let profiler = Profiler::new();
+        
+        {
+            let _scope = ProfileScope::new(
+                &profiler,
+                "scoped_op",
+                "CPU",
+                100,
+            );
+        }
+        
+        assert_eq!(profiler.event_count(), 0);
+    }
+    
     #[test]
     fn test_context_tracking() {
         set_context(Some("test_context".to_string()));
@@ -293,6 +815,100 @@ mod tests {
         assert_eq!(get_context(), None);
     }
     
+    #[test]
+    fn test_profile_scope_records_context() {
+        let profiler = Profiler::new();
+        profiler.enable();
+        
+        set_context(Some("section".to_string()));
+        drop(ProfileScope::new(&profiler, "ctx_op", "CPU", 10));
+        set_context(None);
+        drop(ProfileScope::new(&profiler, "ctx_op", "CPU", 10));
+        
+        let events = profiler.get_events();
+        assert_eq!(events[0].context.as_deref(), Some("section"));
+        assert_eq!(events[1].context, None);
+        assert_eq!(events[1].operation, "ctx_op");
+        assert_eq!(profiler.generate_report(Some("section")).operations["ctx_op"].count, 1);
+    }
+    
+    #[test]
+    fn test_nested_contexts_buffer_until_exit() {
+        let profiler = Profiler::new();
+        profiler.enable();
+        
+        push_context("outer");
+        push_context("inner");
+        drop(ProfileScope::new(&profiler, "nested_op", "CPU", 10));
+        pop_context();
+        assert_eq!(get_context(), Some("outer".to_string()));
+        drop(ProfileScope::new(&profiler, "nested_op", "CPU", 10));
+        assert_eq!(profiler.events.read().len(), 0);
+        pop_context();
+        assert_eq!(get_context(), None);
+        assert_eq!(profiler.events.read().len(), 2);
+        
+        let events = profiler.get_events();
+        assert_eq!(events[0].context.as_deref(), Some("inner"));
+        assert_eq!(events[1].context.as_deref(), Some("outer"));
+        
+        // The outer context's report rolls up the inner one
+        assert_eq!(profiler.generate_report(Some("outer")).operations["nested_op"].count, 2);
+        assert_eq!(profiler.generate_report(Some("inner")).operations["nested_op"].count, 1);
+    }
+    
+    #[test]
+    fn test_context_report_uses_index() {
+        let profiler = Profiler::new();
+        profiler.enable();
+        
+        push_context("indexed_a");
+        drop(ProfileScope::new(&profiler, "op_a", "CPU", 10));
+        drop(ProfileScope::new(&profiler, "op_a", "CPU", 10));
+        pop_context();
+        drop(ProfileScope::new(&profiler, "op_free", "CPU", 10));
+        push_context("indexed_b");
+        drop(ProfileScope::new(&profiler, "op_b", "CPU", 10));
+        pop_context();
+        
+        let store = profiler.events.read();
+        let id_a = NAMES.lock().lookup("indexed_a").unwrap();
+        assert_eq!(store.context_rows[&id_a], vec![0, 1]);
+        drop(store);
+        
+        let report = profiler.generate_report(Some("indexed_b"));
+        assert_eq!(report.operations.len(), 1);
+        assert_eq!(report.operations["op_b"].count, 1);
+        assert!(profiler.generate_report(Some("never_entered")).operations.is_empty());
+        
+        profiler.clear();
+        assert!(profiler.generate_report(Some("indexed_a")).operations.is_empty());
+    }
+    
+    #[test]
+    fn test_record_elapsed() {
+        let profiler = Profiler::new();
+        let op = operation_id("decorated_fn");
+        profiler.record_elapsed(op, 5_000);
+        assert!(profiler.generate_report(None).functions.is_empty());
+        
+        profiler.enable();
+        profiler.record_elapsed(op, 5_000);
+        profiler.record_elapsed(op, 3_000);
+        drop(ProfileScope::new(&profiler, "inner_op", "CPU", 10));
+        
+        // Spans are not events: they neither appear as ops nor add to the total
+        let report = profiler.generate_report(None);
+        assert_eq!(profiler.event_count(), 1);
+        assert!(!report.operations.contains_key("decorated_fn"));
+        let function = &report.functions["decorated_fn"];
+        assert_eq!(function.count, 2);
+        assert_eq!(function.total_time_ms, 0.008);
+        
+        profiler.clear();
+        assert!(profiler.generate_report(None).functions.is_empty());
+    }
+    
     #[test]
     fn test_generate_report() {
         let profiler = Profiler::new();
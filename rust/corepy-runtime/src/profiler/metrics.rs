@@ -3,6 +3,7 @@
 //! This module defines the core data types for the profiling system:
 //! - OperationEvent: Individual operation timing records
 //! - OperationMetrics: Aggregated statistics for an operation
+//! - FunctionMetrics: Call count and time of a `@profile_operation` function
 //! - ProfileReport: Complete profiling session report
 
 use serde::{Deserialize, Serialize};
@@ -124,6 +125,25 @@ impl OperationMetrics {
     }
 }
 
+/// Aggregated timing of a Python function profiled with `@profile_operation`
+///
+/// Kept apart from OperationMetrics: a function's time includes the ops it
+/// calls, so it has no share of the operations' total.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct FunctionMetrics {
+    /// Function name
+    pub function: String,
+    
+    /// Number of calls
+    pub count: usize,
+    
+    /// Total time spent in the function (milliseconds)
+    pub total_time_ms: f64,
+    
+    /// Average time per call (milliseconds)
+    pub avg_time_ms: f64,
+}
+
 /// Complete profiling report for a session
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ProfileReport {
@@ -138,6 +158,10 @@ pub struct ProfileReport {
     
     /// Number of operations profiled
     pub operation_count: usize,
+    
+    /// Metrics for each `@profile_operation` function (unfiltered reports)
+    #[serde(default)]
+    pub functions: std::collections::HashMap<String, FunctionMetrics>,
 }
 
 /// Metadata about the profiling session
@@ -171,6 +195,7 @@ impl ProfileReport {
             operations: std::collections::HashMap::new(),
             total_time_ms: 0.0,
             operation_count: 0,
+            functions: std::collections::HashMap::new(),
         }
     }
     
@@ -227,6 +252,7 @@ impl ProfileReport {
             operations,
             total_time_ms,
             operation_count,
+            functions: std::collections::HashMap::new(),
         }
     }
     
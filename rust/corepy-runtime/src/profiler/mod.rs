@@ -5,4 +5,4 @@
 pub mod metrics;
 pub mod core;
 
-pub use self::core::{Profiler, ProfileScope, set_context};
+pub use self::core::{Profiler, ProfileScope, get_context, operation_id, pop_context, push_context, set_context};
@@ -53,6 +53,12 @@ else
 fi
 echo "✅ Rust runtime built"
 
+# Optional: ahead-of-time build of the numba fallback kernels, so importing
+# them needs no JIT (skipped when numba is not installed)
+if python3 -c "import numba" >/dev/null 2>&1; then
+    python3 -m corepy.ops._kernels_aot && echo "✅ AOT fallback kernels built"
+fi
+
 # Verification
 echo ""
 echo "=== Verification ==="
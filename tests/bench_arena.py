@@ -1,15 +1,19 @@
 """
 Arena Integration Benchmark
 
-Measures overhead of arena integration in reduction operations.
-Expected: <1% overhead from arena.reset() calls
+Measures per-call cost of the reduction entry points. Reductions no longer
+enter an arena scope (they allocate nothing), so the 1K-element latency is
+FFI call + kernel only.
 """
 
 import numpy as np
-import time
-from _corepy_rust import tensor_sum_f32, tensor_mean_f32, tensor_any
+import corepy as cp
+from bench_common import record, time_median
+from _corepy_rust import tensor_sum_f32, tensor_sum_f32_repeat, tensor_mean_f32, tensor_any
+from _corepy_rust import tensor_sum_f32_naive, tensor_sum_f32_pairwise, tensor_sum_f32_kahan
+from _corepy_rust import simd_level
 
-def bench_operation(op_name, op_func, data, iterations=10_000):
+def bench_operation(op_name, op_func, data, iterations=10_000, repeat_func=None):
     """
     Benchmark a single operation with arena integration.
     
@@ -18,34 +22,42 @@ def bench_operation(op_name, op_func, data, iterations=10_000):
         op_func: Function to benchmark
         data: NumPy array input
         iterations: Number of iterations
+        repeat_func: Optional `f(ptr, size, iterations)` that runs the kernel
+            `iterations` times inside Rust. Timed as one call, so per-call
+            FFI overhead does not swamp small sizes.
     
     Returns:
         dict with performance metrics
     """
     size = len(data)
     
-    # Warmup
+    # Bind the pointer and function once: data.ctypes builds a new
+    # ctypes object on every access, which rivals a 1K-element kernel
+    ptr = int(data.ctypes.data)
+    fn = op_func
+    n = size
+    
+    # Warmup (same call as the timed path; any() data is already uint8)
     for _ in range(100):
-        if op_name == "any":
-            # any() takes uint8
-            op_func(data.ctypes.data, size)
-        else:
-            op_func(data.ctypes.data, size)
-    
-    # Timed run
-    start = time.perf_counter()
-    for _ in range(iterations):
-        if op_name == "any":
-            result = op_func(data.ctypes.data, size)
-        else:
-            result = op_func(data.ctypes.data, size)
-    elapsed = time.perf_counter() - start
+        fn(ptr, n)
+    
+    # Timed run: median of TRIALS loops; `elapsed` is one loop of `iterations`
+    if repeat_func is not None:
+        elapsed = time_median(repeat_func, ptr, n, iterations, iterations=1)
+    else:
+        elapsed = time_median(fn, ptr, n, iterations=iterations) * iterations
     
     ops_per_sec = iterations / elapsed
     bytes_processed = size * data.itemsize * iterations
     gb_per_sec = bytes_processed / (elapsed * 1e9)
     avg_latency_us = (elapsed / iterations) * 1e6
     
+    record(
+        bench="arena", op=op_name, size=size, iterations=iterations,
+        gbps=gb_per_sec, ns_per_call=avg_latency_us * 1e3,
+        timed_in="rust" if repeat_func is not None else "python",
+    )
+    
     return {
         'size': size,
         'ops_per_sec': ops_per_sec,
@@ -69,9 +81,13 @@ def print_results(op_name, results):
 def main():
     print("=" * 70)
     print("Arena Integration Benchmark")
-    print("Testing overhead of with_arena() wrapper")
+    print("Reduction dispatch cost (no arena scope in the hot path)")
     print("=" * 70)
     
+    # Instruction set sum_f32 was dispatched to at load time (cpuid)
+    level = simd_level()
+    print(f"\nSIMD level: {level}")
+    
     # Test sizes (small to large)
     test_sizes = [
         1_000,      # 1K - Cache-resident
@@ -81,16 +97,38 @@ def main():
     ]
     
     # === Benchmark sum_f32 ===
-    print("\n[1/3] Benchmarking sum_f32 (AVX2)...")
+    print(f"\n[1/5] Benchmarking sum_f32 ({level}, timed inside Rust)...")
     sum_results = []
     for size in test_sizes:
         data = np.random.rand(size).astype(np.float32)
-        result = bench_operation("sum_f32", tensor_sum_f32, data, iterations=10_000 if size < 100_000 else 1_000)
+        result = bench_operation(
+            "sum_f32", tensor_sum_f32, data,
+            iterations=10_000 if size < 100_000 else 1_000,
+            repeat_func=tensor_sum_f32_repeat,
+        )
         sum_results.append(result)
     print_results("sum_f32", sum_results)
     
+    # === Benchmark summation variants (speed vs accuracy) ===
+    print("\n[2/5] Benchmarking sum_f32 variants (naive / pairwise / kahan)...")
+    variants = [
+        ("default", tensor_sum_f32),
+        ("naive", tensor_sum_f32_naive),
+        ("pairwise", tensor_sum_f32_pairwise),
+        ("kahan", tensor_sum_f32_kahan),
+    ]
+    data = np.random.rand(test_sizes[-1]).astype(np.float32)
+    exact = float(np.sum(data, dtype=np.float64))
+    ptr = int(data.ctypes.data)
+    print(f"\n  {'Method':<10} {'GB/s (1M)':>10} {'Rel. error':>12}")
+    for method, fn in variants:
+        r = bench_operation(f"sum_f32_{method}", fn, data, iterations=1_000)
+        rel_err = abs(fn(ptr, len(data)) - exact) / exact
+        record(bench="arena", op=f"sum_f32_{method}", size=len(data), rel_error=rel_err)
+        print(f"  {method:<10} {r['gb_per_sec']:>10.2f} {rel_err:>12.2e}")
+    
     # === Benchmark mean_f32 ===
-    print("\n[2/3] Benchmarking mean_f32 (AVX2)...")
+    print("\n[3/5] Benchmarking mean_f32 (AVX2)...")
     mean_results = []
     for size in test_sizes:
         data = np.random.rand(size).astype(np.float32)
@@ -99,7 +137,7 @@ def main():
     print_results("mean_f32", mean_results)
     
     # === Benchmark any (early-exit) ===
-    print("\n[3/3] Benchmarking any (early-exit optimization)...")
+    print("\n[4/5] Benchmarking any (early-exit optimization)...")
     any_results = []
     for size in test_sizes:
         # Create bool array with false at start (worst case for early-exit)
@@ -109,6 +147,20 @@ def main():
         any_results.append(result)
     print_results("any", any_results)
     
+    # === Tensor-level sum: result Tensor vs plain float ===
+    print("\n[5/5] Benchmarking Tensor.sum() vs Tensor.sum_scalar() (1K elements)...")
+    t = cp.Tensor(np.random.rand(1_000).astype(np.float32))
+    api_latency = {}
+    for name, method in (("sum", t.sum), ("sum_scalar", t.sum_scalar)):
+        for _ in range(100):
+            method()
+        elapsed = time_median(method, iterations=10_000)
+        api_latency[name] = elapsed * 1e6
+        record(bench="arena", op=f"tensor_{name}", size=1_000, iterations=10_000,
+               ns_per_call=elapsed * 1e9, timed_in="python")
+    for name, us in api_latency.items():
+        print(f"  Tensor.{name + '()':<14} {us:>8.2f} µs")
+    
     # === Performance Summary ===
     print("\n" + "=" * 70)
     print("Performance Summary")
@@ -123,11 +175,11 @@ def main():
     print(f"  sum_f32:  {sum_results[0]['avg_latency_us']:.2f} µs")
     print(f"  mean_f32: {mean_results[0]['avg_latency_us']:.2f} µs")
     print(f"  any:      {any_results[0]['avg_latency_us']:.2f} µs")
+    print(f"  Tensor.sum_scalar(): {api_latency['sum_scalar']:.2f} µs "
+          f"(Tensor.sum(): {api_latency['sum']:.2f} µs)")
     
     print("\n✅ Arena integration benchmark complete!")
-    print("\nExpected overhead: <1% (arena.reset() is O(1))")
-    print("Actual overhead cannot be measured without baseline,")
-    print("but tests passing confirm no crashes or memory leaks.")
+    print("\n1K-element latency is FFI call + kernel: no arena borrow/reset per call.")
     
     print("\n" + "=" * 70)
 
@@ -0,0 +1,53 @@
+"""
+BFloat16 Sum Benchmark
+
+Compares tensor_sum_f32 with tensor_sum_bf16 on the same values. The bf16
+kernel reads half the bytes and widens to float32 in registers, so once the
+input is DRAM-resident its element throughput should approach 2x float32.
+"""
+
+import numpy as np
+from bench_common import record, time_median
+from _corepy_rust import tensor_sum_f32, tensor_sum_bf16
+
+def bench_sum(op_name, fn, data, iterations):
+    """Median seconds per call of fn over `iterations` (after warmup)."""
+    ptr = int(data.ctypes.data)
+    n = data.size
+
+    for _ in range(10):
+        fn(ptr, n)
+
+    elapsed = time_median(fn, ptr, n, iterations=iterations)
+
+    record(
+        bench="bf16_sum", op=op_name, size=n, iterations=iterations,
+        gbps=data.nbytes / (elapsed * 1e9), ns_per_call=elapsed * 1e9,
+    )
+    return elapsed
+
+def main():
+    print("=" * 70)
+    print("Sum: float32 vs bfloat16 storage (float32 accumulation)")
+    print("=" * 70)
+    print(f"\n  {'Size':>11} {'f32 Gelem/s':>12} {'bf16 Gelem/s':>13} {'Ratio':>7} {'Rel. diff':>10}")
+
+    for size in (10_000, 100_000, 1_000_000, 16_000_000):
+        f32 = np.random.rand(size).astype(np.float32)
+        # Truncate to bf16 bit patterns: both kernels then sum identical values
+        bf16 = (f32.view(np.uint32) >> 16).astype(np.uint16)
+        f32 = (bf16.astype(np.uint32) << 16).view(np.float32)
+
+        iterations = 1_000 if size <= 1_000_000 else 50
+        t_f32 = bench_sum("sum_f32", tensor_sum_f32, f32, iterations)
+        t_bf16 = bench_sum("sum_bf16", tensor_sum_bf16, bf16, iterations)
+
+        exact = float(np.sum(f32, dtype=np.float64))
+        rel_diff = abs(tensor_sum_bf16(int(bf16.ctypes.data), size) - exact) / exact
+        print(f"  {size:>11,} {size / t_f32 / 1e9:>12.2f} {size / t_bf16 / 1e9:>13.2f} "
+              f"{t_f32 / t_bf16:>6.2f}x {rel_diff:>10.2e}")
+
+    print("\n" + "=" * 70)
+
+if __name__ == "__main__":
+    main()
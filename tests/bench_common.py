@@ -0,0 +1,107 @@
+"""
+Shared result recording for the bench_*.py scripts.
+
+Each benchmark calls ``record(op=..., size=..., ...)`` per measurement in
+addition to printing it. Rows are kept as columns (one list per field) and
+written once at interpreter exit, so results can be loaded straight into
+pandas/duckdb for regression tracking instead of scraping the printed logs.
+
+Output goes to ``$COREPY_BENCH_RESULTS`` (default ``bench_results.parquet``)
+when pyarrow is installed, otherwise to the same path with a ``.csv`` suffix.
+Set ``COREPY_BENCH_RESULTS=""`` to disable writing.
+
+Timed loops go through ``time_median``: K trials of N calls each on the
+nanosecond clock, reporting the median trial. One preempted trial then
+shifts nothing, where it would skew a single long mean by tens of percent.
+Set ``COREPY_BENCH_CPU=<core>`` to pin the process to one core for less
+migration noise (leave it unset for the parallel benchmarks, which need
+the other cores). Turbo/frequency scaling is not controlled from here.
+"""
+
+import atexit
+import os
+import platform
+import statistics
+import time
+
+_columns = {}
+_n_rows = 0
+
+TRIALS = 11
+
+
+def time_median(fn, *args, iterations, trials=TRIALS):
+    """Median seconds per call of ``fn(*args)`` over `trials` loops of `iterations` calls."""
+    clock = time.perf_counter_ns
+    totals = []
+    for _ in range(trials):
+        start = clock()
+        for _ in range(iterations):
+            fn(*args)
+        totals.append(clock() - start)
+    return statistics.median(totals) / iterations / 1e9
+
+
+def pin_cpu(cpu):
+    """Restrict this process to `cpu`; returns False where affinity is unsupported."""
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, {cpu})
+    return True
+
+
+def record(**fields):
+    """Append one measurement; missing fields in earlier/later rows become None."""
+    global _n_rows
+    fields.setdefault("timestamp", time.time())
+    for name, value in fields.items():
+        column = _columns.get(name)
+        if column is None:
+            column = _columns[name] = [None] * _n_rows
+        column.append(value)
+    _n_rows += 1
+    for column in _columns.values():
+        if len(column) < _n_rows:
+            column.append(None)
+
+
+def columns():
+    """Recorded results as {field: list of values} (all lists have equal length)."""
+    return _columns
+
+
+def save(path=None):
+    """Write the recorded rows (Parquet if pyarrow is available, else CSV); returns the path."""
+    if path is None:
+        path = os.environ.get("COREPY_BENCH_RESULTS", "bench_results.parquet")
+    if not path or not _n_rows:
+        return None
+
+    data = dict(_columns)
+    data.setdefault("machine", [platform.machine()] * _n_rows)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        import csv
+
+        path = os.path.splitext(path)[0] + ".csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values()))
+    else:
+        pq.write_table(pa.table(data), path)
+    return path
+
+
+if os.environ.get("COREPY_BENCH_CPU"):
+    pin_cpu(int(os.environ["COREPY_BENCH_CPU"]))
+
+
+@atexit.register
+def _save_at_exit():
+    path = save()
+    if path:
+        print(f"\nResults written to {path}")
@@ -6,8 +6,23 @@ Expected speedup: 8-16x (AVX2 processes 8x f32 per instruction)
 """
 
 import numpy as np
-import time
-from _corepy_rust import tensor_dot_product_f32
+from bench_common import record, time_median
+from _corepy_rust import tensor_dot_product_f32, tensor_dot_product_f32_repeat, tensor_dot_product_i8
+
+# Optional third contender: a numba-jitted scalar loop. It compiles to an
+# FMA loop, but is called from Python once per dot product, so comparing it
+# with the single-call rows separates the SIMD gap from the call overhead.
+try:
+    from numba import njit
+except ImportError:
+    nb_dot = None
+else:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def nb_dot(a, b):
+        s = 0.0
+        for i in range(a.size):
+            s += a[i] * b[i]
+        return s
 
 def bench_dot_product(size, iterations=1000):
     """
@@ -24,27 +39,42 @@ def bench_dot_product(size, iterations=1000):
     a = np.random.rand(size).astype(np.float32)
     b = np.random.rand(size).astype(np.float32)
     
-    # Warmup
+    # Bind pointers and function once: data.ctypes builds a new
+    # ctypes object on every access, which rivals a small kernel
+    ptr_a, ptr_b = int(a.ctypes.data), int(b.ctypes.data)
+    fn = tensor_dot_product_f32
+    n = size
+    
+    # Warmup (same call as the timed path)
     for _ in range(10):
-        tensor_dot_product_f32(a.ctypes.data, b.ctypes.data, size)
+        fn(ptr_a, ptr_b, n)
     
-    # Benchmark Corepy (AVX2)
-    start = time.perf_counter()
-    for _ in range(iterations):
-        cp_result = tensor_dot_product_f32(a.ctypes.data, b.ctypes.data, size)
-    cp_time = time.perf_counter() - start
+    # Both sides run all iterations in one call, so neither pays Python
+    # dispatch per dot product and small sizes compare the kernels. Each
+    # time is the median of TRIALS such calls.
     
-    # Benchmark NumPy (reference)
-    start = time.perf_counter()
-    for _ in range(iterations):
-        np_result = np.dot(a, b)
-    np_time = time.perf_counter() - start
+    # Benchmark Corepy (AVX2): the loop runs inside Rust
+    cp_time = time_median(tensor_dot_product_f32_repeat, ptr_a, ptr_b, n, iterations, iterations=1)
+    cp_result = fn(ptr_a, ptr_b, n)
+    
+    # Benchmark NumPy (reference): one einsum over `iterations` stacked rows
+    # (zero-stride broadcast views, so nothing is materialized)
+    A = np.broadcast_to(a, (iterations, size))
+    B = np.broadcast_to(b, (iterations, size))
+    np.einsum('ij,ij->', A[:1], B[:1])  # Warm the einsum path
+    np_time = time_median(np.einsum, 'ij,ij->', A, B, iterations=1)
     
     # Verify correctness
     np_result_single = np.dot(a, b)
     error = abs(cp_result - np_result_single)
     relative_error = error / max(abs(np_result_single), 1e-10)
     
+    # Benchmark numba (reference): one Python-level call per dot product
+    nb_time = None
+    if nb_dot is not None:
+        nb_dot(a, b)  # JIT (or cache load) and warm
+        nb_time = time_median(nb_dot, a, b, iterations=iterations) * iterations
+    
     # Calculate metrics
     ops_per_sec_cp = iterations / cp_time
     ops_per_sec_np = iterations / np_time
@@ -54,6 +84,18 @@ def bench_dot_product(size, iterations=1000):
     flops_cp = (2 * size * iterations) / cp_time
     flops_np = (2 * size * iterations) / np_time
     
+    flops_nb = (2 * size * iterations) / nb_time if nb_time else None
+    
+    contenders = [("corepy", cp_time, flops_cp), ("numpy", np_time, flops_np)]
+    if nb_time:
+        contenders.append(("numba", nb_time, flops_nb))
+    for impl, elapsed, flops in contenders:
+        record(
+            bench="dotproduct", op="dot_f32", impl=impl, size=size, iterations=iterations,
+            gflops=flops / 1e9, gbps=(8 * size * iterations) / (elapsed * 1e9),
+            ns_per_call=elapsed / iterations * 1e9, rel_error=float(relative_error),
+        )
+    
     return {
         'size': size,
         'cp_time_ms': cp_time * 1000,
@@ -61,12 +103,37 @@ def bench_dot_product(size, iterations=1000):
         'speedup': speedup,
         'cp_gflops': flops_cp / 1e9,
         'np_gflops': flops_np / 1e9,
+        'nb_time_ms': nb_time * 1000 if nb_time else None,
+        'nb_gflops': flops_nb / 1e9 if nb_time else None,
         'error': error,
         'relative_error': relative_error,
         'cp_result': cp_result,
         'np_result': np_result_single
     }
 
+def bench_dot_i8(size, iterations=1000):
+    """
+    Time the int8 dot product (int32 result) at given size.
+
+    Uses AVX-VNNI (vpdpbusd) when the CPU has it, otherwise the AVX2
+    madd_epi16 kernel. Returns (giga int-ops/s, ns per call).
+    """
+    a = np.random.randint(-128, 128, size, dtype=np.int8)
+    b = np.random.randint(-128, 128, size, dtype=np.int8)
+    ptr_a, ptr_b = int(a.ctypes.data), int(b.ctypes.data)
+    fn = tensor_dot_product_i8
+
+    assert fn(ptr_a, ptr_b, size) == int(a.astype(np.int64) @ b)
+
+    elapsed = time_median(fn, ptr_a, ptr_b, size, iterations=iterations)
+
+    gops = 2 * size / (elapsed * 1e9)
+    record(
+        bench="dotproduct", op="dot_i8", impl="corepy", size=size, iterations=iterations,
+        gops=gops, gbps=2 * size / (elapsed * 1e9), ns_per_call=elapsed * 1e9,
+    )
+    return gops, elapsed * 1e9
+
 def main():
     print("=" * 70)
     print("Dot Product SIMD Benchmark")
@@ -95,9 +162,17 @@ def main():
         print(f"\nSize: {size:>10,} elements ({iterations} iterations)")
         print(f"  Corepy (AVX2): {result['cp_time_ms']:>8.3f} ms  ({result['cp_gflops']:>6.2f} GFLOPS)")
         print(f"  NumPy:         {result['np_time_ms']:>8.3f} ms  ({result['np_gflops']:>6.2f} GFLOPS)")
+        if result['nb_time_ms'] is not None:
+            print(f"  Numba (JIT):   {result['nb_time_ms']:>8.3f} ms  ({result['nb_gflops']:>6.2f} GFLOPS, per-call)")
         print(f"  Speedup:       {result['speedup']:>8.2f}x")
         print(f"  Accuracy:      {result['relative_error']:.2e} relative error")
     
+    print("\nint8 dot product (int32 accumulation, one call per dot):")
+    for size in test_sizes:
+        iterations = max(10, min(10000, 1_000_000 // size))
+        gops, ns = bench_dot_i8(size, iterations)
+        print(f"  {size:>10,} elements: {gops:>7.2f} GOPS  ({ns:>10.1f} ns/call)")
+    
     # Summary
     print("\n" + "=" * 70)
     print("Performance Summary")
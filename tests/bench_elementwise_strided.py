@@ -0,0 +1,74 @@
+"""
+Strided Element-wise Benchmark
+
+Times out = a[::s] + b[::s] on float32 views for s in {1, 2, 4, 8}.
+Unit-stride rows use the contiguous AVX2 kernel, other strides the AVX2
+gather kernel; both read the views in place (no contiguous copy).
+"""
+
+import numpy as np
+from bench_common import record, time_median
+from _corepy_rust import tensor_add_strided_f32
+
+def bench_strided_add(stride, size=1_000_000, iterations=200):
+    """
+    Benchmark a strided add producing `size` outputs.
+
+    Returns:
+        dict with corepy/numpy time per call (ms) and corepy GB/s
+    """
+    a_base = np.random.rand(size * stride).astype(np.float32)
+    b_base = np.random.rand(size * stride).astype(np.float32)
+    a_view = a_base[::stride]
+    b_view = b_base[::stride]
+    out = np.empty(size, dtype=np.float32)
+
+    # Bind everything once; only the kernel call is inside the timed loop
+    a_ptr = int(a_base.ctypes.data)
+    b_ptr = int(b_base.ctypes.data)
+    out_ptr = int(out.ctypes.data)
+    strides = [stride]
+    shape = [size]
+    fn = tensor_add_strided_f32
+
+    # Warmup + correctness
+    fn(a_ptr, strides, b_ptr, strides, out_ptr, shape)
+    np.testing.assert_array_equal(out, a_view + b_view)
+
+    corepy_time = time_median(fn, a_ptr, strides, b_ptr, strides, out_ptr, shape, iterations=iterations)
+
+    np.add(a_view, b_view, out=out)
+    numpy_time = time_median(np.add, a_view, b_view, out, iterations=iterations)
+
+    # Useful bytes: two inputs read, one output written
+    gb_per_sec = 3 * size * 4 / (corepy_time * 1e9)
+
+    for impl, elapsed in (("corepy", corepy_time), ("numpy", numpy_time)):
+        record(
+            bench="elementwise_strided", op="add_f32", impl=impl, size=size,
+            stride=stride, iterations=iterations, ns_per_call=elapsed * 1e9,
+        )
+
+    return {
+        'stride': stride,
+        'corepy_ms': corepy_time * 1e3,
+        'numpy_ms': numpy_time * 1e3,
+        'gb_per_sec': gb_per_sec,
+    }
+
+def main():
+    print("=" * 70)
+    print("Strided Element-wise Add Benchmark (1M outputs)")
+    print("=" * 70)
+    print(f"\n  {'Stride':>6} {'Corepy (ms)':>12} {'NumPy (ms)':>12} {'Speedup':>8} {'GB/s':>8}")
+
+    for stride in (1, 2, 4, 8):
+        r = bench_strided_add(stride)
+        speedup = r['numpy_ms'] / r['corepy_ms']
+        print(f"  {r['stride']:>6} {r['corepy_ms']:>12.3f} {r['numpy_ms']:>12.3f} "
+              f"{speedup:>7.2f}x {r['gb_per_sec']:>8.2f}")
+
+    print("\n" + "=" * 70)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,14 @@
+import argparse
+import itertools
+
 import numpy as np
 import corepy as cp
-import time
+from bench_common import record, time_median
+
+def time_call(fn, iterations):
+    """Median seconds per call of fn (see bench_common.time_median), after one warmup call."""
+    fn()
+    return time_median(fn, iterations=iterations)
 
 def bench_matmul_2d():
     print("=" * 70)
@@ -13,9 +21,16 @@ def bench_matmul_2d():
         (512, 512),
         (1024, 1024),
     ]
+    # Matrix-vector / vector-matrix shapes hit the GEMV specializations
+    degenerate_shapes = [
+        (1024, 1024, 1),
+        (4096, 4096, 1),
+        (1, 1024, 1024),
+        (1, 4096, 4096),
+    ]
+    shapes = [(m, n, n) for m, n in test_sizes] + degenerate_shapes
     
-    for m, n in test_sizes:
-        k = n
+    for m, k, n in shapes:
         print(f"\nSize: {m} x {k} x {n}")
         
         a_np = np.random.rand(m, k).astype(np.float32)
@@ -24,24 +39,18 @@ def bench_matmul_2d():
         a_cp = cp.Tensor(a_np)
         b_cp = cp.Tensor(b_np)
         
-        iterations = 50 if m < 512 else 10
+        iterations = 50 if m * k * n < 512 ** 3 else 10
         
-        # Warmup
-        for _ in range(5):
-             _ = a_cp.matmul(b_cp)
-             _ = a_np @ b_np
+        # Each contender warms up right before its own timed loop, so
+        # neither starts with the other's working set in cache
         
         # NumPy
-        start = time.perf_counter()
-        for _ in range(iterations):
-            expected = a_np @ b_np
-        numpy_time = (time.perf_counter() - start) / iterations
+        numpy_time = time_call(lambda: a_np @ b_np, iterations)
+        expected = a_np @ b_np
         
         # Corepy
-        start = time.perf_counter()
-        for _ in range(iterations):
-            result = a_cp.matmul(b_cp)
-        corepy_time = (time.perf_counter() - start) / iterations
+        corepy_time = time_call(lambda: a_cp.matmul(b_cp), iterations)
+        result = a_cp.matmul(b_cp)
         
         # GFLOPS: 2 * m * n * k operations
         flops = 2 * m * n * k
@@ -50,16 +59,66 @@ def bench_matmul_2d():
         
         speedup = numpy_time / corepy_time
         
-        # Accuracy check
-        result_np = np.array(result._backing_data).reshape(m, n)
+        # Accuracy check (once, outside the timed loops): np.asarray views the
+        # result through __array_interface__, no copy of the m*n output
+        result_np = np.asarray(result)
         error = np.max(np.abs(result_np - expected)) / (np.max(np.abs(expected)) + 1e-9)
         
         print(f"  Corepy (AVX2):   {corepy_time*1000:>8.3f} ms  ({corepy_gflops:>6.2f} GFLOPS)")
         print(f"  NumPy (OpenBLAS):{numpy_time*1000:>8.3f} ms  ({numpy_gflops:>6.2f} GFLOPS)")
         print(f"  Speedup:          {speedup:>6.2f}x")
         print(f"  Max Rel Error:    {error:>8.2e}")
+        
+        for impl, elapsed, gflops in (("corepy", corepy_time, corepy_gflops), ("numpy", numpy_time, numpy_gflops)):
+            record(
+                bench="matmul_2d", op="matmul_f32", impl=impl, m=m, k=k, n=n,
+                size=m * k * n, gflops=gflops, ns_per_call=elapsed * 1e9,
+                rel_error=float(error),
+            )
 
     print("\n" + "=" * 70)
 
+def sweep_matmul_2d(iterations=10):
+    """
+    Time every (m, k, n) in a grid under each CPU backend policy.
+
+    The native kernel's blocking is fixed at compile time, so the tunable
+    here is the DEFAULT policy's native-vs-BLAS flip point: the recorded
+    GFLOPS per (shape, policy) show where OpenBLAS starts to win.
+    """
+    dims = (32, 64, 128, 256, 384, 512)
+    policies = (cp.BackendPolicy.DEFAULT, cp.BackendPolicy.OPENBLAS)
+    previous = cp.get_backend_policy()
+    
+    print("=" * 70)
+    print(f"2D Matmul sweep: {len(dims) ** 3} shapes x {len(policies)} policies")
+    print("=" * 70)
+    try:
+        for m, k, n in itertools.product(dims, repeat=3):
+            a = cp.Tensor(np.random.rand(m, k).astype(np.float32))
+            b = cp.Tensor(np.random.rand(k, n).astype(np.float32))
+            out = cp.Tensor(np.empty((m, n), dtype=np.float32))
+            for policy in policies:
+                cp.set_backend_policy(policy)
+                elapsed = time_call(lambda: a.matmul(b, out=out), iterations)
+                gflops = 2 * m * k * n / elapsed / 1e9
+                record(
+                    bench="matmul_2d_sweep", op="matmul_f32", impl=policy.name,
+                    m=m, k=k, n=n, size=m * k * n, gflops=gflops,
+                    ns_per_call=elapsed * 1e9, backend=cp.last_backend_name(),
+                )
+            print(f"  {m:>4} x {k:>4} x {n:>4}: done")
+    finally:
+        cp.set_backend_policy(previous)
+
 if __name__ == "__main__":
-    bench_matmul_2d()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sweep", action="store_true",
+        help="time a shape grid under each backend policy (for threshold tuning)",
+    )
+    args = parser.parse_args()
+    if args.sweep:
+        sweep_matmul_2d()
+    else:
+        bench_matmul_2d()
@@ -0,0 +1,51 @@
+"""
+Fused Moments Benchmark
+
+Mean + variance need sum(x) and sum(x^2). Two reductions read the input
+twice; tensor_moments_f32 produces both from one pass. Once the input is
+DRAM-resident the fused call should take about half the time of the pair.
+"""
+
+import numpy as np
+from bench_common import record, time_median
+from _corepy_rust import tensor_sum_f32, tensor_dot_product_f32, tensor_moments_f32
+
+def two_pass(ptr, n):
+    """sum(x) and sum(x^2) as two separate reductions (dot(x, x) for the squares)."""
+    return tensor_sum_f32(ptr, n), tensor_dot_product_f32(ptr, ptr, n)
+
+def main():
+    print("=" * 70)
+    print("Moments: sum + sum-of-squares, two passes vs one fused pass")
+    print("=" * 70)
+    print(f"\n  {'Size':>11} {'2-pass (us)':>12} {'fused (us)':>11} {'Speedup':>8} {'fused GB/s':>11}")
+
+    for size in (10_000, 100_000, 1_000_000, 16_000_000):
+        data = np.random.rand(size).astype(np.float32)
+        ptr = int(data.ctypes.data)
+        iterations = 1_000 if size <= 1_000_000 else 20
+
+        for _ in range(10):
+            two_pass(ptr, size)
+            tensor_moments_f32(ptr, size)
+
+        t_two = time_median(two_pass, ptr, size, iterations=iterations)
+        t_fused = time_median(tensor_moments_f32, ptr, size, iterations=iterations)
+
+        expected = (float(np.sum(data, dtype=np.float64)), float(np.dot(data.astype(np.float64), data)))
+        got = tensor_moments_f32(ptr, size)
+        rel_err = max(abs(g - e) / e for g, e in zip(got, expected))
+
+        for impl, elapsed in (("two_pass", t_two), ("fused", t_fused)):
+            record(
+                bench="moments", op="moments_f32", impl=impl, size=size, iterations=iterations,
+                gbps=data.nbytes / (elapsed * 1e9), ns_per_call=elapsed * 1e9, rel_error=rel_err,
+            )
+
+        print(f"  {size:>11,} {t_two * 1e6:>12.1f} {t_fused * 1e6:>11.1f} "
+              f"{t_two / t_fused:>7.2f}x {data.nbytes / (t_fused * 1e9):>11.2f}")
+
+    print("\n" + "=" * 70)
+
+if __name__ == "__main__":
+    main()
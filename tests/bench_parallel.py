@@ -6,17 +6,18 @@ Measures speedup for large arrays (>100K elements).
 """
 
 import numpy as np
-import time
+from bench_common import record, time_median
 from _corepy_rust import tensor_sum_f32, tensor_sum_i32, tensor_mean_f32
 
-def bench_scaling(op_name, op_func, dtype, sizes):
+def bench_scaling(op_name, op_func, buf, sizes):
     """
     Benchmark operation across multiple sizes to measure parallel scaling.
     
     Args:
         op_name: Operation name
         op_func: FFI function
-        dtype: NumPy dtype
+        buf: Preallocated 1-D input at least max(sizes) long; each size
+             times the contiguous prefix view buf[:size] (no allocation)
         sizes: List of sizes to test
     
     Returns:
@@ -25,11 +26,7 @@ def bench_scaling(op_name, op_func, dtype, sizes):
     results = []
     
     for size in sizes:
-        # Create random data
-        if dtype == np.float32:
-            data = np.random.rand(size).astype(dtype)
-        else:
-            data = np.random.randint(0, 100, size, dtype=dtype)
+        data = buf[:size]
         
         # Determine iteration count (smaller for large arrays)
         if size < 100_000:
@@ -39,20 +36,26 @@ def bench_scaling(op_name, op_func, dtype, sizes):
         else:
             iterations = 10
         
-        # Warmup
+        # Bind pointer and function once (data.ctypes allocates per access)
+        ptr = int(data.ctypes.data)
+        fn = op_func
+        n = size
+        
+        # Warmup (same call as the timed path)
         for _ in range(10):
-            op_func(data.ctypes.data, size)
+            fn(ptr, n)
         
-        # Timed run
-        start = time.perf_counter()
-        for _ in range(iterations):
-            result = op_func(data.ctypes.data, size)
-        elapsed = time.perf_counter() - start
+        # Timed run: median of TRIALS loops; `elapsed` is one loop of `iterations`
+        elapsed = time_median(fn, ptr, n, iterations=iterations) * iterations
         
         throughput_gb_s = (size * data.itemsize * iterations) / (elapsed * 1e9)
         latency_ms = (elapsed / iterations) * 1000
         
         results.append((size, throughput_gb_s, latency_ms))
+        record(
+            bench="parallel", op=op_name, size=size, iterations=iterations,
+            gbps=throughput_gb_s, ns_per_call=latency_ms * 1e6,
+        )
         
         # Print immediate feedback
         parallel_marker = "🚀 PARALLEL" if size >= 1_000_000 else "  sequential"
@@ -95,22 +98,33 @@ def main():
         5_000_000,   # Very large parallel
     ]
     
+    # Allocate the inputs once and time prefix views: a fresh 5M-element
+    # array per run means allocator churn and an RNG fill that evicts the
+    # caches right before timing
+    max_size = max(test_sizes)
+    big_f32 = np.random.rand(max_size).astype(np.float32)
+    big_i32 = np.random.randint(0, 100, max_size, dtype=np.int32)
+    
+    # One untimed pass over each whole buffer (page faults, first touch)
+    tensor_sum_f32(int(big_f32.ctypes.data), max_size)
+    tensor_sum_i32(int(big_i32.ctypes.data), max_size)
+    
     # === sum_f32 ===
     print("\n[1/3] sum_f32 (AVX2 SIMD)")
     print("-" * 70)
-    sum_f32_results = bench_scaling("sum_f32", tensor_sum_f32, np.float32, test_sizes)
+    sum_f32_results = bench_scaling("sum_f32", tensor_sum_f32, big_f32, test_sizes)
     print_speedup_analysis(sum_f32_results)
     
     # === sum_i32 ===
     print("\n[2/3] sum_i32 (AVX2 SIMD)")
     print("-" * 70)
-    sum_i32_results = bench_scaling("sum_i32", tensor_sum_i32, np.int32, test_sizes)
+    sum_i32_results = bench_scaling("sum_i32", tensor_sum_i32, big_i32, test_sizes)
     print_speedup_analysis(sum_i32_results)
     
     # === mean_f32 ===
     print("\n[3/3] mean_f32 (parallel sum + divide)")
     print("-" * 70)
-    mean_results = bench_scaling("mean_f32", tensor_mean_f32, np.float32, test_sizes)
+    mean_results = bench_scaling("mean_f32", tensor_mean_f32, big_f32, test_sizes)
     print_speedup_analysis(mean_results)
     
     # === Summary ===
@@ -133,24 +147,19 @@ def main():
     print("NumPy Comparison (5M elements)")
     print("=" * 70)
     
-    size = 5_000_000
-    data_f32 = np.random.rand(size).astype(np.float32)
+    size = max_size
+    data_f32 = big_f32
     
-    # NumPy sum
-    start = time.perf_counter()
-    for _ in range(10):
-        np_result = np.sum(data_f32)
-    numpy_time = time.perf_counter() - start
+    # NumPy sum (median per-call time)
+    numpy_time = time_median(np.sum, data_f32, iterations=10)
     
     # Corepy sum
-    start = time.perf_counter()
-    for _ in range(10):
-        cp_result = tensor_sum_f32(data_f32.ctypes.data, size)
-    corepy_time = time.perf_counter() - start
+    ptr = int(data_f32.ctypes.data)
+    corepy_time = time_median(tensor_sum_f32, ptr, size, iterations=10)
     
     speedup = numpy_time / corepy_time
-    numpy_throughput = (size * 4 * 10) / (numpy_time * 1e9)
-    corepy_throughput = (size * 4 * 10) / (corepy_time * 1e9)
+    numpy_throughput = (size * 4) / (numpy_time * 1e9)
+    corepy_throughput = (size * 4) / (corepy_time * 1e9)
     
     print(f"\nNumPy sum:   {numpy_throughput:.2f} GB/s ({numpy_time*1000:.2f} ms)")
     print(f"Corepy sum:  {corepy_throughput:.2f} GB/s ({corepy_time*1000:.2f} ms)")
@@ -23,14 +23,10 @@ class TestSafety(unittest.TestCase):
         print(f"Input Strides: {sliced_arr.strides}")
         
         # 3. Create Tensor from slice
-        # CURRENT BEHAVIOR: 
-        # - Extracts ptr to '0'
-        # - Passes count=3
-        # - C++ reads contiguous bytes: 0, 1, 2
-        # - Result is sum(0, 1, 2) = 3.0
-        #
-        # CORRECT BEHAVIOR:
-        # - Result should be sum(0, 2, 4) = 6.0
+        # The constructor keeps the view (no copy). The first dense kernel
+        # (sum) copies it to contiguous memory once and keeps that copy, so
+        # the kernel never sees the strided pointer: sum(0, 2, 4) = 6.0.
+        # Reading the raw pointer with count=3 would give sum(0, 1, 2) = 3.0.
         t = cp.Tensor(sliced_arr, dtype=cp.DataType.FLOAT32)
         
         result_tensor = t.sum()
@@ -47,6 +43,25 @@ class TestSafety(unittest.TestCase):
             
         self.assertAlmostEqual(result_val, 6.0, places=5, 
             msg=f"Data corruption! Expected 6.0, got {result_val}")
+        
+        # The contiguous copy replaced the view: later kernels are copy-free
+        self.assertTrue(t._backing_data.flags['C_CONTIGUOUS'])
+
+    def test_non_contiguous_elementwise(self):
+        """
+        Element-wise ops on strided views iterate the strides in place
+        (no contiguous copy) and must still read the right elements.
+        """
+        full_arr = np.arange(12, dtype=np.float32)
+        a = cp.Tensor(full_arr[::2])
+        b = cp.Tensor(full_arr[::-2])
+        
+        result = a + b
+        np.testing.assert_array_equal(
+            np.asarray(result), full_arr[::2] + full_arr[::-2]
+        )
+        # The inputs are still the original views
+        self.assertIs(a._backing_data.base, full_arr)
 
 if __name__ == "__main__":
     unittest.main()
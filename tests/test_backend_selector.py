@@ -3,7 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from corepy.backend.device import DeviceInfo
-from corepy.backend.selector import select_backend
+from corepy.backend.selector import select_backend, select_backend_cached
 from corepy.backend.types import BackendType, OperationProperties, OperationType
 
 
@@ -67,3 +67,16 @@ def test_select_backend_env_var_override(mock_getenv, gpu_device):
     op_props_small = OperationProperties(element_count=100, shape=(100,))
     backend = select_backend(OperationType.COMPUTE_VECTOR, op_props_small, gpu_device)
     assert backend == BackendType.GPU
+
+def test_select_backend_cached_matches_uncached(cpu_only_device, gpu_device, monkeypatch):
+    monkeypatch.delenv("COREPY_BACKEND", raising=False)
+    for device in (cpu_only_device, gpu_device):
+        for n in (100, 10**7):
+            props = OperationProperties(element_count=n, shape=(n,))
+            expected = select_backend(OperationType.COMPUTE_VECTOR, props, device)
+            for _ in range(2): # miss, then hit
+                assert select_backend_cached(OperationType.COMPUTE_VECTOR, n, (n,), device) == expected
+
+    # The environment override is part of the cache key
+    monkeypatch.setenv("COREPY_BACKEND", "cpu")
+    assert select_backend_cached(OperationType.COMPUTE_VECTOR, 10**7, (10**7,), gpu_device) == BackendType.CPU
@@ -58,6 +58,132 @@ class TestBufferProtocol(unittest.TestCase):
         self.assertAlmostEqual(result._backing_data[0], 2.5, places=5)
         print("  ✓ list conversion passed")
 
+    def test_list_buffer_cached(self):
+        """List conversion runs once; later lookups reuse the same buffer."""
+        tensor = cp.Tensor([[1.0, 2.0], [3.0, 4.0]], dtype=DataType.FLOAT32)
+        
+        ptr1, count1, ref1 = tensor._get_buffer_pointer('f4')
+        ptr2, count2, ref2 = tensor._get_buffer_pointer('f4')
+        
+        self.assertEqual(count1, 4)
+        self.assertEqual(ptr1, ptr2)
+        self.assertIs(ref1, ref2)
+        np.testing.assert_array_equal(ref1.ravel(), [1.0, 2.0, 3.0, 4.0])
+
+    def test_nested_list_converted_at_construction(self):
+        """Rectangular nested lists become one contiguous ndarray; the FFI reads it in place."""
+        tensor = cp.Tensor([[1, 2], [3, 4]])
+
+        self.assertIsInstance(tensor._backing_data, np.ndarray)
+        self.assertEqual(tensor.shape, (2, 2))
+        self.assertTrue(tensor._backing_data.flags['C_CONTIGUOUS'])
+        ptr, count, ref = tensor._get_buffer_pointer('f4')
+        self.assertIs(ref, tensor._backing_data)
+        self.assertEqual((ptr, count), (tensor._backing_data.ctypes.data, 4))
+
+    def test_ragged_list_flattened(self):
+        """Ragged nested lists are flattened in order for every buffer type."""
+        tensor = cp.Tensor([[1, 2], [3, [4, 5]], []])
+
+        _ptr, count, ref = tensor._get_buffer_pointer('f4')
+        self.assertEqual(count, 5)
+        np.testing.assert_array_equal(ref, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        _ptr, count, ref = tensor._get_buffer_pointer('i4')
+        np.testing.assert_array_equal(ref, [1, 2, 3, 4, 5])
+
+    def test_strided_numpy_copied_once(self):
+        """A strided NumPy input is made contiguous once and kept."""
+        base = np.arange(8, dtype=np.float32)
+        tensor = cp.Tensor(base[::2])
+
+        ptr1, count1, ref1 = tensor._get_buffer_pointer('f4')
+        ptr2, count2, ref2 = tensor._get_buffer_pointer('f4')
+
+        self.assertEqual(count1, 4)
+        self.assertEqual(ptr1, ptr2)
+        self.assertTrue(tensor._backing_data.flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(ref1, [0.0, 2.0, 4.0, 6.0])
+
+    def test_array_array_support(self):
+        """array.array inputs are 1-D and read in place when the type matches."""
+        import array
+        data = array.array('f', [1.0, 2.0, 3.0, 4.0])
+        tensor = cp.Tensor(data)
+        
+        self.assertEqual(tensor.shape, (4,))
+        ptr, count, ref = tensor._get_buffer_pointer('f4')
+        self.assertEqual((ptr, count), data.buffer_info())
+        self.assertIs(ref, data)
+        
+        # Other element types go through a converted NumPy copy
+        _ptr, count, ref = tensor._get_buffer_pointer('i4')
+        self.assertEqual(count, 4)
+        np.testing.assert_array_equal(ref, [1, 2, 3, 4])
+
+    def test_numpy_export_zero_copy(self):
+        """np.asarray(tensor) views the tensor's data; Tensor(tensor) shares it."""
+        arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+        tensor = cp.Tensor(arr)
+        
+        view = np.asarray(tensor)
+        self.assertEqual(view.shape, (2, 3))
+        self.assertTrue(np.shares_memory(view, arr))
+        
+        wrapped = cp.Tensor(tensor)
+        self.assertEqual(wrapped.shape, (2, 3))
+        self.assertIs(wrapped._backing_data, arr)
+        
+        # Non-NumPy backings are exported through the cached buffer view
+        np.testing.assert_array_equal(np.asarray(cp.Tensor(bytearray([1, 0, 1]), dtype=DataType.BOOL)), [1, 0, 1])
+
+    def test_array_interface_zero_copy(self):
+        """Objects exporting __array_interface__ or a raw buffer are wrapped in place."""
+        import ctypes
+
+        class Exporter:
+            def __init__(self, arr):
+                self._arr = arr
+
+            @property
+            def __array_interface__(self):
+                return self._arr.__array_interface__
+
+        arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+        tensor = cp.Tensor(Exporter(arr))
+        self.assertEqual(tensor.shape, (2, 3))
+        ptr, count, _ref = tensor._get_buffer_pointer('f4')
+        self.assertEqual((ptr, count), (arr.ctypes.data, 6))
+        self.assertTrue(np.shares_memory(np.asarray(tensor), arr))
+
+        raw = (ctypes.c_float * 4)(1.0, 2.0, 3.0, 4.0)
+        tensor = cp.Tensor(raw)
+        self.assertEqual(tensor.shape, (4,))
+        ptr, count, _ref = tensor._get_buffer_pointer('f4')
+        self.assertEqual((ptr, count), (ctypes.addressof(raw), 4))
+
+    def test_buffer_view_reused_across_calls(self):
+        """bytearray/memoryview backings are wrapped once, then read in place."""
+        raw = bytearray([1, 0, 2, 0])
+        for data in (raw, memoryview(raw)):
+            tensor = cp.Tensor(data, dtype=DataType.BOOL)
+            ptr, count, ref = tensor._get_buffer_pointer('u1')
+            self.assertEqual(count, 4)
+            self.assertTrue(np.shares_memory(ref, np.frombuffer(raw, dtype=np.uint8)))
+            self.assertIs(tensor._get_buffer_pointer('u1')[2], ref)
+
+    def test_pointer_resolved_once(self):
+        """The (ptr, count, ref) lookup is cached per buffer code on the tensor."""
+        arr = np.arange(8, dtype=np.float32)
+        tensor = cp.Tensor(arr)
+        first = tensor._get_buffer_pointer('f4')
+        self.assertEqual(first[:2], (arr.ctypes.data, 8))
+        self.assertIs(tensor._get_buffer_pointer('f4'), first)
+        # A different element type is converted once, separately
+        as_int = tensor._get_buffer_pointer('i4')
+        self.assertNotEqual(as_int[0], first[0])
+        self.assertIs(tensor._get_buffer_pointer('i4'), as_int)
+
     def test_binary_ops_mixed_types(self):
         """Test binary ops with different backing types."""
         print("Testing mixed backing types...")
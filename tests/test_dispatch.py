@@ -13,13 +13,13 @@ def test_cpu_add_dispatch():
     t3 = t1 + t2
     
     assert t3.backend == BackendType.CPU
-    # Our simple implementation returns list
-    assert t3._backing_data == [5, 7, 9]
+    # Result is backed by a float32 array the kernel wrote into
+    assert list(t3._backing_data) == [5, 7, 9]
 
 def test_cpu_scalar_add():
     t1 = Tensor([1.0, 2.0])
     t2 = t1 + 10.0
-    assert t2._backing_data == [11.0, 12.0]
+    assert list(t2._backing_data) == [11.0, 12.0]
 
 def test_missing_kernel_error():
     t1 = Tensor([1, 2])
@@ -52,3 +52,18 @@ def test_dispatch_override_gpu(monkeypatch):
     t_res = t_gpu + t_gpu
     assert t_res._backing_data == ["gpu_result"]
     assert t_res.backend == BackendType.GPU
+
+def test_cpu_reduction_kernels_use_numpy():
+    """The no-FFI reduction kernels take an ndarray and return Python scalars."""
+    import numpy as np
+    data = np.array([1.0, 0.0, 3.0, 4.0], dtype=np.float32)
+    
+    assert dispatch_kernel("sum", BackendType.CPU, data) == 8.0
+    assert dispatch_kernel("sum", BackendType.CPU, np.array([100, 100], dtype=np.int8)) == 200
+    assert dispatch_kernel("mean", BackendType.CPU, data) == 2.0
+    assert np.isclose(dispatch_kernel("var", BackendType.CPU, data), np.var(data))
+    assert dispatch_kernel("any", BackendType.CPU, data) is True
+    assert dispatch_kernel("all", BackendType.CPU, data) is False
+    assert dispatch_kernel("count_nonzero", BackendType.CPU, data) == 3
+    with pytest.raises(ValueError):
+        dispatch_kernel("mean", BackendType.CPU, data[:0])
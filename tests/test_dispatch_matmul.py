@@ -24,3 +24,30 @@ def test_cpu_matmul_dispatch():
         np.testing.assert_array_almost_equal(t3._backing_data, expected)
     else:
         assert t3._backing_data == expected
+
+
+def test_cpu_matmul_out():
+    import numpy as np
+    a = np.array([[1, 2], [3, 4]], dtype=np.float32)
+    b = np.array([[5, 6], [7, 8]], dtype=np.float32)
+    out = Tensor(np.empty((2, 2), dtype=np.float32))
+
+    result = Tensor(a).matmul(Tensor(b), out=out)
+
+    # Result is written into the provided buffer and the same Tensor returned
+    assert result is out
+    np.testing.assert_array_almost_equal(out._backing_data, a @ b)
+
+
+def test_cpu_matmul_vector_operands():
+    """1D operands follow NumPy matmul semantics on every CPU path."""
+    import numpy as np
+    m = np.arange(6, dtype=np.float32).reshape(2, 3)
+    v3 = np.array([1, 2, 3], dtype=np.float32)
+    v2 = np.array([4, 5], dtype=np.float32)
+
+    np.testing.assert_array_almost_equal(np.asarray(Tensor(m).matmul(Tensor(v3))), m @ v3)
+    np.testing.assert_array_almost_equal(np.asarray(Tensor(v2).matmul(Tensor(m))), v2 @ m)
+    dot = Tensor(v3).matmul(Tensor(v3))
+    assert dot.shape == (1,)
+    np.testing.assert_array_almost_equal(np.asarray(dot), [v3 @ v3])
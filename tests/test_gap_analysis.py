@@ -161,18 +161,22 @@ def test_simd_performance():
     
     try:
         import time
-        from _corepy_rust import tensor_add_f32, tensor_sum_f32
+        from _corepy_rust import tensor_sum_f32_repeat, tensor_sum_f32_many
         
         # Large array to trigger SIMD paths
         size = 10000
         data = np.random.rand(size).astype(np.float32)
         
-        # Time sum operation
+        # Time sum operation: 1000 kernel runs inside one FFI call
         start = time.perf_counter()
-        for _ in range(1000):
-            result = tensor_sum_f32(data.ctypes.data, len(data))
+        result = tensor_sum_f32_repeat(data.ctypes.data, len(data), 1000)
         rust_time = time.perf_counter() - start
         
+        # Many buffers summed in one crossing
+        chunks = np.split(data, 10)
+        sums = tensor_sum_f32_many([c.ctypes.data for c in chunks], [c.size for c in chunks])
+        assert np.allclose(sums, [np.sum(c) for c in chunks], rtol=1e-4)
+        
         # Compare with NumPy
         start = time.perf_counter()
         for _ in range(1000):
@@ -1,6 +1,15 @@
 import numpy as np
+import pytest
+
 import corepy as cp
 
+try:
+    from corepy import _corepy_rust
+except ImportError:
+    _corepy_rust = None
+
+requires_rust = pytest.mark.skipif(_corepy_rust is None, reason="Rust extension not built")
+
 def test_matmul_2d():
     print("Testing 2D Matmul...")
     
@@ -13,7 +22,10 @@ def test_matmul_2d():
     b_cp = cp.Tensor([[5, 6], [7, 8]])
     
     result_cp = a_cp.matmul(b_cp)
-    result_np = np.array(result_cp._backing_data).reshape(result_cp.shape)
+    # The (m, n) result array is stored as-is: no flat copy to reshape
+    result_np = np.asarray(result_cp)
+    assert result_np.shape == result_cp.shape == (2, 2)
+    assert np.shares_memory(result_np, result_cp._backing_data)
     
     print(f"A:\n{a_np}")
     print(f"B:\n{b_np}")
@@ -32,10 +44,33 @@ def test_matmul_2d():
     b_cp_rect = cp.Tensor(b_rect.tolist())
     
     result_cp_rect = a_cp_rect.matmul(b_cp_rect)
-    result_np_rect = np.array(result_cp_rect._backing_data).reshape(result_cp_rect.shape)
+    result_np_rect = np.asarray(result_cp_rect)
+    assert result_np_rect.shape == (3, 2)
     
     np.testing.assert_allclose(result_np_rect, expected_rect, rtol=1e-5)
     print("✅ Rectangular matrix test passed!")
 
+def test_matmul_2d_small_kernel_threshold():
+    """Shapes on either side of the small-kernel cutoff agree with NumPy."""
+    rng = np.random.default_rng(0)
+    for m, k, n in [(1, 1, 1), (2, 3, 2), (32, 32, 32), (33, 32, 32), (4, 0, 3)]:
+        a = rng.random((m, k), dtype=np.float32)
+        b = rng.random((k, n), dtype=np.float32)
+        result = cp.Tensor(a).matmul(cp.Tensor(b))
+        np.testing.assert_allclose(np.asarray(result), a @ b, rtol=1e-5, atol=1e-6)
+
+@requires_rust
+def test_small_matmul_updates_dispatch_explanation():
+    """explain_last_dispatch describes a small matmul run after a large one."""
+    big = cp.Tensor(np.ones((300, 300), dtype=np.float32))
+    big.matmul(big)
+    a = cp.Tensor(np.ones((2, 3), dtype=np.float32))
+    b = cp.Tensor(np.ones((3, 2), dtype=np.float32))
+    a.matmul(b)
+    
+    explanation = cp.explain_last_dispatch()
+    assert "size=2x2x3" in explanation
+    assert cp.last_backend_name() in explanation
+
 if __name__ == "__main__":
     test_matmul_2d()
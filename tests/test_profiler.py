@@ -1,6 +1,8 @@
 
 import json
+import threading
 
+import numpy as np
 import pytest
 
 import corepy as cp
@@ -13,6 +15,7 @@ from corepy.profiler import (
     profile_operation,
     profile_report,
 )
+from corepy.profiler import core
 
 
 @pytest.fixture(autouse=True)
@@ -71,6 +74,25 @@ def test_context_manager():
     assert 'add' in report['operations']
     assert 'mul' in report['operations']
 
+def test_nested_contexts():
+    """Leaving a nested context restores the enclosing one."""
+    enable_profiling()
+    t1 = cp.Tensor([1.0, 2.0])
+    
+    with ProfileContext("outer"):
+        _ = t1 + t1
+        with ProfileContext("inner"):
+            _ = t1 * t1
+        _ = t1 + t1
+    _ = t1 - t1
+    
+    outer = profile_report(context="outer", format='dict')['operations']
+    inner = profile_report(context="inner", format='dict')['operations']
+    # The outer context rolls up the inner one
+    assert outer['add']['count'] == 2 and outer['mul']['count'] == 1
+    assert inner['mul']['count'] == 1 and 'add' not in inner
+    assert 'sub' not in outer
+
 def test_decorator():
     """Test @profile_operation decorator."""
     enable_profiling()
@@ -81,9 +103,42 @@ def test_decorator():
         
     t = cp.Tensor([10.0])
     _ = my_custom_op(t)
+    _ = my_custom_op(t)
     
     report = profile_report(format='dict')
     assert 'add' in report['operations']
+    assert report['functions']['my_custom_op']['count'] == 2
+    assert my_custom_op.__name__ == 'my_custom_op'
+    
+    # The function's time encloses its ops, so it is not one of them
+    assert 'my_custom_op' not in report['operations']
+    assert 'my_custom_op' in profile_report()
+    
+    # Ops inside the function are attributed to its context, and roll up
+    # into the caller's context
+    scoped = profile_report(context='my_custom_op', format='dict')
+    assert scoped['operations']['add']['count'] == 2
+    with ProfileContext("training"):
+        _ = my_custom_op(t)
+    training = profile_report(context='training', format='dict')
+    assert training['operations']['add']['count'] == 1
+    
+    # Disabled: calls pass straight through and record nothing
+    disable_profiling()
+    assert list(np.asarray(my_custom_op(t))) == [20.0]
+    report = profile_report(format='dict')
+    assert report['functions']['my_custom_op']['count'] == 3
+
+def test_decorator_passes_all_keyword_arguments():
+    """Keyword arguments reach the function whatever their names."""
+    enable_profiling()
+    
+    @profile_operation
+    def passthrough(**kwargs):
+        return kwargs
+    
+    kwargs = {"_clock": 1, "_record": 2, "_push": 3, "_pop": 4}
+    assert passthrough(**kwargs) == kwargs
 
 def test_report_formats():
     """Test different report export formats."""
@@ -143,7 +198,6 @@ def test_matmul_profiling():
 def test_bottleneck_detection():
     """Test bottleneck detection logic."""
     enable_profiling()
-    import numpy as np
     # Use larger tensor to ensure measurable time, but use numpy validation to skip slow python flattening
     # This ensures 'sum' operation dominates execution time, not data prep
     arr = np.ones(100000, dtype=np.float32)
@@ -164,3 +218,60 @@ def test_bottleneck_detection():
 
     found_sum = next(b for b in bottlenecks if b['operation'] == 'sum')
     assert found_sum['percent_total'] > 5.0
+
+def test_bottlenecks_ranked_slowest_first():
+    """detect_bottlenecks orders rows by share of total time, descending."""
+    enable_profiling()
+    big = cp.Tensor(np.ones(200_000, dtype=np.float32))
+    small = cp.Tensor([1.0, 2.0])
+    for _ in range(20):
+        _ = big.sum()
+        _ = small + small
+    
+    rows = [b for b in detect_bottlenecks(threshold=0.0) if b['severity'] != 'HINT']
+    percents = [b['percent_total'] for b in rows]
+    assert percents == sorted(percents, reverse=True)
+    assert rows[0]['operation'] == 'sum'
+    assert 'reduce_stats' in rows[0]['suggestion']
+
+def test_invariant_call_hint():
+    """A reduction repeated on an unchanged tensor is reported as a HINT."""
+    enable_profiling()
+    data = cp.Tensor(np.arange(500, dtype=np.float32))
+    
+    for _ in range(50):
+        m = data.mean()
+        _ = data - m
+    
+    hints = [b for b in detect_bottlenecks(threshold=1.0) if b['severity'] == 'HINT']
+    assert [h['operation'] for h in hints] == ['mean']
+    assert "50x" in hints[0]['reason']
+    
+    # Fresh tensors each time are not invariant calls
+    clear_profile()
+    for i in range(50):
+        _ = cp.Tensor(np.full(8, i, dtype=np.float32)).mean()
+    assert not [b for b in detect_bottlenecks(threshold=1.0) if b['severity'] == 'HINT']
+
+def test_invariant_call_tracking_per_thread_and_bounded():
+    """Hints name their ProfileContext; counts are per thread and capped."""
+    enable_profiling()
+    data = cp.Tensor(np.arange(100, dtype=np.float32))
+    
+    def loop():
+        with ProfileContext("worker"):
+            for _ in range(12):
+                data.sum()
+    threads = [threading.Thread(target=loop) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    hints = [b for b in detect_bottlenecks(threshold=1.0) if b['severity'] == 'HINT']
+    assert len(hints) == 1
+    assert "12x" in hints[0]['reason'] and "'worker'" in hints[0]['reason']
+    
+    for version in range(core._MAX_TRACKED_CALLS + 10):
+        core._note_call("sum", -1 - version)
+    assert len(core._state.calls) <= core._MAX_TRACKED_CALLS
+
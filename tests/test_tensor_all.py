@@ -100,3 +100,16 @@ def test_boundary_33_elements():
     t = Tensor([True] * 33, dtype=DataType.BOOL)
     result = t.all()
     assert result._backing_data == [True]
+
+
+def test_bool_list_stored_as_bytes():
+    """Bool lists become a 0/1 byte array that the kernels read without a copy."""
+    import numpy as np
+    t = Tensor([True, False, 2, 0], dtype=DataType.BOOL)
+    assert t._backing_data.dtype == np.bool_
+    np.testing.assert_array_equal(t._backing_data, [True, False, True, False])
+    _ptr, count, ref = t._get_buffer_pointer('u1')
+    assert count == 4 and np.shares_memory(ref, t._backing_data)
+    # Nested or mixed-type lists still take the generic conversion
+    assert Tensor([[True], [False]], dtype=DataType.BOOL).shape == (2, 1)
+    assert Tensor([True, None], dtype=DataType.BOOL)._backing_data.tolist() == [True, False]
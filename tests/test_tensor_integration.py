@@ -1,12 +1,33 @@
+import numpy as np
+import pytest
+
+import corepy as cp
 from corepy.backend import BackendType
+from corepy.backend.types import DataType
 from corepy.tensor import Tensor
 
+try:
+    from corepy import _corepy_rust
+except ImportError:
+    _corepy_rust = None
+
+requires_rust = pytest.mark.skipif(_corepy_rust is None, reason="Rust extension not built")
+
 
 def test_tensor_creation_defaults():
     t = Tensor([1.0, 2.0, 3.0])
     assert t.backend == BackendType.CPU
     assert t.shape == (3,)
 
+def test_arange_fills_one_buffer():
+    """cp.arange(n) wraps a single NumPy buffer holding 0 .. n-1."""
+    t = cp.arange(10_000)
+    assert t.shape == (10_000,) and t._dtype == DataType.FLOAT32
+    assert isinstance(t._backing_data, np.ndarray) and t._backing_data.dtype == np.float32
+    np.testing.assert_array_equal(t._backing_data, np.arange(10_000, dtype=np.float32))
+    np.testing.assert_array_equal(cp.arange(2, 9, 3, dtype=DataType.INT32)._backing_data, [2, 5, 8])
+    np.testing.assert_array_equal(np.asarray(cp.arange(3, dtype=DataType.BFLOAT16).to_float32()), [0.0, 1.0, 2.0])
+
 def test_tensor_auto_gpu_threshold_mock(monkeypatch):
     """
     Test that large tensors default to GPU if GPU is 'detected'.
@@ -54,3 +75,379 @@ def test_tensor_explicit_override_api():
 def test_tensor_explicit_device_api():
     t = Tensor([1,2,3], device="cuda:0")
     assert t.backend == BackendType.GPU
+
+@requires_rust
+def test_fused_sub_square_sum():
+    """(a - b) * (a - b) then sum() matches the per-op result."""
+    a = Tensor(np.arange(20, dtype=np.float32))
+    b = Tensor(np.ones(20, dtype=np.float32))
+    
+    with cp.fuse():
+        diff = a - b
+        total = (diff * diff).sum()
+    
+    expected = np.arange(20, dtype=np.float32) - 1.0
+    np.testing.assert_allclose(np.asarray(total._backing_data).ravel(), [np.sum(expected ** 2)])
+    # The pending difference is still usable on its own
+    np.testing.assert_allclose(np.asarray(diff._backing_data), expected)
+
+@requires_rust
+def test_fused_mul_sum():
+    """(a * b).sum() matches the dot product."""
+    a = Tensor(np.arange(20, dtype=np.float32))
+    b = Tensor(np.full(20, 2.0, dtype=np.float32))
+    
+    with cp.fuse():
+        total = (a * b).sum()
+    np.testing.assert_allclose(np.asarray(total._backing_data).ravel(), [380.0])
+
+@requires_rust
+def test_ops_outside_blocks_run_eagerly():
+    """Outside batch()/fuse() a result never changes with its inputs' later writes."""
+    from corepy.tensor import _DeferredTensor
+    x = np.arange(8, dtype=np.float32)
+    y = np.ones(8, dtype=np.float32)
+    a, b = Tensor(x), Tensor(y)
+    
+    results = [a - b, a * b, a * 2.0]
+    x[:] = 100.0
+    assert not any(isinstance(r, _DeferredTensor) for r in results)
+    expected = np.arange(8, dtype=np.float32)
+    np.testing.assert_array_equal(results[0]._backing_data, expected - 1.0)
+    np.testing.assert_array_equal(results[1]._backing_data, expected)
+    np.testing.assert_array_equal(results[2]._backing_data, expected * 2.0)
+
+def test_output_buffer_pool_reuse():
+    """Released op buffers are reused; foreign or shared arrays are never pooled."""
+    from corepy.backend.session import get_session
+    session = get_session()
+    
+    buf = session.get_output_buffer(np.float32, 37)
+    assert session.release_output_buffer(buf)
+    assert not session.release_output_buffer(buf) # Already in the free list
+    assert session.get_output_buffer(np.float32, 37) is buf
+    assert session.get_output_buffer(np.float32, 37) is not buf
+    
+    # Tensors only release buffers they own
+    arr = np.empty(37, dtype=np.float32)
+    Tensor(arr).release()
+    assert session.get_output_buffer(np.float32, 37) is not arr
+    Tensor._from_output(buf, DataType.FLOAT32, BackendType.CPU).release()
+    assert session.get_output_buffer(np.float32, 37) is buf
+    owner = Tensor._from_output(buf, DataType.FLOAT32, BackendType.CPU)
+    sharer = Tensor(owner)
+    sharer.release()
+    owner.release()
+    assert sharer._backing_data is buf
+    assert session.get_output_buffer(np.float32, 37) is not buf
+
+@requires_rust
+def test_strided_binary_op_without_copy():
+    """Transposed and reversed inputs are combined in place, not copied."""
+    x = np.arange(12, dtype=np.float32).reshape(3, 4)
+    y = np.arange(12, dtype=np.float32).reshape(4, 3) * 10
+    
+    a, b = Tensor(x), Tensor(y.T)
+    result = a + b
+    np.testing.assert_array_equal(result._backing_data, (x + y.T).ravel())
+    # The strided input was read in place, not replaced by a contiguous copy
+    assert b._backing_data.base is y
+    
+    flat = x.ravel()
+    result = Tensor(flat[::-1]) - Tensor(flat)
+    np.testing.assert_array_equal(result._backing_data, flat[::-1] - flat)
+
+def test_to_same_device_returns_self():
+    t = Tensor([[1.0, 2.0], [3.0, 4.0]])
+    assert t.to("cpu") is t
+    
+    moved = t.to("gpu")
+    assert moved is not t
+    assert moved.backend == BackendType.GPU
+    assert moved.shape == (2, 2)
+    assert moved.to("gpu") is moved
+
+@requires_rust
+def test_batch_runs_recorded_ops():
+    """Ops recorded in cp.batch() run at block exit and match NumPy."""
+    x = np.arange(16, dtype=np.float32)
+    y = np.linspace(1.0, 2.0, 16, dtype=np.float32)
+    a, b = Tensor(x), Tensor(y)
+    
+    with cp.batch():
+        s = a + b
+        t = (s * 2.0 - b) / b
+        u = t * s
+    
+    np.testing.assert_allclose(s._backing_data, x + y, rtol=1e-6)
+    np.testing.assert_allclose(t._backing_data, ((x + y) * 2.0 - y) / y, rtol=1e-6)
+    np.testing.assert_allclose(u._backing_data, ((x + y) * 2.0 - y) / y * (x + y), rtol=1e-6)
+
+@requires_rust
+def test_fuse_evaluates_chains_in_one_kernel():
+    """Chains recorded in cp.fuse() run as one compiled loop, summed or stored."""
+    _fusion = pytest.importorskip("corepy.ops._fusion")
+    if not _fusion.FUSION_AVAILABLE:
+        pytest.skip("numba not installed")
+    n = _fusion.MIN_FUSED_ELEMENTS
+    x = np.linspace(-3.0, 5.0, n, dtype=np.float32)
+    y = np.linspace(1.0, 2.0, n, dtype=np.float32)
+    data, other = Tensor(x), Tensor(y)
+    
+    with cp.fuse():
+        prediction = data * 2.0 + 1.0
+        loss = (prediction - data).sum()
+        ratio = (prediction - other) / other
+    
+    assert loss._backing_data[0] == pytest.approx(float(np.sum((x * 2.0 + 1.0 - x).astype(np.float64))), rel=1e-5)
+    # Nothing ran at exit: values are computed, fused, on first use
+    assert ratio._op is not None and prediction._op is not None
+    np.testing.assert_allclose(ratio._backing_data, (x * 2.0 + 1.0 - y) / y, rtol=1e-6)
+    assert prediction._op is not None
+    assert ("(((x0[i] * s0) + s1) - x0[i])", 1, 2, True) in _fusion._kernels
+    np.testing.assert_array_equal(prediction._backing_data, x * np.float32(2.0) + np.float32(1.0))
+    
+    # Short chains run one kernel per op instead of compiling
+    with cp.fuse():
+        small = (Tensor(x[:100]) + 3.0) / 4.0
+    np.testing.assert_array_equal(small._backing_data, (x[:100] + np.float32(3.0)) / np.float32(4.0))
+    assert ("((x0[i] + s0) / s1)", 1, 2, False) not in _fusion._kernels
+    
+    # NaN reaches the fused sum (no finite-math assumption)
+    x[5] = np.nan
+    with cp.fuse():
+        assert np.isnan((data * 2.0 + 1.0 - data).sum()._backing_data[0])
+
+def test_fusion_cache_ignores_tampered_sources(tmp_path, monkeypatch):
+    """A cached kernel file whose contents differ from its source is never run."""
+    from corepy.ops import _fusion
+    monkeypatch.setattr(_fusion, "_CACHE_DIR", str(tmp_path / "fusion"))
+    source = _fusion._source("(x0[i] + s0)", 1, 1, False)
+    
+    fn, file_backed = _fusion._load(source)
+    assert file_backed and (tmp_path / "fusion").stat().st_mode & 0o777 == 0o700
+    out = np.zeros(3, dtype=np.float32)
+    fn(np.ones(3, dtype=np.float32), 2.0, out)
+    np.testing.assert_array_equal(out, [3.0, 3.0, 3.0])
+    
+    [path] = (tmp_path / "fusion").glob("fused_*.py")
+    path.write_text("raise RuntimeError('planted')\n")
+    fn, file_backed = _fusion._load(source)
+    assert not file_backed
+    fn(np.ones(3, dtype=np.float32), 1.0, out)
+    np.testing.assert_array_equal(out, [2.0, 2.0, 2.0])
+
+@requires_rust
+def test_batched_replays_recorded_chain():
+    """cp.batched runs fn's body once and replays its fused kernel for the rest."""
+    from corepy.ops import _fusion
+    x = np.linspace(-1.0, 1.0, 1024, dtype=np.float32) # 100 replays: enough work to fuse
+    data = Tensor(x)
+    calls = []
+    
+    def step():
+        calls.append(1)
+        return data * 3.0 + 1.0
+    
+    result = cp.batched(step, 100)
+    np.testing.assert_array_equal(result._backing_data, x * np.float32(3.0) + np.float32(1.0))
+    assert len(calls) == (1 if _fusion.FUSION_AVAILABLE else 100)
+    
+    # Results that are not pending chains fall back to calling fn each time
+    calls.clear()
+    total = cp.batched(lambda: calls.append(1) or data.sum(), 5)
+    assert len(calls) == 5 and total._backing_data[0] == pytest.approx(float(x.sum()), abs=1e-4)
+    assert cp.batched(step, 0) is None
+
+@requires_rust
+def test_reduce_stats_single_pass():
+    """cp.reduce_stats gives (mean, sum, max, min) matching NumPy."""
+    for n in (1, 15, 16, 1000, 100_003):
+        x = np.random.default_rng(n).standard_normal(n).astype(np.float32)
+        mean, total, hi, lo = (v._backing_data[0] for v in cp.reduce_stats(Tensor(x)))
+        assert total == pytest.approx(float(x.sum(dtype=np.float64)), abs=1e-3 * max(1.0, n ** 0.5))
+        assert mean == pytest.approx(total / n, rel=1e-6)
+        assert (hi, lo) == (x.max(), x.min())
+        # A NaN anywhere (vector body, tail, any parallel chunk) makes min and max NaN
+        for pos in {0, n // 2, n - 1}:
+            y = x.copy()
+            y[pos] = np.nan
+            assert all(np.isnan(v._backing_data[0]) for v in cp.reduce_stats(Tensor(y)))
+    with pytest.raises(ValueError):
+        cp.reduce_stats(Tensor(np.empty(0, dtype=np.float32)))
+
+def test_bf16_round_trip():
+    """to_bf16() rounds to nearest-even; to_float32() widens exactly."""
+    x = np.array([1.0, 1.00390625, 1.01171875, -3.5, np.inf], dtype=np.float32)
+    t = Tensor(x).to_bf16()
+    assert t._dtype == DataType.BFLOAT16
+    assert t.to_bf16() is t
+    np.testing.assert_array_equal(
+        t.to_float32()._backing_data, [1.0, 1.0, 1.015625, -3.5, np.inf]
+    )
+
+@requires_rust
+def test_bf16_binary_ops():
+    """bf16 op bf16 stays bf16; mixing with float32 promotes."""
+    x = np.linspace(-4.0, 4.0, 37, dtype=np.float32)
+    a, b = Tensor(x).to_bf16(), Tensor(x * 0.5 + 1.0).to_bf16()
+    
+    result = a + b
+    assert result._dtype == DataType.BFLOAT16
+    np.testing.assert_allclose(result.to_float32()._backing_data, x * 1.5 + 1.0, rtol=1e-2, atol=1e-2)
+    
+    mixed = a * Tensor(x)
+    assert mixed._dtype == DataType.FLOAT32
+    np.testing.assert_allclose(mixed._backing_data, x * x, rtol=1e-2)
+    np.testing.assert_allclose(np.asarray(result.sum()._backing_data), [np.sum(x * 1.5 + 1.0)], rtol=1e-2, atol=1e-2)
+
+@requires_rust
+def test_bf16_sum_and_dot():
+    """bf16 sum/mean/dot run on the bf16 kernels and return float32."""
+    x = np.linspace(-2.0, 6.0, 1003, dtype=np.float32)
+    a, b = Tensor(x).to_bf16(), Tensor(x * 0.25).to_bf16()
+    xa = a.to_float32()._backing_data.astype(np.float64)
+    xb = b.to_float32()._backing_data.astype(np.float64)
+    
+    total = a.sum()
+    assert total._dtype == DataType.FLOAT32
+    np.testing.assert_allclose(np.asarray(total._backing_data), [xa.sum()], rtol=1e-5)
+    np.testing.assert_allclose(np.asarray(a.mean()._backing_data), [xa.mean()], rtol=1e-5)
+    
+    dot = a.matmul(b)
+    assert dot._dtype == DataType.FLOAT32
+    np.testing.assert_allclose(np.asarray(dot._backing_data), [xa @ xb], rtol=1e-5)
+
+@requires_rust
+def test_int8_dot_product():
+    """int8 @ int8 is exact in int32 over the full int8 range."""
+    rng = np.random.default_rng(0)
+    for n in (1, 31, 200, 1000):
+        a = rng.integers(-128, 128, n, dtype=np.int8)
+        b = rng.integers(-128, 128, n, dtype=np.int8)
+        dot = Tensor(a, dtype=DataType.INT8).matmul(Tensor(b, dtype=DataType.INT8))
+        assert dot._dtype == DataType.INT32
+        assert int(np.asarray(dot._backing_data)[0]) == int(a.astype(np.int64) @ b)
+
+@requires_rust
+def test_simd_level_reported():
+    """The reduction ISA chosen at load time is exposed as cp.simd_level()."""
+    assert cp.simd_level() in ("avx512", "avx2", "scalar")
+
+@requires_rust
+def test_var_single_pass():
+    """var() matches NumPy's population variance (fused sum / sum-of-squares pass)."""
+    data = np.random.default_rng(1).standard_normal(10_001).astype(np.float32) + 3.0
+    result = Tensor(data).var()
+    assert result._dtype == DataType.FLOAT32
+    assert np.isclose(result._backing_data[0], np.var(data.astype(np.float64)), rtol=1e-4)
+    assert Tensor([2.0, 2.0, 2.0]).var()._backing_data[0] == 0.0
+
+@requires_rust
+def test_center_matches_mean_subtraction():
+    """center() equals x - x.mean() (one native call instead of two)."""
+    data = np.random.default_rng(2).standard_normal(10_001).astype(np.float32) + 5.0
+    t = Tensor(data)
+    result = t.center()
+    assert result._dtype == DataType.FLOAT32
+    np.testing.assert_array_equal(result._backing_data, (t - t.mean())._backing_data)
+    np.testing.assert_allclose(data, Tensor(data).center()._backing_data + data.mean(dtype=np.float64), rtol=1e-5)
+    with pytest.raises(ValueError):
+        Tensor(np.empty(0, dtype=np.float32)).center()
+
+@requires_rust
+def test_one_element_tensor_broadcasts_on_either_side():
+    """A one-element tensor acts as a scalar as the left or the right operand."""
+    x = np.array([1.0, 2.0, 4.0, 8.0], dtype=np.float32)
+    t = Tensor(x)
+    s = Tensor([2.0])
+    for op, expected in (("add", x + 2), ("sub", x - 2), ("mul", x * 2), ("div", x / 2)):
+        np.testing.assert_allclose(t._binary_op(op, s)._backing_data, expected)
+    for op, expected in (("add", 2 + x), ("sub", 2 - x), ("mul", 2 * x), ("div", 2 / x)):
+        np.testing.assert_allclose(s._binary_op(op, t)._backing_data, expected)
+    np.testing.assert_allclose((s - t)._backing_data, 2 - x)
+    np.testing.assert_allclose((t.mean() / t)._backing_data, x.mean() / x, rtol=1e-6)
+
+@requires_rust
+def test_fused_scale_shift():
+    """t * a + b and t * a - b run as one pass and match the two-step result."""
+    data = np.random.default_rng(3).standard_normal(1_003).astype(np.float32)
+    t = Tensor(data)
+    with cp.fuse():
+        up = t * 2.5 + 100.0
+        down = t * 3 - 1
+        # The scaled tensor on its own is unaffected
+        scaled = t * 0.5
+        shifted = scaled + 1.0
+    np.testing.assert_allclose(up._backing_data, data * np.float32(2.5) + np.float32(100.0), rtol=1e-6)
+    np.testing.assert_allclose(down._backing_data, data * np.float32(3.0) - np.float32(1.0), rtol=1e-6, atol=1e-6)
+    np.testing.assert_array_equal(scaled._backing_data, data * np.float32(0.5))
+    np.testing.assert_allclose(shifted._backing_data, data * np.float32(0.5) + np.float32(1.0), rtol=1e-6)
+
+@requires_rust
+def test_sum_many_matches_per_tensor_sums():
+    """Tensor.sum_many gives each tensor's sum_scalar(), in order, from one batched call."""
+    rng = np.random.default_rng(4)
+    tensors = [Tensor(rng.random(n, dtype=np.float32)) for n in (0, 5, 1_000, 300_000)]
+    tensors.append(Tensor([1, 2, 3], dtype=DataType.INT32))
+    a = Tensor(np.arange(6, dtype=np.float32))
+    tensors.append(a * a)
+    
+    sums = Tensor.sum_many(tensors)
+    assert len(sums) == len(tensors)
+    for t, value in zip(tensors, sums):
+        assert np.isclose(value, t.sum_scalar(), rtol=1e-5)
+    assert sums[4] == 6 and sums[5] == 55.0
+
+@requires_rust
+def test_inplace_ops_reuse_unshared_buffer():
+    """x += y writes into x's buffer when x owns it, like a NumPy array."""
+    b = Tensor(np.arange(4, dtype=np.float32))
+    x = b * 1.0
+    ptr = x._get_buffer_pointer('f4')[0]
+    x += b
+    x *= 2.0
+    assert x._get_buffer_pointer('f4')[0] == ptr
+    np.testing.assert_array_equal(x._backing_data, [0.0, 4.0, 8.0, 12.0])
+
+    # References to the same Tensor see the update
+    alias = x
+    x -= 1.0
+    assert alias is x
+    np.testing.assert_array_equal(alias._backing_data, [-1.0, 3.0, 7.0, 11.0])
+
+    # Exported views, wrapping Tensors and user-owned arrays keep their values
+    view = np.asarray(x)
+    wrapped = Tensor(x)
+    x += 1.0
+    assert x._get_buffer_pointer('f4')[0] != ptr
+    np.testing.assert_array_equal(view, [-1.0, 3.0, 7.0, 11.0])
+    np.testing.assert_array_equal(wrapped._backing_data, [-1.0, 3.0, 7.0, 11.0])
+    np.testing.assert_array_equal(x._backing_data, [0.0, 4.0, 8.0, 12.0])
+    arr = np.ones(4, dtype=np.float32)
+    y = Tensor(arr)
+    y /= 2.0
+    np.testing.assert_array_equal(arr, 1.0)
+    np.testing.assert_array_equal(y._backing_data, 0.5)
+
+@requires_rust
+def test_sum_scalar_returns_python_number():
+    """sum_scalar() gives sum()'s value without a result Tensor, fused chains included."""
+    x = np.arange(1, 101, dtype=np.float32)
+    t = Tensor(x)
+    assert isinstance(t.sum_scalar(), float)
+    assert t.sum_scalar() == t.sum()._backing_data[0] == 5050.0
+    assert Tensor(np.arange(10, dtype=np.int32), dtype=DataType.INT32).sum_scalar() == 45
+    assert np.isclose((t * t).sum_scalar(), float(np.dot(x, x)), rtol=1e-6)
+
+@requires_rust
+def test_count_nonzero_and_int8_sum():
+    """PSADBW byte reductions: truthy-byte count and exact int8 sum (int64 result)."""
+    rng = np.random.default_rng(2)
+    for n in (0, 31, 64, 1000):
+        flags = rng.integers(0, 3, n).astype(np.uint8)
+        assert Tensor(flags, dtype=DataType.BOOL).count_nonzero()._backing_data[0] == np.count_nonzero(flags)
+        values = np.full(n, -128, dtype=np.int8)
+        total = Tensor(values, dtype=DataType.INT8).sum()
+        assert total._dtype == DataType.INT64
+        assert total._backing_data[0] == -128 * n
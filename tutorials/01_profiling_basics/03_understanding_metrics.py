@@ -41,7 +41,7 @@ result_small = small_data.sum()
 print(f"Small data sum: {result_small}")
 
 # Large data (slower, but that's expected)
-large_data = cp.tensor([float(i) for i in range(10000)])  # 10,000 elements
+large_data = cp.arange(10000)  # 10,000 elements
 result_large = large_data.sum()
 print(f"Large data sum: {result_large}")
 
@@ -70,11 +70,10 @@ print("=" * 70)
 
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 
 # Quick operations
-for _ in range(100):
-    temp = data + 1.0  # Very fast, called 100 times
+temp = cp.batched(lambda: data + 1.0, 100)  # Very fast, called 100 times
 
 # One slow operation
 result = data.matmul(data)  # Matrix multiply on vector - slower
@@ -184,7 +183,7 @@ print("=" * 70)
 cp.enable_profiling()
 
 # Simulate a buggy implementation with unnecessary work
-data = cp.tensor([float(i) for i in range(500)])
+data = cp.arange(500)
 
 # BUG: Accidentally computing mean inside a loop instead of once!
 results = []
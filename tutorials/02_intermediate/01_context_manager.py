@@ -38,7 +38,7 @@ print("=" * 70)
 
 # This code runs but is NOT profiled
 print("\n1. Initialization (not profiled)...")
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 print(f"   Created tensor with {len(data)} elements")
 
 # Enable profiling ONLY for this critical section
@@ -120,7 +120,7 @@ cp.clear_profile()
 
 # You can nest contexts to create hierarchical reports!
 with ProfileContext("outer_pipeline"):
-    data = cp.tensor([float(i) for i in range(100)])
+    data = cp.arange(100)
     
     with ProfileContext("preprocessing"):
         normalized = data - data.mean()
@@ -153,7 +153,7 @@ print("=" * 70)
 
 cp.clear_profile()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 
 # Implementation A: Separate operations
 with ProfileContext("implementation_A"):
@@ -51,12 +51,13 @@ def preprocess_data(data):
 @profile_operation
 def compute_features(data):
     """Feature engineering - automatically profiled!"""
-    # Compute various statistics
+    # Compute various statistics (one fused pass over the data)
+    mean, total, max_val, min_val = cp.reduce_stats(data)
     features = {
-        'mean': data.mean(),
-        'sum': data.sum(),
-        'max': data.max(),
-        'min': data.min()
+        'mean': mean,
+        'sum': total,
+        'max': max_val,
+        'min': min_val
     }
     return features
 
@@ -70,7 +71,7 @@ def apply_transformation(data):
 print("\nRunning custom functions...")
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 processed = preprocess_data(data)
 features = compute_features(processed)
 final = apply_transformation(processed)
@@ -117,7 +118,7 @@ def method_b_fused_ops(data):
 
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 
 # Run both methods multiple times
 for _ in range(10):
@@ -153,7 +154,7 @@ print("=" * 70)
 def load_and_validate(filepath):
     """Simulated data loading"""
     # In real code: data = cp.read_csv(filepath)
-    data = cp.tensor([float(i) for i in range(500)])
+    data = cp.arange(500)
     # Validation
     if data.sum() < 0:
         raise ValueError("Invalid data")
@@ -223,7 +224,7 @@ def training_step(data, epoch):
 cp.enable_profiling()
 
 # Profile just the training loop, not setup
-data = cp.tensor([float(i) for i in range(100)])  # Not profiled
+data = cp.arange(100)  # Not profiled
 
 with ProfileContext("training"):
     # Only this loop is profiled
@@ -45,7 +45,7 @@ print("=" * 70)
 cp.enable_profiling()
 
 # Simulate a pipeline with one slow operation
-data = cp.tensor([float(i) for i in range(10000)])
+data = cp.arange(10000)
 
 # Fast operations
 temp1 = data + 1.0      # ~0.2ms
@@ -90,7 +90,7 @@ print("=" * 70)
 
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(5000)])
+data = cp.arange(5000)
 
 # Several operations with varying costs
 for i in range(10):
@@ -157,7 +157,7 @@ def fast_postprocessing(data):
 
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 
 # Run pipeline
 preprocessed = fast_preprocessing(data)
@@ -216,7 +216,7 @@ def aggregate(data):
 
 cp.enable_profiling()
 
-data = cp.tensor([float(i) for i in range(1000)])
+data = cp.arange(1000)
 
 for _ in range(10):
     p = preprocess(data)
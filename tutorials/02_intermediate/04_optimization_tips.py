@@ -40,7 +40,7 @@ print("=" * 70)
 cp.enable_profiling()
 
 # This is a large matmul running on CPU
-large_data = cp.tensor([float(i) for i in range(10000)])
+large_data = cp.arange(10000)
 result = large_data.matmul(large_data)
 
 # Get recommendations
@@ -54,7 +54,7 @@ print("=" * 70)
 
 @profile_operation
 def sample_workflow():
-    data = cp.tensor([float(i) for i in range(1000)])
+    data = cp.arange(1000)
     normalized = (data - data.mean()) / data.std()
     result = normalized.sum()
     return result
@@ -122,7 +122,7 @@ print("=" * 70)
 cp.enable_profiling()
 
 # Run more operations for better CSV example
-data = cp.tensor([float(i) for i in range(500)])
+data = cp.arange(500)
 for i in range(5):
     temp = data + i
     result = temp.mean()
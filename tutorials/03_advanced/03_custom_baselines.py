@@ -50,7 +50,7 @@ print("=" * 70)
 @profile_operation
 def data_processing_pipeline(data_size):
     """Standard data processing workflow"""
-    data = cp.tensor([float(i) for i in range(data_size)])
+    data = cp.arange(data_size)
     normalized = (data - data.mean()) / data.std()
     scaled = normalized * 100.0
     result = scaled.sum()
@@ -118,7 +118,7 @@ print("=" * 70)
 @profile_operation
 def data_processing_pipeline_v2(data_size):
     """New version with accidental regression"""
-    data = cp.tensor([float(i) for i in range(data_size)])
+    data = cp.arange(data_size)
     
     # BUG: Computing mean twice (should be once!)
     normalized = (data - data.mean()) / data.std()
@@ -52,7 +52,7 @@ print("=" * 70)
 def load_batch(batch_id, batch_size):
     """Load training data (simulated)"""
     # Simulating data loading
-    data = cp.tensor([float(i) for i in range(batch_size)])
+    data = cp.arange(batch_size)
     return data
 
 @profile_operation
@@ -291,13 +291,13 @@ print(f"{'Metric':<30} {'Before':>15} {'After':>15} {'Improvement':>15}")
 print("=" * 80)
 print(f"{'Total Time':<30} {slow_total:>12.2f}ms {opt_total:>12.2f}ms {speedup:>12.1f}x faster")
 
-# Per-operation comparison
+# Per-function comparison (@profile_operation timings are under 'functions')
 print(f"\n{'Operation Breakdown':<30}")
 print("-" * 80)
 
 for op_name in ['preprocess_batch', 'forward_pass', 'backward_pass']:
-    slow_time = slow_data['operations'].get(op_name, {}).get('avg_time_ms', 0)
-    opt_time = opt_data['operations'].get(f'{op_name}_optimized', {}).get('avg_time_ms', 0)
+    slow_time = slow_data['functions'].get(op_name, {}).get('avg_time_ms', 0)
+    opt_time = opt_data['functions'].get(f'{op_name}_optimized', {}).get('avg_time_ms', 0)
     
     if slow_time > 0 and opt_time > 0:
         op_speedup = slow_time / opt_time